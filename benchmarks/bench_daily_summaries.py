@@ -0,0 +1,148 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""Benchmark: SolarDataReader.async_get_daily_summaries vs. the old N+1 path. @zara
+
+Builds a throw-away solar_forecast.db from data/schema.sql, fills it with
+synthetic daily summaries, time windows and frost analysis, then times the
+set-based reader against the previous per-row lookup pattern for 30, 365 and
+1000 day ranges.
+
+Run from the repository root inside a Home Assistant dev environment:
+
+    python benchmarks/bench_daily_summaries.py
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import aiosqlite
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from custom_components.solar_forecast_ml.extra_features.sfml_stats.const import (  # noqa: E402
+    SOLAR_FORECAST_DB,
+)
+from custom_components.solar_forecast_ml.extra_features.sfml_stats.readers.solar_reader import (  # noqa: E402
+    SolarDataReader,
+)
+
+SCHEMA = REPO_ROOT / "custom_components" / "solar_forecast_ml" / "data" / "schema.sql"
+RANGES = (30, 365, 1000)
+REPEATS = 5
+WINDOWS = ("morning_7_10", "midday_11_14", "afternoon_15_17")
+
+
+def _populate(db_path: Path, days: int) -> None:
+    """Create the schema and insert synthetic rows for the last `days` days. @zara"""
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA.read_text(encoding="utf-8"))
+    today = date.today()
+    rng = random.Random(42)
+    summaries, windows, frost = [], [], []
+    for offset in range(days):
+        day = (today - timedelta(days=offset)).isoformat()
+        predicted = rng.uniform(2, 40)
+        actual = predicted * rng.uniform(0.6, 1.3)
+        summaries.append((day, 0, 1, "winter", predicted, actual, 90.0, actual - predicted, 8, 12, 3.2))
+        for name in WINDOWS:
+            windows.append((day, name, 1.0, 1.1, 91.0, 1, 3))
+        frost.append((day, 10, 0, rng.randint(0, 4), 0, 0))
+    conn.executemany(
+        """INSERT INTO daily_summaries (date, day_of_week, month, season, predicted_total_kwh,
+               actual_total_kwh, accuracy_percent, error_kwh, production_hours, peak_hour, peak_kwh)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        summaries,
+    )
+    conn.executemany(
+        """INSERT INTO daily_summary_time_windows (date, window_name, predicted_kwh, actual_kwh,
+               accuracy, stable, hours_count) VALUES (?, ?, ?, ?, ?, ?, ?)""",
+        windows,
+    )
+    conn.executemany(
+        """INSERT INTO daily_summary_frost_analysis (date, hours_analyzed, frost_detected,
+               total_affected_hours, heavy_frost_hours, light_frost_hours) VALUES (?, ?, ?, ?, ?, ?)""",
+        frost,
+    )
+    conn.commit()
+    conn.close()
+
+
+async def _legacy_n_plus_one(db_path: Path, start: date, end: date) -> int:
+    """Previous access pattern: one summary query plus two lookups per row. @zara"""
+    async with aiosqlite.connect(str(db_path)) as conn:
+        conn.row_factory = aiosqlite.Row
+        async with conn.execute(
+            "SELECT * FROM daily_summaries WHERE date >= ? AND date <= ? ORDER BY date DESC",
+            (start.isoformat(), end.isoformat()),
+        ) as cursor:
+            rows = await cursor.fetchall()
+        for row in rows:
+            async with conn.execute(
+                """SELECT window_name, predicted_kwh, actual_kwh, accuracy, stable, hours_count
+                   FROM daily_summary_time_windows WHERE date = ?""",
+                (row["date"],),
+            ) as cursor:
+                await cursor.fetchall()
+            async with conn.execute(
+                """SELECT hours_analyzed, frost_detected, total_affected_hours,
+                          heavy_frost_hours, light_frost_hours
+                   FROM daily_summary_frost_analysis WHERE date = ?""",
+                (row["date"],),
+            ) as cursor:
+                await cursor.fetchone()
+        return len(rows)
+
+
+async def _time(coro_factory) -> tuple[float, int]:
+    best = float("inf")
+    count = 0
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        count = await coro_factory()
+        best = min(best, time.perf_counter() - started)
+    return best, count
+
+
+async def main() -> None:
+    # The reader warns about its direct-connection fallback on every call @zara
+    logging.getLogger("custom_components").setLevel(logging.ERROR)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = Path(tmp)
+        db_path = config_path / SOLAR_FORECAST_DB
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        _populate(db_path, max(RANGES))
+        reader = SolarDataReader(config_path)
+        end = date.today()
+
+        print(f"{'days':>6} {'legacy ms':>10} {'set-based ms':>13} {'speedup':>8}")
+        for days in RANGES:
+            start = end - timedelta(days=days - 1)
+
+            async def _set_based() -> int:
+                return len(await reader.async_get_daily_summaries(start_date=start, end_date=end))
+
+            legacy_s, legacy_n = await _time(lambda: _legacy_n_plus_one(db_path, start, end))
+            new_s, new_n = await _time(_set_based)
+            assert legacy_n == new_n == days, (legacy_n, new_n, days)
+            print(f"{days:>6} {legacy_s * 1000:>10.1f} {new_s * 1000:>13.1f} {legacy_s / new_s:>7.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,151 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast ML DB-Version
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""Benchmark: BatchLSTMTrainer samples/second, per-sample vs. mini-batch. @zara
+
+Trains the TinyLSTM-shaped network (sequence_length=24) on synthetic
+sequences, once one sample at a time in float64 and then in mini-batches
+in float64 and float32, and reports training throughput. Before timing,
+the batched predictions are checked against a separate per-gate step
+loop that reads the weights exported by to_tiny_lstm_dict(), and the
+export is re-imported with from_tiny_lstm_dict().
+
+The engine is not used by the integration yet. TinyLSTM is compiled in
+this tree, so this checks the engine against the TinyLSTM weight layout
+as documented in to_tiny_lstm_dict(), not against TinyLSTM itself.
+
+Needs only NumPy; the engine module is loaded by path, so no Home
+Assistant environment is required. Run from the repository root on each
+target (x86_64, aarch64):
+
+    python benchmarks/bench_lstm_training.py
+"""
+from __future__ import annotations
+
+import importlib.util
+import platform
+import time
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+ENGINE = REPO_ROOT / "custom_components" / "solar_forecast_ml" / "ai" / "ai_lstm_batch_trainer.py"
+
+SAMPLES = 512
+SEQUENCE_LENGTH = 24
+INPUT_SIZE = 20
+HIDDEN_SIZES = (16, 32)
+NUM_OUTPUTS = 1
+EPOCHS = 2
+TOLERANCE = {np.float64: 1e-9, np.float32: 1e-4}
+
+# (label, batch size, dtype) @zara
+CONFIGS = (
+    ("per-sample f64", 1, np.float64),
+    ("batch 32 f64", 32, np.float64),
+    ("batch 32 f32", 32, np.float32),
+    ("batch 64 f32", 64, np.float32),
+)
+
+
+def _load_engine():
+    """Import ai_lstm_batch_trainer without the integration package. @zara"""
+    spec = importlib.util.spec_from_file_location("ai_lstm_batch_trainer", ENGINE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.BatchLSTMTrainer
+
+
+def _synthetic_data(rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+    """Sequences with a target depending on early and late time steps. @zara"""
+    X = rng.normal(size=(SAMPLES, SEQUENCE_LENGTH, INPUT_SIZE))
+    y = (0.6 * X[:, -3:, 0].mean(axis=1) + 0.4 * X[:, :6, 1].mean(axis=1))[:, None]
+    return X, y
+
+
+def _tiny_lstm_predict(weights: dict, x: np.ndarray) -> np.ndarray:
+    """Per-gate step loop over a to_tiny_lstm_dict() export. @zara"""
+    gates = {name: np.asarray(value) for name, value in weights.items() if name[0] in "Wb"}
+
+    def sigmoid(z: np.ndarray) -> np.ndarray:
+        return 1.0 / (1.0 + np.exp(-z))
+
+    h = np.zeros(weights["hidden_size"])
+    c = np.zeros(weights["hidden_size"])
+    for x_t in x:
+        xh = np.concatenate([x_t, h])
+        i = sigmoid(gates["Wi"] @ xh + gates["bi"])
+        f = sigmoid(gates["Wf"] @ xh + gates["bf"])
+        o = sigmoid(gates["Wo"] @ xh + gates["bo"])
+        g = np.tanh(gates["Wc"] @ xh + gates["bc"])
+        c = f * c + i * g
+        h = o * np.tanh(c)
+    return gates["Wy"] @ h + gates["by"]
+
+
+def _check_predictions(trainer_cls, X: np.ndarray, y: np.ndarray, hidden_size: int) -> None:
+    """Batched predictions must match the TinyLSTM-layout step loop. @zara"""
+    for dtype, tolerance in TOLERANCE.items():
+        trainer = trainer_cls(
+            INPUT_SIZE, hidden_size, SEQUENCE_LENGTH, NUM_OUTPUTS, dtype=dtype, seed=7
+        )
+        trainer.fit(X[:64], y[:64], epochs=1)
+        exported = trainer.to_tiny_lstm_dict()
+        batched = trainer.predict(X[:64]).astype(np.float64)
+        reference = np.stack([_tiny_lstm_predict(exported, x) for x in X[:64]])
+        reloaded = trainer_cls.from_tiny_lstm_dict(exported, dtype=dtype).predict(X[:64])
+        diff = float(np.abs(batched - reference).max())
+        round_trip = float(np.abs(batched - reloaded.astype(np.float64)).max())
+        if max(diff, round_trip) > tolerance:
+            raise SystemExit(
+                f"{np.dtype(dtype).name}: max deviation {diff:.2e} (round trip {round_trip:.2e})"
+                f" > {tolerance:.0e}"
+            )
+        print(
+            f"  predictions {np.dtype(dtype).name}: max deviation {diff:.2e},"
+            f" round trip {round_trip:.2e}"
+        )
+
+
+def main() -> None:
+    trainer_cls = _load_engine()
+    rng = np.random.default_rng(42)
+    X, y = _synthetic_data(rng)
+
+    print(
+        f"{platform.machine()} / {platform.python_implementation()} {platform.python_version()}"
+        f" / numpy {np.__version__}"
+    )
+    print(f"{SAMPLES} samples x {SEQUENCE_LENGTH} steps x {INPUT_SIZE} features, {EPOCHS} epochs")
+
+    for hidden_size in HIDDEN_SIZES:
+        print(f"\nhidden_size={hidden_size}")
+        _check_predictions(trainer_cls, X, y, hidden_size)
+        print(f"  {'config':<16} {'samples/s':>10} {'speedup':>8} {'final loss':>11}")
+        baseline = None
+        for label, batch_size, dtype in CONFIGS:
+            trainer = trainer_cls(
+                INPUT_SIZE,
+                hidden_size,
+                SEQUENCE_LENGTH,
+                NUM_OUTPUTS,
+                batch_size=batch_size,
+                dtype=dtype,
+                seed=0,
+            )
+            started = time.perf_counter()
+            history = trainer.fit(X, y, epochs=EPOCHS)
+            rate = SAMPLES * EPOCHS / (time.perf_counter() - started)
+            baseline = baseline or rate
+            print(f"  {label:<16} {rate:>10.0f} {rate / baseline:>7.1f}x {history[-1]:>11.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,400 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast ML DB-Version
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""
+Batched LSTM Training Engine for Solar Forecast ML V16.4.2.
+Mini-batch forward and backward passes of a single-layer LSTM over
+stacked NumPy tensors, with one fused matmul for all four gates and
+preallocated buffers. Same shape contract as TinyLSTM: sequences of
+(sequence_length, input_size) in, num_outputs values out.
+
+Not used by the retraining path yet: TinyLSTM and AIPredictor.train_model
+are compiled modules in this tree, so neither can call the engine, and
+the layout of the TinyLSTM weights behind to_tiny_lstm_dict() cannot be
+checked against TinyLSTM itself. Verify predictions against
+TinyLSTM.predict before swapping it in.
+
+@zara
+"""
+
+import logging
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+_LOGGER = logging.getLogger(__name__)
+
+# Gate blocks in the fused weight matrix: input, forget, output, candidate.
+# The three sigmoid gates come first so one call activates them together @zara
+GATE_ORDER = ("input", "forget", "output", "candidate")
+
+# Weight and bias names per gate, as in the ai_lstm_weights table @zara
+TINY_LSTM_GATES = {
+    "input": ("Wi", "bi"),
+    "forget": ("Wf", "bf"),
+    "output": ("Wo", "bo"),
+    "candidate": ("Wc", "bc"),
+}
+
+# Attention weights of TinyLSTM, which this engine does not implement @zara
+TINY_LSTM_ATTENTION = ("W_query", "W_key", "W_value", "W_attn_out", "b_attn_out")
+
+
+def _sigmoid(x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Overflow-free logistic function, in place if out is given. @zara"""
+    out = np.multiply(x, 0.5, out=out)
+    np.tanh(out, out=out)
+    out += 1.0
+    out *= 0.5
+    return out
+
+
+class BatchLSTMTrainer:
+    """Single-layer LSTM with a linear head, trained on mini-batches. @zara
+
+    Parameters are one fused gate matrix W of shape
+    (input_size + hidden_size, 4 * hidden_size) with bias b, and the head
+    W_out (hidden_size, num_outputs) with bias b_out. A batch runs each
+    time step as one (batch, input + hidden) x (input + hidden, 4 * hidden)
+    matmul; activations, cell states and gradients live in buffers that
+    are allocated for batch_size once and reused. The output is the head
+    applied to the last hidden state, trained with MSE and Adam.
+    """
+
+    def __init__(
+        self,
+        input_size: int,
+        hidden_size: int,
+        sequence_length: int = 24,
+        num_outputs: int = 1,
+        learning_rate: float = 0.005,
+        batch_size: int = 32,
+        dtype: type = np.float32,
+        clip_norm: float = 5.0,
+        seed: Optional[int] = None,
+    ):
+        """Initialize weights and buffers. @zara
+
+        Args:
+            input_size: Features per time step
+            hidden_size: LSTM units
+            sequence_length: Time steps per sample
+            num_outputs: Values predicted per sample
+            learning_rate: Adam step size
+            batch_size: Samples per mini-batch (buffer size)
+            dtype: np.float32 or np.float64
+            clip_norm: Global gradient norm limit (0 disables clipping)
+            seed: Seed of the weight initialization and shuffling
+        """
+        self.input_size = input_size
+        self.hidden_size = hidden_size
+        self.sequence_length = sequence_length
+        self.num_outputs = num_outputs
+        self.learning_rate = learning_rate
+        self.batch_size = batch_size
+        self.dtype = np.dtype(dtype)
+        self.clip_norm = clip_norm
+        self._rng = np.random.default_rng(seed)
+
+        concat = input_size + hidden_size
+        gate_scale = 1.0 / np.sqrt(concat)
+        head_scale = 1.0 / np.sqrt(hidden_size)
+        self.W = self._rng.uniform(-gate_scale, gate_scale, (concat, 4 * hidden_size)).astype(self.dtype)
+        self.b = np.zeros(4 * hidden_size, dtype=self.dtype)
+        # Forget gate bias of 1 keeps early gradients flowing through the cell @zara
+        self.b[hidden_size:2 * hidden_size] = 1.0
+        self.W_out = self._rng.uniform(-head_scale, head_scale, (hidden_size, num_outputs)).astype(self.dtype)
+        self.b_out = np.zeros(num_outputs, dtype=self.dtype)
+
+        self._adam_m = {name: np.zeros_like(p) for name, p in self._params().items()}
+        self._adam_v = {name: np.zeros_like(p) for name, p in self._params().items()}
+        self._adam_t = 0
+
+        self._allocate(batch_size)
+
+    def _params(self) -> Dict[str, np.ndarray]:
+        """Trainable arrays by name. @zara"""
+        return {"W": self.W, "b": self.b, "W_out": self.W_out, "b_out": self.b_out}
+
+    def _allocate(self, batch_size: int) -> None:
+        """Allocate the forward and backward buffers for batch_size samples. @zara"""
+        T, H, dt = self.sequence_length, self.hidden_size, self.dtype
+        concat = self.input_size + H
+        self._capacity = batch_size
+        self._xh = np.zeros((T, batch_size, concat), dtype=dt)
+        self._gates = np.zeros((T, batch_size, 4 * H), dtype=dt)
+        self._c = np.zeros((T + 1, batch_size, H), dtype=dt)
+        self._tanh_c = np.zeros((T, batch_size, H), dtype=dt)
+        self._h_final = np.zeros((batch_size, H), dtype=dt)
+        self._dz = np.zeros((batch_size, 4 * H), dtype=dt)
+        self._dxh = np.zeros((batch_size, concat), dtype=dt)
+        self._dc = np.zeros((batch_size, H), dtype=dt)
+        self._grads = {name: np.zeros_like(p) for name, p in self._params().items()}
+
+    # ------------------------------------------------------------------
+    # Forward
+    # ------------------------------------------------------------------
+
+    def _forward(self, X: np.ndarray) -> np.ndarray:
+        """Run a batch (B, T, I) through the buffers; return the last hidden state. @zara"""
+        B = X.shape[0]
+        if B > self._capacity:
+            self._allocate(B)
+        I, H = self.input_size, self.hidden_size
+        xh, gates, c, tanh_c = self._xh[:, :B], self._gates[:, :B], self._c[:, :B], self._tanh_c[:, :B]
+
+        c[0] = 0.0
+        xh[0, :, I:] = 0.0
+        # Time-major copy of the inputs into the concat buffer @zara
+        xh[:, :, :I] = X.transpose(1, 0, 2)
+
+        for t in range(self.sequence_length):
+            z = gates[t]
+            np.matmul(xh[t], self.W, out=z)
+            z += self.b
+            _sigmoid(z[:, :3 * H], out=z[:, :3 * H])
+            np.tanh(z[:, 3 * H:], out=z[:, 3 * H:])
+
+            i, f, o, g = z[:, :H], z[:, H:2 * H], z[:, 2 * H:3 * H], z[:, 3 * H:]
+            np.multiply(f, c[t], out=c[t + 1])
+            c[t + 1] += i * g
+            np.tanh(c[t + 1], out=tanh_c[t])
+            # h_t+1 is written straight into the next step's concat input @zara
+            h_next = xh[t + 1, :, I:] if t + 1 < self.sequence_length else self._h_final[:B]
+            np.multiply(o, tanh_c[t], out=h_next)
+
+        return self._h_final[:B]
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Predict (N, num_outputs) for sequences (N, T, I) in batches. @zara"""
+        X = np.asarray(X, dtype=self.dtype)
+        outputs = np.empty((X.shape[0], self.num_outputs), dtype=self.dtype)
+        for start in range(0, X.shape[0], self._capacity):
+            batch = X[start:start + self._capacity]
+            h = self._forward(batch)
+            np.matmul(h, self.W_out, out=outputs[start:start + len(batch)])
+            outputs[start:start + len(batch)] += self.b_out
+        return outputs
+
+    def predict_sample(self, x: np.ndarray) -> np.ndarray:
+        """Predict one sequence (T, I) with the per-sample step loop. @zara
+
+        Uses separate gate matmuls and no shared buffers, as a readable
+        reference of the batched path.
+        """
+        H = self.hidden_size
+        x = np.asarray(x, dtype=np.float64)
+        W, b = self.W.astype(np.float64), self.b.astype(np.float64)
+        h = np.zeros(H)
+        c = np.zeros(H)
+        for t in range(self.sequence_length):
+            xh = np.concatenate([x[t], h])
+            i = 1.0 / (1.0 + np.exp(-(xh @ W[:, :H] + b[:H])))
+            f = 1.0 / (1.0 + np.exp(-(xh @ W[:, H:2 * H] + b[H:2 * H])))
+            o = 1.0 / (1.0 + np.exp(-(xh @ W[:, 2 * H:3 * H] + b[2 * H:3 * H])))
+            g = np.tanh(xh @ W[:, 3 * H:] + b[3 * H:])
+            c = f * c + i * g
+            h = o * np.tanh(c)
+        return h @ self.W_out.astype(np.float64) + self.b_out.astype(np.float64)
+
+    # ------------------------------------------------------------------
+    # Training
+    # ------------------------------------------------------------------
+
+    def train_batch(self, X: np.ndarray, y: np.ndarray) -> float:
+        """One forward/backward pass and Adam step on a mini-batch. @zara
+
+        Args:
+            X: Sequences (B, T, I)
+            y: Targets (B, num_outputs)
+
+        Returns:
+            Mean squared error of the batch before the update
+        """
+        X = np.asarray(X, dtype=self.dtype)
+        y = np.asarray(y, dtype=self.dtype).reshape(X.shape[0], self.num_outputs)
+        B = X.shape[0]
+        I, H = self.input_size, self.hidden_size
+
+        h_last = self._forward(X)
+        error = h_last @ self.W_out
+        error += self.b_out
+        error -= y
+        loss = float(np.mean(error * error))
+
+        grads = self._grads
+        d_out = error * (2.0 / error.size)
+        np.matmul(h_last.T, d_out, out=grads["W_out"])
+        np.sum(d_out, axis=0, out=grads["b_out"])
+        grads["W"][:] = 0.0
+        grads["b"][:] = 0.0
+
+        xh, gates, c, tanh_c = self._xh[:, :B], self._gates[:, :B], self._c[:, :B], self._tanh_c[:, :B]
+        dz, dxh, dc = self._dz[:B], self._dxh[:B], self._dc[:B]
+        dh = d_out @ self.W_out.T
+        dc[:] = 0.0
+
+        for t in reversed(range(self.sequence_length)):
+            z = gates[t]
+            i, f, o, g = z[:, :H], z[:, H:2 * H], z[:, 2 * H:3 * H], z[:, 3 * H:]
+            tc = tanh_c[t]
+
+            # dc += dh * o * (1 - tanh(c)^2) @zara
+            dc += dh * o * (1.0 - tc * tc)
+            np.multiply(dc, g, out=dz[:, :H])
+            dz[:, :H] *= i * (1.0 - i)
+            np.multiply(dc, c[t], out=dz[:, H:2 * H])
+            dz[:, H:2 * H] *= f * (1.0 - f)
+            np.multiply(dh, tc, out=dz[:, 2 * H:3 * H])
+            dz[:, 2 * H:3 * H] *= o * (1.0 - o)
+            np.multiply(dc, i, out=dz[:, 3 * H:])
+            dz[:, 3 * H:] *= 1.0 - g * g
+
+            grads["W"] += xh[t].T @ dz
+            grads["b"] += dz.sum(axis=0)
+            np.matmul(dz, self.W.T, out=dxh)
+            dh = dxh[:, I:]
+            dc *= f
+
+        self._apply_gradients()
+        return loss
+
+    def _apply_gradients(self) -> None:
+        """Clip by global norm and take one Adam step. @zara"""
+        grads = self._grads
+        if self.clip_norm > 0:
+            norm = float(np.sqrt(sum(float(np.sum(g * g)) for g in grads.values())))
+            if norm > self.clip_norm:
+                scale = self.clip_norm / norm
+                for g in grads.values():
+                    g *= scale
+
+        beta1, beta2, eps = 0.9, 0.999, 1e-8
+        self._adam_t += 1
+        correction = np.sqrt(1.0 - beta2 ** self._adam_t) / (1.0 - beta1 ** self._adam_t)
+        step = self.learning_rate * correction
+        for name, param in self._params().items():
+            g, m, v = grads[name], self._adam_m[name], self._adam_v[name]
+            m *= beta1
+            m += (1.0 - beta1) * g
+            v *= beta2
+            v += (1.0 - beta2) * g * g
+            param -= step * m / (np.sqrt(v) + eps)
+
+    def fit(
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        epochs: int = 50,
+        shuffle: bool = True,
+    ) -> List[float]:
+        """Train over all samples for a number of epochs. @zara
+
+        Args:
+            X: Sequences (N, T, I)
+            y: Targets (N, num_outputs)
+            epochs: Passes over the data
+            shuffle: Reshuffle the samples every epoch
+
+        Returns:
+            Sample-weighted mean loss per epoch
+        """
+        X = np.ascontiguousarray(X, dtype=self.dtype)
+        y = np.asarray(y, dtype=self.dtype).reshape(X.shape[0], self.num_outputs)
+        n = X.shape[0]
+        history = []
+        for _ in range(epochs):
+            order = self._rng.permutation(n) if shuffle else np.arange(n)
+            total = 0.0
+            for start in range(0, n, self.batch_size):
+                index = order[start:start + self.batch_size]
+                total += self.train_batch(X[index], y[index]) * len(index)
+            history.append(total / n if n else 0.0)
+        return history
+
+    # ------------------------------------------------------------------
+    # Weights
+    # ------------------------------------------------------------------
+
+    def get_weights(self) -> Dict[str, np.ndarray]:
+        """Copies of the trainable arrays. @zara"""
+        return {name: p.copy() for name, p in self._params().items()}
+
+    def set_weights(self, weights: Dict[str, Sequence]) -> None:
+        """Load trainable arrays, converted to the trainer's dtype. @zara"""
+        for name, param in self._params().items():
+            value = np.asarray(weights[name], dtype=self.dtype)
+            if value.shape != param.shape:
+                raise ValueError(f"Weight {name} has shape {value.shape}, expected {param.shape}")
+            param[...] = value
+
+    def to_tiny_lstm_dict(self) -> Dict[str, Any]:
+        """Export the weights in the TinyLSTM to_dict() layout. @zara
+
+        One matrix per gate named as in ai_lstm_weights (Wi, Wf, Wo, Wc)
+        of shape (hidden_size, input_size + hidden_size), applied to the
+        column [x_t; h_t-1], one bias vector per gate (bi, bf, bo, bc),
+        and the head Wy (num_outputs, hidden_size) with bias by. Arrays
+        are nested float lists so the dict is JSON serializable.
+        """
+        H = self.hidden_size
+        data: Dict[str, Any] = {
+            "input_size": self.input_size,
+            "hidden_size": H,
+            "sequence_length": self.sequence_length,
+            "num_outputs": self.num_outputs,
+            "learning_rate": self.learning_rate,
+        }
+        for block, gate in enumerate(GATE_ORDER):
+            weight_name, bias_name = TINY_LSTM_GATES[gate]
+            columns = slice(block * H, (block + 1) * H)
+            data[weight_name] = self.W[:, columns].T.astype(np.float64).tolist()
+            data[bias_name] = self.b[columns].astype(np.float64).tolist()
+        data["Wy"] = self.W_out.T.astype(np.float64).tolist()
+        data["by"] = self.b_out.astype(np.float64).tolist()
+        return data
+
+    @classmethod
+    def from_tiny_lstm_dict(
+        cls, data: Mapping[str, Any], **kwargs: Any
+    ) -> "BatchLSTMTrainer":
+        """Create a trainer from weights in the TinyLSTM to_dict() layout. @zara
+
+        Args:
+            data: Dict as written by to_tiny_lstm_dict()
+            **kwargs: Further constructor arguments (batch_size, dtype, ...)
+
+        Raises:
+            ValueError: If the dict holds attention weights or wrong shapes
+        """
+        if any(data.get(name) is not None for name in TINY_LSTM_ATTENTION):
+            raise ValueError("TinyLSTM attention weights are not supported by BatchLSTMTrainer")
+        kwargs.setdefault("learning_rate", data.get("learning_rate", 0.005))
+        trainer = cls(
+            int(data["input_size"]),
+            int(data["hidden_size"]),
+            sequence_length=int(data["sequence_length"]),
+            num_outputs=int(data["num_outputs"]),
+            **kwargs,
+        )
+        H = trainer.hidden_size
+        W = np.empty_like(trainer.W)
+        b = np.empty_like(trainer.b)
+        for block, gate in enumerate(GATE_ORDER):
+            weight_name, bias_name = TINY_LSTM_GATES[gate]
+            columns = slice(block * H, (block + 1) * H)
+            W[:, columns] = np.asarray(data[weight_name], dtype=trainer.dtype).T
+            b[columns] = np.asarray(data[bias_name], dtype=trainer.dtype)
+        trainer.set_weights({
+            "W": W,
+            "b": b,
+            "W_out": np.asarray(data["Wy"], dtype=trainer.dtype).T,
+            "b_out": np.asarray(data["by"], dtype=trainer.dtype).reshape(-1),
+        })
+        return trainer
@@ -16,12 +16,21 @@ All data is stored in SQLite database via DatabaseManager.
 import asyncio
 import logging
 import math
+import time
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
+import numpy as np
+
 from ..data.db_manager import DatabaseManager
+from .solar_position import (
+    SunEvents,
+    hourly_epochs,
+    sun_events_batch,
+    sun_position_batch,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -82,116 +91,25 @@ class AstronomyCache:
     def _calculate_sun_position(
         self, dt: datetime, latitude: float, longitude: float
     ) -> Tuple[float, float]:
-        """Calculate sun elevation and azimuth for given time using astronomical formulas. @zara"""
-        dt_utc = dt.astimezone(ZoneInfo('UTC'))
-        year, month, day = dt_utc.year, dt_utc.month, dt_utc.day
-        hour = dt_utc.hour + dt_utc.minute / 60.0 + dt_utc.second / 3600.0
-
-        if month <= 2:
-            year -= 1
-            month += 12
-
-        a = math.floor(year / 100)
-        b = 2 - a + math.floor(a / 4)
-
-        jd = (
-            math.floor(365.25 * (year + 4716))
-            + math.floor(30.6001 * (month + 1))
-            + day
-            + b
-            - 1524.5
-            + hour / 24.0
-        )
-
-        t = (jd - 2451545.0) / 36525.0
-        l0 = (280.46646 + 36000.76983 * t + 0.0003032 * t * t) % 360
-        m = (357.52911 + 35999.05029 * t - 0.0001537 * t * t) % 360
-        m_rad = math.radians(m)
-
-        c = (
-            (1.914602 - 0.004817 * t - 0.000014 * t * t) * math.sin(m_rad)
-            + (0.019993 - 0.000101 * t) * math.sin(2 * m_rad)
-            + 0.000289 * math.sin(3 * m_rad)
-        )
-
-        true_long = (l0 + c) % 360
-        epsilon = 23.439291 - 0.0130042 * t
-        epsilon_rad = math.radians(epsilon)
-        true_long_rad = math.radians(true_long)
-
-        alpha = math.degrees(
-            math.atan2(math.cos(epsilon_rad) * math.sin(true_long_rad), math.cos(true_long_rad))
-        )
-        delta = math.degrees(math.asin(math.sin(epsilon_rad) * math.sin(true_long_rad)))
-        delta_rad = math.radians(delta)
-
-        gmst = (280.46061837 + 360.98564736629 * (jd - 2451545.0)) % 360
-        lst = (gmst + longitude) % 360
-        hour_angle = (lst - alpha) % 360
-        if hour_angle > 180:
-            hour_angle -= 360
-        hour_angle_rad = math.radians(hour_angle)
-
-        lat_rad = math.radians(latitude)
-        sin_elevation = math.sin(lat_rad) * math.sin(delta_rad) + math.cos(lat_rad) * math.cos(
-            delta_rad
-        ) * math.cos(hour_angle_rad)
-        elevation = math.degrees(math.asin(max(-1, min(1, sin_elevation))))
-
-        cos_azimuth = (math.sin(delta_rad) - math.sin(lat_rad) * sin_elevation) / (
-            math.cos(lat_rad) * math.cos(math.radians(elevation))
-        )
-        cos_azimuth = max(-1, min(1, cos_azimuth))
-        azimuth = math.degrees(math.acos(cos_azimuth))
-
-        if hour_angle > 0:
-            azimuth = 360 - azimuth
-
-        return elevation, azimuth
+        """Calculate sun elevation and azimuth for a single time (wraps the batch engine). @zara"""
+        elevation, azimuth = sun_position_batch([dt.timestamp()], latitude, longitude)
+        return float(elevation[0]), float(azimuth[0])
 
     def _calculate_sunrise_sunset(
         self, target_date: date, latitude: float, longitude: float, timezone: ZoneInfo
     ) -> Tuple[Optional[datetime], Optional[datetime], Optional[datetime]]:
         """Calculate sunrise, sunset, and solar noon for a given date. @zara"""
-        solar_noon = None
-        max_elevation = -90
-
-        for minute in range(10 * 60, 14 * 60):
-            test_time = datetime.combine(target_date, datetime.min.time())
-            test_time = test_time.replace(hour=minute // 60, minute=minute % 60, tzinfo=timezone)
-            elevation, _ = self._calculate_sun_position(test_time, latitude, longitude)
-            if elevation > max_elevation:
-                max_elevation = elevation
-                solar_noon = test_time
-
-        if solar_noon is None:
-            return None, None, None
-
-        sunrise = None
-        for hour in range(0, solar_noon.hour + 1):
-            for minute in range(0, 60, 5):
-                test_time = datetime.combine(target_date, datetime.min.time())
-                test_time = test_time.replace(hour=hour, minute=minute, tzinfo=timezone)
-                elevation, _ = self._calculate_sun_position(test_time, latitude, longitude)
-                if elevation > -0.833:
-                    sunrise = test_time
-                    break
-            if sunrise:
-                break
-
-        sunset = None
-        for hour in range(solar_noon.hour, 24):
-            for minute in range(0, 60, 5):
-                test_time = datetime.combine(target_date, datetime.min.time())
-                test_time = test_time.replace(hour=hour, minute=minute, tzinfo=timezone)
-                elevation, _ = self._calculate_sun_position(test_time, latitude, longitude)
-                if elevation < -0.833:
-                    sunset = test_time
-                    break
-            if sunset:
-                break
-
-        return sunrise, sunset, solar_noon
+        events = sun_events_batch([target_date], latitude, longitude, timezone)[0]
+        return events.sunrise, events.sunset, events.solar_noon
+
+    def _calculate_solar_days(
+        self, dates: List[date]
+    ) -> Tuple[List[SunEvents], np.ndarray, np.ndarray]:
+        """Sun events plus (days, 24) elevation/azimuth at HH:30 local in one batch. @zara"""
+        events = sun_events_batch(dates, self.latitude, self.longitude, self.timezone)
+        epochs = hourly_epochs(dates, self.timezone, minute=30)
+        elevation, azimuth = sun_position_batch(epochs, self.latitude, self.longitude)
+        return events, elevation, azimuth
 
     def _calculate_clear_sky_solar_radiation(self, elevation_deg: float, day_of_year: int) -> float:
         """Calculate clear sky solar radiation using simplified model. @zara"""
@@ -323,121 +241,142 @@ class AstronomyCache:
 
         return max(0.0, poa_total)
 
-    async def build_cache_for_date(
-        self, target_date: date, system_capacity_kwp: float
-    ) -> bool:
-        """Build astronomy cache for a specific date and save to DB. @zara"""
-        if not all([self.latitude, self.longitude, self.timezone]):
-            _LOGGER.error("Astronomy Cache not initialized with location")
-            return False
+    def _clear_sky_batch(self, elevation: np.ndarray, day_of_year: np.ndarray) -> np.ndarray:
+        """Vectorized _calculate_clear_sky_solar_radiation over (days, 24). @zara"""
+        daylight = elevation > 0
+        safe_elev = np.where(daylight, elevation, 1.0)
+        elevation_rad = np.radians(safe_elev)
+        distance_factor = 1 + 0.033 * np.cos(2 * np.pi * day_of_year / 365)
+        air_mass = 1 / (np.sin(elevation_rad) + 0.50572 * (safe_elev + 6.07995) ** -1.6364)
+        transmission = 0.7 ** (air_mass**0.678)
+        radiation = 1367 * distance_factor[:, None] * np.sin(elevation_rad) * transmission
+        return np.where(daylight, np.maximum(radiation, 0.0), 0.0)
 
-        def _build_sync():
-            try:
-                sunrise, sunset, solar_noon = self._calculate_sunrise_sunset(
-                    target_date, self.latitude, self.longitude, self.timezone
-                )
-
-                if not sunrise or not sunset or not solar_noon:
-                    _LOGGER.warning(f"Could not calculate sun times for {target_date}")
-                    return None
-
-                daylight_hours = (sunset - sunrise).total_seconds() / 3600.0
-                day_of_year = target_date.timetuple().tm_yday
-
-                hourly_data = []
-                for hour in range(24):
-                    hour_time = datetime.combine(target_date, datetime.min.time())
-                    hour_time = hour_time.replace(hour=hour, minute=30, tzinfo=self.timezone)
-
-                    elevation, azimuth = self._calculate_sun_position(
-                        hour_time, self.latitude, self.longitude
-                    )
-
-                    clear_sky_sr = self._calculate_clear_sky_solar_radiation(elevation, day_of_year)
-
-                    group_results = None
-                    if self._panel_groups:
-                        total_theoretical, group_results = self._calculate_theoretical_pv_per_group(
-                            clear_sky_sr, elevation, azimuth
-                        )
-                        theoretical_pv = total_theoretical
-                    else:
-                        theoretical_pv = self._calculate_theoretical_pv_output(
-                            clear_sky_sr, system_capacity_kwp
-                        )
-
-                    hourly_data.append({
-                        "hour": hour,
-                        "elevation": elevation,
-                        "azimuth": azimuth,
-                        "clear_sky_radiation": clear_sky_sr,
-                        "theoretical_max": theoretical_pv,
-                        "sunrise": sunrise,
-                        "sunset": sunset,
-                        "solar_noon": solar_noon,
-                        "daylight_hours": daylight_hours,
-                        "group_results": group_results,  # Per-group POA for DB @zara
-                    })
-
-                return hourly_data
+    def _panel_group_batch(
+        self,
+        ghi: np.ndarray,
+        elevation: np.ndarray,
+        azimuth: np.ndarray,
+        efficiency: float = 0.95,
+        albedo: float = 0.2,
+    ) -> Tuple[List[Tuple[str, float, float, float]], np.ndarray, np.ndarray, np.ndarray]:
+        """Vectorized per-group AOI/POA/theoretical kWh, shaped (groups, days, 24). @zara"""
+        groups = []
+        for idx, group in enumerate(self._panel_groups):
+            power_kwp = float(group.get("power_wp", 0)) / 1000.0
+            if power_kwp <= 0:
+                continue
+            groups.append((
+                group.get("name", f"Gruppe {idx + 1}"),
+                power_kwp,
+                float(group.get("azimuth", 180)),
+                float(group.get("tilt", 30)),
+            ))
 
-            except Exception as e:
-                _LOGGER.error(f"Error building cache for {target_date}: {e}", exc_info=True)
-                return None
+        shape = (len(groups),) + elevation.shape
+        if not groups:
+            empty = np.zeros(shape)
+            return groups, empty, empty, empty
+
+        power = np.array([g[1] for g in groups])[:, None, None]
+        panel_azimuth = np.array([g[2] for g in groups])[:, None, None]
+        tilt_rad = np.radians(np.array([g[3] for g in groups]))[:, None, None]
+
+        zenith_rad = np.radians(90.0 - elevation)[None]
+        cos_aoi = np.cos(zenith_rad) * np.cos(tilt_rad) + np.sin(zenith_rad) * np.sin(
+            tilt_rad
+        ) * np.cos(np.radians(azimuth[None] - panel_azimuth))
+        aoi = np.degrees(np.arccos(np.clip(cos_aoi, -1.0, 1.0)))
+
+        sin_elev = np.sin(np.radians(elevation))[None]
+        ghi_g = ghi[None]
+        dni = np.minimum(ghi_g / np.maximum(0.01, sin_elev) * 0.85, 1000.0)
+        dhi = np.maximum(ghi_g * 0.15, ghi_g * 0.1)
+        poa_beam = np.where(aoi < 90, dni * np.cos(np.radians(aoi)), 0.0)
+        poa_diffuse = dhi * (1 + np.cos(tilt_rad)) / 2
+        poa_ground = ghi_g * albedo * (1 - np.cos(tilt_rad)) / 2
+        lit = (ghi_g > 0) & (elevation[None] > 0)
+        poa = np.where(lit, np.maximum(poa_beam + poa_diffuse + poa_ground, 0.0), 0.0)
+
+        theoretical = power * (poa / 1000.0) * efficiency
+        return groups, aoi, poa, theoretical
+
+    def _build_range_sync(
+        self, dates: List[date], system_capacity_kwp: float
+    ) -> Tuple[List[tuple], List[tuple], List[date]]:
+        """Compute every day/hour/panel-group cell of a date range in one pass. @zara
+
+        Returns (hourly_rows, group_rows, failed_dates) ready for executemany.
+        """
+        events, elevation, azimuth = self._calculate_solar_days(dates)
+        day_of_year = np.array([d.timetuple().tm_yday for d in dates], dtype=np.float64)
+        clear_sky = self._clear_sky_batch(elevation, day_of_year)
+
+        groups: List[Tuple[str, float, float, float]] = []
+        if self._panel_groups:
+            groups, aoi, poa, group_kwh = self._panel_group_batch(clear_sky, elevation, azimuth)
+            theoretical = np.where(elevation > 0, group_kwh.sum(axis=0), 0.0)
+        else:
+            theoretical = np.maximum(system_capacity_kwp * (clear_sky / 1000.0) * 0.95, 0.0)
 
-        loop = asyncio.get_running_loop()
-        result = await loop.run_in_executor(None, _build_sync)
+        hourly_rows: List[tuple] = []
+        group_rows: List[tuple] = []
+        failed_dates: List[date] = []
 
-        if not result:
-            return False
+        elevation_l = elevation.tolist()
+        azimuth_l = azimuth.tolist()
+        clear_sky_l = clear_sky.tolist()
+        theoretical_l = theoretical.tolist()
 
-        # Batch-Write: Alle 24 Stunden in einem einzigen DB-Commit
-        batch_params = [
-            (target_date, hour_data["hour"], hour_data["elevation"],
-             hour_data["azimuth"], hour_data["clear_sky_radiation"],
-             hour_data["theoretical_max"], hour_data["sunrise"],
-             hour_data["sunset"], hour_data["solar_noon"],
-             hour_data["daylight_hours"])
-            for hour_data in result
-        ]
-
-        await self.db.executemany(
-            """INSERT INTO astronomy_cache
-               (cache_date, hour, sun_elevation_deg, sun_azimuth_deg,
-                clear_sky_radiation_wm2, theoretical_max_kwh,
-                sunrise, sunset, solar_noon, daylight_hours)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-               ON CONFLICT(cache_date, hour) DO UPDATE SET
-                   sun_elevation_deg = excluded.sun_elevation_deg,
-                   sun_azimuth_deg = excluded.sun_azimuth_deg,
-                   clear_sky_radiation_wm2 = excluded.clear_sky_radiation_wm2,
-                   theoretical_max_kwh = excluded.theoretical_max_kwh,
-                   sunrise = excluded.sunrise,
-                   sunset = excluded.sunset,
-                   solar_noon = excluded.solar_noon,
-                   daylight_hours = excluded.daylight_hours""",
-            batch_params
-        )
+        for d_idx, (target_date, day_events) in enumerate(zip(dates, events)):
+            if not day_events.valid:
+                _LOGGER.warning(f"Could not calculate sun times for {target_date}")
+                failed_dates.append(target_date)
+                continue
 
-        # Save per-panel-group POA data @zara V16.1
-        group_params = []
-        for hour_data in result:
-            group_results = hour_data.get("group_results")
-            if group_results:
-                for gr in group_results:
-                    group_params.append((
-                        target_date,
-                        hour_data["hour"],
-                        gr.name,
-                        gr.power_kwp,
-                        gr.azimuth_deg,
-                        gr.tilt_deg,
-                        gr.theoretical_kwh,
-                        gr.poa_wm2,
-                        gr.aoi_deg,
+            daylight_hours = day_events.daylight_hours
+            for hour in range(24):
+                hourly_rows.append((
+                    target_date, hour, elevation_l[d_idx][hour], azimuth_l[d_idx][hour],
+                    clear_sky_l[d_idx][hour], theoretical_l[d_idx][hour],
+                    day_events.sunrise, day_events.sunset, day_events.solar_noon,
+                    daylight_hours,
+                ))
+
+            for g_idx, (name, power_kwp, group_azimuth, tilt) in enumerate(groups):
+                for hour in np.flatnonzero(elevation[d_idx] > 0).tolist():
+                    group_rows.append((
+                        target_date, hour, name, power_kwp, group_azimuth, tilt,
+                        float(group_kwh[g_idx, d_idx, hour]),
+                        float(poa[g_idx, d_idx, hour]),
+                        float(aoi[g_idx, d_idx, hour]),
                     ))
 
-        if group_params:
+        return hourly_rows, group_rows, failed_dates
+
+    async def _write_rows(self, hourly_rows: List[tuple], group_rows: List[tuple]) -> None:
+        """Write hourly and panel-group rows with one executemany per table. @zara"""
+        if hourly_rows:
+            await self.db.executemany(
+                """INSERT INTO astronomy_cache
+                   (cache_date, hour, sun_elevation_deg, sun_azimuth_deg,
+                    clear_sky_radiation_wm2, theoretical_max_kwh,
+                    sunrise, sunset, solar_noon, daylight_hours)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(cache_date, hour) DO UPDATE SET
+                       sun_elevation_deg = excluded.sun_elevation_deg,
+                       sun_azimuth_deg = excluded.sun_azimuth_deg,
+                       clear_sky_radiation_wm2 = excluded.clear_sky_radiation_wm2,
+                       theoretical_max_kwh = excluded.theoretical_max_kwh,
+                       sunrise = excluded.sunrise,
+                       sunset = excluded.sunset,
+                       solar_noon = excluded.solar_noon,
+                       daylight_hours = excluded.daylight_hours""",
+                hourly_rows
+            )
+
+        # Save per-panel-group POA data @zara V16.1
+        if group_rows:
             await self.db.executemany(
                 """INSERT INTO astronomy_cache_panel_groups
                    (cache_date, hour, group_name, power_kwp, azimuth_deg, tilt_deg,
@@ -450,9 +389,32 @@ class AstronomyCache:
                        theoretical_kwh = excluded.theoretical_kwh,
                        poa_wm2 = excluded.poa_wm2,
                        aoi_deg = excluded.aoi_deg""",
-                group_params
+                group_rows
             )
 
+    async def build_cache_for_date(
+        self, target_date: date, system_capacity_kwp: float
+    ) -> bool:
+        """Build astronomy cache for a specific date and save to DB. @zara"""
+        if not all([self.latitude, self.longitude, self.timezone]):
+            _LOGGER.error("Astronomy Cache not initialized with location")
+            return False
+
+        def _build_sync():
+            try:
+                return self._build_range_sync([target_date], system_capacity_kwp)
+            except Exception as e:
+                _LOGGER.error(f"Error building cache for {target_date}: {e}", exc_info=True)
+                return None
+
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(None, _build_sync)
+
+        if not result or not result[0]:
+            return False
+
+        hourly_rows, group_rows, _ = result
+        await self._write_rows(hourly_rows, group_rows)
         return True
 
     async def rebuild_cache(
@@ -461,8 +423,18 @@ class AstronomyCache:
         start_date: Optional[date] = None,
         days_back: int = 30,
         days_ahead: int = 7,
+        progress_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None,
     ) -> Dict:
-        """Rebuild entire astronomy cache in database. @zara"""
+        """Rebuild entire astronomy cache in database in a single vectorized pass. @zara
+
+        All days are computed in one executor job and written with one
+        executemany per table. progress_callback(stage, info) is invoked after
+        the compute and write stages.
+        """
+        if not all([self.latitude, self.longitude, self.timezone]):
+            _LOGGER.error("Astronomy Cache not initialized with location")
+            return {"total_days": 0, "success_count": 0, "error_count": 0}
+
         if start_date is None:
             start_date = datetime.now(self.timezone).date()
 
@@ -471,6 +443,16 @@ class AstronomyCache:
             f"{days_ahead} days ahead from {start_date}"
         )
 
+        def _report(stage: str, info: Dict[str, Any]) -> None:
+            _LOGGER.debug(f"Astronomy cache rebuild [{stage}]: {info}")
+            if progress_callback:
+                try:
+                    progress_callback(stage, info)
+                except Exception as cb_err:
+                    _LOGGER.debug(f"Astronomy progress callback failed: {cb_err}")
+
+        started = time.perf_counter()
+
         await self.db.execute(
             """INSERT INTO astronomy_system_info
                (id, latitude, longitude, elevation_m, timezone, installed_capacity_kwp)
@@ -487,31 +469,52 @@ class AstronomyCache:
         )
 
         start_calc = start_date - timedelta(days=days_back)
-        end_calc = start_date + timedelta(days=days_ahead)
+        total_days = (days_back + days_ahead) + 1
+        dates_to_process = [start_calc + timedelta(days=i) for i in range(total_days)]
 
-        dates_to_process = []
-        current_date = start_calc
-        while current_date <= end_calc:
-            dates_to_process.append(current_date)
-            current_date += timedelta(days=1)
+        _LOGGER.info(f"Processing {len(dates_to_process)} days in one vectorized pass...")
 
-        _LOGGER.info(f"Processing {len(dates_to_process)} days in parallel...")
+        def _timed_build():
+            t0 = time.perf_counter()
+            rows = self._build_range_sync(dates_to_process, system_capacity_kwp)
+            return rows, time.perf_counter() - t0
 
-        results = await asyncio.gather(
-            *[self.build_cache_for_date(d, system_capacity_kwp) for d in dates_to_process],
-            return_exceptions=True
+        loop = asyncio.get_running_loop()
+        (hourly_rows, group_rows, failed_dates), compute_s = await loop.run_in_executor(
+            None, _timed_build
         )
 
-        success_count = sum(1 for r in results if r is True)
-        error_count = len(results) - success_count
+        success_count = len(dates_to_process) - len(failed_dates)
+        _report("computed", {
+            "days": len(dates_to_process),
+            "hourly_rows": len(hourly_rows),
+            "group_rows": len(group_rows),
+            "compute_ms": round(compute_s * 1000, 1),
+        })
 
-        _LOGGER.info(f"Astronomy cache: {success_count}/{len(dates_to_process)} days processed")
+        write_started = time.perf_counter()
+        await self._write_rows(hourly_rows, group_rows)
+        write_s = time.perf_counter() - write_started
 
-        return {
+        result = {
             "total_days": len(dates_to_process),
             "success_count": success_count,
-            "error_count": error_count,
+            "error_count": len(failed_dates),
+            "hourly_rows": len(hourly_rows),
+            "group_rows": len(group_rows),
+            "compute_ms": round(compute_s * 1000, 1),
+            "write_ms": round(write_s * 1000, 1),
+            "total_ms": round((time.perf_counter() - started) * 1000, 1),
         }
+        _report("written", result)
+
+        _LOGGER.info(
+            f"Astronomy cache: {success_count}/{len(dates_to_process)} days processed "
+            f"in {result['total_ms']} ms (compute {result['compute_ms']} ms, "
+            f"write {result['write_ms']} ms)"
+        )
+
+        return result
 
     async def get_day_data(self, target_date: date) -> Optional[Dict]:
         """Get astronomy data for a specific date from database. @zara"""
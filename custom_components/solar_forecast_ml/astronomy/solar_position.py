@@ -0,0 +1,206 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast ML DB-Version
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""
+Vectorized Solar Position Engine for Solar Forecast ML V16.2.0.
+Computes sun elevation/azimuth for whole timestamp arrays in one NumPy call
+and finds sunrise, sunset and solar noon per day without minute-by-minute scans.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+# Apparent sunrise/sunset elevation (refraction + solar disc radius) @zara
+HORIZON_ELEVATION_DEG = -0.833
+
+_UNIX_EPOCH_JD = 2440587.5
+_J2000_JD = 2451545.0
+_SIDEREAL_DEG_PER_DAY = 360.98564736629
+_BISECTION_STEPS = 20  # 12h / 2^20 < 0.05 s @zara
+_NOON_ITERATIONS = 3
+
+
+@dataclass
+class SunEvents:
+    """Sunrise, sunset and solar noon for one local date. @zara"""
+    target_date: date
+    sunrise: Optional[datetime]
+    sunset: Optional[datetime]
+    solar_noon: Optional[datetime]
+
+    @property
+    def valid(self) -> bool:
+        return bool(self.sunrise and self.sunset and self.solar_noon)
+
+    @property
+    def daylight_hours(self) -> float:
+        if not self.valid:
+            return 0.0
+        return (self.sunset - self.sunrise).total_seconds() / 3600.0
+
+
+def _solar_coordinates(epoch: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (right ascension deg, declination rad, GMST deg) for epoch seconds. @zara"""
+    jd = epoch / 86400.0 + _UNIX_EPOCH_JD
+    t = (jd - _J2000_JD) / 36525.0
+
+    l0 = np.mod(280.46646 + 36000.76983 * t + 0.0003032 * t * t, 360.0)
+    m_rad = np.radians(np.mod(357.52911 + 35999.05029 * t - 0.0001537 * t * t, 360.0))
+
+    c = (
+        (1.914602 - 0.004817 * t - 0.000014 * t * t) * np.sin(m_rad)
+        + (0.019993 - 0.000101 * t) * np.sin(2 * m_rad)
+        + 0.000289 * np.sin(3 * m_rad)
+    )
+
+    true_long_rad = np.radians(np.mod(l0 + c, 360.0))
+    epsilon_rad = np.radians(23.439291 - 0.0130042 * t)
+
+    alpha = np.degrees(
+        np.arctan2(np.cos(epsilon_rad) * np.sin(true_long_rad), np.cos(true_long_rad))
+    )
+    delta_rad = np.arcsin(np.sin(epsilon_rad) * np.sin(true_long_rad))
+    gmst = np.mod(280.46061837 + _SIDEREAL_DEG_PER_DAY * (jd - _J2000_JD), 360.0)
+
+    return alpha, delta_rad, gmst
+
+
+def _hour_angle(epoch: np.ndarray, longitude: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (hour angle deg in [-180, 180), declination rad). @zara"""
+    alpha, delta_rad, gmst = _solar_coordinates(epoch)
+    hour_angle = np.mod(gmst + longitude - alpha + 180.0, 360.0) - 180.0
+    return hour_angle, delta_rad
+
+
+def _elevation_from(
+    hour_angle: np.ndarray, delta_rad: np.ndarray, latitude: float
+) -> np.ndarray:
+    lat_rad = np.radians(latitude)
+    sin_elevation = np.sin(lat_rad) * np.sin(delta_rad) + np.cos(lat_rad) * np.cos(
+        delta_rad
+    ) * np.cos(np.radians(hour_angle))
+    return np.clip(sin_elevation, -1.0, 1.0)
+
+
+def sun_position_batch(
+    epoch: Sequence[float], latitude: float, longitude: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate sun elevation and azimuth (degrees) for an array of UTC epoch seconds. @zara"""
+    epoch = np.asarray(epoch, dtype=np.float64)
+    hour_angle, delta_rad = _hour_angle(epoch, longitude)
+    sin_elevation = _elevation_from(hour_angle, delta_rad, latitude)
+    elevation_rad = np.arcsin(sin_elevation)
+
+    lat_rad = np.radians(latitude)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cos_azimuth = (np.sin(delta_rad) - np.sin(lat_rad) * sin_elevation) / (
+            np.cos(lat_rad) * np.cos(elevation_rad)
+        )
+    cos_azimuth = np.clip(np.nan_to_num(cos_azimuth, nan=1.0), -1.0, 1.0)
+    azimuth = np.degrees(np.arccos(cos_azimuth))
+    azimuth = np.where(hour_angle > 0, 360.0 - azimuth, azimuth)
+
+    return np.degrees(elevation_rad), azimuth
+
+
+def sun_elevation_batch(
+    epoch: Sequence[float], latitude: float, longitude: float
+) -> np.ndarray:
+    """Calculate sun elevation only (degrees), skipping the azimuth branch. @zara"""
+    hour_angle, delta_rad = _hour_angle(np.asarray(epoch, dtype=np.float64), longitude)
+    return np.degrees(np.arcsin(_elevation_from(hour_angle, delta_rad, latitude)))
+
+
+def local_epoch(target_date: date, hour: int, minute: int, timezone: ZoneInfo) -> float:
+    """Epoch seconds of a local wall-clock time (same DST semantics as replace(tzinfo=)). @zara"""
+    return datetime.combine(target_date, time(hour, minute), tzinfo=timezone).timestamp()
+
+
+def hourly_epochs(
+    dates: Sequence[date], timezone: ZoneInfo, minute: int = 30
+) -> np.ndarray:
+    """Build a (days, 24) array of epoch seconds for HH:minute local of each date. @zara"""
+    return np.array(
+        [[local_epoch(d, hour, minute, timezone) for hour in range(24)] for d in dates],
+        dtype=np.float64,
+    ).reshape(len(dates), 24)
+
+
+def _bisect_crossing(
+    low: np.ndarray,
+    high: np.ndarray,
+    rising: bool,
+    latitude: float,
+    longitude: float,
+) -> np.ndarray:
+    """Vectorized bisection for the horizon crossing inside [low, high]. @zara"""
+    low = low.copy()
+    high = high.copy()
+    for _ in range(_BISECTION_STEPS):
+        mid = (low + high) * 0.5
+        above = sun_elevation_batch(mid, latitude, longitude) > HORIZON_ELEVATION_DEG
+        move_high = above if rising else ~above
+        high = np.where(move_high, mid, high)
+        low = np.where(move_high, low, mid)
+    return high
+
+
+def sun_events_batch(
+    dates: Sequence[date], latitude: float, longitude: float, timezone: ZoneInfo
+) -> List[SunEvents]:
+    """Find sunrise, sunset and solar noon for many local dates at once. @zara
+
+    Solar noon is solved analytically by driving the hour angle to zero; sunrise
+    and sunset use a vectorized bisection between local midnight and noon.
+    Polar day/night yields None for the missing events.
+    """
+    dates = list(dates)
+    if not dates:
+        return []
+
+    day_start = np.array([local_epoch(d, 0, 0, timezone) for d in dates], dtype=np.float64)
+    day_end = np.array(
+        [local_epoch(d + timedelta(days=1), 0, 0, timezone) for d in dates], dtype=np.float64
+    )
+    noon = np.array([local_epoch(d, 12, 0, timezone) for d in dates], dtype=np.float64)
+
+    for _ in range(_NOON_ITERATIONS):
+        hour_angle, _ = _hour_angle(noon, longitude)
+        noon = noon - hour_angle / _SIDEREAL_DEG_PER_DAY * 86400.0
+
+    elev_start = sun_elevation_batch(day_start, latitude, longitude)
+    elev_noon = sun_elevation_batch(noon, latitude, longitude)
+    elev_end = sun_elevation_batch(day_end, latitude, longitude)
+
+    noon_in_day = (noon >= day_start) & (noon < day_end)
+    sun_up_at_noon = noon_in_day & (elev_noon > HORIZON_ELEVATION_DEG)
+    has_sunrise = sun_up_at_noon & (elev_start <= HORIZON_ELEVATION_DEG)
+    has_sunset = sun_up_at_noon & (elev_end <= HORIZON_ELEVATION_DEG)
+
+    sunrise = _bisect_crossing(day_start, noon, True, latitude, longitude)
+    sunset = _bisect_crossing(noon, day_end, False, latitude, longitude)
+
+    def _to_local(epoch: float, ok: bool) -> Optional[datetime]:
+        if not ok:
+            return None
+        return datetime.fromtimestamp(round(float(epoch)), tz=timezone)
+
+    return [
+        SunEvents(
+            target_date=d,
+            sunrise=_to_local(sunrise[i], has_sunrise[i]),
+            sunset=_to_local(sunset[i], has_sunset[i]),
+            solar_noon=_to_local(noon[i], noon_in_day[i]),
+        )
+        for i, d in enumerate(dates)
+    ]
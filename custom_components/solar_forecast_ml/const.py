@@ -166,6 +166,12 @@ MIN_TRAINING_DATA_POINTS = 50
 BACKUP_RETENTION_DAYS = 30
 MAX_BACKUP_FILES = 10
 
+# Database backups @zara
+BACKUP_PAGES_PER_STEP = 256
+BACKUP_STEP_SLEEP_SECONDS = 0.005
+BACKUP_SEGMENT_PAGES = 64
+BACKUP_COMPRESSION_LEVEL = 6
+
 # ML Model @zara
 ML_MODEL_VERSION = "1.0"
 MODEL_ACCURACY_THRESHOLD = 0.75
@@ -232,6 +238,9 @@ SERVICE_SEND_DAILY_BRIEFING = "send_daily_briefing"
 # Shadow Detection Services @zara V16.2
 SERVICE_BACKFILL_SHADOW_DETECTION = "backfill_shadow_detection"
 
+# Diagnostics Services @zara
+SERVICE_PROFILE_DATABASE_QUERIES = "profile_database_queries"
+
 
 # Icons @zara
 ICON_SOLAR = "mdi:solar-power"
@@ -254,6 +263,17 @@ LOGGER_NAME = f"custom_components.{DOMAIN}"
 COORDINATOR_UPDATE_INTERVAL = timedelta(minutes=60)
 LEARNING_UPDATE_INTERVAL = timedelta(hours=1)
 CLEANUP_INTERVAL = timedelta(days=1)
+WRITE_BUFFER_FLUSH_INTERVAL = timedelta(seconds=30)
+
+# Coordinator update profiling @zara
+UPDATE_PROFILE_HISTORY = 50
+
+# Query profiling (opt-in via service) @zara
+QUERY_PROFILE_MAX_STATEMENTS = 500
+QUERY_PROFILE_TOP_N = 10
+
+# Weather request coalescing @zara
+SINGLE_FLIGHT_FRESH_SECONDS = 60
 
 # Threading @zara
 MAX_CONCURRENT_OPERATIONS = 3
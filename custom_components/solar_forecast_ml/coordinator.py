@@ -41,12 +41,24 @@ from .const import (
     # Coordinator Data Keys
     DATA_KEY_FORECAST_TODAY,
     DATA_KEY_EXTERNAL_SENSORS,
+    DATA_KEY_STATISTICS,
     EXT_SENSOR_SOLAR_YIELD_TODAY,
+    STATS_CURRENT_MONTH,
+    STATS_YIELD_KWH,
+)
+from .core.core_coordinator_snapshot import (
+    DAILY_FORECAST_DAY_AFTER,
+    DAILY_FORECAST_TOMORROW,
+    CoordinatorSnapshot,
+    SnapshotCounters,
 )
 from .core.core_exceptions import MLModelException, SolarForecastMLException, WeatherAPIException
 from .core.core_helpers import SafeDateTimeUtil as dt_util
 from .core.core_startup_data_resolver import StartupDataResolver, StartupData
+from .core.core_single_flight import SingleFlight
+from .core.core_update_profiler import UpdateProfiler
 from .data.data_manager import DataManager
+from .data.data_write_buffer import async_stop_write_buffer, get_write_buffer
 from .forecast.forecast_orchestrator import ForecastOrchestrator
 from .forecast.forecast_weather import WeatherService
 from .forecast.forecast_weather_calculator import WeatherCalculator
@@ -164,6 +176,17 @@ class SolarForecastMLCoordinator(DataUpdateCoordinator):
         self._startup_sensors_ready: bool = False
         self._hourly_predictions_cache: Optional[Dict[str, Any]] = None
 
+        # Sensor snapshot, republished on every listener notification @zara
+        self.snapshot: Optional[CoordinatorSnapshot] = None
+        self.snapshot_counters = SnapshotCounters()
+        self._snapshot_daily_forecasts: Dict[str, float] = {}
+
+        # Per-stage timings of the last updates (diagnostic sensor, system report) @zara
+        self.update_profiler = UpdateProfiler()
+
+        # Shared by recovery, services, morning routine and scheduled refreshes @zara
+        self.weather_requests = SingleFlight()
+
         # Sensor values @zara
         self.next_hour_pred: float = 0.0
         self.peak_production_time_today: str = "Calculating..."
@@ -422,6 +445,13 @@ class SolarForecastMLCoordinator(DataUpdateCoordinator):
                     config_entry=self.entry,
                     coordinator=self,
                 )
+                weather_location = (round(latitude, 3), round(longitude, 3))
+                self.weather_requests.wrap(
+                    self.weather_pipeline_manager,
+                    "update_weather_cache",
+                    "open_meteo",
+                    weather_location,
+                )
 
                 from .astronomy.astronomy_cache_manager import get_cache_manager
                 cache_manager = get_cache_manager(db_manager=self.data_manager._db_manager)
@@ -460,6 +490,16 @@ class SolarForecastMLCoordinator(DataUpdateCoordinator):
                         error_handler=self.error_handler,
                     )
                     await self.weather_service.initialize()
+                    self.weather_requests.wrap(
+                        self.weather_service, "get_hourly_forecast", "open_meteo", weather_location
+                    )
+                    self.weather_requests.wrap(
+                        self.weather_service,
+                        "force_update",
+                        "open_meteo",
+                        weather_location,
+                        use_fresh=False,
+                    )
 
                     async def _start_pipeline_background():
                         try:
@@ -578,6 +618,7 @@ class SolarForecastMLCoordinator(DataUpdateCoordinator):
                     _LOGGER.warning(f"Error removing weekly retraining listener: {e}")
 
             if self.data_manager:
+                await async_stop_write_buffer(self.hass, self.data_manager._db_manager)
                 await self.data_manager.cleanup()
 
         except Exception as e:
@@ -728,25 +769,26 @@ class SolarForecastMLCoordinator(DataUpdateCoordinator):
         self._peak_power_today = 0.0
         self._peak_time_today = None
 
-        # Load today's existing peak from production_time_state @zara
+        # Load today's peak and the all-time record once; both live in memory afterwards @zara
+        peak_record_w: Optional[float] = None
         try:
             today = dt_util.now().date().isoformat()
             row = await self.data_manager._db_manager.fetchone(
-                """SELECT peak_power_w, peak_power_time
+                """SELECT date, peak_power_w, peak_power_time, peak_record_w
                    FROM production_time_state
-                   WHERE id = 1 AND date = ?""",
-                (today,)
+                   WHERE id = 1"""
             )
-            if row and row[0]:
-                self._peak_power_today = float(row[0])
-                self._peak_time_today = str(row[1]) if row[1] else None
+            if row:
+                if str(row[0]) == today and row[1]:
+                    self._peak_power_today = float(row[1])
+                    self._peak_time_today = str(row[2]) if row[2] else None
+                if row[3] is not None:
+                    peak_record_w = float(row[3])
         except Exception as e:
             _LOGGER.debug(f"Could not load today's peak: {e}")
 
-        last_write_time = None
-
         async def power_state_changed(event):
-            nonlocal last_write_time
+            nonlocal peak_record_w
 
             new_state = event.data.get("new_state")
             if not new_state or new_state.state in [None, "unavailable", "unknown"]:
@@ -754,40 +796,43 @@ class SolarForecastMLCoordinator(DataUpdateCoordinator):
 
             try:
                 power_w = float(new_state.state)
+            except (ValueError, TypeError):
+                return
 
-                if power_w > self._peak_power_today:
-                    self._peak_power_today = power_w
-                    now = dt_util.now()
-                    self._peak_time_today = now.strftime("%H:%M")
-
-                    if last_write_time is None or (now - last_write_time).total_seconds() > 60:
-                        today = now.date().isoformat()
-                        time_str = now.strftime("%H:%M")
-
-                        # Save today's peak to production_time_state @zara
-                        await self.data_manager._db_manager.execute(
-                            """UPDATE production_time_state
-                               SET peak_power_w = ?, peak_power_time = ?,
-                                   date = ?, last_updated = ?
-                               WHERE id = 1""",
-                            (power_w, time_str, today, now.isoformat())
-                        )
-
-                        # Check and update all-time record @zara
-                        all_time_peak = await self.data_manager.get_all_time_peak()
-                        if all_time_peak is None or power_w > all_time_peak:
-                            await self.data_manager._db_manager.execute(
-                                """UPDATE production_time_state
-                                   SET peak_record_w = ?, peak_record_date = ?, peak_record_time = ?
-                                   WHERE id = 1""",
-                                (power_w, today, time_str)
-                            )
-                            _LOGGER.info("New all-time peak: %.1f W at %s", power_w, time_str)
+            if power_w <= self._peak_power_today:
+                return
 
-                        last_write_time = now
+            now = dt_util.now()
+            today = now.date().isoformat()
+            time_str = now.strftime("%H:%M")
+            self._peak_power_today = power_w
+            self._peak_time_today = time_str
+
+            # Stage instead of commit; the buffer keeps only the latest peak per flush @zara
+            write_buffer = get_write_buffer(self.hass, self.data_manager._db_manager)
+            write_buffer.stage(
+                "production_time_state",
+                "peak_today",
+                """UPDATE production_time_state
+                   SET peak_power_w = ?, peak_power_time = ?,
+                       date = ?, last_updated = ?
+                   WHERE id = 1""",
+                (power_w, time_str, today, now.isoformat()),
+                value={"power_w": power_w, "time": time_str, "date": today},
+            )
 
-            except (ValueError, TypeError):
-                pass
+            if peak_record_w is None or power_w > peak_record_w:
+                peak_record_w = power_w
+                write_buffer.stage(
+                    "production_time_state",
+                    "peak_record",
+                    """UPDATE production_time_state
+                       SET peak_record_w = ?, peak_record_date = ?, peak_record_time = ?
+                       WHERE id = 1""",
+                    (power_w, today, time_str),
+                    value={"power_w": power_w, "date": today, "time": time_str},
+                )
+                _LOGGER.debug("New all-time peak: %.1f W at %s", power_w, time_str)
 
         self._unsub_power_peak_listener = async_track_state_change_event(
             self.hass, [self.power_entity], power_state_changed
@@ -795,44 +840,66 @@ class SolarForecastMLCoordinator(DataUpdateCoordinator):
 
     async def _async_update_data(self):
         """Fetch data from API endpoint. @zara"""
+        profiler = self.update_profiler
         try:
-            if not self._services_initialized:
-                services_ok = await self._initialize_services()
-                if not services_ok:
-                    raise UpdateFailed("Failed to initialize services")
+            with profiler.update():
+                with profiler.stage("initialize_services"):
+                    if not self._services_initialized:
+                        services_ok = await self._initialize_services()
+                        if not services_ok:
+                            raise UpdateFailed("Failed to initialize services")
 
-            await self._initialize_forecast_orchestrator()
+                    await self._initialize_forecast_orchestrator()
 
-            from .core.core_coordinator_update_helpers import CoordinatorUpdateHelpers
+                # After initialization, which may replace the DatabaseManager @zara
+                profiler.instrument(self.data_manager._db_manager)
 
-            helpers = CoordinatorUpdateHelpers(self, self.data_manager._db_manager)
+                from .core.core_coordinator_update_helpers import CoordinatorUpdateHelpers
 
-            await helpers.handle_startup_recovery()
+                helpers = CoordinatorUpdateHelpers(self, self.data_manager._db_manager)
 
-            current_weather, hourly_forecast = await helpers.fetch_weather_data()
+                with profiler.stage("startup_recovery"):
+                    await helpers.handle_startup_recovery()
 
-            external_sensors = self.sensor_collector.collect_all_sensor_data_dict()
+                with profiler.stage("fetch_weather"):
+                    current_weather, hourly_forecast = await helpers.fetch_weather_data()
 
-            forecast = await helpers.generate_forecast(
-                current_weather, hourly_forecast, external_sensors
-            )
+                with profiler.stage("collect_sensors"):
+                    external_sensors = self.sensor_collector.collect_all_sensor_data_dict()
 
-            result = await helpers.build_coordinator_result(
-                forecast, current_weather, external_sensors
-            )
+                with profiler.stage("generate_forecast"):
+                    forecast = await helpers.generate_forecast(
+                        current_weather, hourly_forecast, external_sensors
+                    )
+
+                with profiler.stage("build_result"):
+                    result = await helpers.build_coordinator_result(
+                        forecast, current_weather, external_sensors
+                    )
 
-            await self._update_sensor_properties(result)
+                with profiler.stage("update_sensor_properties"):
+                    await self._update_sensor_properties(result)
 
-            await helpers.save_forecasts(forecast, forecast.get("hourly", []))
+                with profiler.stage("save_forecasts"):
+                    await helpers.save_forecasts(forecast, forecast.get("hourly", []))
 
-            # Refresh hourly predictions cache after saving to DB @zara
-            await self._refresh_hourly_predictions_cache()
+                # Refresh hourly predictions cache after saving to DB @zara
+                with profiler.stage("refresh_caches"):
+                    await self._refresh_hourly_predictions_cache()
+                    await self._load_snapshot_daily_forecasts()
 
             self._last_update_success_time = dt_util.now()
 
             if not self._startup_sensors_ready:
                 self._startup_sensors_ready = True
 
+            _LOGGER.debug(
+                "Coordinator update took %.1f ms (%d DB queries, %.1f ms DB)",
+                profiler.last_profile.total_ms,
+                profiler.last_profile.db_queries,
+                profiler.last_profile.db_ms,
+            )
+
             return result
 
         except UpdateFailed:
@@ -898,16 +965,12 @@ class SolarForecastMLCoordinator(DataUpdateCoordinator):
             self.cloudiness_volatility = 0.0
             self._training_ready_count = 0
 
-        # Load average daily yield for current month from DB @zara
+        # Average daily yield for current month from the materialized statistics @zara
         try:
-            month_start = dt_util.now().date().replace(day=1).isoformat()
-            row = await self.data_manager._db_manager.fetchone(
-                """SELECT AVG(actual_total_kwh) FROM daily_summaries
-                   WHERE date >= ? AND actual_total_kwh IS NOT NULL""",
-                (month_start,)
-            )
-            if row and row[0] is not None:
-                self.avg_month_yield = round(float(row[0]), 2)
+            current_month = data.get(DATA_KEY_STATISTICS, {}).get(STATS_CURRENT_MONTH, {})
+            month_days = current_month.get("days")
+            if month_days:
+                self.avg_month_yield = round(current_month.get(STATS_YIELD_KWH, 0.0) / month_days, 2)
         except Exception as e:
             _LOGGER.debug(f"Could not load avg_month_yield: {e}")
 
@@ -930,6 +993,57 @@ class SolarForecastMLCoordinator(DataUpdateCoordinator):
         except Exception as e:
             _LOGGER.warning(f"Could not refresh hourly predictions cache: {e}")
 
+    async def _load_snapshot_daily_forecasts(self) -> None:
+        """Load tomorrow and day-after-tomorrow from daily_forecasts in one query. @zara"""
+        try:
+            now = dt_util.now()
+            rows = await self.data_manager._db_manager.fetchall(
+                """SELECT forecast_type, prediction_kwh FROM daily_forecasts
+                   WHERE (forecast_type = ? AND forecast_date = ?)
+                      OR (forecast_type = ? AND forecast_date = ?)""",
+                (
+                    DAILY_FORECAST_TOMORROW,
+                    (now + timedelta(days=1)).date().isoformat(),
+                    DAILY_FORECAST_DAY_AFTER,
+                    (now + timedelta(days=2)).date().isoformat(),
+                ),
+            )
+            self._snapshot_daily_forecasts = {
+                row[0]: round(float(row[1]), 2) for row in rows or [] if row[1] is not None
+            }
+        except Exception as e:
+            _LOGGER.warning(f"Could not load daily forecasts for sensor snapshot: {e}")
+
+    @callback
+    def publish_snapshot(self) -> CoordinatorSnapshot:
+        """Build and publish a new sensor snapshot from the current state. @zara"""
+        self.snapshot_counters.published += 1
+        self.snapshot = CoordinatorSnapshot.build(
+            version=self.snapshot_counters.published,
+            now=dt_util.now(),
+            data=self.data,
+            hourly_cache=self._hourly_predictions_cache,
+            daily_forecasts=self._snapshot_daily_forecasts,
+        )
+        return self.snapshot
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Publish a fresh snapshot, then notify all listeners. @zara"""
+        counters = self.snapshot_counters
+        writes, skipped = counters.state_writes, counters.skipped_writes
+        try:
+            self.publish_snapshot()
+        except Exception as e:
+            _LOGGER.warning(f"Could not build sensor snapshot: {e}")
+        super().async_update_listeners()
+        _LOGGER.debug(
+            "Snapshot %d published: %d state writes, %d unchanged sensors skipped",
+            counters.published,
+            counters.state_writes - writes,
+            counters.skipped_writes - skipped,
+        )
+
     @property
     def last_update_success_time(self) -> Optional[datetime]:
         """Return last successful update time. @zara"""
@@ -0,0 +1,201 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast ML DB-Version
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""
+Coordinator Snapshot for Solar Forecast ML V16.4.2.
+Immutable view of everything the coordinator-driven sensors display,
+published once per listener notification so sensors render synchronously.
+
+@zara
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from ..const import (
+    CACHE_BEST_HOUR_TODAY,
+    CACHE_PREDICTIONS,
+    DATA_KEY_EXPECTED_DAILY_PRODUCTION,
+    DATA_KEY_FORECAST_DAY_AFTER,
+    DATA_KEY_FORECAST_TOMORROW,
+    DATA_KEY_PEAK_TODAY,
+    DATA_KEY_PRODUCTION_TIME,
+    DATA_KEY_STATISTICS,
+    PEAK_TODAY_POWER_W,
+    PRED_PREDICTED_KWH,
+    PRED_PREDICTION_KWH,
+    PRED_TARGET_DATE,
+    PRED_TARGET_HOUR,
+    PROD_TIME_DURATION_SECONDS,
+    STATS_ALL_TIME_PEAK,
+    STATS_AVG_ACCURACY,
+    STATS_AVG_YIELD_KWH,
+    STATS_CONSUMPTION_KWH,
+    STATS_CURRENT_MONTH,
+    STATS_CURRENT_WEEK,
+    STATS_LAST_7_DAYS,
+    STATS_LAST_30_DAYS,
+    STATS_YIELD_KWH,
+)
+
+# daily_forecasts.forecast_type values loaded once per coordinator update @zara
+DAILY_FORECAST_TOMORROW = "tomorrow"
+DAILY_FORECAST_DAY_AFTER = "day_after_tomorrow"
+
+
+@dataclass
+class SnapshotCounters:
+    """Per-coordinator counters of snapshot publishing and sensor writes. @zara"""
+
+    published: int = 0
+    state_writes: int = 0
+    skipped_writes: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        """Get the counters as a dict. @zara"""
+        return {
+            "published": self.published,
+            "state_writes": self.state_writes,
+            "skipped_writes": self.skipped_writes,
+        }
+
+
+@dataclass(frozen=True)
+class CoordinatorSnapshot:
+    """Typed, read-only sensor view of one coordinator state. @zara
+
+    Built from coordinator.data, the hourly predictions cache and the
+    daily_forecasts rows loaded during the last update. Nothing in here
+    touches the database, so sensors can read it inside their listener
+    callback instead of scheduling a reload task each.
+    """
+
+    version: int
+    created_at: datetime
+    date: str
+    today_hourly_kwh: Tuple[Tuple[int, float], ...] = field(default=(), repr=False)
+    best_hour: Optional[str] = None
+    forecast_tomorrow_kwh: float = 0.0
+    forecast_day_after_kwh: Optional[float] = None
+    expected_daily_production_kwh: Optional[float] = None
+    production_time: str = "00:00:00"
+    peak_today_w: float = 0.0
+    all_time_peak_w: float = 0.0
+    all_time_peak_date: Optional[str] = None
+    month_yield_kwh: float = 0.0
+    month_consumption_kwh: float = 0.0
+    week_yield_kwh: float = 0.0
+    week_consumption_kwh: float = 0.0
+    avg_yield_7d_kwh: Optional[float] = None
+    avg_yield_30d_kwh: Optional[float] = None
+    avg_autarky_month: Optional[float] = None
+    avg_accuracy_30d: Optional[float] = None
+
+    @classmethod
+    def build(
+        cls,
+        version: int,
+        now: datetime,
+        data: Optional[Dict[str, Any]],
+        hourly_cache: Optional[Dict[str, Any]],
+        daily_forecasts: Dict[str, float],
+    ) -> "CoordinatorSnapshot":
+        """Build a snapshot from the coordinator state. @zara
+
+        Args:
+            version: Monotonic snapshot number
+            now: Local time the snapshot is built at
+            data: coordinator.data (may be None before the first update)
+            hourly_cache: coordinator._hourly_predictions_cache
+            daily_forecasts: daily_forecasts prediction_kwh by forecast_type
+
+        Returns:
+            New CoordinatorSnapshot
+        """
+        today = now.date().isoformat()
+        data = data or {}
+        statistics = data.get(DATA_KEY_STATISTICS) or {}
+        current_month = statistics.get(STATS_CURRENT_MONTH) or {}
+        current_week = statistics.get(STATS_CURRENT_WEEK) or {}
+        last_7d = statistics.get(STATS_LAST_7_DAYS) or {}
+        last_30d = statistics.get(STATS_LAST_30_DAYS) or {}
+        all_time_peak = statistics.get(STATS_ALL_TIME_PEAK) or {}
+
+        today_hourly_kwh: Tuple[Tuple[int, float], ...] = ()
+        best_hour = None
+        if isinstance(hourly_cache, dict):
+            hours = []
+            for pred in hourly_cache.get(CACHE_PREDICTIONS) or []:
+                if pred.get(PRED_TARGET_DATE) != today or pred.get(PRED_TARGET_HOUR) is None:
+                    continue
+                kwh = pred.get(PRED_PREDICTION_KWH)
+                if kwh is None:
+                    kwh = pred.get(PRED_PREDICTED_KWH)
+                hours.append((int(pred[PRED_TARGET_HOUR]), float(kwh or 0.0)))
+            today_hourly_kwh = tuple(sorted(hours))
+
+            hour = (hourly_cache.get(CACHE_BEST_HOUR_TODAY) or {}).get("hour")
+            if hour is not None:
+                best_hour = f"{hour:02d}:00"
+
+        forecast_tomorrow = daily_forecasts.get(DAILY_FORECAST_TOMORROW)
+        if forecast_tomorrow is None:
+            forecast_tomorrow = data.get(DATA_KEY_FORECAST_TOMORROW) or 0.0
+
+        forecast_day_after = daily_forecasts.get(DAILY_FORECAST_DAY_AFTER)
+        if forecast_day_after is None:
+            day_after = data.get(DATA_KEY_FORECAST_DAY_AFTER)
+            if isinstance(day_after, (int, float)):
+                forecast_day_after = float(day_after)
+            elif isinstance(day_after, dict):
+                forecast_day_after = day_after.get(PRED_PREDICTION_KWH)
+
+        duration_seconds = (data.get(DATA_KEY_PRODUCTION_TIME) or {}).get(
+            PROD_TIME_DURATION_SECONDS, 0
+        ) or 0
+        hours_part, remainder = divmod(duration_seconds, 3600)
+        minutes_part, seconds_part = divmod(remainder, 60)
+
+        return cls(
+            version=version,
+            created_at=now,
+            date=today,
+            today_hourly_kwh=today_hourly_kwh,
+            best_hour=best_hour,
+            forecast_tomorrow_kwh=forecast_tomorrow,
+            forecast_day_after_kwh=forecast_day_after,
+            expected_daily_production_kwh=data.get(DATA_KEY_EXPECTED_DAILY_PRODUCTION),
+            production_time=f"{int(hours_part):02}:{int(minutes_part):02}:{int(seconds_part):02}",
+            peak_today_w=(data.get(DATA_KEY_PEAK_TODAY) or {}).get(PEAK_TODAY_POWER_W) or 0.0,
+            all_time_peak_w=all_time_peak.get(PEAK_TODAY_POWER_W) or 0.0,
+            all_time_peak_date=all_time_peak.get("date"),
+            month_yield_kwh=current_month.get(STATS_YIELD_KWH) or 0.0,
+            month_consumption_kwh=current_month.get(STATS_CONSUMPTION_KWH) or 0.0,
+            week_yield_kwh=current_week.get(STATS_YIELD_KWH) or 0.0,
+            week_consumption_kwh=current_week.get(STATS_CONSUMPTION_KWH) or 0.0,
+            avg_yield_7d_kwh=last_7d.get(STATS_AVG_YIELD_KWH),
+            avg_yield_30d_kwh=last_30d.get(STATS_AVG_YIELD_KWH),
+            avg_autarky_month=current_month.get("avg_autarky"),
+            avg_accuracy_30d=last_30d.get(STATS_AVG_ACCURACY),
+        )
+
+    def hours_from(self, now: datetime, first_hour: int) -> Tuple[Tuple[int, float], ...]:
+        """Get today's hourly predictions starting at first_hour. @zara
+
+        Returns nothing once the local date moved past the snapshot date,
+        so stale predictions are never shown as today's.
+        """
+        if now.date().isoformat() != self.date:
+            return ()
+        return tuple(hour for hour in self.today_hourly_kwh if hour[0] >= first_hour)
+
+    def remaining_today_kwh(self, now: datetime) -> float:
+        """Sum of predictions from the current hour to the end of today. @zara"""
+        return round(sum(kwh for _, kwh in self.hours_from(now, now.hour)), 2)
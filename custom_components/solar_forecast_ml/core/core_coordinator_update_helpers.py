@@ -21,6 +21,8 @@ from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from .core_helpers import SafeDateTimeUtil as dt_util
 from ..data.db_manager import DatabaseManager
+from ..data.data_statistics_materializer import StatisticsMaterializer
+from ..data.data_write_buffer import get_write_buffer
 from ..const import (
     DATA_KEY_FORECAST_TODAY,
     DATA_KEY_FORECAST_TOMORROW,
@@ -50,10 +52,6 @@ from ..const import (
     STATS_ALL_TIME_PEAK,
     STATS_LAST_7_DAYS,
     STATS_LAST_30_DAYS,
-    STATS_AVG_ACCURACY,
-    STATS_YIELD_KWH,
-    STATS_AVG_YIELD_KWH,
-    STATS_CONSUMPTION_KWH,
     STATS_CURRENT_MONTH,
     STATS_CURRENT_WEEK,
 )
@@ -164,7 +162,7 @@ class CoordinatorUpdateHelpers:
         return result
 
     async def _load_statistics(self) -> Dict[str, Any]:
-        """Load statistics from database. @zara"""
+        """Load materialized statistics from daily_statistics. @zara"""
         statistics = {
             STATS_ALL_TIME_PEAK: {},
             STATS_LAST_7_DAYS: {},
@@ -174,91 +172,20 @@ class CoordinatorUpdateHelpers:
         }
 
         try:
-            # Load all-time peak from production_time_state @zara
-            all_time_peak = await self.db.fetchone(
-                """SELECT peak_record_w, peak_record_date, peak_record_time
-                   FROM production_time_state
-                   WHERE id = 1 AND peak_record_w IS NOT NULL"""
-            )
-            if all_time_peak and all_time_peak[0]:
-                statistics[STATS_ALL_TIME_PEAK] = {
-                    PEAK_TODAY_POWER_W: float(all_time_peak[0]),
-                    PEAK_TODAY_AT: f"{all_time_peak[1]} {all_time_peak[2]}" if all_time_peak[1] and all_time_peak[2] else None,
-                    "date": all_time_peak[1],
-                }
+            materializer = StatisticsMaterializer(self.coordinator.hass, self.db)
+            statistics = await materializer.async_get_statistics(dt_util.now().date())
 
-            # Load 7-day statistics @zara
-            stats_7d = await self.db.fetchone(
-                """SELECT AVG(actual_total_kwh), AVG(accuracy_percent), SUM(actual_total_kwh)
-                   FROM daily_summaries
-                   WHERE date >= DATE('now', '-7 days') AND actual_total_kwh IS NOT NULL"""
+            # A new record may still sit in the write-behind buffer @zara
+            pending_record = get_write_buffer(self.coordinator.hass, self.db).pending(
+                "production_time_state", "peak_record"
             )
-            if stats_7d:
-                statistics[STATS_LAST_7_DAYS] = {
-                    STATS_AVG_YIELD_KWH: float(stats_7d[0]) if stats_7d[0] else None,
-                    STATS_AVG_ACCURACY: float(stats_7d[1]) if stats_7d[1] else None,
-                    STATS_YIELD_KWH: float(stats_7d[2]) if stats_7d[2] else None,
-                }
-
-            # Load 30-day statistics @zara
-            stats_30d = await self.db.fetchone(
-                """SELECT AVG(actual_total_kwh), AVG(accuracy_percent), SUM(actual_total_kwh)
-                   FROM daily_summaries
-                   WHERE date >= DATE('now', '-30 days') AND actual_total_kwh IS NOT NULL"""
-            )
-            if stats_30d:
-                statistics[STATS_LAST_30_DAYS] = {
-                    STATS_AVG_YIELD_KWH: float(stats_30d[0]) if stats_30d[0] else None,
-                    STATS_AVG_ACCURACY: float(stats_30d[1]) if stats_30d[1] else None,
-                    STATS_YIELD_KWH: float(stats_30d[2]) if stats_30d[2] else None,
+            if pending_record is not None:
+                statistics[STATS_ALL_TIME_PEAK] = {
+                    PEAK_TODAY_POWER_W: float(pending_record["power_w"]),
+                    PEAK_TODAY_AT: f"{pending_record['date']} {pending_record['time']}",
+                    "date": pending_record["date"],
                 }
 
-            # Load current month statistics @zara
-            month_start = dt_util.now().date().replace(day=1).isoformat()
-
-            month_yield = await self.db.fetchone(
-                """SELECT SUM(actual_total_kwh)
-                   FROM daily_summaries
-                   WHERE date >= ? AND actual_total_kwh IS NOT NULL""",
-                (month_start,)
-            )
-
-            month_consumption = await self.db.fetchone(
-                """SELECT SUM(consumption_kwh)
-                   FROM forecast_history
-                   WHERE date >= ? AND consumption_kwh IS NOT NULL""",
-                (month_start,)
-            )
-
-            statistics[STATS_CURRENT_MONTH] = {
-                STATS_YIELD_KWH: float(month_yield[0]) if month_yield and month_yield[0] else 0.0,
-                STATS_CONSUMPTION_KWH: float(month_consumption[0]) if month_consumption and month_consumption[0] else 0.0,
-            }
-
-            # Load current week statistics @zara
-            week_start = (dt_util.now().date() - timedelta(
-                days=dt_util.now().date().weekday()
-            )).isoformat()
-
-            week_yield = await self.db.fetchone(
-                """SELECT SUM(actual_total_kwh)
-                   FROM daily_summaries
-                   WHERE date >= ? AND actual_total_kwh IS NOT NULL""",
-                (week_start,)
-            )
-
-            week_consumption = await self.db.fetchone(
-                """SELECT SUM(consumption_kwh)
-                   FROM forecast_history
-                   WHERE date >= ? AND consumption_kwh IS NOT NULL""",
-                (week_start,)
-            )
-
-            statistics[STATS_CURRENT_WEEK] = {
-                STATS_YIELD_KWH: float(week_yield[0]) if week_yield and week_yield[0] else 0.0,
-                STATS_CONSUMPTION_KWH: float(week_consumption[0]) if week_consumption and week_consumption[0] else 0.0,
-            }
-
         except Exception as e:
             _LOGGER.warning(f"Failed to load statistics: {e}")
 
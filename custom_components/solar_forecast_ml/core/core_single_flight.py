@@ -0,0 +1,237 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast ML DB-Version
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""
+Single-Flight Request Coalescing for Solar Forecast ML V16.4.2.
+Concurrent callers of the same weather request share one in-flight call,
+and a successful result is reused for a short freshness window.
+
+@zara
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Hashable, Optional, Tuple
+
+from ..const import SINGLE_FLIGHT_FRESH_SECONDS
+from .core_helpers import SafeDateTimeUtil as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+# Marker set on wrapped methods so an instance is only wrapped once @zara
+_WRAPPED_MARKER = "_sfml_single_flight"
+
+# Keys whose flight the current task belongs to; a nested call for the same
+# key runs directly instead of waiting for itself @zara
+_ACTIVE_KEYS: ContextVar[FrozenSet[Hashable]] = ContextVar(
+    "sfml_single_flight_keys", default=frozenset()
+)
+
+
+@dataclass
+class FlightStats:
+    """Counters of one provider. @zara"""
+
+    calls: int = 0
+    executed: int = 0
+    coalesced: int = 0
+    fresh_hits: int = 0
+    errors: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the counters as a dict. @zara"""
+        shared = self.coalesced + self.fresh_hits
+        return {
+            "calls": self.calls,
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "fresh_hits": self.fresh_hits,
+            "errors": self.errors,
+            "shared_ratio": round(shared / self.calls, 3) if self.calls else 0.0,
+        }
+
+
+class SingleFlight:
+    """Coalesce identical concurrent requests into one call. @zara
+
+    A key combines provider, coordinates, time window and call arguments.
+    While a call for a key runs, further callers await the same task;
+    cancelling one waiter does not cancel the shared call. A result that
+    passes the cacheable check is reused for fresh_seconds; failures and
+    empty results are never reused.
+    """
+
+    def __init__(self, fresh_seconds: float = SINGLE_FLIGHT_FRESH_SECONDS):
+        """Initialize the coalescer. @zara
+
+        Args:
+            fresh_seconds: Seconds a successful result is shared after it completed
+        """
+        self.fresh_seconds = fresh_seconds
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self._results: Dict[Hashable, Tuple[float, Any]] = {}
+        self._stats: Dict[str, FlightStats] = {}
+
+    async def async_do(
+        self,
+        provider: str,
+        key: Hashable,
+        call: Callable[[], Awaitable[Any]],
+        use_fresh: bool = True,
+        cacheable: Callable[[Any], bool] = bool,
+    ) -> Any:
+        """Run call once for all concurrent callers of key. @zara
+
+        Args:
+            provider: Provider name the counters are kept under
+            key: Request key (provider, coordinates, time window, arguments)
+            call: Coroutine factory performing the request
+            use_fresh: Accept a result completed within the freshness window
+            cacheable: Whether a result may be shared after completion
+
+        Returns:
+            The result of the shared call
+        """
+        stats = self._stats.setdefault(provider, FlightStats())
+        stats.calls += 1
+        full_key = (provider, key)
+
+        active = _ACTIVE_KEYS.get()
+        if full_key in active:
+            return await call()
+
+        if use_fresh:
+            cached = self._results.get(full_key)
+            if cached is not None and time.monotonic() - cached[0] < self.fresh_seconds:
+                stats.fresh_hits += 1
+                return cached[1]
+
+        task = self._in_flight.get(full_key)
+        if task is not None:
+            stats.coalesced += 1
+            _LOGGER.debug("Coalesced %s request into the running one", provider)
+        else:
+            stats.executed += 1
+            token = _ACTIVE_KEYS.set(active | {full_key})
+            try:
+                task = asyncio.ensure_future(call())
+            finally:
+                _ACTIVE_KEYS.reset(token)
+            self._in_flight[full_key] = task
+            task.add_done_callback(
+                functools.partial(self._finish, full_key, stats, cacheable)
+            )
+
+        return await asyncio.shield(task)
+
+    def _finish(
+        self,
+        full_key: Hashable,
+        stats: FlightStats,
+        cacheable: Callable[[Any], bool],
+        task: asyncio.Task,
+    ) -> None:
+        """Retire a finished flight and keep its result if shareable. @zara"""
+        if self._in_flight.get(full_key) is task:
+            del self._in_flight[full_key]
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            stats.errors += 1
+            return
+        result = task.result()
+        if cacheable(result):
+            self._results[full_key] = (time.monotonic(), result)
+        # Old time windows are never asked for again @zara
+        now = time.monotonic()
+        for stale in [
+            k for k, (done_at, _) in self._results.items() if now - done_at >= self.fresh_seconds
+        ]:
+            del self._results[stale]
+
+    def invalidate(self, provider: Optional[str] = None) -> None:
+        """Drop shared results, of one provider or all. @zara"""
+        if provider is None:
+            self._results.clear()
+            return
+        for full_key in [k for k in self._results if k[0] == provider]:
+            del self._results[full_key]
+
+    def wrap(
+        self,
+        target: Any,
+        method_name: str,
+        provider: str,
+        location: Tuple[float, float],
+        use_fresh: bool = True,
+    ) -> bool:
+        """Route an instance method of a request client through the coalescer. @zara
+
+        The key is (location, current hour, method, arguments, force), so
+        calls for the same place and forecast window share one request.
+        A call passing force=True never takes a fresh result and only
+        joins another forced request, never a regular one that may be
+        served from the client's own cache.
+
+        Args:
+            target: Object whose method is wrapped
+            method_name: Name of the coroutine method
+            provider: Provider name for the counters
+            location: Rounded (latitude, longitude)
+            use_fresh: Whether results may be reused after completion
+
+        Returns:
+            True if the method is wrapped (now or before)
+        """
+        method = getattr(target, method_name, None)
+        if method is None:
+            return False
+        if getattr(method, _WRAPPED_MARKER, False):
+            return True
+
+        @functools.wraps(method)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            force = bool(kwargs.get("force", False))
+            try:
+                arguments = (args, tuple(sorted(i for i in kwargs.items() if i[0] != "force")))
+                hash(arguments)
+            except TypeError:
+                return await method(*args, **kwargs)
+            window = dt_util.now().strftime("%Y-%m-%dT%H")
+            key = (location, window, method_name, arguments, force)
+            result = await self.async_do(
+                provider,
+                key,
+                lambda: method(*args, **kwargs),
+                use_fresh=use_fresh and not force,
+            )
+            if force:
+                # Regular callers must not get the result the refresh replaced @zara
+                self._results.pop((provider, key[:-1] + (False,)), None)
+            return result
+
+        setattr(wrapper, _WRAPPED_MARKER, True)
+        try:
+            setattr(target, method_name, wrapper)
+        except (AttributeError, TypeError) as e:
+            _LOGGER.debug("Cannot coalesce %s.%s: %s", type(target).__name__, method_name, e)
+            return False
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters per provider plus the number of running requests. @zara"""
+        return {
+            "in_flight": len(self._in_flight),
+            "fresh_seconds": self.fresh_seconds,
+            "providers": {name: stats.as_dict() for name, stats in self._stats.items()},
+        }
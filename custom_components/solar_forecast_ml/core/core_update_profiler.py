@@ -0,0 +1,249 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast ML DB-Version
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""
+Update Profiler for Solar Forecast ML V16.4.2.
+Per-stage wall time, DB query count and DB time of every coordinator
+update, kept in a small ring buffer and summarized as p50/p95.
+
+@zara
+"""
+
+import logging
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from ..const import UPDATE_PROFILE_HISTORY
+from ..data.data_db_hooks import subscribe_db_calls, unsubscribe_db_calls
+from .core_helpers import SafeDateTimeUtil as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+# Stage of the coordinator update running in the current task, if any @zara
+_ACTIVE_STAGE: ContextVar[Optional["StageTiming"]] = ContextVar(
+    "sfml_update_profiler_stage", default=None
+)
+
+# Profilers by id() of the DatabaseManager they instrument @zara
+_PROFILERS: Dict[int, "UpdateProfiler"] = {}
+
+
+@dataclass
+class StageTiming:
+    """Timing of one stage of one coordinator update. @zara"""
+
+    wall_ms: float = 0.0
+    db_queries: int = 0
+    db_ms: float = 0.0
+
+
+@dataclass
+class UpdateProfile:
+    """Timings of one complete coordinator update. @zara"""
+
+    started_at: datetime
+    stages: Dict[str, StageTiming] = field(default_factory=dict)
+    total_ms: float = 0.0
+    success: bool = True
+
+    @property
+    def db_queries(self) -> int:
+        """DB statements run by all stages. @zara"""
+        return sum(stage.db_queries for stage in self.stages.values())
+
+    @property
+    def db_ms(self) -> float:
+        """DB time of all stages. @zara"""
+        return sum(stage.db_ms for stage in self.stages.values())
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    """Linear-interpolated percentile of an ascending list. @zara"""
+    if not sorted_values:
+        return 0.0
+    position = fraction * (len(sorted_values) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    weight = position - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * weight
+
+
+def _distribution(values: List[float]) -> Dict[str, float]:
+    """p50/p95/max of a list of values. @zara"""
+    ordered = sorted(values)
+    return {
+        "p50": round(_percentile(ordered, 0.50), 2),
+        "p95": round(_percentile(ordered, 0.95), 2),
+        "max": round(ordered[-1], 2) if ordered else 0.0,
+    }
+
+
+class UpdateProfiler:
+    """Ring buffer of per-stage timings of the last coordinator updates. @zara
+
+    Stages are timed with time.perf_counter. DB statements are counted
+    through the shared hooks of data_db_hooks; a statement is attributed
+    to the stage of the task that issued it, so sensor or service
+    queries running concurrently are not counted.
+    """
+
+    def __init__(self, history: int = UPDATE_PROFILE_HISTORY):
+        """Initialize the profiler. @zara
+
+        Args:
+            history: Number of updates kept for the percentiles
+        """
+        self._history: Deque[UpdateProfile] = deque(maxlen=history)
+        self._current: Optional[UpdateProfile] = None
+        self._db_manager: Optional[Any] = None
+        self.updates = 0
+        self.failed_updates = 0
+
+    @property
+    def last_profile(self) -> Optional[UpdateProfile]:
+        """The most recent completed update, if any. @zara"""
+        return self._history[-1] if self._history else None
+
+    def instrument(self, db_manager: Any) -> None:
+        """Count and time the DB statements of a DatabaseManager. @zara
+
+        Safe to call on every update; a manager is only wrapped once and
+        a replaced manager is picked up on the next call.
+        """
+        if db_manager is None or db_manager is self._db_manager:
+            return
+
+        subscribe_db_calls(db_manager, self)
+        if self._db_manager is not None:
+            unsubscribe_db_calls(self._db_manager, self)
+            _PROFILERS.pop(id(self._db_manager), None)
+        self._db_manager = db_manager
+        _PROFILERS[id(db_manager)] = self
+
+    def wants_db_calls(self) -> bool:
+        """Only calls issued inside a stage are timed. @zara"""
+        return _ACTIVE_STAGE.get() is not None
+
+    def on_db_call(
+        self,
+        method: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        elapsed: float,
+        result: Any,
+        error: bool,
+    ) -> None:
+        """Add a DB call to the stage of the task that issued it. @zara"""
+        timing = _ACTIVE_STAGE.get()
+        if timing is None:
+            return
+        timing.db_ms += elapsed * 1000
+        timing.db_queries += 1
+
+    @contextmanager
+    def update(self) -> Iterator[UpdateProfile]:
+        """Profile one coordinator update; stages are recorded into it. @zara"""
+        profile = UpdateProfile(started_at=dt_util.now())
+        self._current = profile
+        start = time.perf_counter()
+        try:
+            yield profile
+        except BaseException:
+            profile.success = False
+            raise
+        finally:
+            profile.total_ms = (time.perf_counter() - start) * 1000
+            self._current = None
+            self._history.append(profile)
+            self.updates += 1
+            if not profile.success:
+                self.failed_updates += 1
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[Optional[StageTiming]]:
+        """Time one stage of the running update. @zara
+
+        Outside of update() this is a no-op, so helpers can be reused.
+        """
+        profile = self._current
+        if profile is None:
+            yield None
+            return
+
+        timing = profile.stages.setdefault(name, StageTiming())
+        token = _ACTIVE_STAGE.set(timing)
+        start = time.perf_counter()
+        try:
+            yield timing
+        finally:
+            timing.wall_ms += (time.perf_counter() - start) * 1000
+            _ACTIVE_STAGE.reset(token)
+
+    def get_summary(self) -> Dict[str, Any]:
+        """p50/p95 of the updates in the ring buffer, per stage and in total. @zara
+
+        Failed updates stop early and are left out of the percentiles.
+        """
+        profiles = [profile for profile in self._history if profile.success]
+        summary: Dict[str, Any] = {
+            "updates": self.updates,
+            "failed_updates": self.failed_updates,
+            "samples": len(profiles),
+            "total_ms": {},
+            "db_queries": {},
+            "db_ms": {},
+            "stages": {},
+        }
+        last = self.last_profile
+        if last is not None:
+            summary["last_update"] = {
+                "started_at": last.started_at.isoformat(),
+                "success": last.success,
+                "total_ms": round(last.total_ms, 2),
+                "db_queries": last.db_queries,
+                "db_ms": round(last.db_ms, 2),
+            }
+        if not profiles:
+            return summary
+
+        summary["total_ms"] = _distribution([p.total_ms for p in profiles])
+        summary["db_queries"] = _distribution([p.db_queries for p in profiles])
+        summary["db_ms"] = _distribution([p.db_ms for p in profiles])
+
+        # Keep the stage order of the update itself @zara
+        stage_names: List[str] = []
+        for profile in profiles:
+            for name in profile.stages:
+                if name not in stage_names:
+                    stage_names.append(name)
+
+        for name in stage_names:
+            timings = [p.stages[name] for p in profiles if name in p.stages]
+            summary["stages"][name] = {
+                "samples": len(timings),
+                "wall_ms": _distribution([t.wall_ms for t in timings]),
+                "db_queries": _distribution([t.db_queries for t in timings]),
+                "db_ms": _distribution([t.db_ms for t in timings]),
+            }
+        return summary
+
+
+def get_update_profiler(db_manager: Any) -> Optional[UpdateProfiler]:
+    """Get the profiler instrumenting a DatabaseManager, if any. @zara"""
+    if db_manager is None:
+        return None
+    profiler = _PROFILERS.get(id(db_manager))
+    if profiler is None or profiler._db_manager is not db_manager:
+        return None
+    return profiler
@@ -12,6 +12,8 @@
 from .db_manager import DatabaseManager
 from .weather_types import CloudType, BlendedHourForecast, ExpertForecast
 from .data_io import DataManagerIO
+from .data_write_buffer import WriteBehindBuffer
+from .data_statistics_materializer import StatisticsMaterializer
 from .data_persistence import DataPersistence
 from .data_adapter import TypedDataAdapter
 from .data_state_handler import DataStateHandler
@@ -30,6 +32,8 @@ __all__ = [
 
     # Core Data Handling @zara
     "DataManagerIO",
+    "WriteBehindBuffer",
+    "StatisticsMaterializer",
     "DataPersistence",
     "TypedDataAdapter",
     "DataStateHandler",
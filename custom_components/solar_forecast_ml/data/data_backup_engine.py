@@ -0,0 +1,364 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast ML DB-Version
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""
+Backup Engine for Solar Forecast ML V16.4.2.
+Consistent online snapshots of solar_forecast.db, written either as one
+gzip file or as deduplicated, compressed page segments.
+All functions are blocking and meant to run in the executor.
+
+@zara
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from ..const import (
+    BACKUP_COMPRESSION_LEVEL,
+    BACKUP_PAGES_PER_STEP,
+    BACKUP_SEGMENT_PAGES,
+    BACKUP_STEP_SLEEP_SECONDS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+BACKUP_DB_FILE = "solar_forecast.db"
+BACKUP_GZIP_FILE = "solar_forecast.db.gz"
+BACKUP_MANIFEST_FILE = "solar_forecast.manifest.json"
+SEGMENT_STORE_DIR = "_segments"
+
+FORMAT_PLAIN = "plain"
+FORMAT_GZIP = "gzip"
+FORMAT_SEGMENTS = "segments"
+
+MANIFEST_VERSION = 1
+
+# The online backup restarts when another connection writes; give up after this @zara
+_MAX_BACKUP_RESTARTS = 3
+
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+# Segment writes and pruning must not interleave @zara
+_STORE_LOCK = threading.Lock()
+
+
+class _BackupRestartLimit(Exception):
+    """Online backup was restarted too often by concurrent writes. @zara"""
+
+
+def snapshot_database(
+    db_path: Path,
+    target: Path,
+    pages_per_step: int = BACKUP_PAGES_PER_STEP,
+    step_sleep: float = BACKUP_STEP_SLEEP_SECONDS,
+) -> int:
+    """Copy a live database into target with the SQLite online backup API. @zara
+
+    The copy runs in steps of pages_per_step pages with a pause between
+    steps, so writers on other connections keep making progress. If they
+    keep invalidating the copy, a single VACUUM INTO read transaction is
+    used instead. Either way the result is a consistent database.
+
+    Args:
+        db_path: Live database file
+        target: File the snapshot is written to (replaced if present)
+        pages_per_step: Pages copied per backup step
+        step_sleep: Pause between two steps in seconds
+
+    Returns:
+        Size of the snapshot in bytes
+    """
+    target.unlink(missing_ok=True)
+    source = sqlite3.connect(str(db_path), timeout=30)
+    try:
+        source.execute("PRAGMA query_only = ON")
+        restarts = 0
+        last_remaining: Optional[int] = None
+
+        def progress(_status: int, remaining: int, _total: int) -> None:
+            nonlocal restarts, last_remaining
+            if last_remaining is not None and remaining > last_remaining:
+                restarts += 1
+                if restarts > _MAX_BACKUP_RESTARTS:
+                    raise _BackupRestartLimit()
+            last_remaining = remaining
+
+        destination = sqlite3.connect(str(target))
+        try:
+            source.backup(
+                destination, pages=pages_per_step, progress=progress, sleep=step_sleep
+            )
+        except _BackupRestartLimit:
+            destination.close()
+            target.unlink(missing_ok=True)
+            _LOGGER.debug("Online backup kept restarting, using VACUUM INTO")
+            source.execute("VACUUM INTO ?", (str(target),))
+        finally:
+            destination.close()
+    finally:
+        source.close()
+
+    return target.stat().st_size
+
+
+def write_gzip(snapshot: Path, target: Path, level: int = BACKUP_COMPRESSION_LEVEL) -> int:
+    """Compress a snapshot into a single gzip file. @zara
+
+    Returns:
+        Size of the compressed file in bytes
+    """
+    partial = target.with_name(target.name + ".partial")
+    with open(snapshot, "rb") as src, gzip.open(partial, "wb", compresslevel=level) as dst:
+        shutil.copyfileobj(src, dst, _COPY_CHUNK_SIZE)
+    os.replace(partial, target)
+    return target.stat().st_size
+
+
+def _page_size(snapshot: Path) -> int:
+    """Read the page size from the SQLite header. @zara"""
+    with open(snapshot, "rb") as f:
+        header = f.read(18)
+    page_size = int.from_bytes(header[16:18], "big") if len(header) >= 18 else 0
+    return 65536 if page_size == 1 else (page_size or 4096)
+
+
+def _segment_path(store: Path, digest: str) -> Path:
+    """Path of a stored segment. @zara"""
+    return store / digest[:2] / f"{digest}.z"
+
+
+def write_segments(
+    snapshot: Path,
+    manifest_path: Path,
+    store: Path,
+    segment_pages: int = BACKUP_SEGMENT_PAGES,
+    level: int = BACKUP_COMPRESSION_LEVEL,
+) -> Dict[str, Any]:
+    """Store a snapshot as deduplicated, compressed page-aligned segments. @zara
+
+    Every run of segment_pages pages is hashed; only segments the store
+    does not hold yet are compressed and written. A backup of a database
+    where few pages changed therefore costs only those segments plus the
+    manifest.
+
+    Args:
+        snapshot: Snapshot file to store
+        manifest_path: Manifest written for this backup
+        store: Segment store shared by the backups of one type
+        segment_pages: Pages per segment
+        level: zlib compression level
+
+    Returns:
+        The manifest dict
+    """
+    page_size = _page_size(snapshot)
+    segment_size = page_size * segment_pages
+    segments = []
+    stored_bytes = 0
+    new_bytes = 0
+    full_hash = hashlib.sha256()
+
+    with _STORE_LOCK:
+        with open(snapshot, "rb") as f:
+            while True:
+                chunk = f.read(segment_size)
+                if not chunk:
+                    break
+                full_hash.update(chunk)
+                digest = hashlib.blake2b(chunk, digest_size=20).hexdigest()
+                segments.append(digest)
+
+                path = _segment_path(store, digest)
+                if path.exists():
+                    stored_bytes += path.stat().st_size
+                    continue
+
+                data = zlib.compress(chunk, level)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                partial = path.with_name(path.name + ".partial")
+                partial.write_bytes(data)
+                os.replace(partial, path)
+                stored_bytes += len(data)
+                new_bytes += len(data)
+
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "page_size": page_size,
+            "segment_pages": segment_pages,
+            "db_size": snapshot.stat().st_size,
+            "sha256": full_hash.hexdigest(),
+            "segments": segments,
+            "stored_bytes": stored_bytes,
+            "new_bytes": new_bytes,
+        }
+        partial = manifest_path.with_name(manifest_path.name + ".partial")
+        partial.write_text(json.dumps(manifest), encoding="utf-8")
+        os.replace(partial, manifest_path)
+
+    return manifest
+
+
+def _read_manifest(manifest_path: Path) -> Dict[str, Any]:
+    """Load a segment manifest. @zara"""
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported backup manifest version: {manifest.get('version')}")
+    return manifest
+
+
+def _gzip_original_size(path: Path) -> Optional[int]:
+    """Uncompressed size from the gzip trailer (modulo 4 GiB). @zara"""
+    try:
+        with open(path, "rb") as f:
+            f.seek(-4, os.SEEK_END)
+            return int.from_bytes(f.read(4), "little")
+    except OSError:
+        return None
+
+
+def detect_backup_format(backup_dir: Path) -> Optional[str]:
+    """Get the format of a backup folder, None if it holds no database. @zara"""
+    if (backup_dir / BACKUP_MANIFEST_FILE).exists():
+        return FORMAT_SEGMENTS
+    if (backup_dir / BACKUP_GZIP_FILE).exists():
+        return FORMAT_GZIP
+    if (backup_dir / BACKUP_DB_FILE).exists():
+        return FORMAT_PLAIN
+    return None
+
+
+def backup_file_stats(path: Path) -> Dict[str, Any]:
+    """Size and compression ratio of a single-file backup (.db or .db.gz). @zara"""
+    stored = path.stat().st_size
+    if path.name.endswith(".gz"):
+        db_size = _gzip_original_size(path)
+        backup_format = FORMAT_GZIP
+    else:
+        db_size = stored
+        backup_format = FORMAT_PLAIN
+    return {
+        "format": backup_format,
+        "db_size_bytes": db_size,
+        "stored_bytes": stored,
+        "compression_ratio": round(db_size / stored, 2) if db_size and stored else None,
+    }
+
+
+def backup_dir_stats(backup_dir: Path) -> Dict[str, Any]:
+    """Size and compression ratio of a backup folder in any format. @zara"""
+    backup_format = detect_backup_format(backup_dir)
+    if backup_format == FORMAT_SEGMENTS:
+        manifest = _read_manifest(backup_dir / BACKUP_MANIFEST_FILE)
+        db_size = manifest["db_size"]
+        stored = manifest["stored_bytes"]
+        return {
+            "format": FORMAT_SEGMENTS,
+            "db_size_bytes": db_size,
+            "stored_bytes": stored,
+            "new_bytes": manifest["new_bytes"],
+            "compression_ratio": round(db_size / stored, 2) if db_size and stored else None,
+        }
+    if backup_format == FORMAT_GZIP:
+        return backup_file_stats(backup_dir / BACKUP_GZIP_FILE)
+    if backup_format == FORMAT_PLAIN:
+        return backup_file_stats(backup_dir / BACKUP_DB_FILE)
+    return {"format": None}
+
+
+def _materialize(source: Path, target: Path, store: Optional[Path]) -> None:
+    """Write the database contained in a backup to target. @zara"""
+    name = source.name
+    if name == BACKUP_MANIFEST_FILE:
+        if store is None:
+            raise ValueError("Segment store required for segment backups")
+        manifest = _read_manifest(source)
+        full_hash = hashlib.sha256()
+        with open(target, "wb") as dst:
+            for digest in manifest["segments"]:
+                chunk = zlib.decompress(_segment_path(store, digest).read_bytes())
+                full_hash.update(chunk)
+                dst.write(chunk)
+        if full_hash.hexdigest() != manifest["sha256"]:
+            raise ValueError(f"Backup checksum mismatch: {source}")
+    elif name.endswith(".gz"):
+        with gzip.open(source, "rb") as src, open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst, _COPY_CHUNK_SIZE)
+    else:
+        shutil.copyfile(source, target)
+
+
+def restore_database(source: Path, db_path: Path, store: Optional[Path] = None) -> None:
+    """Overwrite db_path with the database of a backup file or manifest. @zara
+
+    The database is rebuilt next to db_path and checked with
+    PRAGMA quick_check. It is then copied into the live file with the
+    SQLite online backup API in one step, so the WAL and every
+    connection still open on db_path (the shared database of the extra
+    features included) see the restored content on their next read.
+
+    Args:
+        source: Backup file (.db, .db.gz) or segment manifest
+        db_path: Database file to overwrite
+        store: Segment store, required for segment manifests
+    """
+    partial = db_path.with_name(db_path.name + ".restore")
+    partial.unlink(missing_ok=True)
+    try:
+        _materialize(source, partial, store)
+        restored = sqlite3.connect(str(partial))
+        try:
+            result = restored.execute("PRAGMA quick_check").fetchone()
+            if not result or result[0] != "ok":
+                raise ValueError(f"Restored database failed integrity check: {result}")
+            # Waits for open writers via the busy timeout @zara
+            target = sqlite3.connect(str(db_path), timeout=30)
+            try:
+                restored.backup(target)
+            finally:
+                target.close()
+        finally:
+            restored.close()
+    finally:
+        partial.unlink(missing_ok=True)
+
+
+def prune_segments(store: Path, manifests: Iterable[Path]) -> int:
+    """Delete segments that no remaining manifest references. @zara
+
+    Returns:
+        Number of deleted segments
+    """
+    if not store.exists():
+        return 0
+
+    with _STORE_LOCK:
+        referenced = set()
+        for manifest_path in manifests:
+            try:
+                referenced.update(_read_manifest(manifest_path)["segments"])
+            except (OSError, ValueError) as e:
+                # Keep everything if a manifest cannot be read @zara
+                _LOGGER.warning("Skipping segment pruning, unreadable manifest %s: %s", manifest_path, e)
+                return 0
+
+        removed = 0
+        for path in store.glob("*/*.z"):
+            if path.stem not in referenced:
+                path.unlink()
+                removed += 1
+        return removed
@@ -23,9 +23,25 @@ from typing import Any, Optional
 
 from homeassistant.core import HomeAssistant
 
-from ..const import BACKUP_RETENTION_DAYS, MAX_BACKUP_FILES
+from ..const import BACKUP_RETENTION_DAYS, BACKUPS_AUTO_DIR, MAX_BACKUP_FILES
 from ..core.core_helpers import SafeDateTimeUtil as dt_util
 from .db_manager import DatabaseManager
+from .data_backup_engine import (
+    BACKUP_DB_FILE,
+    BACKUP_GZIP_FILE,
+    BACKUP_MANIFEST_FILE,
+    FORMAT_GZIP,
+    FORMAT_PLAIN,
+    FORMAT_SEGMENTS,
+    SEGMENT_STORE_DIR,
+    backup_dir_stats,
+    detect_backup_format,
+    prune_segments,
+    restore_database,
+    snapshot_database,
+    write_gzip,
+    write_segments,
+)
 from .data_io import DataManagerIO
 
 _LOGGER = logging.getLogger(__name__)
@@ -34,6 +50,11 @@ _LOGGER = logging.getLogger(__name__)
 class DataBackupHandler(DataManagerIO):
     """Handles database backup creation and management. @zara
 
+    Backups are consistent online snapshots, stored either as one gzip
+    file or, incrementally, as deduplicated segments shared by all backups
+    of a type (see data_backup_engine). Plain .db backups of older
+    versions can still be listed and restored.
+
     Provides methods to:
     - Create automatic and manual backups
     - Cleanup old backups based on retention policy
@@ -62,16 +83,35 @@ class DataBackupHandler(DataManagerIO):
         """Get backup directory for a given type. @zara"""
         return self.backup_base / backup_type
 
+    @staticmethod
+    def _backup_folders(backup_dir: Path) -> list[Path]:
+        """Get the backup folders of a type directory, without the segment store. @zara"""
+        return [
+            folder for folder in backup_dir.iterdir()
+            if folder.is_dir() and folder.name != SEGMENT_STORE_DIR
+        ]
+
+    def _prune_segment_store(self, backup_dir: Path) -> int:
+        """Delete segments no backup of this type references anymore. @zara"""
+        manifests = [
+            folder / BACKUP_MANIFEST_FILE
+            for folder in self._backup_folders(backup_dir)
+            if (folder / BACKUP_MANIFEST_FILE).exists()
+        ]
+        return prune_segments(backup_dir / SEGMENT_STORE_DIR, manifests)
+
     async def create_backup(
         self,
         backup_name: Optional[str] = None,
-        backup_type: str = "manual"
+        backup_type: str = "manual",
+        incremental: Optional[bool] = None,
     ) -> bool:
         """Create backup of the database. @zara
 
         Args:
             backup_name: Optional name for the backup
             backup_type: Type of backup ('auto' or 'manual')
+            incremental: Store only changed segments (default: True for 'auto')
 
         Returns:
             True if backup was created successfully
@@ -82,28 +122,53 @@ class DataBackupHandler(DataManagerIO):
                 timestamp = dt_util.now().strftime("%Y%m%d_%H%M%S")
                 backup_name = f"backup_{timestamp}"
 
-            backup_dir = self._get_backup_dir(backup_type) / backup_name
+            if incremental is None:
+                incremental = backup_type == BACKUPS_AUTO_DIR
 
-            # Ensure backup directory exists @zara
-            def ensure_and_copy():
-                backup_dir.mkdir(parents=True, exist_ok=True)
+            type_dir = self._get_backup_dir(backup_type)
+            backup_dir = type_dir / backup_name
+
+            # Staged rows belong in the backup @zara
+            await self.write_buffer.async_flush()
 
-                # Copy database file @zara
+            def do_backup():
                 db_path = Path(self.db.db_path)
-                if db_path.exists():
-                    dest_file = backup_dir / "solar_forecast.db"
-                    shutil.copy2(db_path, dest_file)
-                    return True
-                return False
+                if not db_path.exists():
+                    return None
 
-            success = await self.hass.async_add_executor_job(ensure_and_copy)
+                created = not backup_dir.exists()
+                backup_dir.mkdir(parents=True, exist_ok=True)
+                snapshot = backup_dir / f"{BACKUP_DB_FILE}.snapshot"
+                try:
+                    snapshot_database(db_path, snapshot)
+                    if incremental:
+                        write_segments(
+                            snapshot,
+                            backup_dir / BACKUP_MANIFEST_FILE,
+                            type_dir / SEGMENT_STORE_DIR,
+                        )
+                    else:
+                        write_gzip(snapshot, backup_dir / BACKUP_GZIP_FILE)
+                except Exception:
+                    if created:
+                        shutil.rmtree(backup_dir, ignore_errors=True)
+                    raise
+                finally:
+                    snapshot.unlink(missing_ok=True)
 
-            if success:
-                _LOGGER.info("Backup created: %s (type: %s)", backup_name, backup_type)
-            else:
+                return backup_dir_stats(backup_dir)
+
+            stats = await self.hass.async_add_executor_job(do_backup)
+
+            if stats is None:
                 _LOGGER.warning("Database file not found for backup")
+                return False
 
-            return success
+            _LOGGER.info(
+                "Backup created: %s (type: %s, format: %s, ratio: %s)",
+                backup_name, backup_type, stats["format"], stats.get("compression_ratio"),
+            )
+            return True
 
         except Exception as e:
             _LOGGER.error("Failed to create backup: %s", e)
@@ -139,18 +204,19 @@ class DataBackupHandler(DataManagerIO):
 
             def do_cleanup():
                 removed_count = 0
-                for backup_folder in backup_dir.iterdir():
-                    if backup_folder.is_dir():
-                        folder_time = datetime.fromtimestamp(
-                            backup_folder.stat().st_mtime
-                        )
-                        folder_time = dt_util.ensure_local(folder_time)
-
-                        if folder_time < cutoff_date:
-                            shutil.rmtree(backup_folder)
-                            removed_count += 1
-                            _LOGGER.info("Removed old backup: %s", backup_folder.name)
-
+                for backup_folder in self._backup_folders(backup_dir):
+                    folder_time = datetime.fromtimestamp(
+                        backup_folder.stat().st_mtime
+                    )
+                    folder_time = dt_util.ensure_local(folder_time)
+
+                    if folder_time < cutoff_date:
+                        shutil.rmtree(backup_folder)
+                        removed_count += 1
+                        _LOGGER.info("Removed old backup: %s", backup_folder.name)
+
+                if removed_count:
+                    self._prune_segment_store(backup_dir)
                 return removed_count
 
             removed = await self.hass.async_add_executor_job(do_cleanup)
@@ -196,8 +262,7 @@ class DataBackupHandler(DataManagerIO):
             def do_cleanup():
                 backup_folders = [
                     (folder, folder.stat().st_mtime)
-                    for folder in backup_dir.iterdir()
-                    if folder.is_dir()
+                    for folder in self._backup_folders(backup_dir)
                 ]
                 backup_folders.sort(key=lambda x: x[1])
 
@@ -208,6 +273,8 @@ class DataBackupHandler(DataManagerIO):
                     removed_count += 1
                     _LOGGER.info("Removed excess backup: %s", oldest_folder.name)
 
+                if removed_count:
+                    self._prune_segment_store(backup_dir)
                 return removed_count
 
             removed = await self.hass.async_add_executor_job(do_cleanup)
@@ -243,25 +310,31 @@ class DataBackupHandler(DataManagerIO):
                     if not backup_dir.exists():
                         continue
 
-                    for backup_folder in backup_dir.iterdir():
-                        if backup_folder.is_dir():
-                            stat = backup_folder.stat()
-
-                            # Calculate total size @zara
-                            total_size = sum(
-                                f.stat().st_size
-                                for f in backup_folder.rglob("*")
-                                if f.is_file()
-                            )
-
-                            backups.append({
-                                "name": backup_folder.name,
-                                "type": btype,
-                                "date": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                                "size_bytes": total_size,
-                                "size_mb": round(total_size / (1024 * 1024), 2),
-                                "path": str(backup_folder),
-                            })
+                    for backup_folder in self._backup_folders(backup_dir):
+                        stat = backup_folder.stat()
+
+                        # Calculate total size @zara
+                        total_size = sum(
+                            f.stat().st_size
+                            for f in backup_folder.rglob("*")
+                            if f.is_file()
+                        )
+
+                        try:
+                            stats = backup_dir_stats(backup_folder)
+                        except (OSError, ValueError) as e:
+                            _LOGGER.debug("Could not read backup %s: %s", backup_folder.name, e)
+                            stats = {"format": None}
+
+                        backups.append({
+                            "name": backup_folder.name,
+                            "type": btype,
+                            "date": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                            "size_bytes": total_size,
+                            "size_mb": round(total_size / (1024 * 1024), 2),
+                            "path": str(backup_folder),
+                            **stats,
+                        })
 
                 backups.sort(key=lambda x: x["date"], reverse=True)
                 return backups
@@ -307,13 +380,21 @@ class DataBackupHandler(DataManagerIO):
 
             # Restore database file @zara
             def do_restore():
-                db_path = Path(self.db.db_path)
-                backup_db = backup_dir / "solar_forecast.db"
+                sources = {
+                    FORMAT_SEGMENTS: BACKUP_MANIFEST_FILE,
+                    FORMAT_GZIP: BACKUP_GZIP_FILE,
+                    FORMAT_PLAIN: BACKUP_DB_FILE,
+                }
+                backup_format = detect_backup_format(backup_dir)
+                if backup_format is None:
+                    return False
 
-                if backup_db.exists():
-                    shutil.copy2(backup_db, db_path)
-                    return True
-                return False
+                restore_database(
+                    backup_dir / sources[backup_format],
+                    Path(self.db.db_path),
+                    store=self._get_backup_dir(backup_type) / SEGMENT_STORE_DIR,
+                )
+                return True
 
             success = await self.hass.async_add_executor_job(do_restore)
 
@@ -354,9 +435,10 @@ class DataBackupHandler(DataManagerIO):
             backup_dir = self._get_backup_dir(backup_type) / backup_name
 
             def do_delete():
-                if not backup_dir.exists():
+                if backup_name == SEGMENT_STORE_DIR or not backup_dir.exists():
                     return False
                 shutil.rmtree(backup_dir)
+                self._prune_segment_store(self._get_backup_dir(backup_type))
                 return True
 
             success = await self.hass.async_add_executor_job(do_delete)
@@ -416,6 +498,7 @@ class DataBackupHandler(DataManagerIO):
                     "total_size_bytes": total_size,
                     "total_size_mb": round(total_size / (1024 * 1024), 2),
                     "path": str(backup_dir),
+                    **backup_dir_stats(backup_dir),
                 }
 
             return await self.hass.async_add_executor_job(get_info)
@@ -142,7 +142,7 @@ class DataCache(DataManagerIO):
         timestamp: Optional[datetime] = None,
         date_str: Optional[str] = None,
     ) -> bool:
-        """Save yield value to database cache. @zara
+        """Save yield value to database cache via the write-behind buffer. @zara
 
         Args:
             value: Yield value in kWh
@@ -163,7 +163,7 @@ class DataCache(DataManagerIO):
                 "time": timestamp.isoformat(),
                 "date": date_str,
             }
-            await self.db.save_yield_cache(cache_data)
+            self.stage_yield_cache(cache_data)
 
             # Also update in-memory cache
             self._cache["yield_current"] = value
@@ -182,6 +182,10 @@ class DataCache(DataManagerIO):
         Returns:
             Dict with yield cache data or None
         """
+        pending = self.write_buffer.pending("yield_cache", 1)
+        if pending is not None:
+            return dict(pending)
+
         try:
             row = await self.fetch_one(
                 "SELECT value, time, date FROM yield_cache WHERE id = 1"
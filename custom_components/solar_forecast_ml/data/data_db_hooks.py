@@ -0,0 +1,160 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast ML DB-Version
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""
+Database Call Hooks for Solar Forecast ML V16.4.2.
+Wraps the statement coroutines of a DatabaseManager instance once and
+reports every call to the observers subscribed to that manager, so the
+update profiler and the query profiler share one set of wrappers.
+
+@zara
+"""
+
+import functools
+import logging
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Protocol, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+# DatabaseManager coroutines that run one statement (or script) each @zara
+DB_METHODS = ("execute", "executemany", "executescript", "fetchone", "fetchall")
+
+# Set while a hooked call runs; statements issued inside it belong to it @zara
+_IN_DB_CALL: ContextVar[bool] = ContextVar("sfml_db_hooks_in_call", default=False)
+
+# Hooks by id() of their DatabaseManager @zara
+_HOOKS: Dict[int, "DatabaseHooks"] = {}
+
+
+class DatabaseCallObserver(Protocol):
+    """Receiver of the hooked calls of one DatabaseManager. @zara"""
+
+    def wants_db_calls(self) -> bool:
+        """Whether the next call should be timed and reported. @zara"""
+
+    def on_db_call(
+        self,
+        method: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        elapsed: float,
+        result: Any,
+        error: bool,
+    ) -> None:
+        """Handle one finished call (elapsed in seconds). @zara"""
+
+
+class DatabaseHooks:
+    """The installed wrappers of one DatabaseManager and their observers. @zara
+
+    Wrappers are installed on the first subscription and stay in place;
+    with no interested observer a call costs one list scan. Observers
+    are notified in subscription order, and unsubscribing one never
+    touches the wrappers, so observers can come and go in any order.
+    """
+
+    def __init__(self, db_manager: Any):
+        """Initialize the hooks of a DatabaseManager. @zara"""
+        self.db = db_manager
+        self.observers: List[DatabaseCallObserver] = []
+        self._installed = False
+
+    def install(self) -> None:
+        """Wrap the statement coroutines of the DatabaseManager instance. @zara"""
+        if self._installed:
+            return
+        for name in DB_METHODS:
+            method = getattr(self.db, name, None)
+            if method is None:
+                continue
+            try:
+                setattr(self.db, name, self._wrap(name, method))
+            except (AttributeError, TypeError) as e:
+                _LOGGER.debug("Cannot hook DatabaseManager.%s: %s", name, e)
+        self._installed = True
+
+    def _wrap(self, name: str, method: Any) -> Any:
+        """Wrap one DatabaseManager coroutine. @zara"""
+
+        @functools.wraps(method)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _IN_DB_CALL.get():
+                return await method(*args, **kwargs)
+            observers = [o for o in self.observers if o.wants_db_calls()]
+            if not observers:
+                return await method(*args, **kwargs)
+
+            token = _IN_DB_CALL.set(True)
+            start = time.perf_counter()
+            try:
+                result = await method(*args, **kwargs)
+            except Exception:
+                self._notify(observers, name, args, kwargs, start, None, True)
+                raise
+            finally:
+                _IN_DB_CALL.reset(token)
+            self._notify(observers, name, args, kwargs, start, result, False)
+            return result
+
+        return wrapper
+
+    @staticmethod
+    def _notify(
+        observers: List[DatabaseCallObserver],
+        name: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        start: float,
+        result: Any,
+        error: bool,
+    ) -> None:
+        """Report a finished call; a failing observer never fails the query. @zara"""
+        elapsed = time.perf_counter() - start
+        for observer in observers:
+            try:
+                observer.on_db_call(name, args, kwargs, elapsed, result, error)
+            except Exception as e:
+                _LOGGER.debug("DB call observer %s failed: %s", type(observer).__name__, e)
+
+
+def get_database_hooks(db_manager: Any, create: bool = False) -> Optional[DatabaseHooks]:
+    """Get the hooks of a DatabaseManager. @zara
+
+    Args:
+        db_manager: DatabaseManager instance
+        create: Create the (not yet installed) hooks if there are none
+
+    Returns:
+        The hooks, or None if there are none and create is False
+    """
+    if db_manager is None:
+        return None
+    hooks = _HOOKS.get(id(db_manager))
+    if hooks is not None and hooks.db is not db_manager:
+        hooks = None
+    if hooks is None and create:
+        hooks = _HOOKS[id(db_manager)] = DatabaseHooks(db_manager)
+    return hooks
+
+
+def subscribe_db_calls(db_manager: Any, observer: DatabaseCallObserver) -> None:
+    """Report the calls of a DatabaseManager to observer, hooking it if needed. @zara"""
+    hooks = get_database_hooks(db_manager, create=True)
+    hooks.install()
+    if observer not in hooks.observers:
+        hooks.observers.append(observer)
+
+
+def unsubscribe_db_calls(db_manager: Any, observer: DatabaseCallObserver) -> None:
+    """Stop reporting the calls of a DatabaseManager to observer. @zara"""
+    hooks = get_database_hooks(db_manager)
+    if hooks is not None and observer in hooks.observers:
+        hooks.observers.remove(observer)
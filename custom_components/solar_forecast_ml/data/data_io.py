@@ -17,12 +17,15 @@ All file I/O replaced with database operations via DatabaseManager.
 
 import asyncio
 import logging
+import time
 from datetime import datetime
 from typing import Any, Optional
 
 from homeassistant.core import HomeAssistant
 
 from .db_manager import DatabaseManager
+from .data_query_profiler import get_query_profiler
+from .data_write_buffer import WriteBehindBuffer, async_stop_write_buffer, get_write_buffer
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -43,11 +46,20 @@ class DataManagerIO:
         """
         self.hass = hass
         self.db = db_manager
-        self._operation_lock = asyncio.Lock()
         self._initialized = False
 
         _LOGGER.debug("DataManagerIO initialized with DatabaseManager")
 
+    @property
+    def write_buffer(self) -> WriteBehindBuffer:
+        """Get the write-behind buffer shared by all users of this database. @zara"""
+        return get_write_buffer(self.hass, self.db)
+
+    @property
+    def _operation_lock(self) -> asyncio.Lock:
+        """Lock serializing writes to this database, shared with the buffer flush. @zara"""
+        return self.write_buffer.operation_lock
+
     async def ensure_initialized(self) -> bool:
         """Ensure the database connection is established. @zara"""
         if self._initialized:
@@ -83,7 +95,9 @@ class DataManagerIO:
         """
         try:
             async with asyncio.timeout(timeout):
+                wait_start = time.perf_counter()
                 async with self._operation_lock:
+                    self._record_lock_wait(sql, wait_start)
                     await self.db.execute(sql, parameters)
                     return True
         except asyncio.TimeoutError:
@@ -93,6 +107,44 @@ class DataManagerIO:
             _LOGGER.error("Database query failed: %s", e)
             return False
 
+    async def execute_many(
+        self,
+        sql: str,
+        parameters_list: list,
+        timeout: float = 30.0
+    ) -> bool:
+        """Execute one statement for many parameter sets with timeout. @zara
+
+        Args:
+            sql: SQL statement to execute
+            parameters_list: One parameter tuple per row
+            timeout: Timeout in seconds
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not parameters_list:
+            return True
+        try:
+            async with asyncio.timeout(timeout):
+                wait_start = time.perf_counter()
+                async with self._operation_lock:
+                    self._record_lock_wait(sql, wait_start)
+                    await self.db.executemany(sql, parameters_list)
+                    return True
+        except asyncio.TimeoutError:
+            _LOGGER.error("Database batch timeout after %.1f seconds", timeout)
+            return False
+        except Exception as e:
+            _LOGGER.error("Database batch failed: %s", e)
+            return False
+
+    def _record_lock_wait(self, sql: str, wait_start: float) -> None:
+        """Report the operation lock wait of a write to the query profiler. @zara"""
+        profiler = get_query_profiler(self.db)
+        if profiler is not None:
+            profiler.record_lock_wait(sql, time.perf_counter() - wait_start)
+
     async def fetch_one(
         self,
         sql: str,
@@ -133,6 +185,25 @@ class DataManagerIO:
             _LOGGER.error("Failed to fetch rows: %s", e)
             return []
 
+    def stage_yield_cache(self, cache_data: dict[str, Any]) -> None:
+        """Stage the yield_cache row in the write-behind buffer. @zara
+
+        Args:
+            cache_data: Dict with value, time and date
+        """
+        self.write_buffer.stage(
+            "yield_cache",
+            1,
+            """INSERT INTO yield_cache (id, value, time, date)
+               VALUES (1, ?, ?, ?)
+               ON CONFLICT(id) DO UPDATE SET
+                   value = excluded.value,
+                   time = excluded.time,
+                   date = excluded.date""",
+            (cache_data["value"], cache_data["time"], cache_data["date"]),
+            value=dict(cache_data),
+        )
+
     async def get_db_stats(self) -> dict[str, Any]:
         """Get database statistics. @zara
 
@@ -160,6 +231,7 @@ class DataManagerIO:
         """Cleanup resources and close database connection. @zara"""
         try:
             _LOGGER.info("Cleaning up DataManagerIO resources...")
+            await async_stop_write_buffer(self.hass, self.db)
             await self.db.close()
             self._initialized = False
             _LOGGER.info("DataManagerIO cleanup completed")
@@ -21,8 +21,10 @@ from typing import Any, Dict, List, Optional
 
 from homeassistant.core import HomeAssistant
 
+from ..core.core_helpers import SafeDateTimeUtil as dt_util
 from .db_manager import DatabaseManager
 from .data_io import DataManagerIO
+from .data_recorder_backfill import async_load_energy_readings, hourly_energy_deltas
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -67,6 +69,10 @@ class PanelGroupSensorReader(DataManagerIO):
             )
 
             self._last_values = {row[0]: row[1] for row in rows if row[1] is not None}
+            for group_name, pending in self.write_buffer.pending_rows(
+                "panel_group_sensor_state"
+            ).items():
+                self._last_values[group_name] = pending["last_value"]
 
             _LOGGER.debug(
                 "Loaded panel group sensor state: %d groups",
@@ -77,23 +83,28 @@ class PanelGroupSensorReader(DataManagerIO):
             self._last_values = {}
 
     async def _save_state(self, group_name: str, value: float) -> None:
-        """Save sensor value for a group to database. @zara
+        """Stage sensor value for a group in the write-behind buffer. @zara
 
         Args:
             group_name: Name of the panel group
             value: Current kWh value
         """
-        try:
-            await self.execute_query(
-                """INSERT INTO panel_group_sensor_state (group_name, last_value, last_updated)
-                   VALUES (?, ?, ?)
-                   ON CONFLICT(group_name) DO UPDATE SET
-                       last_value = excluded.last_value,
-                       last_updated = excluded.last_updated""",
-                (group_name, value, datetime.now()),
-            )
-        except Exception as e:
-            _LOGGER.warning("Failed to save panel group sensor state: %s", e)
+        now = datetime.now()
+        self.write_buffer.stage(
+            "panel_group_sensor_state",
+            group_name,
+            """INSERT INTO panel_group_sensor_state (group_name, last_value, last_updated)
+               VALUES (?, ?, ?)
+               ON CONFLICT(group_name) DO UPDATE SET
+                   last_value = excluded.last_value,
+                   last_updated = excluded.last_updated""",
+            (group_name, value, now),
+            value={
+                "group_name": group_name,
+                "last_value": value,
+                "last_updated": now.isoformat(" "),
+            },
+        )
 
     async def _save_all_states(self) -> None:
         """Save all current sensor values to database. @zara"""
@@ -280,15 +291,6 @@ class PanelGroupSensorReader(DataManagerIO):
         if not self.has_any_sensor():
             return 0
 
-        try:
-            from homeassistant.components.recorder import get_instance
-            from homeassistant.components.recorder.history import (
-                state_changes_during_period,
-            )
-        except ImportError:
-            _LOGGER.debug("Recorder not available for backfill")
-            return 0
-
         from datetime import timedelta
 
         cutoff = (datetime.now() - timedelta(days=days)).date().isoformat()
@@ -318,91 +320,35 @@ class PanelGroupSensorReader(DataManagerIO):
                     continue
 
                 first_date = missing[0][1]
-                start_time = datetime.fromisoformat(f"{first_date}T00:00:00")
-                end_time = datetime.now()
-
-                instance = get_instance(self.hass)
-                states = await instance.async_add_executor_job(
-                    state_changes_during_period,
+                readings = await async_load_energy_readings(
                     self.hass,
-                    start_time,
-                    end_time,
                     entity_id,
-                    False,
-                    True,
-                    None,
+                    datetime.fromisoformat(f"{first_date}T00:00:00"),
+                    dt_util.now(),
                 )
 
-                entity_states = states.get(entity_id, [])
-                if len(entity_states) < 2:
+                if len(readings) < 2:
                     _LOGGER.debug(
-                        "Backfill %s: insufficient recorder data (%d states)",
-                        group_name, len(entity_states),
+                        "Backfill %s: insufficient recorder data (%d readings)",
+                        group_name, len(readings),
                     )
                     continue
 
-                readings = []
-                unit_wh = False
-                for s in entity_states:
-                    if s.state in ("unavailable", "unknown", ""):
-                        continue
-                    try:
-                        val = float(s.state)
-                        if not unit_wh and hasattr(s, "attributes"):
-                            unit = s.attributes.get("unit_of_measurement", "")
-                            if unit.lower() == "wh":
-                                unit_wh = True
-                        if unit_wh:
-                            val = val / 1000.0
-                        readings.append((s.last_changed, val))
-                    except (ValueError, TypeError):
-                        continue
-
-                if len(readings) < 2:
+                deltas = hourly_energy_deltas(
+                    readings, ((row[0], row[1], row[2]) for row in missing)
+                )
+                if not deltas:
                     continue
 
-                readings.sort(key=lambda x: x[0])
-
-                group_filled = 0
-                for prediction_id, target_date, target_hour in missing:
-                    hour_start = datetime.fromisoformat(
-                        f"{target_date}T{target_hour:02d}:00:00"
-                    )
-                    hour_end = datetime.fromisoformat(
-                        f"{target_date}T{target_hour:02d}:59:59"
-                    )
-
-                    val_before = None
-                    val_at_end = None
-
-                    for ts, val in readings:
-                        ts_naive = ts.replace(tzinfo=None) if ts.tzinfo else ts
-                        if ts_naive <= hour_start:
-                            val_before = val
-                        if ts_naive <= hour_end:
-                            val_at_end = val
-
-                    if val_before is None or val_at_end is None:
-                        continue
-
-                    delta = val_at_end - val_before
-
-                    if delta < -0.001:
-                        continue
-
-                    delta = max(0.0, delta)
-
-                    if delta > 10.0:
-                        continue
-
-                    await self.execute_query(
-                        """UPDATE prediction_panel_groups
-                           SET actual_kwh = ?
-                           WHERE prediction_id = ? AND group_name = ?
-                             AND actual_kwh IS NULL""",
-                        (round(delta, 4), prediction_id, group_name),
-                    )
-                    group_filled += 1
+                if not await self.execute_many(
+                    """UPDATE prediction_panel_groups
+                       SET actual_kwh = ?
+                       WHERE prediction_id = ? AND group_name = ?
+                         AND actual_kwh IS NULL""",
+                    [(delta, prediction_id, group_name) for prediction_id, delta in deltas],
+                ):
+                    continue
+                group_filled = len(deltas)
 
                 if group_filled > 0:
                     _LOGGER.info(
@@ -595,6 +541,7 @@ class PanelGroupSensorReader(DataManagerIO):
     async def reset_last_values(self) -> None:
         """Reset all stored last values (e.g., at midnight). @zara"""
         self._last_values = {}
+        self.write_buffer.discard("panel_group_sensor_state")
 
         # Clear database entries
         try:
@@ -616,6 +563,10 @@ class PanelGroupSensorReader(DataManagerIO):
         Returns:
             Dict with state data or None
         """
+        pending = self.write_buffer.pending("panel_group_sensor_state", group_name)
+        if pending is not None:
+            return dict(pending)
+
         try:
             row = await self.fetch_one(
                 """SELECT group_name, last_value, last_updated
@@ -648,7 +599,7 @@ class PanelGroupSensorReader(DataManagerIO):
                 "SELECT group_name, last_value, last_updated FROM panel_group_sensor_state"
             )
 
-            return {
+            states = {
                 row[0]: {
                     "group_name": row[0],
                     "last_value": row[1],
@@ -656,6 +607,8 @@ class PanelGroupSensorReader(DataManagerIO):
                 }
                 for row in rows
             }
+            states.update(self.write_buffer.pending_rows("panel_group_sensor_state"))
+            return states
 
         except Exception as e:
             _LOGGER.error("Failed to get all states from DB: %s", e)
@@ -27,6 +27,13 @@ from homeassistant.core import HomeAssistant
 from ..const import BACKUP_RETENTION_DAYS, MAX_BACKUP_FILES
 from ..core.core_helpers import SafeDateTimeUtil as dt_util
 from .db_manager import DatabaseManager
+from .data_backup_engine import (
+    backup_file_stats,
+    restore_database,
+    snapshot_database,
+    write_gzip,
+)
+from .data_write_buffer import get_write_buffer
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,12 +42,14 @@ class DataPersistence:
     """Handles database backup, restoration, and data migration. @zara
 
     Provides methods to:
-    - Create database backups (copies of the SQLite file)
+    - Create database backups (gzip-compressed online snapshots)
     - Restore from backups
     - Migrate legacy JSON data to database
     - Clean up old backups based on retention policy
     """
 
+    BACKUP_SUFFIXES = (".db.gz", ".db")
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -60,6 +69,22 @@ class DataPersistence:
         self.backup_dir = self.data_dir / "backups" / "auto"
         self.manual_backup_dir = self.data_dir / "backups" / "manual"
 
+    @classmethod
+    def _backup_files(cls, directory: Path) -> list[Path]:
+        """Get the backup files of a directory, compressed and legacy plain. @zara"""
+        return [
+            path for path in directory.iterdir()
+            if path.is_file() and path.name.endswith(cls.BACKUP_SUFFIXES)
+        ]
+
+    @classmethod
+    def _backup_name(cls, path: Path) -> str:
+        """Get the backup name of a backup file. @zara"""
+        for suffix in cls.BACKUP_SUFFIXES:
+            if path.name.endswith(suffix):
+                return path.name[: -len(suffix)]
+        return path.stem
+
     async def create_backup(
         self,
         name: Optional[str] = None,
@@ -83,18 +108,26 @@ class DataPersistence:
 
             await self.hass.async_add_executor_job(ensure_dir)
 
+            # Staged rows belong in the backup @zara
+            await get_write_buffer(self.hass, self.db).async_flush()
+
             # Generate backup filename @zara
             timestamp = dt_util.now().strftime("%Y%m%d_%H%M%S")
             backup_name = f"{name}_{timestamp}" if name else f"backup_{timestamp}"
-            backup_file = backup_base / f"{backup_name}.db"
+            backup_file = backup_base / f"{backup_name}.db.gz"
 
-            # Copy the database file @zara
+            # Snapshot the live database and compress it @zara
             def copy_db():
                 db_path = Path(self.db.db_path)
-                if db_path.exists():
-                    shutil.copy2(db_path, backup_file)
-                    return True
-                return False
+                if not db_path.exists():
+                    return False
+                snapshot = backup_base / f"{backup_name}.db.snapshot"
+                try:
+                    snapshot_database(db_path, snapshot)
+                    write_gzip(snapshot, backup_file)
+                finally:
+                    snapshot.unlink(missing_ok=True)
+                return True
 
             success = await self.hass.async_add_executor_job(copy_db)
 
@@ -143,8 +176,8 @@ class DataPersistence:
                     pre_restore = db_path.with_suffix(".db.pre_restore")
                     shutil.copy2(db_path, pre_restore)
 
-                # Restore from backup @zara
-                shutil.copy2(backup_file, db_path)
+                # Restore from backup (.db.gz or legacy .db) @zara
+                restore_database(backup_file, db_path)
 
             await self.hass.async_add_executor_job(do_restore)
 
@@ -174,7 +207,7 @@ class DataPersistence:
 
             def do_cleanup():
                 backups = sorted(
-                    self.backup_dir.glob("*.db"),
+                    self._backup_files(self.backup_dir),
                     key=lambda p: p.stat().st_mtime
                 )
 
@@ -189,7 +222,7 @@ class DataPersistence:
 
                 # Remove if older than retention period @zara
                 cutoff_date = dt_util.now() - timedelta(days=BACKUP_RETENTION_DAYS)
-                remaining_backups = list(self.backup_dir.glob("*.db"))
+                remaining_backups = self._backup_files(self.backup_dir)
                 for backup in remaining_backups:
                     mtime = datetime.fromtimestamp(backup.stat().st_mtime)
                     mtime = dt_util.ensure_local(mtime)
@@ -225,17 +258,18 @@ class DataPersistence:
 
                 backups = []
                 for backup_file in sorted(
-                    backup_base.glob("*.db"),
+                    self._backup_files(backup_base),
                     key=lambda p: p.stat().st_mtime,
                     reverse=True
                 ):
                     stat = backup_file.stat()
                     backups.append({
-                        "name": backup_file.stem,
+                        "name": self._backup_name(backup_file),
                         "path": str(backup_file),
                         "size_mb": round(stat.st_size / (1024 * 1024), 2),
                         "created": datetime.fromtimestamp(stat.st_mtime).isoformat(),
                         "type": "manual" if manual else "automatic",
+                        **backup_file_stats(backup_file),
                     })
                 return backups
 
@@ -257,13 +291,13 @@ class DataPersistence:
         """
         try:
             backup_base = self.manual_backup_dir if manual else self.backup_dir
-            backup_file = backup_base / f"{backup_name}.db"
-
             def do_delete():
-                if not backup_file.exists():
-                    return False
-                backup_file.unlink()
-                return True
+                for suffix in self.BACKUP_SUFFIXES:
+                    backup_file = backup_base / f"{backup_name}{suffix}"
+                    if backup_file.exists():
+                        backup_file.unlink()
+                        return True
+                return False
 
             success = await self.hass.async_add_executor_job(do_delete)
 
@@ -0,0 +1,337 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast ML DB-Version
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""
+Query Profiler for Solar Forecast ML V16.4.2.
+Opt-in per-statement statistics of all DatabaseManager traffic, with
+EXPLAIN QUERY PLAN for the most expensive statements.
+
+@zara
+"""
+
+import functools
+import logging
+import re
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..const import QUERY_PROFILE_MAX_STATEMENTS, QUERY_PROFILE_TOP_N
+from ..core.core_helpers import SafeDateTimeUtil as dt_util
+from .data_db_hooks import subscribe_db_calls
+from .db_manager import DatabaseManager
+
+_LOGGER = logging.getLogger(__name__)
+
+# Key used once QUERY_PROFILE_MAX_STATEMENTS distinct statements were seen @zara
+OTHER_STATEMENTS = "(other statements)"
+
+# Statements EXPLAIN QUERY PLAN can describe @zara
+_EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE", "REPLACE")
+
+ORDER_BY_FIELDS = ("total_ms", "max_ms", "calls", "rows", "lock_wait_ms")
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?![\w.])")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+# Set during the profiler's own EXPLAIN statements @zara
+_SUSPENDED: ContextVar[bool] = ContextVar("sfml_query_profiler_suspended", default=False)
+
+# Profilers by id() of their DatabaseManager @zara
+_PROFILERS: Dict[int, "QueryProfiler"] = {}
+
+
+@functools.lru_cache(maxsize=1024)
+def normalize_sql(sql: str) -> str:
+    """Reduce a statement to its shape: literals become ?, whitespace collapses. @zara
+
+    IN lists of any length are folded into IN (?...), so the same query
+    with a different number of parameters is counted once.
+    """
+    text = _STRING_LITERAL.sub("?", sql)
+    text = _NUMBER_LITERAL.sub("?", text)
+    text = _WHITESPACE.sub(" ", text).strip().rstrip(";")
+    return _IN_LIST.sub("IN (?...)", text)
+
+
+@dataclass
+class QueryStats:
+    """Accumulated statistics of one normalized statement. @zara"""
+
+    sql: str
+    calls: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    rows: int = 0
+    lock_waits: int = 0
+    lock_wait_ms: float = 0.0
+    sample_sql: Optional[str] = None
+    sample_parameters: Optional[Sequence[Any]] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the statistics as a dict. @zara"""
+        return {
+            "sql": self.sql,
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_ms": round(self.total_ms, 2),
+            "avg_ms": round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            "max_ms": round(self.max_ms, 2),
+            "rows": self.rows,
+            "lock_wait_ms": round(self.lock_wait_ms, 2),
+            "lock_waits": self.lock_waits,
+        }
+
+
+class QueryProfiler:
+    """Opt-in per-statement profiler of a DatabaseManager. @zara
+
+    The profiler subscribes to the shared hooks of data_db_hooks when
+    profiling starts for the first time. While stopped it declines every
+    call, so the hooks stay installed. DataManagerIO reports the time
+    writes spent waiting on its operation lock.
+    """
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        max_statements: int = QUERY_PROFILE_MAX_STATEMENTS,
+    ):
+        """Initialize the profiler. @zara
+
+        Args:
+            db_manager: DatabaseManager whose statements are profiled
+            max_statements: Distinct statements tracked before grouping the rest
+        """
+        self.db = db_manager
+        self.max_statements = max_statements
+        self.enabled = False
+        self.started_at: Optional[datetime] = None
+        self._stats: Dict[str, QueryStats] = {}
+        self._installed = False
+
+    def start(self) -> None:
+        """Start (or continue) collecting statistics. @zara"""
+        if not self._installed:
+            self._install()
+        if not self.enabled:
+            self.enabled = True
+            self.started_at = self.started_at or dt_util.now()
+            _LOGGER.info("Database query profiling started")
+
+    def stop(self) -> None:
+        """Stop collecting; collected statistics are kept. @zara"""
+        if self.enabled:
+            self.enabled = False
+            _LOGGER.info("Database query profiling stopped")
+
+    def reset(self) -> None:
+        """Drop all collected statistics. @zara"""
+        self._stats.clear()
+        self.started_at = dt_util.now() if self.enabled else None
+
+    def _install(self) -> None:
+        """Subscribe to the DB call hooks of the DatabaseManager. @zara"""
+        subscribe_db_calls(self.db, self)
+        self._installed = True
+
+    def wants_db_calls(self) -> bool:
+        """Calls are recorded while enabled, except the profiler's own. @zara"""
+        return self.enabled and not _SUSPENDED.get()
+
+    def on_db_call(
+        self,
+        method: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        elapsed: float,
+        result: Any,
+        error: bool,
+    ) -> None:
+        """Record one hooked DatabaseManager call. @zara"""
+        if not args:
+            return
+        sql = args[0]
+        parameters = args[1] if len(args) > 1 else kwargs.get("parameters", ())
+        if method == "executemany":
+            batch = parameters if isinstance(parameters, (list, tuple)) else None
+            sample = batch[0] if batch else None
+        else:
+            batch = None
+            sample = parameters
+
+        if error:
+            rows = 0
+        elif method == "fetchall":
+            rows = len(result) if result else 0
+        elif method == "fetchone":
+            rows = 0 if result is None else 1
+        elif batch is not None:
+            rows = len(batch)
+        else:
+            rows = 0
+        self.record(sql, sample, elapsed, rows, error=error)
+
+    def _stats_for(self, sql: str) -> QueryStats:
+        """Get or create the statistics bucket of a statement. @zara"""
+        key = normalize_sql(sql)
+        stats = self._stats.get(key)
+        if stats is None:
+            if len(self._stats) >= self.max_statements:
+                key = OTHER_STATEMENTS
+                stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = QueryStats(sql=key)
+        return stats
+
+    def record(
+        self,
+        sql: str,
+        parameters: Any,
+        elapsed: float,
+        rows: int,
+        error: bool = False,
+    ) -> None:
+        """Record one executed statement. @zara
+
+        Args:
+            sql: Statement as executed
+            parameters: Its parameters (first row for executemany)
+            elapsed: Duration in seconds
+            rows: Rows returned (or parameter rows for executemany)
+            error: True if the statement raised
+        """
+        stats = self._stats_for(sql)
+        elapsed_ms = elapsed * 1000
+        stats.calls += 1
+        stats.total_ms += elapsed_ms
+        stats.max_ms = max(stats.max_ms, elapsed_ms)
+        stats.rows += rows
+        if error:
+            stats.errors += 1
+        if stats.sample_sql is None and stats.sql != OTHER_STATEMENTS:
+            stats.sample_sql = sql
+            stats.sample_parameters = parameters
+
+    def record_lock_wait(self, sql: str, elapsed: float) -> None:
+        """Record time a statement waited for the DataManagerIO operation lock. @zara"""
+        if not self.enabled:
+            return
+        stats = self._stats_for(sql)
+        stats.lock_waits += 1
+        stats.lock_wait_ms += elapsed * 1000
+
+    def top(
+        self, limit: int = QUERY_PROFILE_TOP_N, order_by: str = "total_ms"
+    ) -> List[QueryStats]:
+        """Get the most expensive statements. @zara
+
+        Args:
+            limit: Number of statements
+            order_by: One of ORDER_BY_FIELDS
+        """
+        if order_by not in ORDER_BY_FIELDS:
+            raise ValueError(f"order_by must be one of {', '.join(ORDER_BY_FIELDS)}")
+        ranked = sorted(
+            self._stats.values(), key=lambda stats: getattr(stats, order_by), reverse=True
+        )
+        return ranked[:limit]
+
+    async def async_explain(self, stats: QueryStats) -> Optional[List[str]]:
+        """Run EXPLAIN QUERY PLAN for the sample of a statement. @zara
+
+        Returns:
+            Plan detail lines, None if the statement cannot be explained
+        """
+        sample = stats.sample_sql
+        if not sample or not sample.lstrip().upper().startswith(_EXPLAINABLE):
+            return None
+
+        token = _SUSPENDED.set(True)
+        try:
+            rows = await self.db.fetchall(
+                f"EXPLAIN QUERY PLAN {sample}", tuple(stats.sample_parameters or ())
+            )
+        except Exception as e:
+            _LOGGER.debug("EXPLAIN QUERY PLAN failed for %s: %s", stats.sql, e)
+            return None
+        finally:
+            _SUSPENDED.reset(token)
+
+        return [str(row[-1]) for row in rows or []]
+
+    async def async_get_report(
+        self,
+        limit: int = QUERY_PROFILE_TOP_N,
+        order_by: str = "total_ms",
+        explain: bool = True,
+    ) -> Dict[str, Any]:
+        """Get the profile of the top statements, optionally with query plans. @zara
+
+        Statements whose plan contains a SCAN step (a full table or index
+        scan) are listed in full_scans.
+        """
+        statements = []
+        full_scans = []
+        for stats in self.top(limit, order_by):
+            entry = stats.as_dict()
+            if explain:
+                plan = await self.async_explain(stats)
+                entry["plan"] = plan
+                scans = [
+                    line for line in plan or []
+                    if line.startswith("SCAN ") and line != "SCAN CONSTANT ROW"
+                ]
+                entry["scans"] = scans
+                if scans:
+                    full_scans.append({"sql": stats.sql, "scans": scans})
+            statements.append(entry)
+
+        return {
+            "enabled": self.enabled,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "distinct_statements": len(self._stats),
+            "calls": sum(stats.calls for stats in self._stats.values()),
+            "total_ms": round(sum(stats.total_ms for stats in self._stats.values()), 2),
+            "lock_wait_ms": round(sum(stats.lock_wait_ms for stats in self._stats.values()), 2),
+            "order_by": order_by,
+            "statements": statements,
+            "full_scans": full_scans,
+        }
+
+    @property
+    def has_data(self) -> bool:
+        """True once any statement was recorded. @zara"""
+        return bool(self._stats)
+
+
+def get_query_profiler(
+    db_manager: Optional[DatabaseManager], create: bool = False
+) -> Optional[QueryProfiler]:
+    """Get the query profiler of a DatabaseManager. @zara
+
+    Args:
+        db_manager: DatabaseManager instance
+        create: Create the (stopped) profiler if there is none yet
+
+    Returns:
+        The profiler, or None if there is none and create is False
+    """
+    if db_manager is None:
+        return None
+    profiler = _PROFILERS.get(id(db_manager))
+    if profiler is not None and profiler.db is not db_manager:
+        profiler = None
+    if profiler is None and create:
+        profiler = _PROFILERS[id(db_manager)] = QueryProfiler(db_manager)
+    return profiler
@@ -0,0 +1,177 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast ML DB-Version
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""
+Recorder Backfill Engine for Solar Forecast ML V16.4.2.
+Turns the recorder history of a cumulative energy sensor into hourly
+deltas in one sweep, for the panel-group and shadow-detection backfills.
+
+@zara
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Hashable, Iterable, List, Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+
+from ..core.core_helpers import SafeDateTimeUtil as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+# Hourly deltas above this are treated as counter glitches @zara
+MAX_HOURLY_DELTA_KWH = 10.0
+
+# Decreases up to this are rounding noise, larger ones are counter resets @zara
+RESET_TOLERANCE_KWH = 0.001
+
+EnergyReading = Tuple[datetime, float]
+
+
+def parse_energy_readings(entity_states: Iterable[Any]) -> List[EnergyReading]:
+    """Convert recorder states into (naive local timestamp, kWh) readings sorted by time. @zara
+
+    Args:
+        entity_states: Recorder State objects of one energy sensor
+
+    Returns:
+        Readings in ascending time order; unavailable or invalid states are skipped
+    """
+    readings: List[EnergyReading] = []
+    unit_wh = False
+    for state in entity_states:
+        if state.state in ("unavailable", "unknown", ""):
+            continue
+        try:
+            value = float(state.state)
+        except (ValueError, TypeError):
+            continue
+        if not unit_wh and hasattr(state, "attributes"):
+            unit = state.attributes.get("unit_of_measurement", "") or ""
+            if unit.lower() == "wh":
+                unit_wh = True
+        if unit_wh:
+            value = value / 1000.0
+        ts = state.last_changed
+        # Recorder times are UTC, the hour boundaries are local wall-clock times @zara
+        if ts.tzinfo is not None:
+            ts = dt_util.as_local(ts).replace(tzinfo=None)
+        readings.append((ts, value))
+
+    readings.sort(key=lambda reading: reading[0])
+    return readings
+
+
+async def async_load_energy_readings(
+    hass: HomeAssistant,
+    entity_id: str,
+    start_time: datetime,
+    end_time: datetime,
+) -> List[EnergyReading]:
+    """Load and parse the recorder history of an energy sensor in the executor. @zara
+
+    Args:
+        hass: Home Assistant instance
+        entity_id: Cumulative energy sensor
+        start_time: Start of the history window (naive means local time)
+        end_time: End of the history window (naive means local time)
+
+    Returns:
+        Parsed readings, empty if the recorder is not available
+    """
+    try:
+        from homeassistant.components.recorder import get_instance
+        from homeassistant.components.recorder.history import (
+            state_changes_during_period,
+        )
+    except ImportError:
+        _LOGGER.debug("Recorder not available for backfill")
+        return []
+
+    local_tz = dt_util.get_default_time_zone()
+    if start_time.tzinfo is None:
+        start_time = start_time.replace(tzinfo=local_tz)
+    if end_time.tzinfo is None:
+        end_time = end_time.replace(tzinfo=local_tz)
+
+    def _load() -> List[EnergyReading]:
+        states = state_changes_during_period(
+            hass, start_time, end_time, entity_id, False, True, None
+        )
+        return parse_energy_readings(states.get(entity_id, []))
+
+    # Parsing runs with the query so a 1 Hz sensor never blocks the event loop @zara
+    return await get_instance(hass).async_add_executor_job(_load)
+
+
+def hourly_energy_deltas(
+    readings: List[EnergyReading],
+    hours: Iterable[Tuple[Hashable, str, int]],
+    max_delta: float = MAX_HOURLY_DELTA_KWH,
+) -> List[Tuple[Hashable, float]]:
+    """Compute the energy produced in each requested hour in one sweep. @zara
+
+    For an hour the delta is the last reading at or before HH:59:59 minus
+    the last reading at or before HH:00:00. Hours are visited in time
+    order, so both boundaries only move forward through the readings and
+    the whole pass is O(readings + hours).
+
+    Args:
+        readings: Readings sorted by time (see parse_energy_readings)
+        hours: (key, target_date, target_hour) of the hours to fill
+        max_delta: Deltas above this are skipped as implausible
+
+    Returns:
+        (key, kWh) for every hour with a usable delta
+    """
+    boundaries = [
+        (
+            datetime.fromisoformat(f"{target_date}T{target_hour:02d}:00:00"),
+            datetime.fromisoformat(f"{target_date}T{target_hour:02d}:59:59"),
+            key,
+        )
+        for key, target_date, target_hour in hours
+    ]
+    boundaries.sort(key=lambda boundary: boundary[0])
+
+    results: List[Tuple[Hashable, float]] = []
+    count = len(readings)
+    index = 0
+    last_value: Optional[float] = None
+    previous_start: Optional[datetime] = None
+    value_before = value_at_end = None
+
+    for hour_start, hour_end, key in boundaries:
+        # Several keys for the same hour share one pair of boundary values @zara
+        if hour_start != previous_start:
+            previous_start = hour_start
+            while index < count and readings[index][0] <= hour_start:
+                last_value = readings[index][1]
+                index += 1
+            value_before = last_value
+
+            while index < count and readings[index][0] <= hour_end:
+                last_value = readings[index][1]
+                index += 1
+            value_at_end = last_value
+
+        if value_before is None or value_at_end is None:
+            continue
+
+        delta = value_at_end - value_before
+        if delta < -RESET_TOLERANCE_KWH:
+            continue
+
+        delta = max(0.0, delta)
+        if delta > max_delta:
+            continue
+
+        results.append((key, round(delta, 4)))
+
+    return results
@@ -218,7 +218,7 @@ class DataStateHandler(DataManagerIO):
                 "time": timestamp.isoformat(),
                 "date": timestamp.date().isoformat(),
             }
-            await self.db.save_yield_cache(cache)
+            self.stage_yield_cache(cache)
             return True
 
         except Exception as e:
@@ -231,6 +231,10 @@ class DataStateHandler(DataManagerIO):
         Returns:
             Yield cache dictionary or None
         """
+        pending = self.write_buffer.pending("yield_cache", 1)
+        if pending is not None:
+            return dict(pending)
+
         try:
             row = await self.db.fetchone(
                 "SELECT value, time, date FROM yield_cache WHERE id = 1"
@@ -268,6 +272,8 @@ class DataStateHandler(DataManagerIO):
                 "last_values": {group_name: last_value},
                 "last_updated": dt_util.now().isoformat(),
             }
+            # A direct write supersedes a staged value for the same group @zara
+            self.write_buffer.discard("panel_group_sensor_state", group_name)
             await self.db.save_panel_group_sensor_state(state)
             return True
 
@@ -286,7 +292,12 @@ class DataStateHandler(DataManagerIO):
                 "SELECT group_name, last_value FROM panel_group_sensor_state"
             )
 
-            return {row[0]: float(row[1]) for row in rows if row[1] is not None}
+            states = {row[0]: float(row[1]) for row in rows if row[1] is not None}
+            for group_name, pending in self.write_buffer.pending_rows(
+                "panel_group_sensor_state"
+            ).items():
+                states[group_name] = float(pending["last_value"])
+            return states
 
         except Exception as e:
             _LOGGER.error("Failed to load panel group sensor states: %s", e)
@@ -0,0 +1,268 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast ML DB-Version
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""
+Statistics Materializer for Solar Forecast ML V16.4.2.
+Keeps the rolling yield/accuracy/consumption rollups in the daily_statistics
+row so coordinator refreshes read them with one primary-key lookup.
+
+@zara
+"""
+
+import logging
+from datetime import date, timedelta
+from typing import Any, Dict, Optional
+
+from homeassistant.core import HomeAssistant
+
+from ..const import (
+    PEAK_TODAY_AT,
+    PEAK_TODAY_POWER_W,
+    STATS_ALL_TIME_PEAK,
+    STATS_AVG_ACCURACY,
+    STATS_AVG_YIELD_KWH,
+    STATS_CONSUMPTION_KWH,
+    STATS_CURRENT_MONTH,
+    STATS_CURRENT_WEEK,
+    STATS_LAST_7_DAYS,
+    STATS_LAST_30_DAYS,
+    STATS_YIELD_KWH,
+)
+from ..core.core_helpers import SafeDateTimeUtil as dt_util
+from .db_manager import DatabaseManager
+from .data_io import DataManagerIO
+
+_LOGGER = logging.getLogger(__name__)
+
+# daily_statistics columns maintained by the materializer @zara
+_ROLLUP_COLUMNS = (
+    "last_7_days_avg_yield_kwh",
+    "last_7_days_avg_accuracy",
+    "last_7_days_total_yield_kwh",
+    "last_30_days_avg_yield_kwh",
+    "last_30_days_avg_accuracy",
+    "last_30_days_total_yield_kwh",
+    "last_365_days_avg_yield_kwh",
+    "last_365_days_total_yield_kwh",
+    "current_month_yield_kwh",
+    "current_month_days",
+    "current_month_consumption_kwh",
+    "current_month_avg_autarky",
+    "current_week_yield_kwh",
+    "current_week_days",
+    "current_week_consumption_kwh",
+)
+
+
+class StatisticsMaterializer(DataManagerIO):
+    """Materialized rolling statistics in daily_statistics. @zara
+
+    Triggers on daily_summaries and forecast_history bump
+    daily_statistics_state.source_version whenever a finalized day (or
+    today's row) changes. The rollups are recomputed in one bounded pass
+    only when that version moved or the local date rolled over; every
+    other refresh is a single primary-key read.
+    """
+
+    def __init__(self, hass: HomeAssistant, db_manager: DatabaseManager):
+        """Initialize the statistics materializer. @zara
+
+        Args:
+            hass: Home Assistant instance
+            db_manager: DatabaseManager instance for DB operations
+        """
+        super().__init__(hass, db_manager)
+        self.rebuilds = 0
+
+    async def async_get_statistics(self, today: Optional[date] = None) -> Dict[str, Any]:
+        """Get coordinator statistics, rebuilding the rollups only when stale. @zara
+
+        Args:
+            today: Local date the windows are anchored to (default: today)
+
+        Returns:
+            Statistics dict in the coordinator data format
+        """
+        if today is None:
+            today = dt_util.now().date()
+
+        row = await self.fetch_one(
+            f"""SELECT st.source_version, st.built_version, st.period_date,
+                       p.peak_record_w, p.peak_record_date, p.peak_record_time,
+                       {', '.join('s.' + column for column in _ROLLUP_COLUMNS)}
+                FROM daily_statistics_state st
+                LEFT JOIN daily_statistics s ON s.id = 1
+                LEFT JOIN production_time_state p ON p.id = 1
+                WHERE st.id = 1"""
+        )
+
+        if row is None:
+            # State table not created yet: compute without persisting freshness @zara
+            rollups = await self.async_rebuild(today, source_version=None)
+            peak = await self.fetch_one(
+                """SELECT peak_record_w, peak_record_date, peak_record_time
+                   FROM production_time_state WHERE id = 1"""
+            )
+        else:
+            values = tuple(row)
+            source_version, built_version, period_date = values[:3]
+            peak = values[3:6]
+            if built_version != source_version or str(period_date) != today.isoformat():
+                rollups = await self.async_rebuild(today, source_version=source_version)
+            else:
+                rollups = dict(zip(_ROLLUP_COLUMNS, values[6:]))
+
+        return self._to_statistics(rollups, peak)
+
+    async def async_rebuild(
+        self, today: date, source_version: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Recompute all rollups in one pass per source table and store them. @zara
+
+        Args:
+            today: Local date the windows are anchored to
+            source_version: Version read before computing; recorded as built
+
+        Returns:
+            Dict mapping daily_statistics column to value
+        """
+        day_7 = (today - timedelta(days=7)).isoformat()
+        day_30 = (today - timedelta(days=30)).isoformat()
+        day_365 = (today - timedelta(days=365)).isoformat()
+        month_start = today.replace(day=1).isoformat()
+        week_start_date = today - timedelta(days=today.weekday())
+        week_start = week_start_date.isoformat()
+
+        rollups: Dict[str, Any] = dict.fromkeys(_ROLLUP_COLUMNS)
+
+        yields = await self.fetch_one(
+            """SELECT
+                   AVG(CASE WHEN date >= ? THEN actual_total_kwh END),
+                   AVG(CASE WHEN date >= ? THEN accuracy_percent END),
+                   SUM(CASE WHEN date >= ? THEN actual_total_kwh END),
+                   AVG(CASE WHEN date >= ? THEN actual_total_kwh END),
+                   AVG(CASE WHEN date >= ? THEN accuracy_percent END),
+                   SUM(CASE WHEN date >= ? THEN actual_total_kwh END),
+                   AVG(actual_total_kwh),
+                   SUM(actual_total_kwh),
+                   SUM(CASE WHEN date >= ? THEN actual_total_kwh END),
+                   COUNT(CASE WHEN date >= ? THEN 1 END),
+                   SUM(CASE WHEN date >= ? THEN actual_total_kwh END),
+                   COUNT(CASE WHEN date >= ? THEN 1 END)
+               FROM daily_summaries
+               WHERE date >= ? AND actual_total_kwh IS NOT NULL""",
+            (
+                day_7, day_7, day_7,
+                day_30, day_30, day_30,
+                month_start, month_start,
+                week_start, week_start,
+                day_365,
+            ),
+        )
+        if yields:
+            values = tuple(yields)
+            # First ten values follow _ROLLUP_COLUMNS up to current_month_days @zara
+            rollups.update(zip(_ROLLUP_COLUMNS[:10], values[:10]))
+            rollups["current_week_yield_kwh"] = values[10]
+            rollups["current_week_days"] = values[11]
+
+        consumption = await self.fetch_one(
+            """SELECT
+                   SUM(CASE WHEN date >= ? THEN consumption_kwh END),
+                   AVG(CASE WHEN date >= ? THEN autarky END),
+                   SUM(CASE WHEN date >= ? THEN consumption_kwh END)
+               FROM forecast_history
+               WHERE date >= ?""",
+            (month_start, month_start, week_start, min(month_start, week_start)),
+        )
+        if consumption:
+            rollups["current_month_consumption_kwh"] = consumption[0]
+            rollups["current_month_avg_autarky"] = consumption[1]
+            rollups["current_week_consumption_kwh"] = consumption[2]
+
+        now = dt_util.now().isoformat()
+        iso_year, iso_week, _ = today.isocalendar()
+        period_columns = {
+            "current_week_period": f"{iso_year}-W{iso_week:02d}",
+            "current_week_date_range": (
+                f"{week_start} - {(week_start_date + timedelta(days=6)).isoformat()}"
+            ),
+            "current_week_updated_at": now,
+            "current_month_period": today.strftime("%Y-%m"),
+            "current_month_updated_at": now,
+            "last_7_days_calculated_at": now,
+            "last_30_days_calculated_at": now,
+            "last_365_days_calculated_at": now,
+            "last_updated": now,
+        }
+        columns = {**rollups, **period_columns}
+
+        await self.execute_query(
+            f"""INSERT INTO daily_statistics (id, {', '.join(columns)})
+                VALUES (1, {', '.join('?' for _ in columns)})
+                ON CONFLICT(id) DO UPDATE SET
+                    {', '.join(f'{column} = excluded.{column}' for column in columns)}""",
+            tuple(columns.values()),
+        )
+
+        if source_version is not None:
+            # Changes made while computing bumped source_version past this value @zara
+            await self.execute_query(
+                """UPDATE daily_statistics_state
+                   SET built_version = ?, period_date = ?, rebuilt_at = ?
+                   WHERE id = 1""",
+                (source_version, today.isoformat(), now),
+            )
+
+        self.rebuilds += 1
+        _LOGGER.debug("Daily statistics rollups rebuilt for %s", today.isoformat())
+        return rollups
+
+    @staticmethod
+    def _to_statistics(rollups: Dict[str, Any], peak: Optional[Any]) -> Dict[str, Any]:
+        """Convert rollup columns into the coordinator statistics format. @zara"""
+
+        def _optional(value: Any) -> Optional[float]:
+            return float(value) if value else None
+
+        def _total(value: Any) -> float:
+            return float(value) if value else 0.0
+
+        statistics: Dict[str, Any] = {
+            STATS_ALL_TIME_PEAK: {},
+            STATS_LAST_7_DAYS: {
+                STATS_AVG_YIELD_KWH: _optional(rollups["last_7_days_avg_yield_kwh"]),
+                STATS_AVG_ACCURACY: _optional(rollups["last_7_days_avg_accuracy"]),
+                STATS_YIELD_KWH: _optional(rollups["last_7_days_total_yield_kwh"]),
+            },
+            STATS_LAST_30_DAYS: {
+                STATS_AVG_YIELD_KWH: _optional(rollups["last_30_days_avg_yield_kwh"]),
+                STATS_AVG_ACCURACY: _optional(rollups["last_30_days_avg_accuracy"]),
+                STATS_YIELD_KWH: _optional(rollups["last_30_days_total_yield_kwh"]),
+            },
+            STATS_CURRENT_MONTH: {
+                STATS_YIELD_KWH: _total(rollups["current_month_yield_kwh"]),
+                STATS_CONSUMPTION_KWH: _total(rollups["current_month_consumption_kwh"]),
+                "avg_autarky": _optional(rollups["current_month_avg_autarky"]),
+                "days": int(rollups["current_month_days"] or 0),
+            },
+            STATS_CURRENT_WEEK: {
+                STATS_YIELD_KWH: _total(rollups["current_week_yield_kwh"]),
+                STATS_CONSUMPTION_KWH: _total(rollups["current_week_consumption_kwh"]),
+            },
+        }
+
+        if peak and peak[0]:
+            statistics[STATS_ALL_TIME_PEAK] = {
+                PEAK_TODAY_POWER_W: float(peak[0]),
+                PEAK_TODAY_AT: f"{peak[1]} {peak[2]}" if peak[1] and peak[2] else None,
+                "date": peak[1],
+            }
+
+        return statistics
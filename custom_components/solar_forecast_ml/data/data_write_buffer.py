@@ -0,0 +1,229 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast ML DB-Version
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""
+Write-behind buffer for Solar Forecast ML V16.2.0.
+Collects high-frequency singleton-row updates (peaks, sensor counters,
+yield cache) in memory and writes them in one transaction per flush.
+
+@zara
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_track_time_interval
+
+from .db_manager import DatabaseManager
+from ..const import DOMAIN, WRITE_BUFFER_FLUSH_INTERVAL
+
+_LOGGER = logging.getLogger(__name__)
+
+WRITE_BUFFER_KEY = f"{DOMAIN}_write_buffers"
+
+
+@dataclass
+class _PendingWrite:
+    """One staged statement with the value readers should see. @zara"""
+
+    sql: str
+    parameters: Tuple[Any, ...]
+    value: Any
+
+
+class WriteBehindBuffer:
+    """Keyed last-write-wins buffer flushed on a fixed cadence. @zara
+
+    Every row is identified by (table, row_key). Staging a row again only
+    replaces the pending statement, so a sensor that changes every second
+    costs one write per flush interval instead of one commit per event.
+    Readers overlay pending() on top of their query result. At most one
+    flush interval is lost on a crash; shutdown and unload always flush.
+    The flush goes through the DatabaseManager API under operation_lock,
+    the lock DataManagerIO holds for its writes to the same database.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        db_manager: DatabaseManager,
+        flush_interval: timedelta = WRITE_BUFFER_FLUSH_INTERVAL,
+    ):
+        """Initialize the write buffer. @zara
+
+        Args:
+            hass: Home Assistant instance
+            db_manager: DatabaseManager whose connection receives the writes
+            flush_interval: Time between two background flushes
+        """
+        self.hass = hass
+        self.db = db_manager
+        self.flush_interval = flush_interval
+        self._pending: Dict[Tuple[str, Hashable], _PendingWrite] = {}
+        self._flush_lock = asyncio.Lock()
+        self.operation_lock = asyncio.Lock()
+        self._unsub_timer: Optional[Callable[[], None]] = None
+        self._stopped = False
+
+        self.staged = 0
+        self.coalesced = 0
+        self.flushes = 0
+        self.rows_written = 0
+        self.failed_flushes = 0
+
+    @property
+    def pending_count(self) -> int:
+        """Number of rows waiting for the next flush. @zara"""
+        return len(self._pending)
+
+    def stage(
+        self,
+        table: str,
+        row_key: Hashable,
+        sql: str,
+        parameters: Tuple[Any, ...] = (),
+        value: Any = None,
+    ) -> None:
+        """Stage the latest write for one row, replacing an unflushed one. @zara
+
+        Args:
+            table: Table of the row
+            row_key: Key of the row within the table
+            sql: Statement that persists the row (upsert or keyed UPDATE)
+            parameters: Statement parameters
+            value: Value returned by pending() until the row is flushed
+        """
+        key = (table, row_key)
+        if key in self._pending:
+            self.coalesced += 1
+        self._pending[key] = _PendingWrite(sql, tuple(parameters), value)
+        self.staged += 1
+
+        if self._unsub_timer is None and not self._stopped:
+            self._unsub_timer = async_track_time_interval(
+                self.hass, self._async_scheduled_flush, self.flush_interval
+            )
+
+    def pending(self, table: str, row_key: Hashable, default: Any = None) -> Any:
+        """Get the staged value of a row that is not flushed yet. @zara"""
+        write = self._pending.get((table, row_key))
+        return write.value if write is not None else default
+
+    def pending_rows(self, table: str) -> Dict[Hashable, Any]:
+        """Get all staged values of a table keyed by row key. @zara"""
+        return {
+            row_key: write.value
+            for (pending_table, row_key), write in self._pending.items()
+            if pending_table == table
+        }
+
+    def discard(self, table: str, row_key: Optional[Hashable] = None) -> None:
+        """Drop staged rows that a direct write is about to supersede. @zara"""
+        for key in [k for k in self._pending if k[0] == table]:
+            if row_key is None or key[1] == row_key:
+                del self._pending[key]
+
+    async def _async_scheduled_flush(self, _now: Any = None) -> None:
+        """Timer callback. @zara"""
+        await self.async_flush()
+
+    async def async_flush(self) -> int:
+        """Write all staged rows with one executemany per statement. @zara
+
+        Returns:
+            Number of rows written
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            if self.db is None or self.db._db is None:
+                _LOGGER.debug(
+                    "Write buffer flush skipped, database not connected (%d pending)",
+                    len(self._pending),
+                )
+                return 0
+
+            batch, self._pending = self._pending, {}
+            statements: Dict[str, Dict[Tuple[str, Hashable], _PendingWrite]] = {}
+            for key, write in batch.items():
+                statements.setdefault(write.sql, {})[key] = write
+
+            written = 0
+            failed: Dict[Tuple[str, Hashable], _PendingWrite] = {}
+            async with self.operation_lock:
+                for sql, writes in statements.items():
+                    try:
+                        await self.db.executemany(
+                            sql, [write.parameters for write in writes.values()]
+                        )
+                    except Exception as e:
+                        failed.update(writes)
+                        _LOGGER.warning(
+                            "Write buffer flush of %d rows failed: %s", len(writes), e
+                        )
+                        continue
+                    written += len(writes)
+
+            # Keep failed rows for the next flush unless they were staged again meanwhile @zara
+            for key, write in failed.items():
+                self._pending.setdefault(key, write)
+            if failed:
+                self.failed_flushes += 1
+            if written:
+                self.flushes += 1
+                self.rows_written += written
+            _LOGGER.debug(
+                "Write buffer flushed %d rows in %d statements (%d rows kept)",
+                written, len(statements), len(failed),
+            )
+            return written
+
+    async def async_stop(self) -> None:
+        """Cancel the flush timer and write everything still pending. @zara"""
+        self._stopped = True
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        await self.async_flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get buffer statistics. @zara"""
+        return {
+            "pending": len(self._pending),
+            "staged": self.staged,
+            "coalesced": self.coalesced,
+            "flushes": self.flushes,
+            "rows_written": self.rows_written,
+            "failed_flushes": self.failed_flushes,
+            "flush_interval_seconds": self.flush_interval.total_seconds(),
+        }
+
+
+def get_write_buffer(hass: HomeAssistant, db_manager: DatabaseManager) -> WriteBehindBuffer:
+    """Get the write buffer shared by all users of a DatabaseManager. @zara"""
+    buffers: Dict[int, WriteBehindBuffer] = hass.data.setdefault(WRITE_BUFFER_KEY, {})
+    buffer = buffers.get(id(db_manager))
+    if buffer is None or buffer.db is not db_manager:
+        buffer = buffers[id(db_manager)] = WriteBehindBuffer(hass, db_manager)
+    return buffer
+
+
+async def async_stop_write_buffer(hass: HomeAssistant, db_manager: DatabaseManager) -> None:
+    """Flush and remove the write buffer of a DatabaseManager, if any. @zara"""
+    buffers: Dict[int, WriteBehindBuffer] = hass.data.get(WRITE_BUFFER_KEY, {})
+    buffer = buffers.get(id(db_manager))
+    if buffer is None or buffer.db is not db_manager:
+        return
+    del buffers[id(db_manager)]
+    await buffer.async_stop()
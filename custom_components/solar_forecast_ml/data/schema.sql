@@ -1131,6 +1131,56 @@ CREATE TABLE IF NOT EXISTS forecast_history (
 
 CREATE INDEX IF NOT EXISTS idx_forecast_history_date ON forecast_history(date);
 
+-- Freshness of the daily_statistics rollups (V16.4.2 @zara)
+-- Triggers bump source_version whenever a day's yield, accuracy or consumption
+-- changes; StatisticsMaterializer rebuilds the rollups when built_version lags
+-- behind or the local date has moved on.
+CREATE TABLE IF NOT EXISTS daily_statistics_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    source_version INTEGER NOT NULL DEFAULT 0,
+    built_version INTEGER,
+    period_date DATE,
+    rebuilt_at TIMESTAMP
+);
+
+INSERT OR IGNORE INTO daily_statistics_state (id, source_version) VALUES (1, 0);
+
+CREATE TRIGGER IF NOT EXISTS trg_daily_summaries_stats_insert
+AFTER INSERT ON daily_summaries
+BEGIN
+    UPDATE daily_statistics_state SET source_version = source_version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_daily_summaries_stats_update
+AFTER UPDATE OF date, actual_total_kwh, accuracy_percent ON daily_summaries
+BEGIN
+    UPDATE daily_statistics_state SET source_version = source_version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_daily_summaries_stats_delete
+AFTER DELETE ON daily_summaries
+BEGIN
+    UPDATE daily_statistics_state SET source_version = source_version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_forecast_history_stats_insert
+AFTER INSERT ON forecast_history
+BEGIN
+    UPDATE daily_statistics_state SET source_version = source_version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_forecast_history_stats_update
+AFTER UPDATE OF date, consumption_kwh, autarky ON forecast_history
+BEGIN
+    UPDATE daily_statistics_state SET source_version = source_version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_forecast_history_stats_delete
+AFTER DELETE ON forecast_history
+BEGIN
+    UPDATE daily_statistics_state SET source_version = source_version + 1 WHERE id = 1;
+END;
+
 -- Shadow detection details (shadow_detection from hourly_predictions.json)
 CREATE TABLE IF NOT EXISTS hourly_shadow_detection (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -1471,9 +1521,41 @@ CREATE TABLE IF NOT EXISTS stats_billing_totals (
     hours_count INTEGER DEFAULT 0,
     avg_price_ct REAL DEFAULT 0,
     avg_feed_in_tariff_ct REAL DEFAULT 0,
+    grid_import_cost_ct REAL DEFAULT 0,
+    price_sum_ct REAL DEFAULT 0,
+    savings_ct REAL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Running per-day billing aggregates (maintained incrementally from stats_hourly_billing)
+CREATE TABLE IF NOT EXISTS stats_billing_daily (
+    date TEXT PRIMARY KEY,
+    grid_import_kwh REAL DEFAULT 0,
+    grid_import_cost_ct REAL DEFAULT 0,
+    grid_export_kwh REAL DEFAULT 0,
+    solar_yield_kwh REAL DEFAULT 0,
+    solar_to_house_kwh REAL DEFAULT 0,
+    solar_to_battery_kwh REAL DEFAULT 0,
+    battery_to_house_kwh REAL DEFAULT 0,
+    grid_to_house_kwh REAL DEFAULT 0,
+    grid_to_battery_kwh REAL DEFAULT 0,
+    home_consumption_kwh REAL DEFAULT 0,
+    price_sum_ct REAL DEFAULT 0,
+    savings_ct REAL DEFAULT 0,
+    hours_count REAL DEFAULT 0,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Record-level storage for the former SFML Stats JSON history documents
+CREATE TABLE IF NOT EXISTS stats_history_records (
+    store TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    record_key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (store, kind, record_key)
+) WITHOUT ROWID;
+
 -- Forecast comparison with external sources
 CREATE TABLE IF NOT EXISTS stats_forecast_comparison (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
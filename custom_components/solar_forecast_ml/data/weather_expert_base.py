@@ -16,9 +16,12 @@ Each expert fetches data from a specific weather API/source.
 @zara
 """
 
+import time
 from abc import ABC, abstractmethod
 from typing import Any, Optional
 
+from .weather_types import EXPERT_FAILURE_THRESHOLD, EXPERT_RETRY_AFTER_SECONDS
+
 
 class WeatherExpert(ABC):
     """Abstract base class for weather data experts. @zara
@@ -37,6 +40,7 @@ class WeatherExpert(ABC):
         self.name = name
         self._last_error: Optional[str] = None
         self._consecutive_failures: int = 0
+        self._last_failure_time: Optional[float] = None
 
     @abstractmethod
     async def get_cloud_cover(self, date: str, hour: int) -> Optional[float]:
@@ -76,13 +80,27 @@ class WeatherExpert(ABC):
         """Record a failure and increment counter. @zara"""
         self._last_error = error
         self._consecutive_failures += 1
+        self._last_failure_time = time.monotonic()
 
     def reset_failures(self) -> None:
         """Reset failure counter after successful operation. @zara"""
         self._consecutive_failures = 0
         self._last_error = None
+        self._last_failure_time = None
 
     @property
     def is_healthy(self) -> bool:
-        """Check if expert has low failure count. @zara"""
-        return self._consecutive_failures < 5
+        """Check if expert has low failure count. @zara
+
+        An expert over the threshold becomes healthy again once
+        EXPERT_RETRY_AFTER_SECONDS passed since its last failure, so a
+        recovered source gets one probe; another failure restarts the wait.
+        Failures counted without record_failure() carry no time and keep
+        the expert unhealthy until reset_failures().
+        """
+        if self._consecutive_failures < EXPERT_FAILURE_THRESHOLD:
+            return True
+        if self._last_failure_time is None:
+            return False
+        return time.monotonic() - self._last_failure_time >= EXPERT_RETRY_AFTER_SECONDS
+
@@ -140,6 +140,10 @@ WTTR_IN_BASE_URL = "https://wttr.in"
 WTTR_IN_TIMEOUT = 15
 WTTR_IN_CACHE_HOURS = 6
 
+# Expert health @zara
+EXPERT_FAILURE_THRESHOLD = 5
+EXPERT_RETRY_AFTER_SECONDS = 900
+
 # Learning parameters @zara
 LEARNING_SMOOTHING_FACTOR = 0.3
 LEARNING_MIN_ERROR = 5.0
@@ -180,3 +184,4 @@ class BlendedHourForecast:
     visibility_m: Optional[float] = None
     fog_detected: bool = False
     fog_type: Optional[str] = None
+
@@ -31,6 +31,16 @@ AWATTAR_API_URL_AT = "https://api.awattar.at/v1/marketdata"
 
 API_TIMEOUT = 30  # seconds
 
+# Shared HTTP client (keep-alive, revalidation, retries)
+HTTP_LIMIT_PER_HOST = 2  # concurrent requests per upstream host
+HTTP_DNS_CACHE_TTL = 300  # seconds, only for the standalone connector
+HTTP_MAX_RETRIES = 3
+HTTP_RETRY_BASE_DELAY = 2.0  # seconds, doubled per attempt
+HTTP_RETRY_MAX_DELAY = 30.0  # seconds, cap of one backoff window
+HTTP_CACHE_DIR = "http_cache"  # below the grid_price_monitor folder
+HTTP_CACHE_MAX_ENTRIES = 16
+HTTP_FRESH_SECONDS = 60.0  # identical fetches within this window share one response
+
 # ============================================================================
 # CONFIGURATION KEYS
 # ============================================================================
@@ -134,8 +144,11 @@ ATTR_CHEAP_HOURS_TOMORROW = "cheap_hours_tomorrow"
 ATTR_PRICE_TREND = "price_trend"
 ATTR_LAST_UPDATE = "last_update"
 ATTR_DATA_SOURCE = "data_source"
+ATTR_API_STATS = "api_stats"
 
 # ============================================================================
 # DATABASE
 # ============================================================================
 DB_PATH = "/config/solar_forecast_ml/solar_forecast.db"
+# Cadence of the write-behind flush for staged single-row updates
+DB_WRITE_FLUSH_INTERVAL = timedelta(seconds=30)
@@ -33,12 +33,13 @@ from .const import (
     DEFAULT_PROVIDER_MARKUP,
     DEFAULT_TAXES_FEES,
     DOMAIN,
+    HTTP_CACHE_DIR,
     PRICE_FETCH_INTERVAL,
     UPDATE_INTERVAL,
     VAT_RATE_AT,
     VAT_RATE_DE,
 )
-from .core import ElectricityPriceService, BatteryTracker, PriceCalculator
+from .core import ElectricityPriceService, BatteryTracker, DayPriceSummary, PriceCalculator, PooledHttpClient
 from .storage import DataValidator, GPMDatabaseConnector, PriceCache, HistoryManager, StatisticsStore
 from .helpers import GPMLogger, async_setup_gpm_logging
 
@@ -76,8 +77,14 @@ class GridPriceMonitorCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             provider_markup=self._provider_markup,
         )
 
-        self._price_service = ElectricityPriceService(self._country)
+        # One keep-alive client on HA's shared session for all outbound fetches
+        self._http_client = PooledHttpClient(
+            hass,
+            cache_dir=Path(hass.config.path()) / "grid_price_monitor" / HTTP_CACHE_DIR,
+        )
+        self._price_service = ElectricityPriceService(self._country, self._http_client)
         self._last_price_fetch: datetime | None = None
+        self._day_summaries: dict[str, DayPriceSummary] = {}
 
         # Battery tracker
         self._battery_power_sensor = entry.data.get(CONF_BATTERY_POWER_SENSOR, "")
@@ -132,7 +139,7 @@ class GridPriceMonitorCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         gpm_path = config_path / "grid_price_monitor"
 
         # Initialize database connector
-        self._db_connector = GPMDatabaseConnector(DB_PATH)
+        self._db_connector = GPMDatabaseConnector(self.hass, DB_PATH)
         await self._db_connector.connect()
 
         # Initialize data validator (for logs directory + legacy cleanup)
@@ -345,62 +352,42 @@ class GridPriceMonitorCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 is_cheap=is_cheap
             )
 
-        # Get statistics
-        cheapest = self._price_service.get_cheapest_hour_today()
-        most_expensive = self._price_service.get_most_expensive_hour_today()
-        average_net = self._price_service.get_average_price_today()
-
-        # Calculate total for cheapest/most expensive
-        cheapest_total = None
-        most_expensive_total = None
-        average_total = None
-
-        if cheapest:
-            cheapest_total = self.calculate_total_price(cheapest["price"])
-        if most_expensive:
-            most_expensive_total = self.calculate_total_price(most_expensive["price"])
-
-        # Calculate average of TOTAL prices (not total of average net)
-        # This is more accurate as it represents what users actually pay on average
-        today_prices_for_avg = self._price_service.get_today_prices()
-        if today_prices_for_avg:
-            total_prices = [self.calculate_total_price(p["price"]) for p in today_prices_for_avg]
-            average_total = round(sum(total_prices) / len(total_prices), 2)
-
-            # Update statistics store
-            if self._statistics_store:
-                await self._statistics_store.async_update_daily_average(
-                    date=now.date().isoformat(),
-                    average_net=average_net,
-                    average_total=average_total,
-                    min_price=cheapest["price"] if cheapest else None,
-                    max_price=most_expensive["price"] if most_expensive else None,
-                )
-
-                # Update monthly summary
-                cheap_hours_count = sum(
-                    1 for p in today_prices_for_avg
-                    if self.calculate_total_price(p["price"]) < self._max_price
-                )
-                await self._statistics_store.async_update_monthly_summary(
-                    year=now.year,
-                    month=now.month,
-                    average_price=average_total,
-                    total_cheap_hours=cheap_hours_count,
-                    country=self._country,
-                )
-
-        # Get forecast data (reuse today_prices_for_avg if available)
-        today_prices = today_prices_for_avg if today_prices_for_avg else self._price_service.get_today_prices()
-        tomorrow_prices = self._price_service.get_tomorrow_prices()
+        # Day statistics are recomputed only when prices or config change
+        local_now = datetime.now().astimezone()
+        today = self._get_day_summary(local_now)
+        tomorrow = self._get_day_summary(local_now + timedelta(days=1))
+        self._day_summaries = {today.date: today, tomorrow.date: tomorrow}
+
+        cheapest = today.cheapest
+        most_expensive = today.most_expensive
+        average_net = today.average_net
+        cheapest_total = today.cheapest_total
+        most_expensive_total = today.most_expensive_total
+        # Average of TOTAL prices (not total of average net), what users actually pay
+        average_total = today.average_total
+
+        if today.has_data and self._statistics_store:
+            await self._statistics_store.async_update_daily_average(
+                date=now.date().isoformat(),
+                average_net=average_net,
+                average_total=average_total,
+                min_price=cheapest["price"] if cheapest else None,
+                max_price=most_expensive["price"] if most_expensive else None,
+            )
 
-        # Calculate total prices for forecasts
-        today_forecast = self._build_forecast_with_total(today_prices)
-        tomorrow_forecast = self._build_forecast_with_total(tomorrow_prices)
+            # Update monthly summary
+            await self._statistics_store.async_update_monthly_summary(
+                year=now.year,
+                month=now.month,
+                average_price=average_total,
+                total_cheap_hours=today.cheap_count,
+                country=self._country,
+            )
 
-        # Get cheap hours (based on total price < max_price)
-        cheap_hours_today = self._get_cheap_hours_for_date(today_prices)
-        cheap_hours_tomorrow = self._get_cheap_hours_for_date(tomorrow_prices)
+        today_forecast = today.forecast
+        tomorrow_forecast = tomorrow.forecast
+        cheap_hours_today = today.cheap_hours
+        cheap_hours_tomorrow = tomorrow.cheap_hours
 
         # Find next cheap hour
         next_cheap = self._find_next_cheap_hour()
@@ -441,6 +428,7 @@ class GridPriceMonitorCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "price_trend": price_trend,
             # Meta
             "last_update": now.isoformat(),
+            "api_stats": self._price_service.http_stats,
             "data_source": "aWATTar",
             "country": self._country,
             # Config values for reference
@@ -572,53 +560,35 @@ class GridPriceMonitorCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             enriched.append(enriched_entry)
         return enriched
 
-    def _build_forecast_with_total(
-        self, prices: list[dict[str, Any]]
-    ) -> list[dict[str, Any]]:
-        """Build forecast list with total prices @zara"""
-        forecast = []
-        for entry in prices:
-            spot_net = entry["price"]
-            spot_gross = round(spot_net * self.vat_factor, 2)
-            total = self.calculate_total_price(spot_net)
-
-            forecast.append({
-                "hour": entry["hour"],
-                "spot_price_net": spot_net,
-                "spot_price": spot_gross,
-                "total_price": total,
-                "is_cheap": total < self._max_price,
-            })
-        return forecast
-
-    def _get_cheap_hours_for_date(
-        self, prices: list[dict[str, Any]]
-    ) -> list[int]:
-        """Get list of cheap hours for a date @zara"""
-        cheap_hours = []
-        for p in prices:
-            total = self.calculate_total_price(p["price"])
-            if total < self._max_price:
-                cheap_hours.append(p["hour"])
-        return cheap_hours
+    def _get_day_summary(self, day: datetime) -> DayPriceSummary:
+        """Get the cached price summary of a local day, rebuilding it if stale @zara"""
+        date_key = day.date().isoformat()
+        version = (
+            self._price_service.prices_version,
+            self._calculator.config_version,
+            self._max_price,
+        )
+        summary = self._day_summaries.get(date_key)
+        if summary is None or summary.version != version:
+            summary = DayPriceSummary.build(
+                date_key,
+                self._price_service.get_prices_for_date(day),
+                self._calculator,
+                self._max_price,
+                self._price_service.prices_version,
+            )
+        return summary
 
     def _find_next_cheap_hour(self) -> dict[str, Any] | None:
         """Find the next hour where total price is below max threshold @zara"""
-        now = datetime.now(timezone.utc)
-
-        # Use public method instead of private _price_cache
-        for entry in self._price_service.get_all_prices():
-            entry_ts = entry["timestamp"]
-            if isinstance(entry_ts, str):
-                entry_ts = datetime.fromisoformat(entry_ts)
-            if entry_ts >= now:
-                total = self.calculate_total_price(entry["price"])
-                if total < self._max_price:
-                    return {
-                        "hour": entry["hour"],
-                        "timestamp": entry_ts,
-                        "total_price": total,
-                    }
+        for entry_ts, entry in self._price_service.get_upcoming_prices():
+            total = self.calculate_total_price(entry["price"])
+            if total < self._max_price:
+                return {
+                    "hour": entry["hour"],
+                    "timestamp": entry_ts,
+                    "total_price": total,
+                }
         return None
 
     def _calculate_trend(
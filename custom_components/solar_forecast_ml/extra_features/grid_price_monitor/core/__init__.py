@@ -7,12 +7,16 @@
 # * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
 # ******************************************************************************
 
+from .http_client import PooledHttpClient
 from .price_service import ElectricityPriceService
 from .battery_tracker import BatteryTracker
 from .calculator import PriceCalculator
+from .day_summary import DayPriceSummary
 
 __all__ = [
+    "PooledHttpClient",
     "ElectricityPriceService",
     "BatteryTracker",
     "PriceCalculator",
+    "DayPriceSummary",
 ]
@@ -60,10 +60,6 @@ class BatteryTracker:
         # Unsubscribe callback
         self._unsub_state_change = None
 
-        # Debounce save - prevent race condition from rapid updates
-        self._save_pending = False
-        self._save_interval_seconds = 60  # Save at most every 60 seconds
-
     @property
     def current_power(self) -> float:
         """Get current battery charging power in W @zara"""
@@ -121,7 +117,9 @@ class BatteryTracker:
             self._unsub_state_change = None
 
         # Save data before unloading
-        await self._async_save_data()
+        self._schedule_save()
+        if self._db:
+            await self._db.async_flush()
 
     @callback
     def _async_state_changed(self, event) -> None:
@@ -169,7 +167,7 @@ class BatteryTracker:
         self._last_power_w = power_w
         self._last_update = now
 
-        # Schedule debounced save to prevent race conditions from rapid updates
+        # Stage the row; the connector writes the latest value once per flush interval
         self._schedule_save()
 
     def _check_date_resets(self, now: datetime) -> None:
@@ -210,21 +208,31 @@ class BatteryTracker:
 
     @callback
     def _schedule_save(self) -> None:
-        """Schedule a debounced save operation @zara"""
-        if self._save_pending:
-            return  # Already scheduled
-
-        self._save_pending = True
-
-        async def _delayed_save():
-            """Perform the delayed save @zara"""
-            await self._async_save_data()
-            self._save_pending = False
+        """Stage the statistics row in the connector's write-behind buffer @zara"""
+        if not self._db:
+            return
 
-        # Schedule save after interval
-        self.hass.loop.call_later(
-            self._save_interval_seconds,
-            lambda: self.hass.async_create_task(_delayed_save())
+        self._db.stage(
+            "GPM_battery_stats",
+            """INSERT INTO GPM_battery_stats
+               (id, energy_today_wh, energy_week_wh, energy_month_wh,
+                current_day, current_week, current_month)
+               VALUES (1, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(id) DO UPDATE SET
+                   energy_today_wh = excluded.energy_today_wh,
+                   energy_week_wh = excluded.energy_week_wh,
+                   energy_month_wh = excluded.energy_month_wh,
+                   current_day = excluded.current_day,
+                   current_week = excluded.current_week,
+                   current_month = excluded.current_month""",
+            (
+                self._energy_today_wh,
+                self._energy_week_wh,
+                self._energy_month_wh,
+                self._current_day,
+                self._current_week,
+                self._current_month,
+            ),
         )
 
     async def _async_load_data(self) -> None:
@@ -287,36 +295,6 @@ class BatteryTracker:
             self.energy_month_kwh,
         )
 
-    async def _async_save_data(self) -> None:
-        """Save statistics to database @zara"""
-        if not self._db:
-            return
-
-        try:
-            await self._db.execute(
-                """INSERT INTO GPM_battery_stats
-                   (id, energy_today_wh, energy_week_wh, energy_month_wh,
-                    current_day, current_week, current_month)
-                   VALUES (1, ?, ?, ?, ?, ?, ?)
-                   ON CONFLICT(id) DO UPDATE SET
-                       energy_today_wh = excluded.energy_today_wh,
-                       energy_week_wh = excluded.energy_week_wh,
-                       energy_month_wh = excluded.energy_month_wh,
-                       current_day = excluded.current_day,
-                       current_week = excluded.current_week,
-                       current_month = excluded.current_month""",
-                (
-                    self._energy_today_wh,
-                    self._energy_week_wh,
-                    self._energy_month_wh,
-                    self._current_day,
-                    self._current_week,
-                    self._current_month,
-                ),
-            )
-        except Exception as err:
-            _LOGGER.error("Failed to save battery statistics: %s", err)
-
     def get_statistics(self) -> dict[str, Any]:
         """Get all battery statistics @zara"""
         return {
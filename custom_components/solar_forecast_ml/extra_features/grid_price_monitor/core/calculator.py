@@ -37,6 +37,12 @@ class PriceCalculator:
         self._grid_fee = grid_fee
         self._taxes_fees = taxes_fees
         self._provider_markup = provider_markup
+        self._config_version = 0
+
+    @property
+    def config_version(self) -> int:
+        """Counter that changes whenever a price-relevant setting changes @zara"""
+        return self._config_version
 
     @property
     def vat_rate(self) -> int:
@@ -46,7 +52,9 @@ class PriceCalculator:
     @vat_rate.setter
     def vat_rate(self, value: int) -> None:
         """Set VAT rate @zara"""
-        self._vat_rate = value
+        if value != self._vat_rate:
+            self._vat_rate = value
+            self._config_version += 1
 
     @property
     def vat_factor(self) -> float:
@@ -61,7 +69,9 @@ class PriceCalculator:
     @grid_fee.setter
     def grid_fee(self, value: float) -> None:
         """Set grid fee @zara"""
-        self._grid_fee = value
+        if value != self._grid_fee:
+            self._grid_fee = value
+            self._config_version += 1
 
     @property
     def taxes_fees(self) -> float:
@@ -71,7 +81,9 @@ class PriceCalculator:
     @taxes_fees.setter
     def taxes_fees(self, value: float) -> None:
         """Set taxes and fees @zara"""
-        self._taxes_fees = value
+        if value != self._taxes_fees:
+            self._taxes_fees = value
+            self._config_version += 1
 
     @property
     def provider_markup(self) -> float:
@@ -81,7 +93,9 @@ class PriceCalculator:
     @provider_markup.setter
     def provider_markup(self, value: float) -> None:
         """Set provider markup @zara"""
-        self._provider_markup = value
+        if value != self._provider_markup:
+            self._provider_markup = value
+            self._config_version += 1
 
     @property
     def total_markup(self) -> float:
@@ -245,6 +259,8 @@ class PriceCalculator:
             taxes_fees: New taxes and fees
             provider_markup: New provider markup
         """
+        previous = (self._vat_rate, self._grid_fee, self._taxes_fees, self._provider_markup)
+
         if vat_rate is not None:
             self._vat_rate = vat_rate
         if grid_fee is not None:
@@ -254,6 +270,10 @@ class PriceCalculator:
         if provider_markup is not None:
             self._provider_markup = provider_markup
 
+        if previous == (self._vat_rate, self._grid_fee, self._taxes_fees, self._provider_markup):
+            return
+
+        self._config_version += 1
         _LOGGER.debug(
             "Calculator updated: VAT=%d%%, markup=%.2f ct/kWh",
             self._vat_rate,
@@ -0,0 +1,127 @@
+# ******************************************************************************
+# @copyright (C) 2025 Zara-Toorox - Solar Forecast ML
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from .calculator import PriceCalculator
+
+
+@dataclass(frozen=True)
+class DayPriceSummary:
+    """Derived price statistics for one local day, computed in a single pass @zara
+
+    A summary is valid for one combination of price data, calculator config
+    and cheap threshold (see version). The coordinator keeps it until one of
+    them changes, so regular updates only read the precomputed values.
+    """
+
+    date: str
+    version: tuple[int, int, float]
+    entries: list[dict[str, Any]] = field(repr=False)
+    net: list[float] = field(repr=False)
+    gross: list[float] = field(repr=False)
+    total: list[float] = field(repr=False)
+    cheap_mask: list[bool] = field(repr=False)
+    cheapest_index: int | None = None
+    most_expensive_index: int | None = None
+    average_net: float | None = None
+    average_total: float | None = None
+    forecast: list[dict[str, Any]] = field(default_factory=list, repr=False)
+    cheap_hours: list[int] = field(default_factory=list)
+
+    @classmethod
+    def build(
+        cls,
+        date: str,
+        entries: list[dict[str, Any]],
+        calculator: PriceCalculator,
+        max_price: float,
+        prices_version: int,
+    ) -> DayPriceSummary:
+        """Compute all statistics of the day's price entries @zara"""
+        net = [entry["price"] for entry in entries]
+        gross = [calculator.calculate_gross_spot(price) for price in net]
+        total = [calculator.calculate_total_price(price) for price in net]
+        cheap_mask = [price < max_price for price in total]
+
+        cheapest_index = most_expensive_index = None
+        average_net = average_total = None
+        if net:
+            cheapest_index = min(range(len(net)), key=net.__getitem__)
+            most_expensive_index = max(range(len(net)), key=net.__getitem__)
+            average_net = round(sum(net) / len(net), 2)
+            average_total = round(sum(total) / len(total), 2)
+
+        forecast = [
+            {
+                "hour": entry["hour"],
+                "spot_price_net": net[i],
+                "spot_price": gross[i],
+                "total_price": total[i],
+                "is_cheap": cheap_mask[i],
+            }
+            for i, entry in enumerate(entries)
+        ]
+
+        return cls(
+            date=date,
+            version=(prices_version, calculator.config_version, max_price),
+            entries=entries,
+            net=net,
+            gross=gross,
+            total=total,
+            cheap_mask=cheap_mask,
+            cheapest_index=cheapest_index,
+            most_expensive_index=most_expensive_index,
+            average_net=average_net,
+            average_total=average_total,
+            forecast=forecast,
+            cheap_hours=[entry["hour"] for entry, cheap in zip(entries, cheap_mask) if cheap],
+        )
+
+    @property
+    def has_data(self) -> bool:
+        """Check if the day has any prices @zara"""
+        return bool(self.entries)
+
+    @property
+    def cheap_count(self) -> int:
+        """Number of cheap slots of the day @zara"""
+        return sum(self.cheap_mask)
+
+    @property
+    def cheapest(self) -> dict[str, Any] | None:
+        """Price entry with the lowest net price @zara"""
+        if self.cheapest_index is None:
+            return None
+        return self.entries[self.cheapest_index]
+
+    @property
+    def most_expensive(self) -> dict[str, Any] | None:
+        """Price entry with the highest net price @zara"""
+        if self.most_expensive_index is None:
+            return None
+        return self.entries[self.most_expensive_index]
+
+    @property
+    def cheapest_total(self) -> float | None:
+        """Total price of the cheapest entry @zara"""
+        if self.cheapest_index is None:
+            return None
+        return self.total[self.cheapest_index]
+
+    @property
+    def most_expensive_total(self) -> float | None:
+        """Total price of the most expensive entry @zara"""
+        if self.most_expensive_index is None:
+            return None
+        return self.total[self.most_expensive_index]
@@ -0,0 +1,448 @@
+# ******************************************************************************
+# @copyright (C) 2025 Zara-Toorox - Solar Forecast ML
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TYPE_CHECKING
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from ..const import (
+    API_TIMEOUT,
+    HTTP_CACHE_MAX_ENTRIES,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_FRESH_SECONDS,
+    HTTP_LIMIT_PER_HOST,
+    HTTP_MAX_RETRIES,
+    HTTP_RETRY_BASE_DELAY,
+    HTTP_RETRY_MAX_DELAY,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+# Statuses worth another attempt (rate limit, upstream hiccups)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass
+class HttpFetchResult:
+    """Body and status of one fetch, possibly served from the revalidated cache @zara"""
+
+    url: str
+    status: int
+    body: bytes
+    from_cache: bool = False
+
+    def json(self) -> Any:
+        """Decode the body as JSON @zara"""
+        return json.loads(self.body)
+
+
+@dataclass
+class UpstreamStats:
+    """Latency and byte counters of one upstream @zara"""
+
+    calls: int = 0
+    coalesced: int = 0
+    fresh_hits: int = 0
+    requests: int = 0
+    failures: int = 0
+    retries: int = 0
+    not_modified: int = 0
+    bytes_received: int = 0
+    total_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    last_status: int | None = None
+    last_error: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters as a dict @zara"""
+        answered = self.requests - self.failures
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "fresh_hits": self.fresh_hits,
+            "requests": self.requests,
+            "failures": self.failures,
+            "retries": self.retries,
+            "not_modified": self.not_modified,
+            "bytes_received": self.bytes_received,
+            "avg_latency_ms": round(self.total_latency_ms / answered, 1) if answered > 0 else None,
+            "max_latency_ms": round(self.max_latency_ms, 1),
+            "last_status": self.last_status,
+            "last_error": self.last_error,
+        }
+
+
+@dataclass
+class _CacheEntry:
+    """Validators and body of the last 200 response of a URL @zara"""
+
+    url: str
+    body: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+    stored_at: float = field(default_factory=time.time)
+
+    def validators(self) -> dict[str, str]:
+        """Return the conditional request headers for this entry @zara"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class PooledHttpClient:
+    """Shared keep-alive HTTP client for outbound data fetches @zara
+
+    Uses Home Assistant's shared aiohttp session when hass is given, so
+    connections and DNS lookups are pooled with the rest of HA; without
+    hass it owns a session with its own limited, DNS-caching connector
+    (used standalone and in tests). Requests to one host are limited to
+    limit_per_host at a time. Responses carrying an ETag or Last-Modified
+    header are kept in a small on-disk cache and revalidated with
+    If-None-Match / If-Modified-Since, so an unchanged upstream answers
+    with an empty 304. Failed attempts are retried with jittered
+    exponential backoff. Identical fetches share one in-flight request,
+    and a 200 result is reused for fresh_seconds.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant | None = None,
+        cache_dir: Path | None = None,
+        timeout: float = API_TIMEOUT,
+        limit_per_host: int = HTTP_LIMIT_PER_HOST,
+        max_retries: int = HTTP_MAX_RETRIES,
+        retry_base_delay: float = HTTP_RETRY_BASE_DELAY,
+        retry_max_delay: float = HTTP_RETRY_MAX_DELAY,
+        max_cache_entries: int = HTTP_CACHE_MAX_ENTRIES,
+        fresh_seconds: float = HTTP_FRESH_SECONDS,
+    ) -> None:
+        """Initialize the client @zara
+
+        Args:
+            hass: Home Assistant instance (None: own session)
+            cache_dir: Folder of the revalidation cache (None: memory only)
+            timeout: Total timeout of one attempt in seconds
+            limit_per_host: Concurrent requests per host
+            max_retries: Attempts per fetch
+            retry_base_delay: Backoff window of the first retry in seconds
+            retry_max_delay: Largest backoff window in seconds
+            max_cache_entries: Responses kept in the cache
+            fresh_seconds: Seconds a 200 result is shared with identical fetches
+        """
+        self._hass = hass
+        self._cache_dir = cache_dir
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._limit_per_host = limit_per_host
+        self._max_retries = max(1, max_retries)
+        self._retry_base_delay = retry_base_delay
+        self._retry_max_delay = retry_max_delay
+        self._max_cache_entries = max_cache_entries
+        self._fresh_seconds = fresh_seconds
+
+        self._session: aiohttp.ClientSession | None = None
+        self._owns_session = False
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
+        self._cache: dict[str, _CacheEntry | None] = {}
+        self._stats: dict[str, UpstreamStats] = {}
+        self._in_flight: dict[tuple, asyncio.Task] = {}
+        self._fresh: dict[tuple, tuple[float, HttpFetchResult]] = {}
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session, creating it on first use @zara"""
+        if self._session is None or self._session.closed:
+            if self._hass is not None:
+                from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+                self._session = async_get_clientsession(self._hass)
+                self._owns_session = False
+            else:
+                connector = aiohttp.TCPConnector(
+                    limit_per_host=self._limit_per_host,
+                    ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+                    use_dns_cache=True,
+                )
+                self._session = aiohttp.ClientSession(connector=connector)
+                self._owns_session = True
+        return self._session
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        """Return the concurrency limit of the URL's host @zara"""
+        host = urlsplit(url).netloc
+        limit = self._host_limits.get(host)
+        if limit is None:
+            limit = self._host_limits[host] = asyncio.Semaphore(self._limit_per_host)
+        return limit
+
+    def _backoff(self, attempt: int, retry_after: float | None) -> float:
+        """Return the jittered delay before retry number attempt (1-based) @zara"""
+        window = min(self._retry_max_delay, self._retry_base_delay * 2 ** (attempt - 1))
+        delay = window / 2 + random.uniform(0, window / 2)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self._retry_max_delay))
+        return delay
+
+    async def async_fetch(
+        self,
+        url: str,
+        upstream: str,
+        headers: dict[str, str] | None = None,
+        use_fresh: bool = True,
+    ) -> HttpFetchResult:
+        """GET a URL once for all concurrent and recent identical callers @zara
+
+        The key is upstream, URL (provider, location and time window are
+        part of the query) and headers. A caller arriving while the same
+        fetch runs awaits it; cancelling one caller does not cancel the
+        shared fetch. A 200 result completed less than fresh_seconds ago
+        is returned directly unless use_fresh is False.
+
+        Args:
+            url: Absolute URL including the query string
+            upstream: Name the counters are kept under
+            headers: Extra request headers
+            use_fresh: Accept a recently completed identical result
+
+        Returns:
+            See _async_fetch_uncoalesced
+
+        Raises:
+            asyncio.TimeoutError, aiohttp.ClientError: if every attempt failed
+            without an HTTP response
+        """
+        stats = self._stats.setdefault(upstream, UpstreamStats())
+        stats.calls += 1
+        key = (upstream, url, tuple(sorted((headers or {}).items())))
+
+        if use_fresh:
+            fresh = self._fresh.get(key)
+            if fresh is not None and time.monotonic() - fresh[0] < self._fresh_seconds:
+                stats.fresh_hits += 1
+                return fresh[1]
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            stats.coalesced += 1
+            _LOGGER.debug("%s fetch joined the request already in flight", upstream)
+        else:
+            task = asyncio.ensure_future(self._async_fetch_uncoalesced(url, upstream, headers))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish_flight(key, done))
+        return await asyncio.shield(task)
+
+    def _finish_flight(self, key: tuple, task: asyncio.Task) -> None:
+        """Retire a finished fetch and keep a 200 result for reuse @zara"""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        now = time.monotonic()
+        self._fresh = {
+            k: v for k, v in self._fresh.items() if now - v[0] < self._fresh_seconds
+        }
+        if task.cancelled() or task.exception() is not None:
+            return
+        result = task.result()
+        if result.status == 200:
+            self._fresh[key] = (now, result)
+
+    async def _async_fetch_uncoalesced(
+        self,
+        url: str,
+        upstream: str,
+        headers: dict[str, str] | None = None,
+    ) -> HttpFetchResult:
+        """GET a URL with revalidation and retries @zara
+
+        Args:
+            url: Absolute URL including the query string
+            upstream: Name the counters are kept under
+            headers: Extra request headers
+
+        Returns:
+            Result of the last attempt; a 304 is answered from the cache
+            with status 200 and from_cache set
+
+        Raises:
+            asyncio.TimeoutError, aiohttp.ClientError: if every attempt failed
+            without an HTTP response
+        """
+        stats = self._stats.setdefault(upstream, UpstreamStats())
+        cached = await self._async_get_cached(url)
+        last_error: Exception | None = None
+        retry_after: float | None = None
+
+        for attempt in range(self._max_retries):
+            if attempt:
+                stats.retries += 1
+                await asyncio.sleep(self._backoff(attempt, retry_after))
+                retry_after = None
+
+            request_headers = dict(headers or {})
+            if cached is not None:
+                request_headers.update(cached.validators())
+
+            stats.requests += 1
+            start = time.perf_counter()
+            try:
+                async with self._host_limit(url):
+                    async with self._get_session().get(
+                        url, headers=request_headers, timeout=self._timeout
+                    ) as response:
+                        body = await response.read()
+                        status = response.status
+                        response_headers = response.headers
+            except (asyncio.TimeoutError, aiohttp.ClientError) as err:
+                last_error = err
+                stats.failures += 1
+                stats.last_error = f"{type(err).__name__}: {err}"
+                _LOGGER.debug(
+                    "%s fetch failed (attempt %d/%d): %s",
+                    upstream, attempt + 1, self._max_retries, err,
+                )
+                continue
+
+            latency_ms = (time.perf_counter() - start) * 1000
+            stats.total_latency_ms += latency_ms
+            stats.max_latency_ms = max(stats.max_latency_ms, latency_ms)
+            stats.bytes_received += len(body)
+            stats.last_status = status
+
+            if status == 304 and cached is not None:
+                stats.not_modified += 1
+                return HttpFetchResult(url, 200, cached.body, from_cache=True)
+
+            if status in RETRY_STATUSES and attempt < self._max_retries - 1:
+                retry_after = _parse_retry_after(response_headers.get("Retry-After"))
+                _LOGGER.debug(
+                    "%s returned status %s (attempt %d/%d)",
+                    upstream, status, attempt + 1, self._max_retries,
+                )
+                continue
+
+            if status == 200:
+                etag = response_headers.get("ETag")
+                last_modified = response_headers.get("Last-Modified")
+                if etag or last_modified:
+                    await self._async_store(_CacheEntry(url, body, etag, last_modified))
+
+            return HttpFetchResult(url, status, body)
+
+        assert last_error is not None
+        raise last_error
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Return the counters of all upstreams @zara"""
+        return {name: stats.as_dict() for name, stats in self._stats.items()}
+
+    async def async_close(self) -> None:
+        """Close the session if this client created it @zara"""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+        self._session = None
+
+    # ------------------------------------------------------------------
+    # Revalidation cache
+    # ------------------------------------------------------------------
+
+    def _cache_path(self, url: str) -> Path | None:
+        """Return the cache file of a URL @zara"""
+        if self._cache_dir is None:
+            return None
+        return self._cache_dir / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+
+    async def _async_get_cached(self, url: str) -> _CacheEntry | None:
+        """Return the cache entry of a URL, reading it from disk once @zara"""
+        if url in self._cache:
+            return self._cache[url]
+        path = self._cache_path(url)
+        entry = None
+        if path is not None:
+            entry = await asyncio.get_running_loop().run_in_executor(None, _read_entry, path)
+        self._cache[url] = entry
+        return entry
+
+    async def _async_store(self, entry: _CacheEntry) -> None:
+        """Keep an entry in memory and on disk, evicting the oldest ones @zara"""
+        self._cache.pop(entry.url, None)
+        self._cache[entry.url] = entry
+        stored = [url for url, cached in self._cache.items() if cached is not None]
+        for url in stored[: max(0, len(stored) - self._max_cache_entries)]:
+            del self._cache[url]
+
+        path = self._cache_path(entry.url)
+        if path is not None:
+            await asyncio.get_running_loop().run_in_executor(
+                None, _write_entry, path, entry, self._max_cache_entries
+            )
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds @zara"""
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+def _read_entry(path: Path) -> _CacheEntry | None:
+    """Load a cache file (executor) @zara"""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return _CacheEntry(
+            url=data["url"],
+            body=base64.b64decode(data["body"]),
+            etag=data.get("etag"),
+            last_modified=data.get("last_modified"),
+            stored_at=data.get("stored_at", 0.0),
+        )
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError) as err:
+        _LOGGER.debug("Ignoring unreadable HTTP cache file %s: %s", path, err)
+        return None
+
+
+def _write_entry(path: Path, entry: _CacheEntry, max_entries: int) -> None:
+    """Write a cache file and prune the oldest files (executor) @zara"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_suffix(".partial")
+        partial.write_text(
+            json.dumps({
+                "url": entry.url,
+                "etag": entry.etag,
+                "last_modified": entry.last_modified,
+                "stored_at": entry.stored_at,
+                "body": base64.b64encode(entry.body).decode("ascii"),
+            }),
+            encoding="utf-8",
+        )
+        partial.replace(path)
+
+        files = sorted(path.parent.glob("*.json"), key=lambda f: f.stat().st_mtime)
+        for old in files[: max(0, len(files) - max_entries)]:
+            old.unlink(missing_ok=True)
+    except OSError as err:
+        _LOGGER.debug("Could not write HTTP cache file %s: %s", path, err)
@@ -11,32 +11,107 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import aiohttp
 
 from ..const import (
-    API_TIMEOUT,
     AWATTAR_API_URL_AT,
     AWATTAR_API_URL_DE,
 )
+from .http_client import PooledHttpClient
 
 _LOGGER = logging.getLogger(__name__)
 
-# Retry configuration
-MAX_RETRIES = 3
-RETRY_DELAY_SECONDS = 5
+# Slot length assumed when the timeline has a single entry @zara
+DEFAULT_SLOT_SECONDS = 3600
+
+
+def _entry_datetime(entry: dict[str, Any]) -> datetime:
+    """Return the entry timestamp as datetime (cache entries store ISO strings) @zara"""
+    entry_ts = entry["timestamp"]
+    if isinstance(entry_ts, str):
+        entry_ts = datetime.fromisoformat(entry_ts)
+    return entry_ts
+
+
+class _PriceTimeline:
+    """Sorted, pre-parsed price slots with bisect lookups @zara
+
+    Timestamps are parsed once into epoch seconds. Each slot covers
+    [start, start + slot_seconds), where slot_seconds is the smallest gap
+    between entries, so hourly and quarter-hour data are both resolved
+    without caller changes. Local dates map to index ranges into the
+    sorted entries.
+    """
+
+    def __init__(self, entries: list[dict[str, Any]]) -> None:
+        """Build the timeline from raw price entries @zara"""
+        parsed = []
+        for entry in entries:
+            try:
+                ts = _entry_datetime(entry)
+                parsed.append((ts.timestamp(), ts, entry["price"], entry))
+            except (KeyError, TypeError, ValueError) as err:
+                _LOGGER.warning("Skipping invalid price entry: %s", err)
+        parsed.sort(key=lambda item: item[0])
+
+        self.epochs: list[float] = [item[0] for item in parsed]
+        self.datetimes: list[datetime] = [item[1] for item in parsed]
+        self.prices: list[float] = [item[2] for item in parsed]
+        self.entries: list[dict[str, Any]] = [item[3] for item in parsed]
+
+        gaps = [b - a for a, b in zip(self.epochs, self.epochs[1:]) if b > a]
+        self.slot_seconds: float = min(gaps) if gaps else DEFAULT_SLOT_SECONDS
+
+        self.date_index: dict[str, tuple[int, int]] = {}
+        for i, ts in enumerate(self.datetimes):
+            local_date = ts.astimezone().date().isoformat()
+            start, _ = self.date_index.get(local_date, (i, i))
+            self.date_index[local_date] = (start, i + 1)
+
+    def __len__(self) -> int:
+        return len(self.epochs)
+
+    def index_at(self, moment: datetime) -> int | None:
+        """Return the index of the slot containing moment @zara"""
+        epoch = moment.timestamp()
+        i = bisect_right(self.epochs, epoch) - 1
+        if i < 0 or epoch >= self.epochs[i] + self.slot_seconds:
+            return None
+        return i
+
+    def index_from(self, moment: datetime) -> int:
+        """Return the index of the first slot starting at or after moment @zara"""
+        return bisect_left(self.epochs, moment.timestamp())
+
+    def entries_for_date(self, local_date: str) -> list[dict[str, Any]]:
+        """Return the entries of one local date (ISO format) @zara"""
+        start, end = self.date_index.get(local_date, (0, 0))
+        return self.entries[start:end]
 
 
 class ElectricityPriceService:
     """Service for fetching electricity spot prices from aWATTar API @zara"""
 
-    def __init__(self, country: str = "DE") -> None:
-        """Initialize the electricity price service @zara"""
+    def __init__(
+        self, country: str = "DE", http_client: PooledHttpClient | None = None
+    ) -> None:
+        """Initialize the electricity price service @zara
+
+        Args:
+            country: DE or AT
+            http_client: Shared HTTP client (default: a standalone one)
+        """
         self.country = country.upper()
         self.api_url = AWATTAR_API_URL_DE if self.country == "DE" else AWATTAR_API_URL_AT
+        self._http = http_client or PooledHttpClient()
+        self._upstream = f"awattar_{self.country.lower()}"
         self._price_cache: list[dict[str, Any]] = []
+        self._timeline = _PriceTimeline([])
+        self._prices_version = 0
         self._last_update: datetime | None = None
 
     async def fetch_day_ahead_prices(
@@ -65,71 +140,36 @@ class ElectricityPriceService:
 
         url = f"{self.api_url}?start={start_ts}&end={end_ts}"
 
-        # Retry logic for resilience
-        last_error: Exception | None = None
-        for attempt in range(MAX_RETRIES):
-            try:
-                timeout = aiohttp.ClientTimeout(total=API_TIMEOUT)
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    async with session.get(url) as response:
-                        if response.status != 200:
-                            _LOGGER.warning(
-                                "aWATTar API returned status %s for %s (attempt %d/%d)",
-                                response.status,
-                                self.country,
-                                attempt + 1,
-                                MAX_RETRIES,
-                            )
-                            if attempt < MAX_RETRIES - 1:
-                                await asyncio.sleep(RETRY_DELAY_SECONDS)
-                                continue
-                            return None
-
-                        data = await response.json()
-                        prices = self._parse_awattar_response(data)
-
-                        if prices:
-                            self._price_cache = prices
-                            self._last_update = datetime.now(timezone.utc)
-                            _LOGGER.debug(
-                                "Fetched %d price entries for %s",
-                                len(prices),
-                                self.country,
-                            )
-
-                        return prices
-
-            except asyncio.TimeoutError as err:
-                last_error = err
-                _LOGGER.warning(
-                    "Timeout fetching prices (attempt %d/%d): %s",
-                    attempt + 1,
-                    MAX_RETRIES,
-                    err,
-                )
-            except aiohttp.ClientError as err:
-                last_error = err
-                _LOGGER.warning(
-                    "Network error fetching prices (attempt %d/%d): %s",
-                    attempt + 1,
-                    MAX_RETRIES,
-                    err,
-                )
-            except Exception as err:
-                last_error = err
-                _LOGGER.error("Unexpected error fetching prices: %s", err, exc_info=True)
-                return None  # Don't retry on unexpected errors
-
-            # Wait before retrying
-            if attempt < MAX_RETRIES - 1:
-                await asyncio.sleep(RETRY_DELAY_SECONDS)
-
-        _LOGGER.error(
-            "Failed to fetch prices after %d attempts. Last error: %s",
-            MAX_RETRIES,
-            last_error,
-        )
-        return None
+        # Connection reuse, revalidation and retries are handled by the client
+        try:
+            result = await self._http.async_fetch(url, self._upstream)
+        except (asyncio.TimeoutError, aiohttp.ClientError) as err:
+            _LOGGER.error("Failed to fetch prices for %s: %s", self.country, err)
+            return None
+
+        if result.status != 200:
+            _LOGGER.warning(
+                "aWATTar API returned status %s for %s", result.status, self.country
+            )
+            return None
+
+        try:
+            prices = self._parse_awattar_response(result.json())
+        except ValueError as err:
+            _LOGGER.error("Invalid aWATTar response for %s: %s", self.country, err)
+            return None
+
+        if prices:
+            self._set_prices(prices)
+            self._last_update = datetime.now(timezone.utc)
+            _LOGGER.debug(
+                "Fetched %d price entries for %s%s",
+                len(prices),
+                self.country,
+                " (not modified)" if result.from_cache else "",
+            )
+
+        return prices
 
     def _parse_awattar_response(
         self, response: dict[str, Any]
@@ -186,36 +226,26 @@ class ElectricityPriceService:
         Args:
             prices: List of price entries from cache
         """
-        self._price_cache = prices
+        self._set_prices(prices)
         _LOGGER.debug("Loaded %d prices from cache", len(prices))
 
-    def get_current_price(self) -> float | None:
-        """Get the current hour's spot price @zara"""
-        now = datetime.now(timezone.utc)
-        current_hour = now.replace(minute=0, second=0, microsecond=0)
-
-        for entry in self._price_cache:
-            entry_ts = entry["timestamp"]
-            if isinstance(entry_ts, str):
-                entry_ts = datetime.fromisoformat(entry_ts)
-            if entry_ts == current_hour:
-                return entry["price"]
+    def _set_prices(self, prices: list[dict[str, Any]]) -> None:
+        """Replace the price cache and rebuild the timeline @zara"""
+        self._timeline = _PriceTimeline(prices)
+        self._price_cache = self._timeline.entries
+        self._prices_version += 1
 
-        return None
+    def get_current_price(self) -> float | None:
+        """Get the spot price of the current slot (hour or quarter-hour) @zara"""
+        i = self._timeline.index_at(datetime.now(timezone.utc))
+        return self._timeline.prices[i] if i is not None else None
 
     def get_next_hour_price(self) -> float | None:
-        """Get the next hour's spot price @zara"""
+        """Get the spot price at the start of the next hour @zara"""
         now = datetime.now(timezone.utc)
         next_hour = (now + timedelta(hours=1)).replace(minute=0, second=0, microsecond=0)
-
-        for entry in self._price_cache:
-            entry_ts = entry["timestamp"]
-            if isinstance(entry_ts, str):
-                entry_ts = datetime.fromisoformat(entry_ts)
-            if entry_ts == next_hour:
-                return entry["price"]
-
-        return None
+        i = self._timeline.index_at(next_hour)
+        return self._timeline.prices[i] if i is not None else None
 
     def get_prices_for_date(self, date: datetime) -> list[dict[str, Any]]:
         """Get all prices for a specific date in LOCAL timezone @zara
@@ -228,20 +258,7 @@ class ElectricityPriceService:
         else:
             local_date = date.date()
 
-        target_date = local_date.isoformat()
-
-        result = []
-        for p in self._price_cache:
-            # Convert UTC timestamp to local date for comparison
-            entry_ts = p["timestamp"]
-            if isinstance(entry_ts, str):
-                entry_ts = datetime.fromisoformat(entry_ts)
-            # Convert to local timezone and get date
-            entry_local_date = entry_ts.astimezone().date().isoformat()
-            if entry_local_date == target_date:
-                result.append(p)
-
-        return result
+        return self._timeline.entries_for_date(local_date.isoformat())
 
     def get_today_prices(self) -> list[dict[str, Any]]:
         """Get all prices for today (local timezone) @zara"""
@@ -289,20 +306,17 @@ class ElectricityPriceService:
 
     def get_next_cheap_hour(self, max_price: float) -> dict[str, Any] | None:
         """Get the next hour where price is below max_price @zara"""
-        now = datetime.now(timezone.utc)
-
-        future_cheap = []
-        for p in self._price_cache:
-            entry_ts = p["timestamp"]
-            if isinstance(entry_ts, str):
-                entry_ts = datetime.fromisoformat(entry_ts)
-            if entry_ts >= now and p["price"] < max_price:
-                future_cheap.append(p)
-
-        if not future_cheap:
-            return None
+        timeline = self._timeline
+        for i in range(timeline.index_from(datetime.now(timezone.utc)), len(timeline)):
+            if timeline.prices[i] < max_price:
+                return timeline.entries[i]
+        return None
 
-        return min(future_cheap, key=lambda x: x["timestamp"] if isinstance(x["timestamp"], datetime) else datetime.fromisoformat(x["timestamp"]))
+    def get_upcoming_prices(self) -> list[tuple[datetime, dict[str, Any]]]:
+        """Get (timestamp, entry) pairs for all slots starting from now @zara"""
+        timeline = self._timeline
+        i = timeline.index_from(datetime.now(timezone.utc))
+        return list(zip(timeline.datetimes[i:], timeline.entries[i:]))
 
     def get_all_prices(self) -> list[dict[str, Any]]:
         """Get all cached prices @zara"""
@@ -313,6 +327,16 @@ class ElectricityPriceService:
         """Return the last update timestamp @zara"""
         return self._last_update
 
+    @property
+    def prices_version(self) -> int:
+        """Counter that changes whenever new prices are loaded @zara"""
+        return self._prices_version
+
+    @property
+    def http_stats(self) -> dict[str, Any]:
+        """Return latency and byte counters of the price upstream @zara"""
+        return self._http.get_stats().get(self._upstream, {})
+
     @property
     def has_data(self) -> bool:
         """Check if price data is available @zara"""
@@ -15,6 +15,7 @@ from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.config_entries import ConfigEntry
 
 from ..const import (
+    ATTR_API_STATS,
     ATTR_CHEAP_HOURS_TODAY,
     ATTR_CHEAP_HOURS_TOMORROW,
     ATTR_DATA_SOURCE,
@@ -81,6 +82,7 @@ class GridPriceSpotSensor(GridPriceBaseSensor):
             ATTR_PRICE_TREND: self.coordinator.data.get("price_trend"),
             ATTR_DATA_SOURCE: self.coordinator.data.get("data_source"),
             ATTR_LAST_UPDATE: self.coordinator.data.get("last_update"),
+            ATTR_API_STATS: self.coordinator.data.get("api_stats"),
         }
 
 
@@ -0,0 +1,231 @@
+# ******************************************************************************
+# @copyright (C) 2025 Zara-Toorox - Solar Forecast ML
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""Process-wide access layer for solar_forecast.db. @zara
+
+SFML Stats, Grid Price Monitor and ML Weather are installed as separate
+integrations, so each one ships an identical copy of this module. The
+instance itself lives in hass.data under SHARED_DB_KEY and is shared by
+whichever integration opens it first; the others only take a reference.
+
+The database is switched to WAL. All writes go through one writer
+connection guarded by a FIFO lock, reads use a small pool of read-only
+connections so dashboard queries never wait behind forecast writes.
+Keep the copies in sfml_stats/storage, grid_price_monitor/storage and
+ml_weather in sync.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncIterator
+from urllib.parse import quote
+
+import aiosqlite
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+SHARED_DB_KEY = "solar_forecast_db_access"
+READ_POOL_SIZE = 3
+BUSY_TIMEOUT_MS = 30000
+
+
+async def async_acquire_database(hass: HomeAssistant, db_path: str | Path) -> SharedDatabase:
+    """Return the shared database for db_path and take a reference on it. @zara"""
+    registry: dict[str, Any] = hass.data.setdefault(SHARED_DB_KEY, {})
+    key = os.path.abspath(str(db_path))
+    database = registry.get(key)
+    if database is None:
+        database = registry[key] = SharedDatabase(key)
+    database.references += 1
+    try:
+        await database.async_open()
+    except Exception:
+        await async_release_database(hass, key)
+        raise
+    return database
+
+
+async def async_release_database(hass: HomeAssistant, db_path: str | Path) -> None:
+    """Drop a reference and close the shared database when it was the last one. @zara"""
+    registry: dict[str, Any] = hass.data.get(SHARED_DB_KEY, {})
+    key = os.path.abspath(str(db_path))
+    database = registry.get(key)
+    if database is None:
+        return
+    database.references -= 1
+    if database.references <= 0:
+        registry.pop(key, None)
+        await database.async_close()
+
+
+class SharedDatabase:
+    """One WAL writer connection plus a pool of read-only connections. @zara"""
+
+    def __init__(self, db_path: str) -> None:
+        """Initialize the access layer. @zara"""
+        self.db_path = db_path
+        self.references = 0
+        self._writer: aiosqlite.Connection | None = None
+        self._write_lock = asyncio.Lock()
+        self._open_lock = asyncio.Lock()
+        self._readers: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._reader_count = 0
+        self._all_readers: list[aiosqlite.Connection] = []
+        self.journal_mode: str | None = None
+        self.reads = 0
+        self.writes = 0
+
+    @property
+    def is_open(self) -> bool:
+        """Check if the writer connection is open. @zara"""
+        return self._writer is not None
+
+    @property
+    def writer(self) -> aiosqlite.Connection:
+        """Return the writer connection for callers that manage their own commits. @zara"""
+        if self._writer is None:
+            raise RuntimeError("Database not connected")
+        return self._writer
+
+    async def async_open(self) -> None:
+        """Open the writer connection and switch the database to WAL. @zara"""
+        async with self._open_lock:
+            if self._writer is not None:
+                return
+
+            writer = await aiosqlite.connect(self.db_path)
+            writer.row_factory = aiosqlite.Row
+            try:
+                await writer.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+                async with writer.execute("PRAGMA journal_mode = WAL") as cursor:
+                    row = await cursor.fetchone()
+                await writer.execute("PRAGMA synchronous = NORMAL")
+                await writer.execute("PRAGMA foreign_keys = ON")
+            except Exception:
+                await writer.close()
+                raise
+
+            self.journal_mode = str(row[0]).lower() if row else None
+            if self.journal_mode != "wal":
+                # Another connection holds the DB; WAL is applied on a later open @zara
+                _LOGGER.warning(
+                    "Could not switch %s to WAL (journal_mode=%s)", self.db_path, self.journal_mode
+                )
+            self._writer = writer
+            _LOGGER.info("Shared database opened: %s (journal_mode=%s)", self.db_path, self.journal_mode)
+
+    async def async_close(self) -> None:
+        """Close the writer and all pooled readers. @zara"""
+        async with self._open_lock:
+            readers, self._all_readers = self._all_readers, []
+            self._readers = asyncio.Queue()
+            self._reader_count = 0
+            for conn in readers:
+                try:
+                    await conn.close()
+                except Exception as err:
+                    _LOGGER.debug("Error closing reader connection: %s", err)
+
+            if self._writer is not None:
+                try:
+                    await self._writer.close()
+                except Exception as err:
+                    _LOGGER.error("Error closing shared database: %s", err)
+                finally:
+                    self._writer = None
+                    _LOGGER.info("Shared database closed: %s", self.db_path)
+
+    async def _open_reader(self) -> aiosqlite.Connection:
+        """Open one read-only connection for the pool. @zara"""
+        conn = await aiosqlite.connect(f"file:{quote(self.db_path)}?mode=ro", uri=True)
+        conn.row_factory = aiosqlite.Row
+        await conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        await conn.execute("PRAGMA query_only = ON")
+        self._all_readers.append(conn)
+        return conn
+
+    @asynccontextmanager
+    async def read(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a read-only connection from the pool. @zara"""
+        if self._writer is None:
+            raise RuntimeError("Database not connected")
+
+        if self._readers.empty() and self._reader_count < READ_POOL_SIZE:
+            self._reader_count += 1
+            try:
+                conn = await self._open_reader()
+            except Exception:
+                self._reader_count -= 1
+                raise
+        else:
+            conn = await self._readers.get()
+
+        pool = self._readers
+        self.reads += 1
+        try:
+            yield conn
+        finally:
+            # Connections of a closed pool are not handed out again @zara
+            if pool is self._readers:
+                pool.put_nowait(conn)
+
+    @asynccontextmanager
+    async def write(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Run one write transaction on the writer, serialized with all other writes. @zara"""
+        async with self._write_lock:
+            writer = self.writer
+            self.writes += 1
+            try:
+                yield writer
+            except BaseException:
+                await writer.rollback()
+                raise
+            await writer.commit()
+
+    async def fetchall(self, sql: str, parameters: tuple | list = ()) -> list[aiosqlite.Row]:
+        """Run a read query on the pool and fetch all rows. @zara"""
+        async with self.read() as conn:
+            async with conn.execute(sql, parameters) as cursor:
+                return await cursor.fetchall()
+
+    async def fetchone(self, sql: str, parameters: tuple | list = ()) -> aiosqlite.Row | None:
+        """Run a read query on the pool and fetch one row. @zara"""
+        async with self.read() as conn:
+            async with conn.execute(sql, parameters) as cursor:
+                return await cursor.fetchone()
+
+    async def execute_write(self, sql: str, parameters: tuple | list = ()) -> int:
+        """Run one write statement in its own transaction. @zara"""
+        async with self.write() as conn:
+            cursor = await conn.execute(sql, parameters)
+            return cursor.rowcount
+
+    async def executemany_write(self, sql: str, parameters_list: list[tuple]) -> int:
+        """Run a write statement for many parameter sets in one transaction. @zara"""
+        async with self.write() as conn:
+            await conn.executemany(sql, parameters_list)
+        return len(parameters_list)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return usage counters. @zara"""
+        return {
+            "db_path": self.db_path,
+            "journal_mode": self.journal_mode,
+            "references": self.references,
+            "read_pool_size": self._reader_count,
+            "reads": self.reads,
+            "writes": self.writes,
+        }
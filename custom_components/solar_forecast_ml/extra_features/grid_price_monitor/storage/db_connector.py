@@ -9,74 +9,128 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable
 
 import aiosqlite
+from homeassistant.helpers.event import async_track_time_interval
+
+from ..const import DB_WRITE_FLUSH_INTERVAL
+from .db_access import SharedDatabase, async_acquire_database, async_release_database
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class GPMTransaction:
+    """Statements of one serialized write transaction on the writer @zara
+
+    Only valid inside GPMDatabaseConnector.transaction(); reads made here
+    see the transaction's own uncommitted changes.
+    """
+
+    def __init__(self, conn: aiosqlite.Connection) -> None:
+        """Initialize the transaction handle @zara"""
+        self._conn = conn
+
+    async def execute(self, sql: str, parameters: tuple = ()) -> int:
+        """Execute a SQL statement inside the transaction @zara"""
+        cursor = await self._conn.execute(sql, parameters)
+        return cursor.rowcount
+
+    async def executemany(self, sql: str, parameters_list: list[tuple]) -> int:
+        """Execute SQL with multiple parameter sets inside the transaction @zara"""
+        await self._conn.executemany(sql, parameters_list)
+        return len(parameters_list)
+
+    async def fetchone(self, sql: str, parameters: tuple = ()) -> aiosqlite.Row | None:
+        """Execute SQL inside the transaction and fetch one row @zara"""
+        async with self._conn.execute(sql, parameters) as cursor:
+            return await cursor.fetchone()
+
+
 class GPMDatabaseConnector:
     """Lightweight SQLite connector for Grid Price Monitor @zara
 
-    Uses the shared solar_forecast.db with GPM_ prefixed tables.
+    Uses the shared solar_forecast.db with GPM_ prefixed tables through the
+    process-wide access layer (WAL, one serialized writer, pooled readers).
     """
 
-    def __init__(self, db_path: str) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        db_path: str,
+        flush_interval: timedelta = DB_WRITE_FLUSH_INTERVAL,
+    ) -> None:
         """Initialize the database connector @zara
 
         Args:
+            hass: Home Assistant instance (holds the shared access layer)
             db_path: Absolute path to the SQLite database file
+            flush_interval: Cadence of the write-behind flush for staged rows
         """
+        self._hass = hass
         self.db_path = db_path
-        self._db: aiosqlite.Connection | None = None
+        self._shared: SharedDatabase | None = None
 
-    async def connect(self) -> None:
-        """Establish database connection and ensure tables exist @zara"""
-        self._db = await aiosqlite.connect(self.db_path)
-        self._db.row_factory = aiosqlite.Row
+        # Write-behind buffer: key -> (sql, parameters, value), last write wins
+        self._flush_interval = flush_interval
+        self._staged: dict[str, tuple[str, tuple, Any]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._unsub_flush: Callable[[], None] | None = None
 
-        # Match SFML PRAGMA settings for shared DB compatibility
-        await self._db.execute("PRAGMA foreign_keys = ON")
-        await self._db.execute("PRAGMA journal_mode = DELETE")
-        await self._db.execute("PRAGMA busy_timeout = 30000")
+    async def connect(self) -> None:
+        """Take a reference on the shared database and ensure tables exist @zara"""
+        self._shared = await async_acquire_database(self._hass, self.db_path)
 
         await self._ensure_tables()
+        self._unsub_flush = async_track_time_interval(
+            self._hass, self._async_scheduled_flush, self._flush_interval
+        )
         _LOGGER.info(
-            "GPM database connected: %s", self.db_path
+            "GPM database connected: %s (journal_mode=%s)",
+            self.db_path,
+            self._shared.journal_mode,
         )
 
     async def close(self) -> None:
-        """Close database connection @zara"""
-        if self._db:
-            await self._db.close()
-            self._db = None
+        """Flush staged writes and release the shared database reference @zara"""
+        if self._unsub_flush:
+            self._unsub_flush()
+            self._unsub_flush = None
+
+        if self._shared:
+            await self.async_flush()
+            self._shared = None
+            await async_release_database(self._hass, self.db_path)
             _LOGGER.debug("GPM database connection closed")
 
     async def execute(
         self,
         sql: str,
         parameters: tuple = (),
-        auto_commit: bool = True,
     ) -> None:
-        """Execute a SQL statement @zara
+        """Execute a SQL statement as its own serialized write transaction @zara
+
+        Statements that must commit together go through transaction().
 
         Args:
             sql: SQL statement
             parameters: Query parameters
-            auto_commit: Whether to auto-commit after execution
         """
-        await self._db.execute(sql, parameters)
-        if auto_commit:
-            await self._db.commit()
+        await self._shared.execute_write(sql, parameters)
 
     async def fetchone(
         self,
         sql: str,
         parameters: tuple = (),
     ) -> aiosqlite.Row | None:
-        """Execute SQL and fetch one row @zara
+        """Execute SQL on the read-only pool and fetch one row @zara
 
         Args:
             sql: SQL query
@@ -85,15 +139,14 @@ class GPMDatabaseConnector:
         Returns:
             Single row or None
         """
-        async with self._db.execute(sql, parameters) as cursor:
-            return await cursor.fetchone()
+        return await self._shared.fetchone(sql, parameters)
 
     async def fetchall(
         self,
         sql: str,
         parameters: tuple = (),
     ) -> list[aiosqlite.Row]:
-        """Execute SQL and fetch all rows @zara
+        """Execute SQL on the read-only pool and fetch all rows @zara
 
         Args:
             sql: SQL query
@@ -102,8 +155,7 @@ class GPMDatabaseConnector:
         Returns:
             List of rows
         """
-        async with self._db.execute(sql, parameters) as cursor:
-            return await cursor.fetchall()
+        return await self._shared.fetchall(sql, parameters)
 
     async def executemany(
         self,
@@ -119,120 +171,184 @@ class GPMDatabaseConnector:
         Returns:
             Number of rows affected
         """
-        await self._db.executemany(sql, parameters_list)
-        await self._db.commit()
-        return len(parameters_list)
+        return await self._shared.executemany_write(sql, parameters_list)
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[GPMTransaction]:
+        """Run the statements of the yielded handle as one serialized write @zara
+
+        Commits when the block exits and rolls back if it raises. The
+        connector's own execute/executemany take the same lock and must
+        not be awaited inside the block.
+        """
+        async with self._shared.write() as conn:
+            yield GPMTransaction(conn)
+
+    def stage(
+        self,
+        key: str,
+        sql: str,
+        parameters: tuple = (),
+        value: Any = None,
+    ) -> None:
+        """Stage a single-row upsert for the next flush @zara
+
+        Staging the same key again replaces the unflushed statement, so a
+        row updated on every sensor event is written once per flush interval.
+
+        Args:
+            key: Identity of the row, usually the table name for id = 1 rows
+            sql: Statement that persists the row
+            parameters: Statement parameters
+            value: Value returned by pending() until the row is flushed
+        """
+        self._staged[key] = (sql, tuple(parameters), value)
+
+    def pending(self, key: str, default: Any = None) -> Any:
+        """Get the staged value of a row that is not flushed yet @zara"""
+        staged = self._staged.get(key)
+        return staged[2] if staged is not None else default
+
+    async def _async_scheduled_flush(self, _now: Any = None) -> None:
+        """Timer callback for the write-behind flush @zara"""
+        await self.async_flush()
+
+    async def async_flush(self) -> int:
+        """Write all staged rows in one serialized transaction @zara
+
+        Returns:
+            Number of rows written
+        """
+        async with self._flush_lock:
+            if not self._staged or self._shared is None:
+                return 0
+
+            batch, self._staged = self._staged, {}
+            try:
+                async with self._shared.write() as conn:
+                    for sql, parameters, _value in batch.values():
+                        await conn.execute(sql, parameters)
+            except Exception as err:
+                # Keep rows for the next flush unless they were staged again meanwhile
+                for key, staged in batch.items():
+                    self._staged.setdefault(key, staged)
+                _LOGGER.warning("GPM write flush failed (%d rows kept): %s", len(batch), err)
+                return 0
+
+            _LOGGER.debug("GPM write flush: %d rows", len(batch))
+            return len(batch)
 
     async def commit(self) -> None:
         """Commit current transaction @zara"""
-        await self._db.commit()
+        async with self._shared.write():
+            pass
 
     async def _ensure_tables(self) -> None:
         """Create all GPM tables if they don't exist @zara"""
-        await self._db.executescript("""
-            -- Price cache metadata (single row)
-            CREATE TABLE IF NOT EXISTS GPM_price_cache_meta (
-                id INTEGER PRIMARY KEY DEFAULT 1,
-                last_fetch TEXT,
-                valid_until TEXT,
-                country TEXT,
-                CHECK (id = 1)
-            );
-
-            -- Price cache entries
-            CREATE TABLE IF NOT EXISTS GPM_price_cache (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT NOT NULL UNIQUE,
-                price REAL NOT NULL,
-                total_price REAL,
-                hour INTEGER NOT NULL
-            );
-
-            -- Price history (2 years retention)
-            CREATE TABLE IF NOT EXISTS GPM_price_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT NOT NULL UNIQUE,
-                price_net REAL NOT NULL,
-                total_price REAL,
-                hour INTEGER NOT NULL
-            );
-            CREATE INDEX IF NOT EXISTS idx_gpm_price_history_ts
-                ON GPM_price_history(timestamp);
-
-            -- Daily average statistics
-            CREATE TABLE IF NOT EXISTS GPM_daily_averages (
-                date TEXT PRIMARY KEY,
-                average_net REAL NOT NULL,
-                average_total REAL NOT NULL,
-                min_price REAL,
-                max_price REAL
-            );
-
-            -- Monthly summary statistics
-            CREATE TABLE IF NOT EXISTS GPM_monthly_summaries (
-                month TEXT PRIMARY KEY,
-                average_price REAL NOT NULL,
-                cheap_hours INTEGER NOT NULL DEFAULT 0,
-                country TEXT
-            );
-
-            -- All-time price extremes (single row)
-            CREATE TABLE IF NOT EXISTS GPM_price_extremes (
-                id INTEGER PRIMARY KEY DEFAULT 1,
-                all_time_low REAL,
-                all_time_low_date TEXT,
-                all_time_high REAL,
-                all_time_high_date TEXT,
-                CHECK (id = 1)
-            );
-
-            -- Battery tracker statistics (single row, replaces HA Store)
-            CREATE TABLE IF NOT EXISTS GPM_battery_stats (
-                id INTEGER PRIMARY KEY DEFAULT 1,
-                energy_today_wh REAL DEFAULT 0.0,
-                energy_week_wh REAL DEFAULT 0.0,
-                energy_month_wh REAL DEFAULT 0.0,
-                current_day INTEGER,
-                current_week INTEGER,
-                current_month INTEGER,
-                CHECK (id = 1)
-            );
-
-            -- Battery totals for statistics display (single row)
-            CREATE TABLE IF NOT EXISTS GPM_battery_totals (
-                id INTEGER PRIMARY KEY DEFAULT 1,
-                today_kwh REAL DEFAULT 0.0,
-                week_kwh REAL DEFAULT 0.0,
-                month_kwh REAL DEFAULT 0.0,
-                CHECK (id = 1)
-            );
-
-            -- Current price for external integrations (single row)
-            CREATE TABLE IF NOT EXISTS GPM_current_price (
-                id INTEGER PRIMARY KEY DEFAULT 1,
-                timestamp TEXT NOT NULL,
-                spot_price_net REAL,
-                spot_price_gross REAL,
-                total_price REAL,
-                price_next_hour REAL,
-                is_cheap INTEGER DEFAULT 0,
-                average_today REAL,
-                cheapest_today REAL,
-                most_expensive_today REAL,
-                country TEXT,
-                last_updated TEXT NOT NULL,
-                CHECK (id = 1)
-            );
-
-            -- Configuration backup (single row)
-            CREATE TABLE IF NOT EXISTS GPM_config_backup (
-                id INTEGER PRIMARY KEY DEFAULT 1,
-                backup_time TEXT,
-                config_json TEXT,
-                CHECK (id = 1)
-            );
-        """)
-        await self._db.commit()
+        async with self._shared.write() as conn:
+            await conn.executescript("""
+                -- Price cache metadata (single row)
+                CREATE TABLE IF NOT EXISTS GPM_price_cache_meta (
+                    id INTEGER PRIMARY KEY DEFAULT 1,
+                    last_fetch TEXT,
+                    valid_until TEXT,
+                    country TEXT,
+                    CHECK (id = 1)
+                );
+
+                -- Price cache entries
+                CREATE TABLE IF NOT EXISTS GPM_price_cache (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp TEXT NOT NULL UNIQUE,
+                    price REAL NOT NULL,
+                    total_price REAL,
+                    hour INTEGER NOT NULL
+                );
+
+                -- Price history (2 years retention)
+                CREATE TABLE IF NOT EXISTS GPM_price_history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp TEXT NOT NULL UNIQUE,
+                    price_net REAL NOT NULL,
+                    total_price REAL,
+                    hour INTEGER NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_gpm_price_history_ts
+                    ON GPM_price_history(timestamp);
+
+                -- Daily average statistics
+                CREATE TABLE IF NOT EXISTS GPM_daily_averages (
+                    date TEXT PRIMARY KEY,
+                    average_net REAL NOT NULL,
+                    average_total REAL NOT NULL,
+                    min_price REAL,
+                    max_price REAL
+                );
+
+                -- Monthly summary statistics
+                CREATE TABLE IF NOT EXISTS GPM_monthly_summaries (
+                    month TEXT PRIMARY KEY,
+                    average_price REAL NOT NULL,
+                    cheap_hours INTEGER NOT NULL DEFAULT 0,
+                    country TEXT
+                );
+
+                -- All-time price extremes (single row)
+                CREATE TABLE IF NOT EXISTS GPM_price_extremes (
+                    id INTEGER PRIMARY KEY DEFAULT 1,
+                    all_time_low REAL,
+                    all_time_low_date TEXT,
+                    all_time_high REAL,
+                    all_time_high_date TEXT,
+                    CHECK (id = 1)
+                );
+
+                -- Battery tracker statistics (single row, replaces HA Store)
+                CREATE TABLE IF NOT EXISTS GPM_battery_stats (
+                    id INTEGER PRIMARY KEY DEFAULT 1,
+                    energy_today_wh REAL DEFAULT 0.0,
+                    energy_week_wh REAL DEFAULT 0.0,
+                    energy_month_wh REAL DEFAULT 0.0,
+                    current_day INTEGER,
+                    current_week INTEGER,
+                    current_month INTEGER,
+                    CHECK (id = 1)
+                );
+
+                -- Battery totals for statistics display (single row)
+                CREATE TABLE IF NOT EXISTS GPM_battery_totals (
+                    id INTEGER PRIMARY KEY DEFAULT 1,
+                    today_kwh REAL DEFAULT 0.0,
+                    week_kwh REAL DEFAULT 0.0,
+                    month_kwh REAL DEFAULT 0.0,
+                    CHECK (id = 1)
+                );
+
+                -- Current price for external integrations (single row)
+                CREATE TABLE IF NOT EXISTS GPM_current_price (
+                    id INTEGER PRIMARY KEY DEFAULT 1,
+                    timestamp TEXT NOT NULL,
+                    spot_price_net REAL,
+                    spot_price_gross REAL,
+                    total_price REAL,
+                    price_next_hour REAL,
+                    is_cheap INTEGER DEFAULT 0,
+                    average_today REAL,
+                    cheapest_today REAL,
+                    most_expensive_today REAL,
+                    country TEXT,
+                    last_updated TEXT NOT NULL,
+                    CHECK (id = 1)
+                );
+
+                -- Configuration backup (single row)
+                CREATE TABLE IF NOT EXISTS GPM_config_backup (
+                    id INTEGER PRIMARY KEY DEFAULT 1,
+                    backup_time TEXT,
+                    config_json TEXT,
+                    CHECK (id = 1)
+                );
+            """)
 
         # Migrate existing tables: add total_price column if missing
         await self._migrate_tables()
@@ -242,17 +358,17 @@ class GPMDatabaseConnector:
     async def _migrate_tables(self) -> None:
         """Run schema migrations for existing tables @zara"""
         try:
-            # Check if total_price column exists in GPM_price_history
-            async with self._db.execute(
-                "PRAGMA table_info(GPM_price_history)"
-            ) as cursor:
-                columns = [row[1] for row in await cursor.fetchall()]
-
-            if "total_price" not in columns:
-                await self._db.execute(
-                    "ALTER TABLE GPM_price_history ADD COLUMN total_price REAL"
-                )
-                await self._db.commit()
-                _LOGGER.info("Migrated GPM_price_history: added total_price column")
+            async with self._shared.write() as conn:
+                # Check if total_price column exists in GPM_price_history
+                async with conn.execute(
+                    "PRAGMA table_info(GPM_price_history)"
+                ) as cursor:
+                    columns = [row[1] for row in await cursor.fetchall()]
+
+                if "total_price" not in columns:
+                    await conn.execute(
+                        "ALTER TABLE GPM_price_history ADD COLUMN total_price REAL"
+                    )
+                    _LOGGER.info("Migrated GPM_price_history: added total_price column")
         except Exception as err:
             _LOGGER.warning("Table migration check failed: %s", err)
@@ -121,31 +121,30 @@ class HistoryManager:
             cutoff_date = datetime.now(timezone.utc) - timedelta(days=HISTORY_RETENTION_DAYS)
             cutoff_str = cutoff_date.isoformat()
 
-            # Delete old entries
-            await self._db.execute(
-                "DELETE FROM GPM_price_history WHERE timestamp < ?",
-                (cutoff_str,),
-                auto_commit=False,
-            )
+            async with self._db.transaction() as tx:
+                # Delete old entries
+                await tx.execute(
+                    "DELETE FROM GPM_price_history WHERE timestamp < ?",
+                    (cutoff_str,),
+                )
 
-            # Enforce maximum entry limit
-            row = await self._db.fetchone(
-                "SELECT COUNT(*) as cnt FROM GPM_price_history"
-            )
-            total = row["cnt"] if row else 0
-
-            if total > MAX_HISTORY_ENTRIES:
-                overflow = total - MAX_HISTORY_ENTRIES
-                await self._db.execute(
-                    """DELETE FROM GPM_price_history WHERE id IN (
-                           SELECT id FROM GPM_price_history
-                           ORDER BY timestamp ASC LIMIT ?
-                       )""",
-                    (overflow,),
+                # Enforce maximum entry limit
+                row = await tx.fetchone(
+                    "SELECT COUNT(*) as cnt FROM GPM_price_history"
                 )
-                _LOGGER.info("Cleaned up %d old history entries", overflow)
+                total = row["cnt"] if row else 0
+
+                if total > MAX_HISTORY_ENTRIES:
+                    overflow = total - MAX_HISTORY_ENTRIES
+                    await tx.execute(
+                        """DELETE FROM GPM_price_history WHERE id IN (
+                               SELECT id FROM GPM_price_history
+                               ORDER BY timestamp ASC LIMIT ?
+                           )""",
+                        (overflow,),
+                    )
+                    _LOGGER.info("Cleaned up %d old history entries", overflow)
 
-            await self._db.commit()
             return 0
 
         except Exception as err:
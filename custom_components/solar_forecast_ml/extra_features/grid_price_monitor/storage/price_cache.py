@@ -78,24 +78,6 @@ class PriceCache:
             now_local = datetime.now().astimezone()
             valid_until_local = now_local + timedelta(hours=CACHE_VALIDITY_HOURS)
 
-            # Update metadata
-            await self._db.execute(
-                """INSERT INTO GPM_price_cache_meta (id, last_fetch, valid_until, country)
-                   VALUES (1, ?, ?, ?)
-                   ON CONFLICT(id) DO UPDATE SET
-                       last_fetch = excluded.last_fetch,
-                       valid_until = excluded.valid_until,
-                       country = excluded.country""",
-                (now_local.isoformat(), valid_until_local.isoformat(), country),
-                auto_commit=False,
-            )
-
-            # Replace all cache entries
-            await self._db.execute(
-                "DELETE FROM GPM_price_cache", auto_commit=False
-            )
-
-            # Insert new entries
             params = []
             for entry in prices:
                 ts = entry.get("timestamp")
@@ -108,11 +90,25 @@ class PriceCache:
                     entry.get("hour", 0),
                 ))
 
-            await self._db.executemany(
-                """INSERT OR REPLACE INTO GPM_price_cache
-                   (timestamp, price, total_price, hour) VALUES (?, ?, ?, ?)""",
-                params,
-            )
+            async with self._db.transaction() as tx:
+                # Update metadata
+                await tx.execute(
+                    """INSERT INTO GPM_price_cache_meta (id, last_fetch, valid_until, country)
+                       VALUES (1, ?, ?, ?)
+                       ON CONFLICT(id) DO UPDATE SET
+                           last_fetch = excluded.last_fetch,
+                           valid_until = excluded.valid_until,
+                           country = excluded.country""",
+                    (now_local.isoformat(), valid_until_local.isoformat(), country),
+                )
+
+                # Replace all cache entries
+                await tx.execute("DELETE FROM GPM_price_cache")
+                await tx.executemany(
+                    """INSERT OR REPLACE INTO GPM_price_cache
+                       (timestamp, price, total_price, hour) VALUES (?, ?, ?, ?)""",
+                    params,
+                )
 
             _LOGGER.debug(
                 "Saved %d price entries to cache, valid until %s",
@@ -279,17 +275,16 @@ class PriceCache:
             True if cleared successfully
         """
         try:
-            await self._db.execute(
-                "DELETE FROM GPM_price_cache", auto_commit=False
-            )
-            await self._db.execute(
-                """INSERT INTO GPM_price_cache_meta (id, last_fetch, valid_until, country)
-                   VALUES (1, NULL, NULL, NULL)
-                   ON CONFLICT(id) DO UPDATE SET
-                       last_fetch = NULL,
-                       valid_until = NULL,
-                       country = NULL""",
-            )
+            async with self._db.transaction() as tx:
+                await tx.execute("DELETE FROM GPM_price_cache")
+                await tx.execute(
+                    """INSERT INTO GPM_price_cache_meta (id, last_fetch, valid_until, country)
+                       VALUES (1, NULL, NULL, NULL)
+                       ON CONFLICT(id) DO UPDATE SET
+                           last_fetch = NULL,
+                           valid_until = NULL,
+                           country = NULL""",
+                )
             self._loaded = False
             _LOGGER.debug("Price cache cleared")
             return True
@@ -207,19 +207,18 @@ class StatisticsStore:
             week_kwh: Energy charged this week in kWh
             month_kwh: Energy charged this month in kWh
         """
-        try:
-            await self._db.execute(
-                """INSERT INTO GPM_battery_totals
-                   (id, today_kwh, week_kwh, month_kwh)
-                   VALUES (1, ?, ?, ?)
-                   ON CONFLICT(id) DO UPDATE SET
-                       today_kwh = excluded.today_kwh,
-                       week_kwh = excluded.week_kwh,
-                       month_kwh = excluded.month_kwh""",
-                (today_kwh, week_kwh, month_kwh),
-            )
-        except Exception as err:
-            _LOGGER.error("Failed to update battery totals: %s", err)
+        self._db.stage(
+            "GPM_battery_totals",
+            """INSERT INTO GPM_battery_totals
+               (id, today_kwh, week_kwh, month_kwh)
+               VALUES (1, ?, ?, ?)
+               ON CONFLICT(id) DO UPDATE SET
+                   today_kwh = excluded.today_kwh,
+                   week_kwh = excluded.week_kwh,
+                   month_kwh = excluded.month_kwh""",
+            (today_kwh, week_kwh, month_kwh),
+            value={"today_kwh": today_kwh, "week_kwh": week_kwh, "month_kwh": month_kwh},
+        )
 
     async def async_get_daily_average(self, date: datetime) -> dict[str, Any] | None:
         """Get daily average for a specific date @zara
@@ -320,6 +319,10 @@ class StatisticsStore:
         Returns:
             Dictionary with battery totals
         """
+        pending = self._db.pending("GPM_battery_totals")
+        if pending is not None:
+            return dict(pending)
+
         try:
             row = await self._db.fetchone(
                 "SELECT today_kwh, week_kwh, month_kwh FROM GPM_battery_totals WHERE id = 1"
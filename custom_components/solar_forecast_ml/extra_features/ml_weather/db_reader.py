@@ -14,10 +14,10 @@ from datetime import date, datetime
 from pathlib import Path
 from typing import Any
 
-import aiosqlite
-
 from homeassistant.core import HomeAssistant
 
+from .db_access import SharedDatabase, async_acquire_database, async_release_database
+
 _LOGGER = logging.getLogger(__name__)
 
 MAX_RECONNECT_ATTEMPTS = 3
@@ -30,8 +30,7 @@ class DatabaseReader:
         """Initialize the database reader."""
         self._hass = hass
         self._db_path = Path(hass.config.path(db_path))
-        self._connection: aiosqlite.Connection | None = None
-        self._is_connected: bool = False
+        self._shared: SharedDatabase | None = None
         self._lock = asyncio.Lock()
 
     @property
@@ -42,7 +41,7 @@ class DatabaseReader:
     @property
     def is_connected(self) -> bool:
         """Check if connection is active."""
-        return self._is_connected and self._connection is not None
+        return self._shared is not None and self._shared.is_open
 
     @property
     def db_path(self) -> str:
@@ -50,9 +49,9 @@ class DatabaseReader:
         return str(self._db_path)
 
     async def async_connect(self) -> bool:
-        """Establish database connection."""
+        """Take a reference on the shared database access layer."""
         async with self._lock:
-            if self._is_connected and self._connection is not None:
+            if self.is_connected:
                 return True
 
             if not self.is_available:
@@ -60,29 +59,25 @@ class DatabaseReader:
                 return False
 
             try:
-                self._connection = await aiosqlite.connect(str(self._db_path))
-                self._connection.row_factory = aiosqlite.Row
-                self._is_connected = True
+                self._shared = await async_acquire_database(self._hass, self._db_path)
                 _LOGGER.info("ML Weather database connection established: %s", self._db_path)
                 return True
             except Exception as err:
                 _LOGGER.error("Failed to connect to database: %s", err)
-                self._connection = None
-                self._is_connected = False
+                self._shared = None
                 return False
 
     async def async_close(self) -> None:
-        """Close database connection."""
+        """Release the shared database reference."""
         async with self._lock:
-            if self._connection is not None:
+            if self._shared is not None:
                 try:
-                    await self._connection.close()
+                    await async_release_database(self._hass, self._db_path)
                     _LOGGER.debug("ML Weather database connection closed")
                 except Exception as err:
                     _LOGGER.error("Error closing database connection: %s", err)
                 finally:
-                    self._connection = None
-                    self._is_connected = False
+                    self._shared = None
 
     async def _ensure_connected(self) -> bool:
         """Ensure we have an active database connection, reconnect if needed."""
@@ -124,8 +119,7 @@ class DatabaseReader:
                 ORDER BY forecast_date, hour
             """
 
-            async with self._connection.execute(query, [start_date, end_date]) as cursor:
-                rows = await cursor.fetchall()
+            rows = await self._shared.fetchall(query, [start_date, end_date])
 
             result: dict[str, dict[str, dict[str, Any]]] = {}
 
@@ -158,8 +152,6 @@ class DatabaseReader:
 
         except Exception as err:
             _LOGGER.error("Error reading weather forecast from database: %s", err)
-            self._is_connected = False
-            self._connection = None
             return {}
 
     async def async_get_weather_version(self) -> str:
@@ -172,9 +164,8 @@ class DatabaseReader:
                 SELECT version FROM weather_forecast
                 ORDER BY updated_at DESC LIMIT 1
             """
-            async with self._connection.execute(query) as cursor:
-                row = await cursor.fetchone()
-                return row["version"] if row and row["version"] else "unknown"
+            row = await self._shared.fetchone(query)
+            return row["version"] if row and row["version"] else "unknown"
         except Exception:
             return "unknown"
 
@@ -198,8 +189,7 @@ class DatabaseReader:
                 ORDER BY forecast_type, created_at DESC
             """
 
-            async with self._connection.execute(query, [today_str]) as cursor:
-                rows = await cursor.fetchall()
+            rows = await self._shared.fetchall(query, [today_str])
 
             result: dict[str, Any] = {}
             seen_types: set[str] = set()
@@ -227,8 +217,6 @@ class DatabaseReader:
 
         except Exception as err:
             _LOGGER.error("Error reading PV forecast from database: %s", err)
-            self._is_connected = False
-            self._connection = None
             return {}
 
     async def async_get_db_info(self) -> dict[str, Any]:
@@ -249,23 +237,21 @@ class DatabaseReader:
 
         if self.is_connected:
             try:
-                async with self._connection.execute(
+                row = await self._shared.fetchone(
                     "SELECT COUNT(*) as cnt FROM weather_forecast"
-                ) as cursor:
-                    row = await cursor.fetchone()
-                    info["weather_forecast_rows"] = row["cnt"] if row else 0
+                )
+                info["weather_forecast_rows"] = row["cnt"] if row else 0
 
-                async with self._connection.execute(
+                row = await self._shared.fetchone(
                     "SELECT COUNT(*) as cnt FROM daily_forecasts"
-                ) as cursor:
-                    row = await cursor.fetchone()
-                    info["daily_forecasts_rows"] = row["cnt"] if row else 0
+                )
+                info["daily_forecasts_rows"] = row["cnt"] if row else 0
 
-                async with self._connection.execute(
+                row = await self._shared.fetchone(
                     "SELECT MAX(updated_at) as latest FROM weather_forecast"
-                ) as cursor:
-                    row = await cursor.fetchone()
-                    info["latest_update"] = row["latest"] if row else None
+                )
+                info["latest_update"] = row["latest"] if row else None
+                info["journal_mode"] = self._shared.journal_mode
 
             except Exception as err:
                 _LOGGER.debug("Error getting DB info: %s", err)
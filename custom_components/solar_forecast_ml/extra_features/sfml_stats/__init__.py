@@ -267,7 +267,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         try:
             from .charts import ForecastComparisonChart
             chart = ForecastComparisonChart(validator)
-            await chart.save()
+            await chart.render_png()
             _LOGGER.info("Forecast comparison chart generated successfully")
         except Exception as err:
             _LOGGER.error("Forecast comparison chart generation failed: %s", err)
@@ -411,6 +411,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except Exception:
         pass
 
+    try:
+        from .utils import get_response_cache
+        response_cache = get_response_cache()
+        response_cache.detach_sources()
+        response_cache.clear()
+    except Exception as err:
+        _LOGGER.debug("Error clearing response cache: %s", err)
+
     try:
         await DatabaseConnectionManager.close_instance()
         _LOGGER.info("Database connection manager closed")
@@ -10,7 +10,6 @@
 """REST API views for SFML Stats dashboard. @zara"""
 from __future__ import annotations
 
-import asyncio
 import functools
 import ipaddress
 import json
@@ -144,8 +143,17 @@ from ..const import (
     CONF_FORECAST_ENTITY_2_NAME,
     DEFAULT_FORECAST_ENTITY_1_NAME,
     DEFAULT_FORECAST_ENTITY_2_NAME,
+    API_CACHE_TTL_SECONDS,
+    RESPONSE_CACHE_LIVE_TTL_SECONDS,
+    RESPONSE_CACHE_TTL_SECONDS,
+    CACHE_TAG_SFML,
+    CACHE_TAG_GPM,
+    CACHE_TAG_STATS,
+    HISTORY_STORE_DAILY_ENERGY,
+    HISTORY_STORE_HOURLY_BILLING,
 )
-from ..utils import get_json_cache, read_json_safe
+from ..storage.history_store import get_history_store
+from ..utils import get_json_cache, get_response_cache, read_json_safe
 from ..readers.solar_reader import SolarDataReader, DailyForecast
 from ..readers.weather_reader import WeatherDataReader
 from ..sfml_data_reader import SFMLDataReader
@@ -192,17 +200,71 @@ GRID_PATH: Path | None = None
 HASS: HomeAssistant | None = None
 
 
+def _etag_matches(request: web.Request, etag: str) -> bool:
+    """Check If-None-Match against an ETag (weak comparison). @zara"""
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    candidates = [c.strip().removeprefix("W/") for c in header.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def cached_response(*tags: str, ttl: int | None = None):
+    """Decorator: Serve GET responses from the shared response cache. @zara
+
+    Keys are view name + path + query parameters. Entries expire after `ttl`
+    seconds or when one of `tags` is invalidated by a source coordinator
+    update. Replies carry an ETag and honour If-None-Match with 304.
+    """
+    max_age = RESPONSE_CACHE_TTL_SECONDS if ttl is None else ttl
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, request: web.Request, *args, **kwargs):
+            cache = get_response_cache()
+            cache.attach_sources(HASS)
+            key = cache.make_key(self.name, request.path, request.query)
+
+            entry = cache.get(key, max_age)
+            if entry is None:
+                response = await func(self, request, *args, **kwargs)
+                body = getattr(response, "body", None)
+                if response.status != 200 or not isinstance(body, bytes):
+                    return response
+                entry = cache.put(key, body, response.content_type, response.charset, tags)
+
+            headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+            if _etag_matches(request, entry.etag):
+                cache.not_modified += 1
+                return web.Response(status=304, headers=headers)
+            return web.Response(
+                body=entry.body,
+                content_type=entry.content_type,
+                charset=entry.charset,
+                headers=headers,
+            )
+        return wrapper
+    return decorator
+
+
+def invalidates_response_cache(*tags: str):
+    """Decorator: Drop cached responses after a successful write request. @zara"""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, request: web.Request, *args, **kwargs):
+            response = await func(self, request, *args, **kwargs)
+            if response.status < 400:
+                get_response_cache().invalidate_tags(*tags)
+            return response
+        return wrapper
+    return decorator
+
+
 @asynccontextmanager
 async def _get_db() -> AsyncIterator[aiosqlite.Connection]:
-    """Get DB connection via manager with direct fallback. @zara"""
-    from ..storage.db_connection_manager import get_manager
-    manager = get_manager()
-    if manager is not None and manager.is_connected:
-        yield await manager.get_connection()
-        return
-    db_path = Path(HASS.config.path()) / SOLAR_FORECAST_DB
-    async with aiosqlite.connect(str(db_path)) as conn:
-        conn.row_factory = aiosqlite.Row
+    """Get a pooled read-only DB connection. @zara"""
+    from ..storage.db_connection_manager import db_read_connection
+    async with db_read_connection(Path(HASS.config.path()) / SOLAR_FORECAST_DB) as conn:
         yield conn
 
 
@@ -458,6 +520,7 @@ class HealthCheckView(HomeAssistantView):
                     "status": status,
                     "version": VERSION,
                     "checks": checks,
+                    "response_cache": get_response_cache().stats,
                     "timestamp": datetime.now().isoformat(),
                 },
                 status=status_code,
@@ -742,6 +805,7 @@ class SolarDataView(HomeAssistantView):
     requires_auth = False
 
     @local_only
+    @cached_response(CACHE_TAG_SFML)
     async def get(self, request: Request) -> Response:
         """Return solar data. @zara"""
         days = int(request.query.get("days", 7))
@@ -806,37 +870,41 @@ class SolarDataView(HomeAssistantView):
                 _LOGGER.error("Error loading daily summaries from database: %s", e)
                 result["data"]["daily"] = []
 
+        # One range scan feeds both the hourly history and multi_day_hourly blocks @zara
+        today = date.today()
+        cutoff_date = today - timedelta(days=days)
+        range_predictions = None
+        try:
+            reader = _get_solar_reader()
+            range_predictions = await reader.async_get_hourly_predictions_range(
+                start=cutoff_date if include_hourly else today,
+                end=today + timedelta(days=2),
+            )
+        except Exception as e:
+            _LOGGER.error("Error loading hourly predictions from database: %s", e)
+
         if include_hourly:
-            try:
-                reader = _get_solar_reader()
-                cutoff_date = date.today() - timedelta(days=days)
-                all_predictions = []
-                current = cutoff_date
-                while current <= date.today():
-                    day_predictions = await reader.async_get_hourly_predictions(target_date=current)
-                    for p in day_predictions:
-                        all_predictions.append({
-                            "target_datetime": p.target_datetime.isoformat(),
-                            "target_hour": p.target_hour,
-                            "target_date": p.target_date.isoformat(),
-                            "prediction_kwh": p.prediction_kwh,
-                            "actual_kwh": p.actual_kwh,
-                            "accuracy_percent": p.accuracy_percent,
-                            "error_kwh": p.error_kwh,
-                            "prediction_method": p.prediction_method,
-                            "ml_contribution_percent": p.ml_contribution_percent,
-                            "confidence": p.confidence,
-                            "temperature": p.temperature,
-                            "solar_radiation": p.solar_radiation,
-                            "clouds": p.clouds,
-                            "sun_elevation": p.sun_elevation,
-                            "theoretical_max_kwh": p.theoretical_max_kwh,
-                        })
-                    current += timedelta(days=1)
-                result["data"]["hourly"] = all_predictions
-            except Exception as e:
-                _LOGGER.error("Error loading hourly predictions from database: %s", e)
-                result["data"]["hourly"] = []
+            result["data"]["hourly"] = [
+                {
+                    "target_datetime": p.target_datetime.isoformat(),
+                    "target_hour": p.target_hour,
+                    "target_date": p.target_date.isoformat(),
+                    "prediction_kwh": p.prediction_kwh,
+                    "actual_kwh": p.actual_kwh,
+                    "accuracy_percent": p.accuracy_percent,
+                    "error_kwh": p.error_kwh,
+                    "prediction_method": p.prediction_method,
+                    "ml_contribution_percent": p.ml_contribution_percent,
+                    "confidence": p.confidence,
+                    "temperature": p.temperature,
+                    "solar_radiation": p.solar_radiation,
+                    "clouds": p.clouds,
+                    "sun_elevation": p.sun_elevation,
+                    "theoretical_max_kwh": p.theoretical_max_kwh,
+                }
+                for p in (range_predictions or [])
+                if cutoff_date <= p.target_date <= today
+            ]
 
         weather_db = await _get_weather_from_db(days=days)
         if weather_db:
@@ -909,15 +977,15 @@ class SolarDataView(HomeAssistantView):
             }
 
         try:
-            reader = _get_solar_reader()
-            today = date.today()
-            tomorrow = today + timedelta(days=1)
-            day_after = today + timedelta(days=2)
+            predictions_by_date: dict[date, list] = {}
+            for p in range_predictions or []:
+                if p.target_date >= today:
+                    predictions_by_date.setdefault(p.target_date, []).append(p)
 
             multi_day_data = {}
 
-            for target_date in [today, tomorrow, day_after]:
-                predictions = await reader.async_get_hourly_predictions(target_date=target_date)
+            for target_date in [today, today + timedelta(days=1), today + timedelta(days=2)]:
+                predictions = predictions_by_date.get(target_date)
                 if predictions:
                     hourly_data = []
                     for p in predictions:
@@ -949,6 +1017,7 @@ class PriceDataView(HomeAssistantView):
     requires_auth = False
 
     @local_only
+    @cached_response(CACHE_TAG_GPM)
     async def get(self, request: Request) -> Response:
         """Return price data. @zara"""
         days = int(request.query.get("days", 7))
@@ -997,6 +1066,7 @@ class SummaryDataView(HomeAssistantView):
     requires_auth = False
 
     @local_only
+    @cached_response(CACHE_TAG_SFML, CACHE_TAG_GPM, CACHE_TAG_STATS)
     async def get(self, request: Request) -> Response:
         """Return a summary for the dashboard. @zara"""
         result = {
@@ -1117,6 +1187,7 @@ class RealtimeDataView(HomeAssistantView):
     requires_auth = False
 
     @local_only
+    @cached_response(CACHE_TAG_SFML, ttl=RESPONSE_CACHE_LIVE_TTL_SECONDS)
     async def get(self, request: Request) -> Response:
         """Return current realtime data. @zara"""
         result = {
@@ -1294,6 +1365,7 @@ class EnergyFlowView(HomeAssistantView):
     requires_auth = False
 
     @local_only
+    @cached_response(CACHE_TAG_SFML, CACHE_TAG_GPM, ttl=RESPONSE_CACHE_LIVE_TTL_SECONDS)
     async def get(self, request: Request) -> Response:
         """Return current energy flow data. @zara"""
         config = _get_config()
@@ -1572,6 +1644,7 @@ class StatisticsView(HomeAssistantView):
     requires_auth = False
 
     @local_only
+    @cached_response(CACHE_TAG_SFML, CACHE_TAG_GPM)
     async def get(self, request: Request) -> Response:
         """Return statistics data from SFML SQLite database. @zara"""
         result = {
@@ -1869,6 +1942,7 @@ class BillingDataView(HomeAssistantView):
     requires_auth = False
 
     @local_only
+    @cached_response(CACHE_TAG_GPM, CACHE_TAG_STATS)
     async def get(self, request: Request) -> Response:
         """Return billing configuration and annual balance data. @zara"""
         if HASS is None:
@@ -2086,6 +2160,7 @@ class WeatherHistoryView(HomeAssistantView):
     requires_auth = False
 
     @local_only
+    @cached_response(CACHE_TAG_SFML)
     async def get(self, request: web.Request) -> web.Response:
         """Get weather history. @zara"""
         try:
@@ -2119,6 +2194,7 @@ class WeatherComparisonView(HomeAssistantView):
     requires_auth = False
 
     @local_only
+    @cached_response(CACHE_TAG_SFML)
     async def get(self, request: web.Request) -> web.Response:
         """Get actual vs forecast weather comparison data. @zara"""
         try:
@@ -2194,6 +2270,7 @@ class PowerSourcesHistoryView(HomeAssistantView):
     requires_auth = False
 
     @local_only
+    @cached_response(CACHE_TAG_STATS, ttl=API_CACHE_TTL_SECONDS)
     async def get(self, request: web.Request) -> web.Response:
         """Get power sources history from Home Assistant Recorder. @zara"""
         try:
@@ -2323,21 +2400,10 @@ class PowerSourcesHistoryView(HomeAssistantView):
         return result
 
     async def _get_hourly_history_from_file(self) -> list[dict]:
-        """Get hourly history from our own data file as alternative. @zara"""
+        """Get hourly history from the billing history store as alternative. @zara"""
         try:
-            hourly_path = Path(HASS.config.path()) / "sfml_stats" / "data" / "hourly_billing_history.json"
-
-            if not hourly_path.exists():
-                return []
-
-            import aiofiles
-            import json
-
-            async with aiofiles.open(hourly_path, 'r') as f:
-                content = await f.read()
-                data = json.loads(content)
-
-            hours_data = data.get("hours", {})
+            store = get_history_store(Path(HASS.config.path()), HISTORY_STORE_HOURLY_BILLING)
+            hours_data = await store.async_get_records()
             result = []
 
             for hour_key, hour_data in sorted(hours_data.items()):
@@ -2352,7 +2418,7 @@ class PowerSourcesHistoryView(HomeAssistantView):
 
             return result
         except Exception as e:
-            _LOGGER.error("Error reading hourly history file: %s", e)
+            _LOGGER.error("Error reading hourly billing history: %s", e)
             return []
 
     async def _get_power_sources_collector_data(self, hours: int) -> list[dict]:
@@ -2513,6 +2579,7 @@ class EnergySourcesDailyStatsView(HomeAssistantView):
     requires_auth = False
 
     @local_only
+    @cached_response(CACHE_TAG_STATS, CACHE_TAG_GPM)
     async def get(self, request: web.Request) -> web.Response:
         """Get daily energy sources statistics. @zara"""
         try:
@@ -2544,47 +2611,41 @@ class EnergySourcesDailyStatsView(HomeAssistantView):
             else:
                 daily_stats = await collector.get_daily_stats(days)
 
-            history_path = Path(HASS.config.path()) / "sfml_stats" / "data" / "daily_energy_history.json"
-            if history_path.exists():
-                import aiofiles
-                async with aiofiles.open(history_path, 'r') as f:
-                    content = await f.read()
-                    history_data = json.loads(content)
-                    history_days = history_data.get("days", {})
-
-                    for date_str, day_data in history_days.items():
-                        if date_str not in daily_stats.get("days", {}):
-                            daily_stats.setdefault("days", {})[date_str] = {
-                                "date": date_str,
-                                "solar_to_house_kwh": day_data.get("solar_to_house_kwh", 0),
-                                "solar_to_battery_kwh": day_data.get("battery_charge_solar_kwh", 0),
-                                "battery_to_house_kwh": day_data.get("battery_to_house_kwh", 0),
-                                "battery_charge_grid_kwh": day_data.get("battery_charge_grid_kwh", 0),
-                                "grid_to_house_kwh": day_data.get("grid_import_kwh", 0),
-                                "grid_export_kwh": day_data.get("grid_export_kwh", 0),
-                                "home_consumption_kwh": day_data.get("home_consumption_kwh", 0),
-                                "solar_yield_kwh": day_data.get("solar_yield_kwh", 0),
-                                "price_ct_kwh": day_data.get("price_ct_kwh", 0),
-                                "autarky_percent": day_data.get("autarky_percent", 0),
-                                "self_consumption_percent": day_data.get("self_consumption_percent", 0),
-                                "avg_soc": day_data.get("avg_soc", 0),
-                                "min_soc": day_data.get("min_soc", 0),
-                                "max_soc": day_data.get("max_soc", 0),
-                                "peak_battery_power_w": day_data.get("peak_battery_power_w", 0),
-                                "peak_consumption_w": day_data.get("peak_battery_power_w", 0),
-                            }
-                        else:
-                            existing = daily_stats["days"][date_str]
-                            if existing.get("peak_battery_power_w") is None or existing.get("peak_battery_power_w") == 0:
-                                existing["peak_battery_power_w"] = day_data.get("peak_battery_power_w", 0)
-                            if existing.get("home_consumption_kwh") is None or existing.get("home_consumption_kwh") == 0:
-                                existing["home_consumption_kwh"] = day_data.get("home_consumption_kwh", 0)
-                            if existing.get("autarky_percent") is None or existing.get("autarky_percent") == 0:
-                                existing["autarky_percent"] = day_data.get("autarky_percent", 0)
-                            if existing.get("self_consumption_percent") is None or existing.get("self_consumption_percent") == 0:
-                                existing["self_consumption_percent"] = day_data.get("self_consumption_percent", 0)
-                            if existing.get("peak_consumption_w") is None or existing.get("peak_consumption_w") == 0:
-                                existing["peak_consumption_w"] = day_data.get("peak_battery_power_w", 0)
+            store = get_history_store(Path(HASS.config.path()), HISTORY_STORE_DAILY_ENERGY)
+            history_days = await store.async_get_records()
+            for date_str, day_data in history_days.items():
+                if date_str not in daily_stats.get("days", {}):
+                    daily_stats.setdefault("days", {})[date_str] = {
+                        "date": date_str,
+                        "solar_to_house_kwh": day_data.get("solar_to_house_kwh", 0),
+                        "solar_to_battery_kwh": day_data.get("battery_charge_solar_kwh", 0),
+                        "battery_to_house_kwh": day_data.get("battery_to_house_kwh", 0),
+                        "battery_charge_grid_kwh": day_data.get("battery_charge_grid_kwh", 0),
+                        "grid_to_house_kwh": day_data.get("grid_import_kwh", 0),
+                        "grid_export_kwh": day_data.get("grid_export_kwh", 0),
+                        "home_consumption_kwh": day_data.get("home_consumption_kwh", 0),
+                        "solar_yield_kwh": day_data.get("solar_yield_kwh", 0),
+                        "price_ct_kwh": day_data.get("price_ct_kwh", 0),
+                        "autarky_percent": day_data.get("autarky_percent", 0),
+                        "self_consumption_percent": day_data.get("self_consumption_percent", 0),
+                        "avg_soc": day_data.get("avg_soc", 0),
+                        "min_soc": day_data.get("min_soc", 0),
+                        "max_soc": day_data.get("max_soc", 0),
+                        "peak_battery_power_w": day_data.get("peak_battery_power_w", 0),
+                        "peak_consumption_w": day_data.get("peak_battery_power_w", 0),
+                    }
+                else:
+                    existing = daily_stats["days"][date_str]
+                    if existing.get("peak_battery_power_w") is None or existing.get("peak_battery_power_w") == 0:
+                        existing["peak_battery_power_w"] = day_data.get("peak_battery_power_w", 0)
+                    if existing.get("home_consumption_kwh") is None or existing.get("home_consumption_kwh") == 0:
+                        existing["home_consumption_kwh"] = day_data.get("home_consumption_kwh", 0)
+                    if existing.get("autarky_percent") is None or existing.get("autarky_percent") == 0:
+                        existing["autarky_percent"] = day_data.get("autarky_percent", 0)
+                    if existing.get("self_consumption_percent") is None or existing.get("self_consumption_percent") == 0:
+                        existing["self_consumption_percent"] = day_data.get("self_consumption_percent", 0)
+                    if existing.get("peak_consumption_w") is None or existing.get("peak_consumption_w") == 0:
+                        existing["peak_consumption_w"] = day_data.get("peak_battery_power_w", 0)
 
             config = _get_config()
             sfml_reader = SFMLDataReader(HASS)
@@ -2813,6 +2874,7 @@ class MonthlyTariffsView(HomeAssistantView):
     requires_auth = False
 
     @local_only
+    @cached_response(CACHE_TAG_STATS)
     async def get(self, request: web.Request) -> web.Response:
         """Get monthly tariffs data. @zara"""
         try:
@@ -2894,6 +2956,7 @@ class MonthlyTariffDetailView(HomeAssistantView):
             }, status=500)
 
     @local_only
+    @invalidates_response_cache(CACHE_TAG_STATS)
     async def post(self, request: web.Request, year: str, month: str) -> web.Response:
         """Update overrides for a specific month. @zara"""
         try:
@@ -2956,6 +3019,7 @@ class MonthlyTariffFinalizeView(HomeAssistantView):
     requires_auth = False
 
     @local_only
+    @invalidates_response_cache(CACHE_TAG_STATS)
     async def post(self, request: web.Request, year: str, month: str) -> web.Response:
         """Finalize a month and optionally recalculate history. @zara"""
         try:
@@ -2992,6 +3056,7 @@ class MonthlyTariffFinalizeView(HomeAssistantView):
                 "error": str(err)
             }, status=500)
 
+    @invalidates_response_cache(CACHE_TAG_STATS)
     async def delete(self, request: web.Request, year: str, month: str) -> web.Response:
         """Remove finalization from a month. @zara"""
         try:
@@ -3137,6 +3202,7 @@ class MonthlyTariffsDefaultsView(HomeAssistantView):
             }, status=500)
 
     @local_only
+    @invalidates_response_cache(CACHE_TAG_STATS)
     async def post(self, request: web.Request) -> web.Response:
         """Update default tariff settings. @zara"""
         try:
@@ -3239,32 +3305,12 @@ class ExportWeeklyReportView(HomeAssistantView):
                 }, status=500)
 
             chart = WeeklyReportChart(validator)
-            fig = await chart.generate(year=year, week=week)
-
-            import io
-            from concurrent.futures import ThreadPoolExecutor
-
-            def _render_to_bytes():
-                buf = io.BytesIO()
-                fig.savefig(
-                    buf,
-                    format="png",
-                    dpi=150,
-                    bbox_inches="tight",
-                    facecolor=chart.styles.background,
-                    edgecolor="none"
-                )
-                buf.seek(0)
-                import matplotlib.pyplot as plt
-                plt.close(fig)
-                return buf.getvalue()
-
-            loop = asyncio.get_running_loop()
-            with ThreadPoolExecutor() as pool:
-                png_bytes = await loop.run_in_executor(pool, _render_to_bytes)
-
-            save_path = await chart.save(year=year, week=week)
-            _LOGGER.info("Weekly report saved to: %s", save_path)
+            rendered = await chart.render_png(year=year, week=week)
+            png_bytes = rendered.png
+            save_path = rendered.path
+            _LOGGER.info(
+                "Weekly report saved to: %s (cached: %s)", save_path, rendered.cached
+            )
 
             return web.Response(
                 body=png_bytes,
@@ -3358,6 +3404,7 @@ class ForecastComparisonView(HomeAssistantView):
     requires_auth = False
 
     @local_only
+    @cached_response(CACHE_TAG_SFML, CACHE_TAG_STATS)
     async def get(self, request: web.Request) -> web.Response:
         """Return forecast comparison data as JSON. @zara"""
         try:
@@ -3440,29 +3487,8 @@ class ForecastComparisonChartView(HomeAssistantView):
             _LOGGER.info("Generating forecast comparison chart (%d days)", days)
 
             chart = ForecastComparisonChart(validator)
-            fig = await chart.generate(days=days)
-
-            import io
-            from concurrent.futures import ThreadPoolExecutor
-
-            def _render_to_bytes():
-                buf = io.BytesIO()
-                fig.savefig(
-                    buf,
-                    format="png",
-                    dpi=150,
-                    bbox_inches="tight",
-                    facecolor=chart.styles.background,
-                    edgecolor="none",
-                )
-                import matplotlib.pyplot as plt
-                plt.close(fig)
-                buf.seek(0)
-                return buf.getvalue()
-
-            loop = asyncio.get_running_loop()
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                png_bytes = await loop.run_in_executor(executor, _render_to_bytes)
+            rendered = await chart.render_png(days=days)
+            png_bytes = rendered.png
 
             return web.Response(
                 body=png_bytes,
@@ -3503,6 +3529,7 @@ class ShadowAnalyticsView(HomeAssistantView):
     requires_auth = False
 
     @local_only
+    @cached_response(CACHE_TAG_SFML)
     async def get(self, request: web.Request) -> web.Response:
         """Return shadow analytics data as JSON. @zara"""
         try:
@@ -3661,6 +3688,7 @@ class AIStatusView(HomeAssistantView):
     requires_auth = False
 
     @local_only
+    @cached_response(CACHE_TAG_SFML)
     async def get(self, request: web.Request) -> web.Response:
         """Return AI model status as JSON. @zara"""
         try:
@@ -3763,6 +3791,7 @@ class DashboardSettingsView(HomeAssistantView):
         })
 
     @local_only
+    @invalidates_response_cache(CACHE_TAG_STATS)
     async def post(self, request: web.Request) -> web.Response:
         """Update dashboard settings for current session. @zara"""
         try:
@@ -27,7 +27,88 @@ from ..readers.solar_reader import SolarDataReader
 
 _LOGGER = logging.getLogger(__name__)
 
-_subscriptions: dict[str, set] = {}
+# Marks keys dropped from the realtime payload since the previous tick @zara
+_REMOVED = object()
+
+
+def _send_update(
+    connection: ActiveConnection, msg_id: int, changes: dict[str, Any], full: bool
+) -> None:
+    """Send one realtime update; removed keys are listed separately. @zara"""
+    connection.send_message(
+        websocket_api.event_message(
+            msg_id,
+            {
+                "type": "update",
+                "timestamp": datetime.now().isoformat(),
+                "full": full,
+                "data": {k: v for k, v in changes.items() if v is not _REMOVED},
+                "removed": [k for k, v in changes.items() if v is _REMOVED],
+            },
+        )
+    )
+
+
+class _RealtimeBroadcaster:
+    """Single producer per interval bucket fanning realtime data out to all subscribers. @zara
+
+    Realtime data is computed once per tick, diffed against the previous
+    payload and only changed top-level keys are sent to subscribers.
+    send_message never blocks; Home Assistant queues per connection and
+    drops clients whose queue overflows.
+    """
+
+    def __init__(self, hass: HomeAssistant, interval: int) -> None:
+        self.hass = hass
+        self.interval = interval
+        self.subscribers: dict[tuple[int, int], tuple[ActiveConnection, int]] = {}
+        self._payload: dict[str, Any] | None = None
+        self._task: asyncio.Task | None = None
+        self.ticks = 0
+
+    def add(self, connection: ActiveConnection, msg_id: int) -> None:
+        self.subscribers[(id(connection), msg_id)] = (connection, msg_id)
+        if self._payload is not None:
+            _send_update(connection, msg_id, self._payload, full=True)
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._produce(), f"sfml_stats_ws_broadcast_{self.interval}s"
+            )
+
+    def remove(self, connection: ActiveConnection, msg_id: int) -> None:
+        self.subscribers.pop((id(connection), msg_id), None)
+        if not self.subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+            _broadcasters.pop(self.interval, None)
+
+    async def _produce(self) -> None:
+        """Compute realtime data once per tick and broadcast the diff. @zara"""
+        while True:
+            try:
+                payload = await _get_realtime_data(self.hass)
+                previous = self._payload
+                self._payload = payload
+                self.ticks += 1
+
+                if previous is None:
+                    for connection, msg_id in list(self.subscribers.values()):
+                        _send_update(connection, msg_id, payload, full=True)
+                else:
+                    changes = {k: v for k, v in payload.items() if previous.get(k) != v}
+                    changes.update({k: _REMOVED for k in previous if k not in payload})
+                    if changes:
+                        for connection, msg_id in list(self.subscribers.values()):
+                            _send_update(connection, msg_id, changes, full=False)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                _LOGGER.error("Error producing WebSocket update: %s", e)
+
+            await asyncio.sleep(self.interval)
+
+
+_broadcasters: dict[int, _RealtimeBroadcaster] = {}
 
 
 def _get_config_paths(hass: HomeAssistant) -> tuple[Path, Path]:
@@ -71,33 +152,14 @@ async def websocket_subscribe_updates(
 
     connection.send_result(msg_id, {"subscribed": True, "interval": interval})
 
-    async def send_updates():
-        """Send periodic updates. @zara"""
-        while True:
-            try:
-                data = await _get_realtime_data(hass)
-                connection.send_message(
-                    websocket_api.event_message(
-                        msg_id,
-                        {
-                            "type": "update",
-                            "timestamp": datetime.now().isoformat(),
-                            "data": data,
-                        }
-                    )
-                )
-                await asyncio.sleep(interval)
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                _LOGGER.error("Error sending WebSocket update: %s", e)
-                break
-
-    task = asyncio.create_task(send_updates())
+    broadcaster = _broadcasters.get(interval)
+    if broadcaster is None:
+        broadcaster = _broadcasters[interval] = _RealtimeBroadcaster(hass, interval)
+    broadcaster.add(connection, msg_id)
 
     @callback
     def on_disconnect():
-        task.cancel()
+        broadcaster.remove(connection, msg_id)
 
     connection.subscriptions[msg_id] = on_disconnect
 
@@ -11,7 +11,7 @@
 from __future__ import annotations
 
 from .styles import ChartStyles, apply_dark_theme
-from .base import BaseChart
+from .base import BaseChart, RenderedChart
 from .weekly_report import WeeklyReportChart
 from .forecast_comparison import ForecastComparisonChart
 
@@ -19,6 +19,7 @@ __all__ = [
     "ChartStyles",
     "apply_dark_theme",
     "BaseChart",
+    "RenderedChart",
     "WeeklyReportChart",
     "ForecastComparisonChart",
 ]
@@ -11,9 +11,13 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import io
+import json
 import logging
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any, TYPE_CHECKING
@@ -30,6 +34,23 @@ _LOGGER = logging.getLogger(__name__)
 
 _MATPLOTLIB_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="matplotlib")
 
+CHART_CACHE_DIR: str = "charts"
+
+
+@dataclass(frozen=True)
+class RenderedChart:
+    """PNG bytes of a rendered chart plus where they were written. @zara"""
+    png: bytes
+    path: Path
+    cache_key: str
+    cached: bool
+
+
+def _data_digest(data: Any) -> str:
+    """Stable hash of chart input data. @zara"""
+    payload = json.dumps(data, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:20]
+
 
 class BaseChart(ABC):
     """Abstract base class for all charts. @zara"""
@@ -55,10 +76,92 @@ class BaseChart(ABC):
         """Return the export path for charts. @zara"""
         return self._validator.get_export_path("charts")
 
+    @property
+    def cache_path(self) -> Path:
+        """Return the content-addressed PNG cache directory. @zara"""
+        return self._validator.export_base_path / ".cache" / CHART_CACHE_DIR
+
+    @property
+    def chart_type(self) -> str:
+        """Return the chart type used in cache keys. @zara"""
+        return type(self).__name__
+
     @abstractmethod
     async def generate(self, **kwargs: Any) -> "Figure":
         """Generate the chart. @zara"""
 
+    @abstractmethod
+    async def load_data(self, **kwargs: Any) -> dict[str, Any]:
+        """Load the input data of the chart. @zara"""
+
+    def get_period(self, **kwargs: Any) -> str:
+        """Return the period label used in cache keys. @zara"""
+        return "default"
+
+    @abstractmethod
+    def _build_figure(self, data: dict[str, Any]) -> "Figure":
+        """Build the figure from loaded data (executor thread). @zara"""
+
+    async def render_png(self, filename: str | None = None, **kwargs: Any) -> RenderedChart:
+        """Rasterize the chart once, write it to disk and return the bytes. @zara
+
+        Renders are cached under chart type, period and a hash of the input
+        data, so an unchanged chart is served from disk without matplotlib.
+        """
+        data = await self.load_data(**kwargs)
+        period = self.get_period(**kwargs)
+        cache_key = f"{self.chart_type}_{period}_{_data_digest(data)}"
+
+        if filename is None:
+            filename = self.get_filename(**kwargs)
+        file_path = self.export_path / filename
+        cache_file = self.cache_path / f"{cache_key}.png"
+
+        def _read_cached() -> bytes | None:
+            if not cache_file.exists():
+                return None
+            png = cache_file.read_bytes()
+            # The export file may hold a render of another period; always refresh it @zara
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_bytes(png)
+            return png
+
+        def _render_sync() -> bytes:
+            import matplotlib.pyplot as plt
+            fig = self._build_figure(data)
+            try:
+                buf = io.BytesIO()
+                fig.savefig(
+                    buf,
+                    format="png",
+                    dpi=CHART_DPI,
+                    bbox_inches="tight",
+                    facecolor=self._styles.background,
+                    edgecolor="none",
+                )
+            finally:
+                plt.close(fig)
+            png = buf.getvalue()
+
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_bytes(png)
+
+            # Keep only the newest render per chart type and period @zara
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            for stale in cache_file.parent.glob(f"{self.chart_type}_{period}_*.png"):
+                stale.unlink(missing_ok=True)
+            cache_file.write_bytes(png)
+            return png
+
+        png = await self._run_in_executor(_read_cached)
+        if png is not None:
+            _LOGGER.debug("Chart cache hit: %s", cache_key)
+            return RenderedChart(png=png, path=file_path, cache_key=cache_key, cached=True)
+
+        png = await self._run_in_executor(_render_sync)
+        _LOGGER.info("Chart gespeichert: %s", file_path)
+        return RenderedChart(png=png, path=file_path, cache_key=cache_key, cached=False)
+
     async def _run_in_executor(self, func, *args, **kwargs):
         """Run a function in the executor. @zara"""
         import functools
@@ -44,11 +44,23 @@ class ForecastComparisonChart(BaseChart):
         today = date.today().isoformat()
         return f"forecast_comparison_{today}.png"
 
-    async def generate(self, **kwargs: Any) -> "Figure":
-        """Generate the forecast comparison chart. @zara"""
+    def get_period(self, **kwargs: Any) -> str:
+        """Return the period used in cache keys. @zara"""
+        days = kwargs.get("days", FORECAST_COMPARISON_CHART_DAYS)
+        return f"{date.today().isoformat()}_{days}d"
+
+    async def load_data(self, **kwargs: Any) -> dict[str, Any]:
+        """Load the comparison data of the chart. @zara"""
         days = kwargs.get("days", FORECAST_COMPARISON_CHART_DAYS)
+        return await self._reader.async_get_chart_data(days=days)
 
-        chart_data = await self._reader.async_get_chart_data(days=days)
+    def _build_figure(self, data: dict[str, Any]) -> "Figure":
+        """Build the comparison figure from loaded data. @zara"""
+        return self._generate_sync(data)
+
+    async def generate(self, **kwargs: Any) -> "Figure":
+        """Generate the forecast comparison chart. @zara"""
+        chart_data = await self.load_data(**kwargs)
 
         fig = await self._run_in_executor(
             self._generate_sync,
@@ -122,18 +122,23 @@ class PanelSeasonalReportChart(BaseChart):
         """Generate the complete panel seasonal report. @zara"""
         _LOGGER.info("Generiere Panel-Gruppen Saisonal-Report")
 
-        panel_groups, monthly_stats = await self._load_and_aggregate_data()
-
-        if not panel_groups or not monthly_stats:
-            return await self._run_in_executor(self._create_no_data_figure)
-
-        fig = await self._run_in_executor(
-            self._generate_sync, panel_groups, monthly_stats
-        )
+        data = await self.load_data()
+        fig = await self._run_in_executor(self._build_figure, data)
 
         self._fig = fig
         return fig
 
+    async def load_data(self, **kwargs) -> dict[str, Any]:
+        """Load the panel groups and their monthly statistics. @zara"""
+        panel_groups, monthly_stats = await self._load_and_aggregate_data()
+        return {"panel_groups": panel_groups, "monthly_stats": monthly_stats}
+
+    def _build_figure(self, data: dict[str, Any]) -> "Figure":
+        """Build the seasonal report figure from loaded data. @zara"""
+        if not data["panel_groups"] or not data["monthly_stats"]:
+            return self._create_no_data_figure()
+        return self._generate_sync(data["panel_groups"], data["monthly_stats"])
+
     def _generate_sync(
         self,
         panel_groups: list[PanelGroupData],
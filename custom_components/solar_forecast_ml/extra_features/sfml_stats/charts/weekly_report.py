@@ -62,33 +62,60 @@ class WeeklyReportChart(BaseChart):
 
         return WEEKLY_REPORT_PATTERN.format(week=week, year=year)
 
-    async def generate(
-        self,
-        year: int = None,
-        week: int = None,
-        **kwargs,
-    ) -> "Figure":
-        """Generate the complete weekly report. @zara"""
+    def get_period(self, year: int = None, week: int = None, **kwargs) -> str:
+        """Return the ISO week used in cache keys. @zara"""
+        year, week = self._resolve_week(year, week)
+        return f"{year}-W{week:02d}"
+
+    @staticmethod
+    def _resolve_week(year: int | None, week: int | None) -> tuple[int, int]:
+        """Fill a missing year/week with the current ISO week. @zara"""
         if year is None or week is None:
-            today = date.today()
-            iso = today.isocalendar()
+            iso = date.today().isocalendar()
             year = year or iso[0]
             week = week or iso[1]
+        return year, week
 
-        _LOGGER.info("Generiere Wochenbericht f\u00fcr KW %d/%d", week, year)
+    async def load_data(
+        self,
+        year: int = None,
+        week: int = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """Load all inputs of the weekly report. @zara"""
+        year, week = self._resolve_week(year, week)
 
         solar_stats = await self._solar_reader.async_get_weekly_stats(year, week)
         price_stats = await self._price_reader.async_get_weekly_stats(year, week)
         hourly_predictions = await self._solar_reader.async_get_hourly_predictions()
 
         week_start = self._get_week_start(year, week)
-        week_end = week_start + timedelta(days=6)
+        return {
+            "year": year,
+            "week": week,
+            "week_start": week_start,
+            "week_end": week_start + timedelta(days=6),
+            "solar_stats": solar_stats,
+            "price_stats": price_stats,
+            "hourly_predictions": hourly_predictions,
+        }
+
+    def _build_figure(self, data: dict[str, Any]) -> "Figure":
+        """Build the weekly report figure from loaded data. @zara"""
+        return self._generate_sync(**data)
 
-        fig = await self._run_in_executor(
-            self._generate_sync,
-            year, week, week_start, week_end,
-            solar_stats, price_stats, hourly_predictions
-        )
+    async def generate(
+        self,
+        year: int = None,
+        week: int = None,
+        **kwargs,
+    ) -> "Figure":
+        """Generate the complete weekly report. @zara"""
+        year, week = self._resolve_week(year, week)
+        _LOGGER.info("Generiere Wochenbericht f\u00fcr KW %d/%d", week, year)
+
+        data = await self.load_data(year=year, week=week)
+        fig = await self._run_in_executor(self._build_figure, data)
 
         self._fig = fig
         return fig
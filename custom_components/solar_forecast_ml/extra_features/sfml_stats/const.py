@@ -51,6 +51,11 @@ SFML_STATS_DATA: Final = SFML_STATS_BASE / "data"
 DAILY_ENERGY_HISTORY: Final = "daily_energy_history.json"
 HOURLY_BILLING_HISTORY: Final = "hourly_billing_history.json"
 
+HISTORY_STORE_HOURLY_BILLING: Final = "hourly_billing"
+HISTORY_STORE_DAILY_ENERGY: Final = "daily_energy"
+HISTORY_STORE_FORECAST_COMPARISON: Final = "forecast_comparison"
+HISTORY_STORE_MONTHLY_TARIFFS: Final = "monthly_tariffs"
+
 EXPORT_DIRECTORIES: Final = [
     SFML_STATS_BASE,
     SFML_STATS_WEEKLY,
@@ -274,6 +279,14 @@ POWER_COLLECTION_INTERVAL_SECONDS: Final = 300
 POWER_DATA_RETENTION_DAYS: Final = 730
 
 API_CACHE_TTL_SECONDS: Final = 30
+RESPONSE_CACHE_TTL_SECONDS: Final = 300
+RESPONSE_CACHE_LIVE_TTL_SECONDS: Final = 5
+RESPONSE_CACHE_MAX_ENTRIES: Final = 128
+
+# Response cache invalidation tags @zara
+CACHE_TAG_SFML: Final = "sfml"
+CACHE_TAG_GPM: Final = "gpm"
+CACHE_TAG_STATS: Final = "sfml_stats"
 MAX_HISTORY_HOURS: Final = 168
 
 WEATHER_HISTORY_DAYS: Final = 365
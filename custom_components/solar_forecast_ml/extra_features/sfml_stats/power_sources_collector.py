@@ -70,14 +70,16 @@ class PowerSourcesCollector:
 
     @asynccontextmanager
     async def _get_db(self) -> AsyncIterator[aiosqlite.Connection]:
-        """Get DB connection via manager with direct fallback. @zara"""
-        from .storage.db_connection_manager import get_manager
-        manager = get_manager()
-        if manager is not None and manager.is_connected:
-            yield await manager.get_connection()
-            return
-        async with aiosqlite.connect(str(self._db_path)) as conn:
-            conn.row_factory = aiosqlite.Row
+        """Run a serialized write transaction on the shared writer. @zara"""
+        from .storage.db_connection_manager import db_connection
+        async with db_connection(self._db_path) as conn:
+            yield conn
+
+    @asynccontextmanager
+    async def _get_read_db(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a pooled read-only DB connection. @zara"""
+        from .storage.db_connection_manager import db_read_connection
+        async with db_read_connection(self._db_path) as conn:
             yield conn
 
     @property
@@ -241,7 +243,7 @@ class PowerSourcesCollector:
         cutoff = (datetime.now(timezone.utc) - timedelta(hours=hours)).isoformat()
 
         try:
-            async with self._get_db() as db:
+            async with self._get_read_db() as db:
                 async with db.execute("""
                     SELECT timestamp, date, hour,
                            solar_power_w, house_consumption_w,
@@ -433,7 +435,7 @@ class PowerSourcesCollector:
         cutoff = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
 
         try:
-            async with self._get_db() as db:
+            async with self._get_read_db() as db:
                 async with db.execute("""
                     SELECT date, solar_yield_kwh, solar_to_house_kwh, solar_to_battery_kwh,
                            battery_to_house_kwh, battery_charge_solar_kwh, battery_charge_grid_kwh,
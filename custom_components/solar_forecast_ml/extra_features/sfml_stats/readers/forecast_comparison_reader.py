@@ -100,14 +100,9 @@ class ForecastComparisonReader:
 
     @asynccontextmanager
     async def _get_db(self) -> AsyncIterator[aiosqlite.Connection]:
-        """Get DB connection via manager with direct fallback. @zara"""
-        from ..storage.db_connection_manager import get_manager
-        manager = get_manager()
-        if manager is not None and manager.is_connected:
-            yield await manager.get_connection()
-            return
-        async with aiosqlite.connect(str(self._db_path)) as conn:
-            conn.row_factory = aiosqlite.Row
+        """Get a pooled read-only DB connection. @zara"""
+        from ..storage.db_connection_manager import db_read_connection
+        async with db_read_connection(self._db_path) as conn:
             yield conn
 
     @property
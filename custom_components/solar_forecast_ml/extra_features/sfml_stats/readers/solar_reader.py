@@ -143,21 +143,11 @@ class SolarDataReader:
 
     @asynccontextmanager
     async def _get_db_connection(self) -> AsyncIterator[aiosqlite.Connection]:
-        """Get a database connection from the manager. @zara"""
-        from ..storage.db_connection_manager import get_manager
-
-        manager = get_manager()
-        if manager is not None and manager.is_connected:
-            _LOGGER.debug("SolarDataReader: Using database connection manager")
-            yield await manager.get_connection()
-        else:
-            _LOGGER.warning("SolarDataReader: Database manager not available, using direct connection (THIS CAUSES THREADING ERRORS)")
-            conn = await aiosqlite.connect(str(self._db_path))
-            conn.row_factory = aiosqlite.Row
-            try:
-                yield conn
-            finally:
-                await conn.close()
+        """Get a pooled read-only database connection. @zara"""
+        from ..storage.db_connection_manager import db_read_connection
+
+        async with db_read_connection(self._db_path) as conn:
+            yield conn
 
     async def async_get_daily_summaries(
         self,
@@ -203,14 +193,22 @@ class SolarDataReader:
                     rows = await cursor.fetchall()
 
                 summaries: list[DailySummary] = []
+                if not rows:
+                    return summaries
+
+                # Set-based child lookups: one range query per table instead of 2 per row @zara
+                first_date = min(str(row["date"]) for row in rows)
+                last_date = max(str(row["date"]) for row in rows)
+                windows_by_date = await self._get_time_windows_range(conn, first_date, last_date)
+                frost_by_date = await self._get_frost_analysis_range(conn, first_date, last_date)
 
                 for row in rows:
                     try:
                         summary_date = date.fromisoformat(row["date"]) if isinstance(row["date"], str) else row["date"]
 
-                        time_windows = await self._get_time_windows(conn, row["date"])
+                        time_windows = windows_by_date.get(str(row["date"]), {})
 
-                        frost_data = await self._get_frost_analysis(conn, row["date"])
+                        frost_data = frost_by_date.get(str(row["date"]))
 
                         summary = DailySummary(
                             date=summary_date,
@@ -245,52 +243,56 @@ class SolarDataReader:
             _LOGGER.error("Error reading daily summaries from database: %s", err)
             return []
 
-    async def _get_time_windows(self, conn: aiosqlite.Connection, date_str: str) -> dict[str, dict]:
-        """Get time windows for a specific date. @zara"""
+    async def _get_time_windows_range(
+        self, conn: aiosqlite.Connection, first_date: str, last_date: str
+    ) -> dict[str, dict[str, dict]]:
+        """Get time windows for all dates in a range, keyed by date. @zara"""
+        result: dict[str, dict[str, dict]] = {}
         try:
             async with conn.execute(
-                """SELECT window_name, predicted_kwh, actual_kwh, accuracy, stable, hours_count
-                   FROM daily_summary_time_windows WHERE date = ?""",
-                (date_str,)
+                """SELECT date, window_name, predicted_kwh, actual_kwh, accuracy, stable, hours_count
+                   FROM daily_summary_time_windows WHERE date >= ? AND date <= ?""",
+                (first_date, last_date)
             ) as cursor:
                 rows = await cursor.fetchall()
 
-            return {
-                row["window_name"]: {
+            for row in rows:
+                result.setdefault(str(row["date"]), {})[row["window_name"]] = {
                     "predicted_kwh": row["predicted_kwh"],
                     "actual_kwh": row["actual_kwh"],
                     "accuracy": row["accuracy"],
                     "stable": bool(row["stable"]),
                     "hours_count": row["hours_count"],
                 }
-                for row in rows
-            }
+            return result
         except Exception:
             return {}
 
-    async def _get_frost_analysis(self, conn: aiosqlite.Connection, date_str: str) -> dict | None:
-        """Get frost analysis for a specific date. @zara"""
+    async def _get_frost_analysis_range(
+        self, conn: aiosqlite.Connection, first_date: str, last_date: str
+    ) -> dict[str, dict]:
+        """Get frost analysis for all dates in a range, keyed by date. @zara"""
         try:
             async with conn.execute(
-                """SELECT hours_analyzed, frost_detected, total_affected_hours,
+                """SELECT date, hours_analyzed, frost_detected, total_affected_hours,
                           heavy_frost_hours, light_frost_hours
-                   FROM daily_summary_frost_analysis WHERE date = ?""",
-                (date_str,)
+                   FROM daily_summary_frost_analysis WHERE date >= ? AND date <= ?""",
+                (first_date, last_date)
             ) as cursor:
-                row = await cursor.fetchone()
-
-            if not row:
-                return None
+                rows = await cursor.fetchall()
 
             return {
-                "hours_analyzed": row["hours_analyzed"],
-                "frost_detected": bool(row["frost_detected"]),
-                "total_affected_hours": row["total_affected_hours"],
-                "heavy_frost_hours": row["heavy_frost_hours"],
-                "light_frost_hours": row["light_frost_hours"],
+                str(row["date"]): {
+                    "hours_analyzed": row["hours_analyzed"],
+                    "frost_detected": bool(row["frost_detected"]),
+                    "total_affected_hours": row["total_affected_hours"],
+                    "heavy_frost_hours": row["heavy_frost_hours"],
+                    "light_frost_hours": row["light_frost_hours"],
+                }
+                for row in rows
             }
         except Exception:
-            return None
+            return {}
 
     async def async_get_hourly_predictions(
         self,
@@ -298,6 +300,39 @@ class SolarDataReader:
         include_no_production: bool = False,
     ) -> list[HourlyPrediction]:
         """Read hourly predictions from database. @zara"""
+        conditions = []
+        params = []
+
+        if target_date:
+            conditions.append("hp.target_date = ?")
+            params.append(target_date.isoformat())
+
+        return await self._query_hourly_predictions(
+            conditions, params, include_no_production, "hp.target_datetime"
+        )
+
+    async def async_get_hourly_predictions_range(
+        self,
+        start: date,
+        end: date,
+        include_no_production: bool = False,
+    ) -> list[HourlyPrediction]:
+        """Read hourly predictions for an inclusive date range in one indexed scan. @zara"""
+        return await self._query_hourly_predictions(
+            ["hp.target_date >= ?", "hp.target_date <= ?"],
+            [start.isoformat(), end.isoformat()],
+            include_no_production,
+            "hp.target_date, hp.target_datetime",
+        )
+
+    async def _query_hourly_predictions(
+        self,
+        conditions: list[str],
+        params: list[Any],
+        include_no_production: bool,
+        order_by: str,
+    ) -> list[HourlyPrediction]:
+        """Run the hourly prediction query and parse the rows. @zara"""
         if not self.is_available:
             _LOGGER.debug("Database not found: %s", self._db_path)
             return []
@@ -317,12 +352,7 @@ class SolarDataReader:
                         AND pw.weather_type = 'forecast'
                     LEFT JOIN prediction_astronomy pa ON hp.prediction_id = pa.prediction_id
                 """
-                params = []
-                conditions = []
-
-                if target_date:
-                    conditions.append("hp.target_date = ?")
-                    params.append(target_date.isoformat())
+                conditions = list(conditions)
 
                 if not include_no_production:
                     conditions.append("(hp.prediction_kwh > 0 OR (hp.actual_kwh IS NOT NULL AND hp.actual_kwh > 0))")
@@ -330,7 +360,7 @@ class SolarDataReader:
                 if conditions:
                     query += " WHERE " + " AND ".join(conditions)
 
-                query += " ORDER BY hp.target_datetime"
+                query += f" ORDER BY {order_by}"
 
                 async with conn.execute(query, params) as cursor:
                     rows = await cursor.fetchall()
@@ -63,21 +63,11 @@ class WeatherDataReader:
 
     @asynccontextmanager
     async def _get_db_connection(self) -> AsyncIterator[aiosqlite.Connection]:
-        """Get a database connection from the manager. @zara"""
-        from ..storage.db_connection_manager import get_manager
-
-        manager = get_manager()
-        if manager is not None and manager.is_connected:
-            _LOGGER.debug("WeatherDataReader: Using database connection manager")
-            yield await manager.get_connection()
-        else:
-            _LOGGER.warning("WeatherDataReader: Database manager not available, using direct connection (THIS CAUSES THREADING ERRORS)")
-            conn = await aiosqlite.connect(str(self._db_path))
-            conn.row_factory = aiosqlite.Row
-            try:
-                yield conn
-            finally:
-                await conn.close()
+        """Get a pooled read-only database connection. @zara"""
+        from ..storage.db_connection_manager import db_read_connection
+
+        async with db_read_connection(self._db_path) as conn:
+            yield conn
 
     async def async_get_hourly_weather(
         self,
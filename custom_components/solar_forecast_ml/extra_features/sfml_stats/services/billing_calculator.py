@@ -61,14 +61,16 @@ class BillingCalculator:
 
     @asynccontextmanager
     async def _get_db(self) -> AsyncIterator[aiosqlite.Connection]:
-        """Get DB connection via manager with direct fallback. @zara"""
-        from ..storage.db_connection_manager import get_manager
-        manager = get_manager()
-        if manager is not None and manager.is_connected:
-            yield await manager.get_connection()
-            return
-        async with aiosqlite.connect(str(self._db_path)) as conn:
-            conn.row_factory = aiosqlite.Row
+        """Run a serialized write transaction on the shared writer. @zara"""
+        from ..storage.db_connection_manager import db_connection
+        async with db_connection(self._db_path) as conn:
+            yield conn
+
+    @asynccontextmanager
+    async def _get_read_db(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a pooled read-only DB connection. @zara"""
+        from ..storage.db_connection_manager import db_read_connection
+        async with db_read_connection(self._db_path) as conn:
             yield conn
 
     @property
@@ -149,7 +151,7 @@ class BillingCalculator:
         billing_start_str = billing_start.isoformat()
 
         try:
-            async with self._get_db() as db:
+            async with self._get_read_db() as db:
                 async with db.execute("""
                     SELECT
                         COALESCE(SUM(solar_yield_kwh), 0) as solar_total_kwh,
@@ -189,7 +191,7 @@ class BillingCalculator:
         billing_start_str = billing_start.isoformat()
 
         try:
-            async with self._get_db() as db:
+            async with self._get_read_db() as db:
                 async with db.execute("""
                     SELECT
                         COALESCE(SUM(smartmeter_import_kwh), 0) as smartmeter_import_kwh,
@@ -218,7 +220,7 @@ class BillingCalculator:
             return {}
 
         try:
-            async with self._get_db() as db:
+            async with self._get_read_db() as db:
                 async with db.execute("""
                     SELECT
                         COALESCE(SUM(consumer_heatpump_kwh), 0) as consumer_heatpump_kwh,
@@ -432,7 +434,7 @@ class BillingCalculator:
         hourly_self_by_date: dict[str, float] = defaultdict(float)
 
         try:
-            async with self._get_db() as db:
+            async with self._get_read_db() as db:
                 async with db.execute("""
                     SELECT
                         hb.date,
@@ -680,6 +682,9 @@ class BillingCalculator:
             "Sensor CSV import: %d hours imported, %d without GPM price",
             imported, no_price,
         )
+
+        from .hourly_aggregator import HourlyBillingAggregator
+        await HourlyBillingAggregator(self._hass, self._config_path).async_rebuild_totals()
         return {
             "success": True,
             "imported": imported,
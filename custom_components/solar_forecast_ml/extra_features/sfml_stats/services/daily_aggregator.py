@@ -12,7 +12,7 @@ from __future__ import annotations
 
 import json
 import logging
-from datetime import date, datetime, timedelta
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any
 
@@ -23,7 +23,7 @@ from homeassistant.core import HomeAssistant
 from ..const import (
     DOMAIN,
     SFML_STATS_DATA,
-    DAILY_ENERGY_HISTORY,
+    HISTORY_STORE_DAILY_ENERGY,
     CONF_SENSOR_GRID_IMPORT_DAILY,
     CONF_SENSOR_BATTERY_CHARGE_SOLAR_DAILY,
     CONF_SENSOR_BATTERY_CHARGE_GRID_DAILY,
@@ -43,6 +43,7 @@ from ..const import (
     DEFAULT_BILLING_FIXED_PRICE,
 )
 from ..sfml_data_reader import SFMLDataReader
+from ..storage.history_store import get_history_store
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -55,7 +56,7 @@ class DailyEnergyAggregator:
         self._hass = hass
         self._config_path = config_path
         self._data_path = config_path / SFML_STATS_DATA
-        self._history_file = self._data_path / DAILY_ENERGY_HISTORY
+        self._store = get_history_store(config_path, HISTORY_STORE_DAILY_ENERGY)
 
     def _get_config(self) -> dict[str, Any]:
         """Get current configuration. @zara"""
@@ -83,31 +84,6 @@ class DailyEnergyAggregator:
         except (ValueError, TypeError):
             return None
 
-    async def _load_history(self) -> dict[str, Any]:
-        """Load existing history file. @zara"""
-        if not self._history_file.exists():
-            return {"days": {}, "last_updated": None}
-
-        try:
-            async with aiofiles.open(self._history_file, "r", encoding="utf-8") as f:
-                content = await f.read()
-                return json.loads(content)
-        except Exception as err:
-            _LOGGER.error("Error loading history: %s", err)
-            return {"days": {}, "last_updated": None}
-
-    async def _save_history(self, history: dict[str, Any]) -> bool:
-        """Save history file. @zara"""
-        self._data_path.mkdir(parents=True, exist_ok=True)
-
-        try:
-            async with aiofiles.open(self._history_file, "w", encoding="utf-8") as f:
-                await f.write(json.dumps(history, indent=2, ensure_ascii=False))
-            return True
-        except Exception as err:
-            _LOGGER.error("Error saving history: %s", err)
-            return False
-
     async def async_aggregate_daily(self) -> bool:
         """Aggregate daily values and save them. @zara"""
         config = self._get_config()
@@ -194,11 +170,10 @@ class DailyEnergyAggregator:
         if price_mode == PRICE_MODE_FIXED:
             daily_data["fixed_price_ct"] = fixed_price
 
-        history = await self._load_history()
-        history["days"][today_str] = daily_data
-        history["last_updated"] = datetime.now().isoformat()
-
-        success = await self._save_history(history)
+        success = await self._store.async_save(
+            records={today_str: daily_data},
+            meta={"last_updated": datetime.now().isoformat()},
+        )
 
         if success:
             _LOGGER.info(
@@ -254,7 +229,9 @@ class DailyEnergyAggregator:
         end_date: date,
     ) -> dict[str, Any]:
         """Get aggregated data for a billing period. @zara"""
-        history = await self._load_history()
+        days = await self._store.async_get_records(
+            start=start_date.isoformat(), end=end_date.isoformat()
+        )
 
         result = {
             "period_start": start_date.isoformat(),
@@ -270,25 +247,19 @@ class DailyEnergyAggregator:
             "daily_data": [],
         }
 
-        current = start_date
-        while current <= end_date:
-            day_str = current.isoformat()
-            if day_str in history.get("days", {}):
-                day_data = history["days"][day_str]
-                result["days_with_data"] += 1
-
-                result["total_solar_yield_kwh"] += day_data.get("solar_yield_kwh") or 0
-                result["total_grid_import_kwh"] += day_data.get("grid_import_kwh") or 0
-                result["total_grid_export_kwh"] += day_data.get("grid_export_kwh") or 0
-                result["total_battery_charge_solar_kwh"] += day_data.get("battery_charge_solar_kwh") or 0
-                result["total_battery_charge_grid_kwh"] += day_data.get("battery_charge_grid_kwh") or 0
-                result["total_solar_to_house_kwh"] += day_data.get("solar_to_house_kwh") or 0
-
-                result["daily_data"].append({
-                    "date": day_str,
-                    **day_data
-                })
-
-            current = current + timedelta(days=1)
+        for day_str, day_data in days.items():
+            result["days_with_data"] += 1
+
+            result["total_solar_yield_kwh"] += day_data.get("solar_yield_kwh") or 0
+            result["total_grid_import_kwh"] += day_data.get("grid_import_kwh") or 0
+            result["total_grid_export_kwh"] += day_data.get("grid_export_kwh") or 0
+            result["total_battery_charge_solar_kwh"] += day_data.get("battery_charge_solar_kwh") or 0
+            result["total_battery_charge_grid_kwh"] += day_data.get("battery_charge_grid_kwh") or 0
+            result["total_solar_to_house_kwh"] += day_data.get("solar_to_house_kwh") or 0
+
+            result["daily_data"].append({
+                "date": day_str,
+                **day_data
+            })
 
         return result
@@ -10,14 +10,12 @@
 """Forecast comparison collector for SFML Stats. @zara"""
 from __future__ import annotations
 
-import json
 import logging
 from contextlib import asynccontextmanager
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any, TYPE_CHECKING, AsyncIterator
 
-import aiofiles
 import aiosqlite
 
 from homeassistant.core import HomeAssistant
@@ -29,7 +27,7 @@ from ..const import (
     DOMAIN,
     SFML_STATS_DATA,
     SOLAR_FORECAST_DB,
-    EXTERNAL_FORECASTS_HISTORY,
+    HISTORY_STORE_FORECAST_COMPARISON,
     FORECAST_COMPARISON_RETENTION_DAYS,
     CONF_FORECAST_ENTITY_1,
     CONF_FORECAST_ENTITY_2,
@@ -39,6 +37,7 @@ from ..const import (
     DEFAULT_FORECAST_ENTITY_2_NAME,
 )
 from ..sfml_data_reader import SFMLDataReader
+from ..storage.history_store import get_history_store
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -53,7 +52,7 @@ class ForecastComparisonCollector:
         self._hass = hass
         self._config_path = config_path
         self._data_path = config_path / SFML_STATS_DATA
-        self._history_file = self._data_path / EXTERNAL_FORECASTS_HISTORY
+        self._store = get_history_store(config_path, HISTORY_STORE_FORECAST_COMPARISON)
         self._db_path = config_path / SOLAR_FORECAST_DB
         if db_manager is not None:
             ForecastComparisonCollector._db_manager = db_manager
@@ -84,73 +83,30 @@ class ForecastComparisonCollector:
         except (ValueError, TypeError):
             return None
 
-    async def _load_history(self) -> dict[str, Any]:
-        """Load existing history file. @zara"""
-        if not self._history_file.exists():
-            return {
-                "days": {},
+    async def _save_entries(self, entries: dict[str, Any]) -> bool:
+        """Upsert changed day entries and refresh the metadata. @zara"""
+        return await self._store.async_save(
+            records=entries,
+            meta={
                 "metadata": {
-                    "last_updated": None,
+                    "last_updated": datetime.now().isoformat(),
                     "retention_days": FORECAST_COMPARISON_RETENTION_DAYS,
                 }
-            }
-
-        try:
-            async with aiofiles.open(self._history_file, "r", encoding="utf-8") as f:
-                content = await f.read()
-                return json.loads(content)
-        except Exception as err:
-            _LOGGER.error("Error loading forecast history: %s", err)
-            return {
-                "days": {},
-                "metadata": {
-                    "last_updated": None,
-                    "retention_days": FORECAST_COMPARISON_RETENTION_DAYS,
-                }
-            }
-
-    async def _save_history(self, history: dict[str, Any]) -> bool:
-        """Save history file. @zara"""
-        self._data_path.mkdir(parents=True, exist_ok=True)
-
-        try:
-            async with aiofiles.open(self._history_file, "w", encoding="utf-8") as f:
-                await f.write(json.dumps(history, indent=2, ensure_ascii=False))
-            return True
-        except Exception as err:
-            _LOGGER.error("Error saving forecast history: %s", err)
-            return False
+            },
+        )
 
     @asynccontextmanager
     async def _get_db_connection(self) -> AsyncIterator[aiosqlite.Connection | None]:
-        """Get a database connection via the centralized manager. @zara"""
-        from ..storage.db_connection_manager import get_manager
-
-        manager = get_manager()
-        if manager is not None and manager.is_connected:
-            try:
-                _LOGGER.debug("ForecastComparisonCollector: Using database connection manager")
-                yield await manager.get_connection()
-                return
-            except Exception as err:
-                _LOGGER.warning("Error getting connection from manager: %s", err)
+        """Get a pooled read-only connection, None if the database is missing. @zara"""
+        from ..storage.db_connection_manager import db_read_connection
 
-        _LOGGER.warning("ForecastComparisonCollector: Database manager not available, using direct connection (THIS CAUSES THREADING ERRORS)")
         if not self._db_path.exists():
             _LOGGER.debug("SFML database not found: %s", self._db_path)
             yield None
             return
 
-        try:
-            conn = await aiosqlite.connect(str(self._db_path))
-            conn.row_factory = aiosqlite.Row
-            try:
-                yield conn
-            finally:
-                await conn.close()
-        except Exception as err:
-            _LOGGER.error("Error connecting to SFML database: %s", err)
-            yield None
+        async with db_read_connection(self._db_path) as conn:
+            yield conn
 
     async def _get_sfml_forecast(self, day_str: str) -> float | None:
         """Get SFML forecast for a specific day from database. @zara"""
@@ -203,22 +159,13 @@ class ForecastComparisonCollector:
                 _LOGGER.warning("Error reading SFML forecast from database: %s", err)
                 return None
 
-    async def _cleanup_old_entries(self, history: dict[str, Any]) -> None:
+    async def _cleanup_old_entries(self) -> None:
         """Remove entries older than retention period. @zara"""
-        retention_days = history.get("metadata", {}).get(
-            "retention_days", FORECAST_COMPARISON_RETENTION_DAYS
-        )
-        cutoff_date = date.today() - timedelta(days=retention_days)
-        cutoff_str = cutoff_date.isoformat()
+        cutoff_date = date.today() - timedelta(days=FORECAST_COMPARISON_RETENTION_DAYS)
 
-        days_to_remove = [
-            day_str for day_str in history.get("days", {})
-            if day_str < cutoff_str
-        ]
-
-        for day_str in days_to_remove:
-            del history["days"][day_str]
-            _LOGGER.debug("Removed old forecast entry: %s", day_str)
+        deleted = await self._store.async_delete_before(cutoff_date.isoformat())
+        if deleted:
+            _LOGGER.debug("Removed %d old forecast entries", deleted)
 
     async def async_collect_morning_forecasts(self) -> bool:
         """Collect forecast values for today at morning time. @zara"""
@@ -237,9 +184,7 @@ class ForecastComparisonCollector:
 
         sfml_forecast_kwh = await self._get_sfml_forecast(today_str)
 
-        history = await self._load_history()
-
-        daily_entry: dict[str, Any] = history.get("days", {}).get(today_str, {})
+        daily_entry: dict[str, Any] = await self._store.async_get_record(today_str) or {}
 
         if "sfml_forecast_kwh" not in daily_entry or daily_entry.get("sfml_forecast_kwh") is None:
             daily_entry["sfml_forecast_kwh"] = sfml_forecast_kwh
@@ -267,10 +212,7 @@ class ForecastComparisonCollector:
         if "actual_kwh" not in daily_entry:
             daily_entry["actual_kwh"] = None
 
-        history["days"][today_str] = daily_entry
-        history["metadata"]["last_updated"] = datetime.now().isoformat()
-
-        success = await self._save_history(history)
+        success = await self._save_entries({today_str: daily_entry})
 
         if success:
             _LOGGER.info(
@@ -293,9 +235,7 @@ class ForecastComparisonCollector:
         sfml_reader = SFMLDataReader(self._hass)
         actual_kwh = sfml_reader.get_live_yield()
 
-        history = await self._load_history()
-
-        daily_entry = history.get("days", {}).get(today_str, {})
+        daily_entry = await self._store.async_get_record(today_str) or {}
 
         if not daily_entry:
             _LOGGER.warning("No morning forecast data for %s, creating new entry", today_str)
@@ -337,12 +277,9 @@ class ForecastComparisonCollector:
                         max(0, 100 - (error / actual_kwh * 100)), 1
                     )
 
-        history["days"][today_str] = daily_entry
-        history["metadata"]["last_updated"] = datetime.now().isoformat()
-
-        await self._cleanup_old_entries(history)
+        success = await self._save_entries({today_str: daily_entry})
 
-        success = await self._save_history(history)
+        await self._cleanup_old_entries()
 
         if success:
             sfml_forecast = daily_entry.get("sfml_forecast_kwh")
@@ -361,23 +298,18 @@ class ForecastComparisonCollector:
 
     async def async_get_comparison_data(self, days: int = 7) -> list[dict[str, Any]]:
         """Get forecast comparison data for the last N days. @zara"""
-        history = await self._load_history()
-
         cutoff_date = date.today() - timedelta(days=days - 1)
-        result = []
-
-        current = cutoff_date
-        while current <= date.today():
-            day_str = current.isoformat()
-            if day_str in history.get("days", {}):
-                day_data = history["days"][day_str]
-                result.append({
-                    "date": day_str,
-                    **day_data
-                })
-            current = current + timedelta(days=1)
+        history_days = await self._store.async_get_records(
+            start=cutoff_date.isoformat(), end=date.today().isoformat()
+        )
 
-        return result
+        return [
+            {
+                "date": day_str,
+                **day_data
+            }
+            for day_str, day_data in history_days.items()
+        ]
 
     async def _get_all_sfml_summaries(self) -> dict[str, dict[str, Any]]:
         """Load all SFML summaries from database. @zara"""
@@ -490,18 +422,21 @@ class ForecastComparisonCollector:
         external_1_history = await self._get_sensor_history_from_recorder(external_1_entity, days)
         external_2_history = await self._get_sensor_history_from_recorder(external_2_entity, days)
 
-        history = await self._load_history()
-
         end_date = date.today()
         start_date = end_date - timedelta(days=days - 1)
 
+        existing_days = await self._store.async_get_records(
+            start=start_date.isoformat(), end=end_date.isoformat()
+        )
+        new_entries: dict[str, Any] = {}
+
         current = start_date
         days_added = 0
 
         while current <= end_date:
             day_str = current.isoformat()
 
-            if day_str in history.get("days", {}):
+            if day_str in existing_days:
                 current = current + timedelta(days=1)
                 continue
 
@@ -554,14 +489,12 @@ class ForecastComparisonCollector:
                             max(0, 100 - (error / actual_kwh * 100)), 1
                         )
 
-                history["days"][day_str] = daily_entry
+                new_entries[day_str] = daily_entry
                 days_added += 1
 
             current = current + timedelta(days=1)
 
-        history["metadata"]["last_updated"] = datetime.now().isoformat()
-
-        success = await self._save_history(history)
+        success = await self._save_entries(new_entries)
 
         if success:
             _LOGGER.info(
@@ -577,18 +510,21 @@ class ForecastComparisonCollector:
 
         sfml_data = await self._get_all_sfml_summaries()
 
-        history = await self._load_history()
-
         repaired_count = 0
         end_date = date.today()
         start_date = end_date - timedelta(days=days - 1)
 
+        existing_days = await self._store.async_get_records(
+            start=start_date.isoformat(), end=end_date.isoformat()
+        )
+        repaired: dict[str, Any] = {}
+
         current = start_date
         while current <= end_date:
             day_str = current.isoformat()
 
-            if day_str in history.get("days", {}):
-                daily_entry = history["days"][day_str]
+            if day_str in existing_days:
+                daily_entry = existing_days[day_str]
 
                 if daily_entry.get("sfml_forecast_kwh") is None:
                     sfml_info = sfml_data.get(day_str, {})
@@ -606,14 +542,13 @@ class ForecastComparisonCollector:
                                 max(0, 100 - (error / actual_kwh * 100)), 1
                             )
 
-                        history["days"][day_str] = daily_entry
+                        repaired[day_str] = daily_entry
                         repaired_count += 1
 
             current = current + timedelta(days=1)
 
         if repaired_count > 0:
-            history["metadata"]["last_updated"] = datetime.now().isoformat()
-            await self._save_history(history)
+            await self._save_entries(repaired)
             _LOGGER.info("Repaired %d missing SFML forecasts", repaired_count)
 
         return repaired_count
@@ -10,22 +10,21 @@
 """Hourly billing aggregator for SFML Stats. @zara"""
 from __future__ import annotations
 
-import json
+import calendar
 import logging
 from contextlib import asynccontextmanager
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any, AsyncIterator
 
-import aiofiles
 import aiosqlite
+import numpy as np
 
 from homeassistant.core import HomeAssistant
 
 from ..const import (
     DOMAIN,
-    SFML_STATS_DATA,
-    HOURLY_BILLING_HISTORY,
+    HISTORY_STORE_HOURLY_BILLING,
     SOLAR_FORECAST_DB,
     CONF_SENSOR_SMARTMETER_IMPORT,
     CONF_SENSOR_SMARTMETER_EXPORT,
@@ -46,9 +45,41 @@ from ..const import (
     DEFAULT_BILLING_FIXED_PRICE,
 )
 from ..sfml_data_reader import SFMLDataReader
+from ..storage.history_store import get_history_store
 
 _LOGGER = logging.getLogger(__name__)
 
+_BILLING_SUM_FIELDS: tuple[str, ...] = (
+    "grid_import_kwh",
+    "grid_import_cost_ct",
+    "grid_export_kwh",
+    "solar_yield_kwh",
+    "solar_to_house_kwh",
+    "solar_to_battery_kwh",
+    "battery_to_house_kwh",
+    "grid_to_house_kwh",
+    "grid_to_battery_kwh",
+    "home_consumption_kwh",
+)
+# Price and savings sums keep averages exact under incremental updates @zara
+_BILLING_AGG_FIELDS: tuple[str, ...] = _BILLING_SUM_FIELDS + (
+    "price_sum_ct",
+    "savings_ct",
+    "hours_count",
+)
+_AGGREGATES_SETTING_KEY = "billing_aggregates_version"
+_AGGREGATES_VERSION = "1"
+
+_PERIOD_DERIVED_SQL = """
+    UPDATE stats_billing_totals SET
+        grid_import_cost_eur = grid_import_cost_ct / 100.0,
+        savings_eur = savings_ct / 100.0,
+        avg_price_ct = CASE WHEN hours_count > 0
+            THEN price_sum_ct / hours_count ELSE 0 END,
+        self_consumption_kwh = MAX(0, solar_yield_kwh - grid_export_kwh),
+        updated_at = CURRENT_TIMESTAMP
+"""
+
 
 class HourlyBillingAggregator:
     """Aggregate hourly energy values and calculate costs. @zara"""
@@ -57,20 +88,22 @@ class HourlyBillingAggregator:
         """Initialize the aggregator. @zara"""
         self._hass = hass
         self._config_path = config_path
-        self._data_path = config_path / SFML_STATS_DATA
-        self._history_file = self._data_path / HOURLY_BILLING_HISTORY
         self._db_path = config_path / SOLAR_FORECAST_DB
+        self._store = get_history_store(config_path, HISTORY_STORE_HOURLY_BILLING)
+        self._aggregates_ready = False
 
     @asynccontextmanager
     async def _get_db(self) -> AsyncIterator[aiosqlite.Connection]:
-        """Get DB connection via manager with direct fallback. @zara"""
-        from ..storage.db_connection_manager import get_manager
-        manager = get_manager()
-        if manager is not None and manager.is_connected:
-            yield await manager.get_connection()
-            return
-        async with aiosqlite.connect(str(self._db_path)) as conn:
-            conn.row_factory = aiosqlite.Row
+        """Run a serialized write transaction on the shared writer. @zara"""
+        from ..storage.db_connection_manager import db_connection
+        async with db_connection(self._db_path) as conn:
+            yield conn
+
+    @asynccontextmanager
+    async def _get_read_db(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a pooled read-only DB connection. @zara"""
+        from ..storage.db_connection_manager import db_read_connection
+        async with db_read_connection(self._db_path) as conn:
             yield conn
 
     def _get_config(self) -> dict[str, Any]:
@@ -99,95 +132,103 @@ class HourlyBillingAggregator:
         except (ValueError, TypeError):
             return None
 
-    async def _calculate_kwh_from_recorder(
+    async def _fetch_recorder_states(
         self,
-        entity_id: str,
+        entity_ids: list[str | None],
         start_time: datetime,
         end_time: datetime,
-    ) -> float:
-        """Calculate kWh from watt values in recorder. @zara"""
-        if not entity_id:
-            return 0.0
-
-        hours = (end_time - start_time).total_seconds() / 3600
+    ) -> dict[str, list[Any]]:
+        """Load the state changes of all entities with a single recorder query. @zara"""
+        wanted = sorted({entity_id for entity_id in entity_ids if entity_id})
+        if not wanted:
+            return {}
 
         try:
             from homeassistant.components.recorder import get_instance
-            from homeassistant.components.recorder.history import state_changes_during_period
+            from homeassistant.components.recorder.history import get_significant_states
 
             instance = get_instance(self._hass)
 
-            states = await instance.async_add_executor_job(
-                state_changes_during_period,
-                self._hass,
-                start_time,
-                end_time,
-                [entity_id],
-                True,
-                False,
-                None,
-            )
-
-            entity_states = states.get(entity_id, [])
+            def _query() -> dict[str, list[Any]]:
+                return get_significant_states(
+                    self._hass,
+                    start_time,
+                    end_time,
+                    wanted,
+                    significant_changes_only=False,
+                    include_start_time_state=True,
+                    no_attributes=True,
+                )
 
+            states = await instance.async_add_executor_job(_query) or {}
             _LOGGER.debug(
-                "Recorder for %s: %d states from %s to %s",
-                entity_id, len(entity_states), start_time, end_time
+                "Recorder: %d states for %d entities from %s to %s",
+                sum(len(v) for v in states.values()), len(wanted), start_time, end_time
             )
-
-            if len(entity_states) >= 1:
-                total_wh = 0.0
-
-                if len(entity_states) == 1:
-                    try:
-                        watts = float(entity_states[0].state)
-                        if watts > 0:
-                            kwh = (watts * hours) / 1000
-                            _LOGGER.debug(
-                                "%s: 1 state with %.1f W -> %.4f kWh",
-                                entity_id, watts, kwh
-                            )
-                            return kwh
-                    except (ValueError, TypeError):
-                        pass
-                else:
-                    for i in range(1, len(entity_states)):
-                        prev_state = entity_states[i - 1]
-                        curr_state = entity_states[i]
-
-                        delta_seconds = (
-                            curr_state.last_changed - prev_state.last_changed
-                        ).total_seconds()
-                        delta_hours = delta_seconds / 3600
-
-                        try:
-                            prev_watts = float(prev_state.state)
-                            curr_watts = float(curr_state.state)
-
-                            prev_watts = max(0, prev_watts)
-                            curr_watts = max(0, curr_watts)
-
-                            avg_watts = (prev_watts + curr_watts) / 2
-                            total_wh += avg_watts * delta_hours
-
-                        except (ValueError, TypeError):
-                            continue
-
-                    if total_wh > 0:
-                        kwh = total_wh / 1000
-                        _LOGGER.debug(
-                            "%s: Calculated %.4f kWh from %d states",
-                            entity_id, kwh, len(entity_states)
-                        )
-                        return kwh
+            return states
 
         except ImportError as err:
             _LOGGER.debug("Recorder not available: %s", err)
         except Exception as err:
-            _LOGGER.debug(
-                "Recorder query for %s failed: %s",
-                entity_id, err
-            )
+            _LOGGER.debug("Recorder query for %s failed: %s", wanted, err)
+
+        return {}
+
+    @staticmethod
+    def _state_arrays(entity_states: list[Any]) -> tuple[np.ndarray, np.ndarray]:
+        """Return (epoch seconds, values) with NaN for non-numeric states. @zara"""
+        def _value(state: Any) -> float:
+            try:
+                return float(state.state)
+            except (ValueError, TypeError):
+                return np.nan
+
+        count = len(entity_states)
+        times = np.fromiter(
+            (state.last_changed.timestamp() for state in entity_states), np.float64, count
+        )
+        values = np.fromiter((_value(state) for state in entity_states), np.float64, count)
+        return times, values
+
+    def _kwh_from_power_states(
+        self,
+        entity_id: str | None,
+        states: dict[str, list[Any]],
+        hours: float,
+    ) -> float:
+        """Integrate watt states to kWh with the trapezoid rule. @zara"""
+        if not entity_id:
+            return 0.0
+
+        entity_states = states.get(entity_id, [])
+
+        if len(entity_states) == 1:
+            try:
+                watts = float(entity_states[0].state)
+                if watts > 0:
+                    kwh = (watts * hours) / 1000
+                    _LOGGER.debug(
+                        "%s: 1 state with %.1f W -> %.4f kWh",
+                        entity_id, watts, kwh
+                    )
+                    return kwh
+            except (ValueError, TypeError):
+                pass
+
+        elif len(entity_states) > 1:
+            times, watts = self._state_arrays(entity_states)
+            watts = np.maximum(watts, 0.0)
+            # Segments touching a non-numeric state are skipped (NaN) @zara
+            segment_wh = (watts[:-1] + watts[1:]) * 0.5 * (np.diff(times) / 3600.0)
+            total_wh = float(np.nansum(segment_wh))
+
+            if total_wh > 0:
+                kwh = total_wh / 1000
+                _LOGGER.debug(
+                    "%s: Calculated %.4f kWh from %d states",
+                    entity_id, kwh, len(entity_states)
+                )
+                return kwh
 
         current = self._get_sensor_value(entity_id)
         if current is not None and current > 0:
@@ -201,107 +242,43 @@ class HourlyBillingAggregator:
         _LOGGER.debug("%s: No value available, returning 0", entity_id)
         return 0.0
 
-    async def _calculate_kwh_diff_from_total(
+    def _kwh_diff_from_total_states(
         self,
-        entity_id: str,
-        start_time: datetime,
-        end_time: datetime,
+        entity_id: str | None,
+        states: dict[str, list[Any]],
     ) -> float | None:
-        """Calculate kWh difference from a total_increasing kWh sensor. @zara"""
+        """Calculate kWh difference from total_increasing kWh sensor states. @zara"""
         if not entity_id:
             return None
 
-        try:
-            from homeassistant.components.recorder import get_instance
-            from homeassistant.components.recorder.history import state_changes_during_period
-
-            instance = get_instance(self._hass)
-
-            states = await instance.async_add_executor_job(
-                state_changes_during_period,
-                self._hass,
-                start_time,
-                end_time,
-                [entity_id],
-                True,
-                False,
-                None,
-            )
-
-            entity_states = states.get(entity_id, [])
-
-            if len(entity_states) >= 2:
-                try:
-                    start_kwh = float(entity_states[0].state)
-                    end_kwh = float(entity_states[-1].state)
+        entity_states = states.get(entity_id, [])
 
-                    diff = end_kwh - start_kwh
+        if len(entity_states) >= 2:
+            try:
+                start_kwh = float(entity_states[0].state)
+                end_kwh = float(entity_states[-1].state)
 
-                    if diff >= -0.001:
-                        diff = max(0, diff)
-                        _LOGGER.debug(
-                            "%s: kWh difference %.4f (%.4f -> %.4f)",
-                            entity_id, diff, start_kwh, end_kwh
-                        )
-                        return diff
+                diff = end_kwh - start_kwh
 
-                except (ValueError, TypeError):
-                    pass
+                if diff >= -0.001:
+                    diff = max(0, diff)
+                    _LOGGER.debug(
+                        "%s: kWh difference %.4f (%.4f -> %.4f)",
+                        entity_id, diff, start_kwh, end_kwh
+                    )
+                    return diff
 
-            elif len(entity_states) == 1:
-                _LOGGER.debug(
-                    "%s: Only 1 state in period, cannot calculate difference",
-                    entity_id
-                )
+            except (ValueError, TypeError):
+                pass
 
-        except ImportError:
-            _LOGGER.debug("Recorder not available for kWh diff")
-        except Exception as err:
-            _LOGGER.debug("Error in kWh diff for %s: %s", entity_id, err)
+        elif len(entity_states) == 1:
+            _LOGGER.debug(
+                "%s: Only 1 state in period, cannot calculate difference",
+                entity_id
+            )
 
         return None
 
-    async def _load_history(self) -> dict[str, Any]:
-        """Load the existing history file. @zara"""
-        if not self._history_file.exists():
-            return {
-                "billing_period": {},
-                "hours": {},
-                "totals": {
-                    "grid_import_kwh": 0,
-                    "grid_import_cost_eur": 0,
-                    "grid_export_kwh": 0,
-                    "solar_yield_kwh": 0,
-                    "self_consumption_kwh": 0,
-                },
-                "last_updated": None,
-            }
-
-        try:
-            async with aiofiles.open(self._history_file, "r", encoding="utf-8") as f:
-                content = await f.read()
-                return json.loads(content)
-        except Exception as err:
-            _LOGGER.error("Error loading billing history: %s", err)
-            return {
-                "billing_period": {},
-                "hours": {},
-                "totals": {},
-                "last_updated": None,
-            }
-
-    async def _save_history(self, history: dict[str, Any]) -> bool:
-        """Save the history file. @zara"""
-        self._data_path.mkdir(parents=True, exist_ok=True)
-
-        try:
-            async with aiofiles.open(self._history_file, "w", encoding="utf-8") as f:
-                await f.write(json.dumps(history, indent=2, ensure_ascii=False))
-            return True
-        except Exception as err:
-            _LOGGER.error("Error saving billing history: %s", err)
-            return False
-
     async def async_aggregate_hourly(self) -> bool:
         """Aggregate the last hour and calculate costs. @zara"""
         config = self._get_config()
@@ -334,13 +311,34 @@ class HourlyBillingAggregator:
             )
             return False
 
+        hours = (end_time - start_time).total_seconds() / 3600
+        sfml_reader = SFMLDataReader(self._hass)
+        solar_power_entity = sfml_reader.get_power_entity_id()
+
+        # One recorder query for every configured flow sensor @zara
+        states = await self._fetch_recorder_states(
+            [
+                smartmeter_import_kwh,
+                smartmeter_export_kwh,
+                smartmeter_import_w,
+                smartmeter_export_w,
+                config.get(CONF_SENSOR_GRID_TO_HOUSE),
+                config.get(CONF_SENSOR_GRID_TO_BATTERY),
+                solar_power_entity,
+                config.get(CONF_SENSOR_SOLAR_TO_HOUSE),
+                config.get(CONF_SENSOR_SOLAR_TO_BATTERY),
+                config.get(CONF_SENSOR_BATTERY_TO_HOUSE),
+                config.get(CONF_SENSOR_HOME_CONSUMPTION),
+            ],
+            start_time,
+            end_time,
+        )
+
         grid_import_kwh = 0.0
         data_source = "none"
 
         if smartmeter_import_kwh:
-            diff = await self._calculate_kwh_diff_from_total(
-                smartmeter_import_kwh, start_time, end_time
-            )
+            diff = self._kwh_diff_from_total_states(smartmeter_import_kwh, states)
             if diff is not None:
                 grid_import_kwh = diff
                 data_source = "kwh_sensor"
@@ -350,8 +348,8 @@ class HourlyBillingAggregator:
                 )
 
         if grid_import_kwh == 0.0 and smartmeter_import_w:
-            grid_import_kwh = await self._calculate_kwh_from_recorder(
-                smartmeter_import_w, start_time, end_time
+            grid_import_kwh = self._kwh_from_power_states(
+                smartmeter_import_w, states, hours
             )
             if grid_import_kwh > 0:
                 data_source = "watt_recorder"
@@ -369,24 +367,21 @@ class HourlyBillingAggregator:
         grid_export_kwh = 0.0
 
         if smartmeter_export_kwh:
-            diff = await self._calculate_kwh_diff_from_total(
-                smartmeter_export_kwh, start_time, end_time
-            )
+            diff = self._kwh_diff_from_total_states(smartmeter_export_kwh, states)
             if diff is not None:
                 grid_export_kwh = diff
         elif smartmeter_export_w:
-            grid_export_kwh = await self._calculate_kwh_from_recorder(
-                smartmeter_export_w, start_time, end_time
+            grid_export_kwh = self._kwh_from_power_states(
+                smartmeter_export_w, states, hours
             )
 
-        grid_to_house_kwh = await self._calculate_kwh_from_recorder(
-            config.get(CONF_SENSOR_GRID_TO_HOUSE), start_time, end_time
+        grid_to_house_kwh = self._kwh_from_power_states(
+            config.get(CONF_SENSOR_GRID_TO_HOUSE), states, hours
         )
-        grid_to_battery_kwh = await self._calculate_kwh_from_recorder(
-            config.get(CONF_SENSOR_GRID_TO_BATTERY), start_time, end_time
+        grid_to_battery_kwh = self._kwh_from_power_states(
+            config.get(CONF_SENSOR_GRID_TO_BATTERY), states, hours
         )
 
-        sfml_reader = SFMLDataReader(self._hass)
         hourly_yield = await sfml_reader.get_hourly_yield(
             date=start_time.strftime("%Y-%m-%d"),
             hour=start_time.hour,
@@ -398,25 +393,25 @@ class HourlyBillingAggregator:
                 solar_power_kwh
             )
         else:
-            solar_power_kwh = await self._calculate_kwh_from_recorder(
-                sfml_reader.get_power_entity_id(), start_time, end_time
+            solar_power_kwh = self._kwh_from_power_states(
+                solar_power_entity, states, hours
             )
             _LOGGER.debug(
                 "Solar yield from recorder fallback: %.4f kWh",
                 solar_power_kwh
             )
 
-        solar_to_house_kwh = await self._calculate_kwh_from_recorder(
-            config.get(CONF_SENSOR_SOLAR_TO_HOUSE), start_time, end_time
+        solar_to_house_kwh = self._kwh_from_power_states(
+            config.get(CONF_SENSOR_SOLAR_TO_HOUSE), states, hours
         )
-        solar_to_battery_kwh = await self._calculate_kwh_from_recorder(
-            config.get(CONF_SENSOR_SOLAR_TO_BATTERY), start_time, end_time
+        solar_to_battery_kwh = self._kwh_from_power_states(
+            config.get(CONF_SENSOR_SOLAR_TO_BATTERY), states, hours
         )
-        battery_to_house_kwh = await self._calculate_kwh_from_recorder(
-            config.get(CONF_SENSOR_BATTERY_TO_HOUSE), start_time, end_time
+        battery_to_house_kwh = self._kwh_from_power_states(
+            config.get(CONF_SENSOR_BATTERY_TO_HOUSE), states, hours
         )
-        home_consumption_kwh = await self._calculate_kwh_from_recorder(
-            config.get(CONF_SENSOR_HOME_CONSUMPTION), start_time, end_time
+        home_consumption_kwh = self._kwh_from_power_states(
+            config.get(CONF_SENSOR_HOME_CONSUMPTION), states, hours
         )
 
         price_mode = config.get(CONF_BILLING_PRICE_MODE, "dynamic")
@@ -459,22 +454,6 @@ class HourlyBillingAggregator:
             "data_source": data_source,
         }
 
-        history = await self._load_history()
-
-        billing_start_day = config.get(CONF_BILLING_START_DAY, 1)
-        billing_start_month = config.get(CONF_BILLING_START_MONTH, 1)
-        history["billing_period"] = {
-            "start_day": billing_start_day,
-            "start_month": billing_start_month,
-        }
-
-        history["hours"][hour_key] = hourly_data
-        history["last_updated"] = now.isoformat()
-
-        await self._recalculate_totals(history, config)
-
-        success = await self._save_history(history)
-
         await self._write_hourly_to_db(
             hour_key=hour_key,
             date_str=start_time.strftime("%Y-%m-%d"),
@@ -482,6 +461,21 @@ class HourlyBillingAggregator:
             hourly_data=hourly_data,
         )
 
+        billing_period: dict[str, Any] = {
+            "start_day": config.get(CONF_BILLING_START_DAY, 1),
+            "start_month": config.get(CONF_BILLING_START_MONTH, 1),
+        }
+        meta: dict[str, Any] = {
+            "billing_period": billing_period,
+            "last_updated": now.isoformat(),
+        }
+
+        period = await self.async_get_period_totals(config)
+        if period is not None:
+            billing_period["start"], meta["totals"] = period
+
+        success = await self._store.async_save(records={hour_key: hourly_data}, meta=meta)
+
         if success:
             _LOGGER.info(
                 "Billing aggregation saved: Import=%.3f kWh (%.2f ct), "
@@ -494,15 +488,9 @@ class HourlyBillingAggregator:
 
         return success
 
-    async def _recalculate_totals(
-        self,
-        history: dict[str, Any],
-        config: dict[str, Any],
-    ) -> None:
-        """Recalculate totals for the billing period. @zara"""
-        import calendar
-        from datetime import date
-
+    @staticmethod
+    def _get_billing_start(config: dict[str, Any]) -> tuple[date, int, int]:
+        """Return the current billing period start and the configured day/month. @zara"""
         billing_start_day = config.get(CONF_BILLING_START_DAY, 1)
         billing_start_month = config.get(CONF_BILLING_START_MONTH, 1)
 
@@ -518,67 +506,43 @@ class HourlyBillingAggregator:
         current_year = today.year
 
         max_day = calendar.monthrange(current_year, billing_start_month)[1]
-        billing_start_day = min(billing_start_day, max_day)
+        start_day = min(billing_start_day, max_day)
 
-        billing_start = date(current_year, billing_start_month, billing_start_day)
+        billing_start = date(current_year, billing_start_month, start_day)
 
         if billing_start > today:
             max_day_prev = calendar.monthrange(current_year - 1, billing_start_month)[1]
-            billing_start_day = min(billing_start_day, max_day_prev)
-            billing_start = date(current_year - 1, billing_start_month, billing_start_day)
-
-        billing_start_str = billing_start.isoformat()
-
-        totals = {
-            "grid_import_kwh": 0,
-            "grid_import_cost_eur": 0,
-            "grid_export_kwh": 0,
-            "solar_yield_kwh": 0,
-            "solar_to_house_kwh": 0,
-            "solar_to_battery_kwh": 0,
-            "battery_to_house_kwh": 0,
-            "grid_to_house_kwh": 0,
-            "grid_to_battery_kwh": 0,
-            "home_consumption_kwh": 0,
-            "hours_count": 0,
-            "avg_price_ct": 0,
+            start_day = min(billing_start_day, max_day_prev)
+            billing_start = date(current_year - 1, billing_start_month, start_day)
+
+        return billing_start, billing_start_day, billing_start_month
+
+    @staticmethod
+    def _hour_contribution(hour_data: Any) -> dict[str, float]:
+        """Return what one hourly billing row adds to the aggregates. @zara"""
+        values = {field: float(hour_data[field] or 0) for field in _BILLING_SUM_FIELDS}
+        price = float(hour_data["price_ct_kwh"] or 0)
+        values["price_sum_ct"] = price
+        values["savings_ct"] = (
+            values["solar_to_house_kwh"] + values["battery_to_house_kwh"]
+        ) * price
+        values["hours_count"] = 1
+        return values
+
+    @staticmethod
+    def _compose_totals(row: Any) -> dict[str, Any]:
+        """Build the totals dict from a stats_billing_totals row. @zara"""
+        totals: dict[str, Any] = {
+            field: round(float(row[field] or 0), 4)
+            for field in _BILLING_SUM_FIELDS
+            if field != "grid_import_cost_ct"
         }
-
-        price_sum = 0
-
-        for hour_key, hour_data in history.get("hours", {}).items():
-            hour_date = hour_key[:10]
-            if hour_date >= billing_start_str:
-                totals["grid_import_kwh"] += hour_data.get("grid_import_kwh", 0)
-                totals["grid_import_cost_eur"] += (
-                    hour_data.get("grid_import_cost_ct", 0) / 100
-                )
-                totals["grid_export_kwh"] += hour_data.get("grid_export_kwh", 0)
-                totals["solar_yield_kwh"] += hour_data.get("solar_yield_kwh", 0)
-                totals["solar_to_house_kwh"] += hour_data.get("solar_to_house_kwh", 0)
-                totals["solar_to_battery_kwh"] += hour_data.get(
-                    "solar_to_battery_kwh", 0
-                )
-                totals["battery_to_house_kwh"] += hour_data.get(
-                    "battery_to_house_kwh", 0
-                )
-                totals["grid_to_house_kwh"] += hour_data.get("grid_to_house_kwh", 0)
-                totals["grid_to_battery_kwh"] += hour_data.get(
-                    "grid_to_battery_kwh", 0
-                )
-                totals["home_consumption_kwh"] += hour_data.get(
-                    "home_consumption_kwh", 0
-                )
-                totals["hours_count"] += 1
-                price_sum += hour_data.get("price_ct_kwh", 0)
-
-        if totals["hours_count"] > 0:
-            totals["avg_price_ct"] = round(price_sum / totals["hours_count"], 2)
-
-        for key in totals:
-            if isinstance(totals[key], float):
-                totals[key] = round(totals[key], 4)
-
+        hours_count = int(row["hours_count"] or 0)
+        totals["grid_import_cost_eur"] = round(float(row["grid_import_cost_ct"] or 0) / 100, 4)
+        totals["hours_count"] = hours_count
+        totals["avg_price_ct"] = (
+            round(float(row["price_sum_ct"] or 0) / hours_count, 2) if hours_count > 0 else 0
+        )
         totals["self_consumption_kwh"] = round(
             max(0, totals["solar_yield_kwh"] - totals["grid_export_kwh"]), 4
         )
@@ -598,20 +562,172 @@ class HourlyBillingAggregator:
         else:
             totals["autarkie_percent"] = 0
 
-        savings_ct = 0.0
-        for hour_key, hour_data in history.get("hours", {}).items():
-            hour_date = hour_key[:10]
-            if hour_date >= billing_start_str:
-                self_h = (
-                    (hour_data.get("solar_to_house_kwh", 0) or 0)
-                    + (hour_data.get("battery_to_house_kwh", 0) or 0)
+        totals["savings_eur"] = round(float(row["savings_ct"] or 0) / 100, 2)
+        return totals
+
+    async def _ensure_aggregate_tables(self, db: aiosqlite.Connection) -> None:
+        """Create the running aggregates and rebuild them once from stats_hourly_billing. @zara"""
+        if self._aggregates_ready:
+            return
+
+        columns = ",\n".join(f"    {field} REAL DEFAULT 0" for field in _BILLING_AGG_FIELDS)
+        await db.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS stats_billing_daily (
+                date TEXT PRIMARY KEY,
+            {columns},
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+
+        async with db.execute("PRAGMA table_info(stats_billing_totals)") as cursor:
+            existing_columns = {row[1] for row in await cursor.fetchall()}
+
+        for col_name in ("grid_import_cost_ct", "price_sum_ct", "savings_ct"):
+            if col_name not in existing_columns:
+                await db.execute(
+                    f"ALTER TABLE stats_billing_totals ADD COLUMN {col_name} REAL DEFAULT 0"
+                )
+                _LOGGER.info("Added column %s to stats_billing_totals", col_name)
+
+        async with db.execute(
+            "SELECT value FROM stats_settings WHERE key = ?",
+            (_AGGREGATES_SETTING_KEY,),
+        ) as cursor:
+            row = await cursor.fetchone()
+
+        if row is None or row[0] != _AGGREGATES_VERSION:
+            await self._rebuild_daily_aggregates(db)
+
+        await db.commit()
+        self._aggregates_ready = True
+
+    async def _rebuild_daily_aggregates(self, db: aiosqlite.Connection) -> None:
+        """Rebuild stats_billing_daily from stats_hourly_billing in one pass. @zara"""
+        sums = ", ".join(f"COALESCE(SUM({field}), 0)" for field in _BILLING_SUM_FIELDS)
+        await db.execute("DELETE FROM stats_billing_daily")
+        await db.execute(
+            f"""
+            INSERT INTO stats_billing_daily (date, {", ".join(_BILLING_AGG_FIELDS)})
+            SELECT date, {sums},
+                COALESCE(SUM(price_ct_kwh), 0),
+                COALESCE(SUM(
+                    (COALESCE(solar_to_house_kwh, 0) + COALESCE(battery_to_house_kwh, 0))
+                    * COALESCE(price_ct_kwh, 0)
+                ), 0),
+                COUNT(*)
+            FROM stats_hourly_billing
+            GROUP BY date
+            """
+        )
+        # Period totals are rebuilt lazily from the daily rows @zara
+        await db.execute("DELETE FROM stats_billing_totals")
+        await db.execute(
+            "INSERT OR REPLACE INTO stats_settings (key, value, updated_at) "
+            "VALUES (?, ?, CURRENT_TIMESTAMP)",
+            (_AGGREGATES_SETTING_KEY, _AGGREGATES_VERSION),
+        )
+        _LOGGER.info("Billing aggregates rebuilt from stats_hourly_billing")
+
+    async def _apply_hour_delta(
+        self,
+        db: aiosqlite.Connection,
+        date_str: str,
+        delta: dict[str, float],
+    ) -> None:
+        """Add one hour's change to the daily and period aggregates in O(1). @zara"""
+        fields = ", ".join(_BILLING_AGG_FIELDS)
+        placeholders = ", ".join("?" for _ in _BILLING_AGG_FIELDS)
+        increments = ", ".join(f"{f} = {f} + excluded.{f}" for f in _BILLING_AGG_FIELDS)
+        values = tuple(delta[f] for f in _BILLING_AGG_FIELDS)
+
+        await db.execute(
+            f"""
+            INSERT INTO stats_billing_daily (date, {fields}) VALUES (?, {placeholders})
+            ON CONFLICT(date) DO UPDATE SET {increments}, updated_at = CURRENT_TIMESTAMP
+            """,
+            (date_str, *values),
+        )
+
+        period_increments = ", ".join(f"{f} = {f} + ?" for f in _BILLING_AGG_FIELDS)
+        cursor = await db.execute(
+            f"UPDATE stats_billing_totals SET {period_increments} WHERE billing_start_date <= ?",
+            (*values, date_str),
+        )
+        if cursor.rowcount:
+            await db.execute(_PERIOD_DERIVED_SQL)
+
+    async def async_get_period_totals(
+        self, config: dict[str, Any] | None = None
+    ) -> tuple[str, dict[str, Any]] | None:
+        """Return (billing start, totals) from the running aggregates. @zara
+
+        The period row is only rebuilt from stats_billing_daily when the
+        billing start day/month changes or a new billing period begins.
+        """
+        if not self._db_path.exists():
+            return None
+
+        config = config if config is not None else self._get_config()
+        billing_start, start_day, start_month = self._get_billing_start(config)
+        billing_start_str = billing_start.isoformat()
+
+        try:
+            async with self._get_db() as db:
+                await self._ensure_aggregate_tables(db)
+
+                query = (
+                    "SELECT * FROM stats_billing_totals WHERE billing_start_date = ? "
+                    "AND billing_start_day = ? AND billing_start_month = ?"
                 )
-                price_h = hour_data.get("price_ct_kwh", 0) or 0
-                savings_ct += self_h * price_h
-        totals["savings_eur"] = round(savings_ct / 100, 2)
+                params = (billing_start_str, start_day, start_month)
+                async with db.execute(query, params) as cursor:
+                    row = await cursor.fetchone()
+
+                if row is None:
+                    sums = ", ".join(f"COALESCE(SUM({f}), 0)" for f in _BILLING_AGG_FIELDS)
+                    await db.execute("DELETE FROM stats_billing_totals")
+                    await db.execute(
+                        f"""
+                        INSERT INTO stats_billing_totals (
+                            billing_start_date, billing_start_day, billing_start_month,
+                            {", ".join(_BILLING_AGG_FIELDS)}
+                        )
+                        SELECT ?, ?, ?, {sums}
+                        FROM stats_billing_daily WHERE date >= ?
+                        """,
+                        (*params, billing_start_str),
+                    )
+                    await db.execute(_PERIOD_DERIVED_SQL)
+                    await db.commit()
+                    _LOGGER.info("Billing period totals rebuilt for %s", billing_start_str)
+
+                    async with db.execute(query, params) as cursor:
+                        row = await cursor.fetchone()
+
+        except Exception as err:
+            _LOGGER.error("Error reading billing totals: %s", err)
+            return None
+
+        if row is None:
+            return None
+        return billing_start_str, self._compose_totals(row)
 
-        history["totals"] = totals
-        history["billing_period"]["start"] = billing_start_str
+    async def async_rebuild_totals(self) -> bool:
+        """Rebuild all running aggregates, e.g. after a bulk import. @zara"""
+        if not self._db_path.exists():
+            return False
+
+        try:
+            async with self._get_db() as db:
+                await self._ensure_aggregate_tables(db)
+                await self._rebuild_daily_aggregates(db)
+                await db.commit()
+            return True
+        except Exception as err:
+            _LOGGER.error("Error rebuilding billing aggregates: %s", err)
+            return False
 
     async def _get_gpm_price(self, date_str: str, hour: int) -> float | None:
         """Get exact price from GPM_price_history for a specific hour. @zara"""
@@ -619,7 +735,7 @@ class HourlyBillingAggregator:
             return None
 
         try:
-            async with self._get_db() as db:
+            async with self._get_read_db() as db:
                 async with db.execute(
                     """
                     SELECT total_price FROM GPM_price_history
@@ -650,6 +766,17 @@ class HourlyBillingAggregator:
 
         try:
             async with self._get_db() as db:
+                await self._ensure_aggregate_tables(db)
+
+                async with db.execute(
+                    f"""
+                    SELECT price_ct_kwh, {", ".join(_BILLING_SUM_FIELDS)}
+                    FROM stats_hourly_billing WHERE hour_key = ?
+                    """,
+                    (hour_key,),
+                ) as cursor:
+                    previous = await cursor.fetchone()
+
                 await db.execute(
                     """
                     INSERT OR REPLACE INTO stats_hourly_billing (
@@ -681,6 +808,16 @@ class HourlyBillingAggregator:
                         hourly_data.get("data_source", "aggregator"),
                     ),
                 )
+
+                delta = self._hour_contribution(
+                    {"price_ct_kwh": hourly_data.get("price_ct_kwh", 0)}
+                    | {f: hourly_data.get(f, 0) for f in _BILLING_SUM_FIELDS}
+                )
+                if previous is not None:
+                    old = self._hour_contribution(previous)
+                    delta = {f: delta[f] - old[f] for f in _BILLING_AGG_FIELDS}
+                await self._apply_hour_delta(db, date_str, delta)
+
                 await db.commit()
 
             _LOGGER.debug(
@@ -697,22 +834,10 @@ class HourlyBillingAggregator:
 
     async def async_cleanup_old_data(self, keep_days: int = 400) -> int:
         """Remove old hourly data older than keep_days. @zara"""
-        history = await self._load_history()
         cutoff = (datetime.now() - timedelta(days=keep_days)).isoformat()[:10]
 
-        deleted = 0
-        hours_to_keep = {}
-
-        for hour_key, hour_data in history.get("hours", {}).items():
-            hour_date = hour_key[:10]
-            if hour_date >= cutoff:
-                hours_to_keep[hour_key] = hour_data
-            else:
-                deleted += 1
-
+        deleted = await self._store.async_delete_before(cutoff)
         if deleted > 0:
-            history["hours"] = hours_to_keep
-            await self._save_history(history)
             _LOGGER.info("Billing history: %d old entries deleted", deleted)
 
         return deleted
@@ -10,21 +10,19 @@
 """Monthly tariff manager for EEG and Energy Sharing support. @zara"""
 from __future__ import annotations
 
-import json
 import logging
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any
 
-import aiofiles
-
 from homeassistant.core import HomeAssistant
 
 from ..const import (
     DOMAIN,
     SFML_STATS_DATA,
-    MONTHLY_TARIFFS_FILE,
-    HOURLY_BILLING_HISTORY,
+    HISTORY_STORE_MONTHLY_TARIFFS,
+    HISTORY_STORE_HOURLY_BILLING,
+    HISTORY_STORE_DAILY_ENERGY,
     CONF_FEED_IN_TARIFF,
     CONF_BILLING_FIXED_PRICE,
     CONF_REFERENCE_PRICE,
@@ -47,6 +45,7 @@ from ..const import (
     GRID_FEE_FACTOR_LOW,
     GRID_FEE_FACTOR_VERY_LOW,
 )
+from ..storage.history_store import get_history_store
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -65,8 +64,9 @@ class MonthlyTariffManager:
         self._config_path = config_path
         self._entry_data = entry_data
         self._data_path = config_path / SFML_STATS_DATA
-        self._tariff_file = self._data_path / MONTHLY_TARIFFS_FILE
-        self._hourly_file = self._data_path / HOURLY_BILLING_HISTORY
+        self._tariff_store = get_history_store(config_path, HISTORY_STORE_MONTHLY_TARIFFS)
+        self._hourly_store = get_history_store(config_path, HISTORY_STORE_HOURLY_BILLING)
+        self._daily_store = get_history_store(config_path, HISTORY_STORE_DAILY_ENERGY)
         self._cache: dict[str, Any] | None = None
 
     def update_config(self, new_config: dict[str, Any]) -> None:
@@ -117,56 +117,30 @@ class MonthlyTariffManager:
         }
 
     async def _load_data(self) -> dict[str, Any]:
-        """Load tariff data from file. @zara"""
+        """Load tariff data from the history store. @zara"""
         if self._cache is not None:
             return self._cache
 
-        if not self._tariff_file.exists():
-            self._cache = {
-                "version": 1,
-                "defaults": self._get_defaults(),
-                "months": {},
-            }
-            return self._cache
+        document = await self._tariff_store.async_load()
+        document.setdefault("version", 1)
+        if "defaults" not in document:
+            document["defaults"] = self._get_defaults()
+        self._cache = document
+        return self._cache
 
-        try:
-            async with aiofiles.open(self._tariff_file, "r", encoding="utf-8") as f:
-                content = await f.read()
-                self._cache = json.loads(content)
-                return self._cache
-        except Exception as err:
-            _LOGGER.error("Error loading tariff data: %s", err)
-            self._cache = {
-                "version": 1,
-                "defaults": self._get_defaults(),
-                "months": {},
-            }
-            return self._cache
-
-    async def _save_data(self, data: dict[str, Any]) -> bool:
-        """Save tariff data to file. @zara"""
-        try:
-            self._data_path.mkdir(parents=True, exist_ok=True)
-            async with aiofiles.open(self._tariff_file, "w", encoding="utf-8") as f:
-                await f.write(json.dumps(data, indent=2, ensure_ascii=False))
+    async def _save_data(
+        self, data: dict[str, Any], month_key: str | None = None
+    ) -> bool:
+        """Persist the settings and, if given, one changed month. @zara"""
+        months = data.get("months", {})
+        records = {month_key: months[month_key]} if month_key in months else None
+        success = await self._tariff_store.async_save(
+            records=records,
+            meta={"version": data.get("version", 1), "defaults": data.get("defaults", {})},
+        )
+        if success:
             self._cache = data
-            return True
-        except Exception as err:
-            _LOGGER.error("Error saving tariff data: %s", err)
-            return False
-
-    async def _load_hourly_data(self) -> dict[str, Any]:
-        """Load hourly billing history data. @zara"""
-        if not self._hourly_file.exists():
-            return {"hours": {}}
-
-        try:
-            async with aiofiles.open(self._hourly_file, "r", encoding="utf-8") as f:
-                content = await f.read()
-                return json.loads(content)
-        except Exception as err:
-            _LOGGER.error("Error loading hourly data: %s", err)
-            return {"hours": {}}
+        return success
 
     def _get_month_key(self, year: int, month: int) -> str:
         """Generate month key in YYYY-MM format. @zara"""
@@ -207,8 +181,7 @@ class MonthlyTariffManager:
     ) -> dict[str, float]:
         """Calculate consumption-weighted average price for a month. @zara"""
         month_key = self._get_month_key(year, month)
-        hourly_data = await self._load_hourly_data()
-        hours = hourly_data.get("hours", {})
+        hours = await self._hourly_store.async_get_records(prefix=month_key)
 
         total_cost_ct = 0.0
         total_import_kwh = 0.0
@@ -377,7 +350,7 @@ class MonthlyTariffManager:
         data["months"][month_key]["overrides"] = existing_overrides
         data["months"][month_key]["updated_at"] = datetime.now().isoformat()
 
-        return await self._save_data(data)
+        return await self._save_data(data, month_key)
 
     async def finalize_month(
         self,
@@ -398,7 +371,7 @@ class MonthlyTariffManager:
         data["months"][month_key]["is_finalized"] = True
         data["months"][month_key]["finalized_at"] = datetime.now().isoformat()
 
-        await self._save_data(data)
+        await self._save_data(data, month_key)
 
         result = {
             "success": True,
@@ -422,7 +395,7 @@ class MonthlyTariffManager:
         if month_key in data.get("months", {}):
             data["months"][month_key]["is_finalized"] = False
             data["months"][month_key].pop("finalized_at", None)
-            return await self._save_data(data)
+            return await self._save_data(data, month_key)
 
         return True
 
@@ -438,24 +411,13 @@ class MonthlyTariffManager:
         export_price = effective["export_price_ct"]["value"]
         reference_price = effective["reference_price_ct"]["value"]
 
-        daily_file = self._data_path / "daily_energy_history.json"
-        if not daily_file.exists():
-            return {"success": False, "error": "No daily history file"}
-
-        try:
-            async with aiofiles.open(daily_file, "r", encoding="utf-8") as f:
-                content = await f.read()
-                daily_data = json.loads(content)
-        except Exception as err:
-            return {"success": False, "error": str(err)}
+        days = await self._daily_store.async_get_records(prefix=month_key)
+        if not days:
+            return {"success": False, "error": "No daily history data"}
 
         days_updated = 0
-        days = daily_data.get("days", {})
 
         for day_key, day_data in days.items():
-            if not day_key.startswith(month_key):
-                continue
-
             import_kwh = day_data.get("grid_import_kwh", 0) or 0
             export_kwh = day_data.get("grid_export_kwh", 0) or 0
             self_consumption_kwh = (
@@ -473,14 +435,12 @@ class MonthlyTariffManager:
 
             days_updated += 1
 
-        daily_data["days"] = days
-        daily_data["last_recalculation"] = datetime.now().isoformat()
-
-        try:
-            async with aiofiles.open(daily_file, "w", encoding="utf-8") as f:
-                await f.write(json.dumps(daily_data, indent=2, ensure_ascii=False))
-        except Exception as err:
-            return {"success": False, "error": str(err)}
+        saved = await self._daily_store.async_save(
+            records=days,
+            meta={"last_recalculation": datetime.now().isoformat()},
+        )
+        if not saved:
+            return {"success": False, "error": "Saving daily history failed"}
 
         _LOGGER.info(
             "Recalculated %d days for %s with import=%.2f, export=%.2f, ref=%.2f ct/kWh",
@@ -11,5 +11,6 @@
 from __future__ import annotations
 
 from .data_validator import DataValidator
+from .history_store import HistoryStore, get_history_store
 
-__all__ = ["DataValidator"]
+__all__ = ["DataValidator", "HistoryStore", "get_history_store"]
@@ -7,7 +7,11 @@
 # * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
 # ******************************************************************************
 
-"""Centralized database connection manager for SFML Stats. @zara"""
+"""Centralized database connection manager for SFML Stats. @zara
+
+Connections come from the process-wide access layer in db_access, which is
+shared with Grid Price Monitor and ML Weather.
+"""
 from __future__ import annotations
 
 import asyncio
@@ -19,6 +23,7 @@ from typing import TYPE_CHECKING, AsyncIterator
 import aiosqlite
 
 from ..const import SOLAR_FORECAST_DB
+from .db_access import SharedDatabase, async_acquire_database, async_release_database
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -28,25 +33,59 @@ _LOGGER = logging.getLogger(__name__)
 
 def get_manager() -> DatabaseConnectionManager | None:
     """Get the current database manager instance if available. @zara"""
-    instance = DatabaseConnectionManager._instance
-    _LOGGER.debug("get_manager() called, returning: %s (connected: %s)",
-                  instance is not None,
-                  instance.is_connected if instance else False)
-    return instance
+    return DatabaseConnectionManager._instance
+
+
+@asynccontextmanager
+async def db_connection(db_path: Path) -> AsyncIterator[aiosqlite.Connection]:
+    """Serialized write transaction on the shared writer, short-lived fallback before setup. @zara
+
+    The block holds the shared write lock, so it must not open another
+    db_connection. It commits on exit and rolls back on an exception;
+    reads belong on db_read_connection.
+    """
+    manager = get_manager()
+    if manager is not None and manager.is_connected:
+        async with manager.get_connection_ctx() as conn:
+            yield conn
+        return
+    _LOGGER.debug("Database manager not available, using short-lived connection")
+    async with aiosqlite.connect(str(db_path)) as conn:
+        conn.row_factory = aiosqlite.Row
+        try:
+            yield conn
+        except BaseException:
+            await conn.rollback()
+            raise
+        await conn.commit()
+
+
+@asynccontextmanager
+async def db_read_connection(db_path: Path) -> AsyncIterator[aiosqlite.Connection]:
+    """Pooled read-only connection, short-lived fallback before setup. @zara"""
+    manager = get_manager()
+    if manager is not None and manager.is_connected:
+        async with manager.read_connection() as conn:
+            yield conn
+        return
+    _LOGGER.debug("Database manager not available, using short-lived connection")
+    async with aiosqlite.connect(str(db_path)) as conn:
+        conn.row_factory = aiosqlite.Row
+        yield conn
 
 
 class DatabaseConnectionManager:
-    """Singleton manager for SQLite database connections. @zara"""
+    """Singleton handle on the shared solar_forecast.db access layer. @zara"""
 
     _instance: DatabaseConnectionManager | None = None
     _lock: asyncio.Lock = asyncio.Lock()
 
-    def __init__(self, config_path: Path) -> None:
+    def __init__(self, hass: HomeAssistant, config_path: Path) -> None:
         """Initialize the database connection manager. @zara"""
+        self._hass = hass
         self._config_path = config_path
         self._db_path = config_path / SOLAR_FORECAST_DB
-        self._connection: aiosqlite.Connection | None = None
-        self._is_connected = False
+        self._shared: SharedDatabase | None = None
 
     @classmethod
     async def get_instance(cls, hass: HomeAssistant) -> DatabaseConnectionManager:
@@ -55,7 +94,7 @@ class DatabaseConnectionManager:
             async with cls._lock:
                 if cls._instance is None:
                     config_path = Path(hass.config.path())
-                    cls._instance = cls(config_path)
+                    cls._instance = cls(hass, config_path)
                     await cls._instance.connect()
         return cls._instance
 
@@ -81,11 +120,16 @@ class DatabaseConnectionManager:
     @property
     def is_connected(self) -> bool:
         """Check if connection is active. @zara"""
-        return self._is_connected and self._connection is not None
+        return self._shared is not None and self._shared.is_open
+
+    @property
+    def shared(self) -> SharedDatabase | None:
+        """Return the shared access layer. @zara"""
+        return self._shared
 
     async def connect(self) -> bool:
-        """Establish database connection. @zara"""
-        if self._is_connected and self._connection is not None:
+        """Take a reference on the shared database. @zara"""
+        if self.is_connected:
             _LOGGER.debug("Database already connected")
             return True
 
@@ -94,100 +138,56 @@ class DatabaseConnectionManager:
             return False
 
         try:
-            self._connection = await aiosqlite.connect(str(self._db_path))
-            self._connection.row_factory = aiosqlite.Row
-            self._is_connected = True
+            self._shared = await async_acquire_database(self._hass, self._db_path)
             _LOGGER.info("Database connection established: %s", self._db_path)
             return True
         except Exception as err:
             _LOGGER.error("Failed to connect to database: %s", err)
-            self._connection = None
-            self._is_connected = False
+            self._shared = None
             return False
 
     async def close(self) -> None:
-        """Close database connection. @zara"""
-        if self._connection is not None:
+        """Release the reference on the shared database. @zara"""
+        if self._shared is not None:
             try:
-                await self._connection.close()
+                await async_release_database(self._hass, self._db_path)
                 _LOGGER.info("Database connection closed")
             except Exception as err:
                 _LOGGER.error("Error closing database connection: %s", err)
             finally:
-                self._connection = None
-                self._is_connected = False
-
-    async def execute(self, query: str, params: tuple | list | None = None):
-        """Execute a query and return cursor. @zara"""
-        if not self.is_connected:
-            raise RuntimeError("Database not connected")
-
-        if params is None:
-            params = []
+                self._shared = None
 
-        return self._connection.execute(query, params)
-
-    async def get_connection(self) -> aiosqlite.Connection:
-        """Get the active database connection. @zara"""
-        if not self.is_connected:
-            raise RuntimeError("Database not connected")
-        return self._connection
+    @asynccontextmanager
+    async def read_connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a pooled read-only connection. @zara"""
+        if not await self._ensure_connected():
+            raise RuntimeError("Database not available")
+        async with self._shared.read() as conn:
+            yield conn
 
     async def _ensure_connected(self) -> bool:
         """Verify connection is alive, reconnect if needed. @zara"""
-        if self._connection is not None:
-            try:
-                await self._connection.execute("SELECT 1")
-                return True
-            except Exception:
-                _LOGGER.warning("Database connection lost, attempting reconnect")
-                self._connection = None
-                self._is_connected = False
-
+        if self.is_connected:
+            return True
+        self._shared = None
         return await self.connect()
 
     async def execute_read(self, query: str, params: tuple | list | None = None) -> list[aiosqlite.Row]:
-        """Execute a read query with auto-reconnect. @zara"""
-        if params is None:
-            params = []
-
-        for attempt in range(2):
-            if not await self._ensure_connected():
-                raise RuntimeError("Database not available")
-            try:
-                async with self._connection.execute(query, params) as cursor:
-                    return await cursor.fetchall()
-            except aiosqlite.OperationalError as err:
-                if attempt == 0 and "database is locked" not in str(err):
-                    _LOGGER.warning("Read query failed (attempt 1), retrying: %s", err)
-                    self._connection = None
-                    self._is_connected = False
-                    continue
-                raise
+        """Execute a read query on the read pool. @zara"""
+        if not await self._ensure_connected():
+            raise RuntimeError("Database not available")
+        return await self._shared.fetchall(query, params or [])
 
     async def execute_write(self, query: str, params: tuple | list | None = None) -> None:
-        """Execute a write query with auto-commit and auto-reconnect. @zara"""
-        if params is None:
-            params = []
-
-        for attempt in range(2):
-            if not await self._ensure_connected():
-                raise RuntimeError("Database not available")
-            try:
-                await self._connection.execute(query, params)
-                await self._connection.commit()
-                return
-            except aiosqlite.OperationalError as err:
-                if attempt == 0 and "database is locked" not in str(err):
-                    _LOGGER.warning("Write query failed (attempt 1), retrying: %s", err)
-                    self._connection = None
-                    self._is_connected = False
-                    continue
-                raise
+        """Execute a write query in its own serialized transaction. @zara"""
+        if not await self._ensure_connected():
+            raise RuntimeError("Database not available")
+        await self._shared.execute_write(query, params or [])
 
     @asynccontextmanager
     async def get_connection_ctx(self) -> AsyncIterator[aiosqlite.Connection]:
-        """Context manager for multi-statement operations. @zara"""
+        """Context manager for multi-statement write transactions. @zara"""
         if not await self._ensure_connected():
             raise RuntimeError("Database not available")
-        yield self._connection
+        async with self._shared.write() as conn:
+            yield conn
@@ -0,0 +1,338 @@
+# ******************************************************************************
+# @copyright (C) 2026 Zara-Toorox - Solar Forecast Stats x86 DB-Version part of Solar Forecast ML DB
+# * This program is protected by a Proprietary Non-Commercial License.
+# 1. Personal and Educational use only.
+# 2. COMMERCIAL USE AND AI TRAINING ARE STRICTLY PROHIBITED.
+# 3. Clear attribution to "Zara-Toorox" is required.
+# * Full license terms: https://github.com/Zara-Toorox/ha-solar-forecast-ml/blob/main/LICENSE
+# ******************************************************************************
+
+"""Record-level SQLite storage for the SFML Stats history documents. @zara
+
+The collectors used to rewrite a whole JSON document on every update. Each
+document is now stored as one row per record (hour, day or month) plus a few
+meta rows, so an update only upserts what changed. The legacy JSON file is
+imported once and kept as ``<file>.migrated``.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+import aiofiles
+import aiosqlite
+
+from ..const import (
+    SFML_STATS_DATA,
+    SOLAR_FORECAST_DB,
+    HOURLY_BILLING_HISTORY,
+    DAILY_ENERGY_HISTORY,
+    EXTERNAL_FORECASTS_HISTORY,
+    MONTHLY_TARIFFS_FILE,
+    HISTORY_STORE_HOURLY_BILLING,
+    HISTORY_STORE_DAILY_ENERGY,
+    HISTORY_STORE_FORECAST_COMPARISON,
+    HISTORY_STORE_MONTHLY_TARIFFS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Store name -> (records key in the legacy document, legacy JSON file) @zara
+HISTORY_STORES: dict[str, tuple[str, str]] = {
+    HISTORY_STORE_HOURLY_BILLING: ("hours", HOURLY_BILLING_HISTORY),
+    HISTORY_STORE_DAILY_ENERGY: ("days", DAILY_ENERGY_HISTORY),
+    HISTORY_STORE_FORECAST_COMPARISON: ("days", EXTERNAL_FORECASTS_HISTORY),
+    HISTORY_STORE_MONTHLY_TARIFFS: ("months", MONTHLY_TARIFFS_FILE),
+}
+
+_KIND_RECORD = "r"
+_KIND_META = "m"
+_MIGRATED_META_KEY = "__migrated__"
+
+_stores: dict[tuple[str, str], HistoryStore] = {}
+
+
+def get_history_store(config_path: Path, name: str) -> HistoryStore:
+    """Return the shared store for a history document. @zara"""
+    key = (str(config_path), name)
+    store = _stores.get(key)
+    if store is None:
+        store = _stores[key] = HistoryStore(config_path, name)
+    return store
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+class HistoryStore:
+    """One history document stored record by record in stats_history_records. @zara"""
+
+    def __init__(self, config_path: Path, name: str) -> None:
+        """Initialize the store. @zara"""
+        if name not in HISTORY_STORES:
+            raise ValueError(f"Unknown history store: {name}")
+        self._name = name
+        self._records_key, legacy_name = HISTORY_STORES[name]
+        self._legacy_file = config_path / SFML_STATS_DATA / legacy_name
+        self._db_path = config_path / SOLAR_FORECAST_DB
+        self._ready = False
+        self._ready_lock = asyncio.Lock()
+
+    @property
+    def name(self) -> str:
+        """Return the store name. @zara"""
+        return self._name
+
+    @property
+    def records_key(self) -> str:
+        """Return the records key of the legacy document. @zara"""
+        return self._records_key
+
+    @property
+    def is_available(self) -> bool:
+        """Check if the database file exists. @zara"""
+        return self._db_path.exists()
+
+    @asynccontextmanager
+    async def _get_db(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Run a serialized write transaction on the shared writer. @zara"""
+        from .db_connection_manager import db_connection
+        async with db_connection(self._db_path) as conn:
+            yield conn
+
+    @asynccontextmanager
+    async def _get_read_db(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a pooled read-only DB connection. @zara"""
+        from .db_connection_manager import db_read_connection
+        async with db_read_connection(self._db_path) as conn:
+            yield conn
+
+    async def _ensure_ready(self, db: aiosqlite.Connection) -> None:
+        """Create the table and import the legacy JSON file once. @zara"""
+        if self._ready:
+            return
+
+        async with self._ready_lock:
+            if self._ready:
+                return
+
+            await db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS stats_history_records (
+                    store TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    record_key TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (store, kind, record_key)
+                ) WITHOUT ROWID
+                """
+            )
+
+            async with db.execute(
+                "SELECT 1 FROM stats_history_records WHERE store = ? AND kind = ? AND record_key = ?",
+                (self._name, _KIND_META, _MIGRATED_META_KEY),
+            ) as cursor:
+                migrated = await cursor.fetchone() is not None
+
+            imported = False
+            if not migrated:
+                imported = await self._migrate_legacy_file(db)
+
+            await db.commit()
+
+            # Only a committed import may retire the legacy file; otherwise
+            # the next start retries the migration @zara
+            if imported:
+                await self._archive_legacy_file()
+            self._ready = True
+
+    async def _async_prepare(self) -> None:
+        """Run _ensure_ready in a write transaction before reading. @zara"""
+        if self._ready:
+            return
+        async with self._get_db() as db:
+            await self._ensure_ready(db)
+
+    async def _migrate_legacy_file(self, db: aiosqlite.Connection) -> bool:
+        """Import the legacy JSON document into stats_history_records. @zara
+
+        Returns:
+            True if the rows including the migrated marker were written,
+            False if the legacy file could not be read (nothing written)
+        """
+        document: dict[str, Any] = {}
+        if self._legacy_file.exists():
+            try:
+                async with aiofiles.open(self._legacy_file, "r", encoding="utf-8") as f:
+                    document = json.loads(await f.read())
+                if not isinstance(document, dict):
+                    raise ValueError(f"unexpected top-level {type(document).__name__}")
+            except Exception as err:
+                _LOGGER.error(
+                    "Error reading %s for migration, will retry on next start: %s",
+                    self._legacy_file, err,
+                )
+                return False
+
+        records = document.pop(self._records_key, None) or {}
+        meta = {**document, _MIGRATED_META_KEY: True}
+
+        await db.executemany(
+            "INSERT OR REPLACE INTO stats_history_records (store, kind, record_key, payload) "
+            "VALUES (?, ?, ?, ?)",
+            [(self._name, _KIND_RECORD, k, _dumps(v)) for k, v in records.items()]
+            + [(self._name, _KIND_META, k, _dumps(v)) for k, v in meta.items()],
+        )
+
+        if records or document:
+            _LOGGER.info(
+                "Migrated %s to database: %d records", self._legacy_file.name, len(records)
+            )
+        return True
+
+    async def _archive_legacy_file(self) -> None:
+        """Keep the imported JSON file as <file>.migrated. @zara"""
+        if not self._legacy_file.exists():
+            return
+
+        migrated_file = self._legacy_file.with_name(self._legacy_file.name + ".migrated")
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._legacy_file.replace, migrated_file
+            )
+        except OSError as err:
+            _LOGGER.warning("Could not rename %s: %s", self._legacy_file, err)
+
+    async def async_get_records(
+        self,
+        start: str | None = None,
+        end: str | None = None,
+        prefix: str | None = None,
+    ) -> dict[str, Any]:
+        """Return records ordered by key, optionally within [start, end] or by prefix. @zara"""
+        if not self.is_available:
+            return {}
+
+        conditions = ["store = ?", "kind = ?"]
+        params: list[Any] = [self._name, _KIND_RECORD]
+        if prefix is not None:
+            # Keys are ASCII dates/months, so a key range replaces LIKE prefix% @zara
+            conditions.append("record_key >= ? AND record_key < ?")
+            params.extend([prefix, prefix + "\uffff"])
+        if start is not None:
+            conditions.append("record_key >= ?")
+            params.append(start)
+        if end is not None:
+            conditions.append("record_key <= ?")
+            params.append(end)
+
+        try:
+            await self._async_prepare()
+            async with self._get_read_db() as db:
+                async with db.execute(
+                    f"SELECT record_key, payload FROM stats_history_records "
+                    f"WHERE {' AND '.join(conditions)} ORDER BY record_key",
+                    params,
+                ) as cursor:
+                    rows = await cursor.fetchall()
+        except Exception as err:
+            _LOGGER.error("Error reading history store %s: %s", self._name, err)
+            return {}
+
+        return {row[0]: json.loads(row[1]) for row in rows}
+
+    async def async_get_record(self, key: str) -> Any | None:
+        """Return a single record or None. @zara"""
+        records = await self.async_get_records(start=key, end=key)
+        return records.get(key)
+
+    async def async_get_meta(self) -> dict[str, Any]:
+        """Return the meta values of the document. @zara"""
+        if not self.is_available:
+            return {}
+
+        try:
+            await self._async_prepare()
+            async with self._get_read_db() as db:
+                async with db.execute(
+                    "SELECT record_key, payload FROM stats_history_records "
+                    "WHERE store = ? AND kind = ?",
+                    (self._name, _KIND_META),
+                ) as cursor:
+                    rows = await cursor.fetchall()
+        except Exception as err:
+            _LOGGER.error("Error reading history store %s: %s", self._name, err)
+            return {}
+
+        return {row[0]: json.loads(row[1]) for row in rows if row[0] != _MIGRATED_META_KEY}
+
+    async def async_load(self) -> dict[str, Any]:
+        """Return the whole document in its legacy JSON shape. @zara"""
+        document = await self.async_get_meta()
+        document[self._records_key] = await self.async_get_records()
+        return document
+
+    async def async_save(
+        self,
+        records: dict[str, Any] | None = None,
+        meta: dict[str, Any] | None = None,
+    ) -> bool:
+        """Upsert the given records and meta values in one transaction. @zara"""
+        if not self.is_available:
+            _LOGGER.debug("DB not available, skipping history store %s write", self._name)
+            return False
+
+        rows = [
+            (self._name, _KIND_RECORD, key, _dumps(value))
+            for key, value in (records or {}).items()
+        ] + [
+            (self._name, _KIND_META, key, _dumps(value))
+            for key, value in (meta or {}).items()
+        ]
+        if not rows:
+            return True
+
+        try:
+            async with self._get_db() as db:
+                await self._ensure_ready(db)
+                await db.executemany(
+                    """
+                    INSERT INTO stats_history_records (store, kind, record_key, payload)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(store, kind, record_key) DO UPDATE SET
+                        payload = excluded.payload,
+                        updated_at = CURRENT_TIMESTAMP
+                    """,
+                    rows,
+                )
+                await db.commit()
+            return True
+        except Exception as err:
+            _LOGGER.error("Error saving history store %s: %s", self._name, err)
+            return False
+
+    async def async_delete_before(self, key: str) -> int:
+        """Delete all records with a key lower than the given one. @zara"""
+        if not self.is_available:
+            return 0
+
+        try:
+            async with self._get_db() as db:
+                await self._ensure_ready(db)
+                cursor = await db.execute(
+                    "DELETE FROM stats_history_records "
+                    "WHERE store = ? AND kind = ? AND record_key < ?",
+                    (self._name, _KIND_RECORD, key),
+                )
+                deleted = cursor.rowcount
+                await db.commit()
+            return deleted
+        except Exception as err:
+            _LOGGER.error("Error cleaning history store %s: %s", self._name, err)
+            return 0
@@ -10,7 +10,7 @@
 """Utilities module for SFML Stats. @zara"""
 from __future__ import annotations
 
-from .cache import TTLCache, get_json_cache
+from .cache import ResponseCache, TTLCache, get_json_cache, get_response_cache
 from .file_ops import (
     read_json_safe,
     write_json_safe,
@@ -19,8 +19,10 @@ from .file_ops import (
 )
 
 __all__ = [
+    "ResponseCache",
     "TTLCache",
     "get_json_cache",
+    "get_response_cache",
     "read_json_safe",
     "write_json_safe",
     "append_to_file_safe",
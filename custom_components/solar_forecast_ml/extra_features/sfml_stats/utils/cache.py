@@ -12,16 +12,31 @@ from __future__ import annotations
 
 import asyncio
 import functools
+import hashlib
 import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Callable, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Mapping, TypeVar
 
-from ..const import API_CACHE_TTL_SECONDS
+from ..const import (
+    API_CACHE_TTL_SECONDS,
+    CACHE_TAG_GPM,
+    CACHE_TAG_SFML,
+    RESPONSE_CACHE_MAX_ENTRIES,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+SFML_DOMAIN = "solar_forecast_ml"
+GPM_DOMAIN = "grid_price_monitor"
+
 
 class TTLCache:
     """Simple TTL cache for async functions. @zara"""
@@ -111,3 +126,145 @@ _json_file_cache = TTLCache(ttl_seconds=API_CACHE_TTL_SECONDS)
 def get_json_cache() -> TTLCache:
     """Get the global JSON file cache instance. @zara"""
     return _json_file_cache
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Rendered API response body with its validator. @zara"""
+
+    body: bytes
+    content_type: str
+    charset: str | None
+    etag: str
+    created: float
+    tags: frozenset[str]
+
+
+class ResponseCache:
+    """Tag-invalidated cache for rendered API responses. @zara
+
+    Entries are keyed by view name and query string and expire after the
+    view's TTL or as soon as one of their tags is invalidated, e.g. when the
+    SFML or GPM coordinator publishes an update.
+    """
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES) -> None:
+        """Initialize the response cache. @zara"""
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._max_entries = max_entries
+        self._source_unsubs: dict[int, Callable[[], None]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(view_name: str, path: str, query: Mapping[str, str]) -> str:
+        """Build a stable key from view name, path and query parameters. @zara"""
+        return f"{view_name}:{path}?" + "&".join(f"{k}={v}" for k, v in sorted(query.items()))
+
+    def get(self, key: str, ttl_seconds: float) -> CachedResponse | None:
+        """Return a fresh entry or None. @zara"""
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry.created < ttl_seconds:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(
+        self,
+        key: str,
+        body: bytes,
+        content_type: str,
+        charset: str | None,
+        tags: tuple[str, ...] | frozenset[str],
+    ) -> CachedResponse:
+        """Store a rendered body and return the entry with its ETag. @zara"""
+        entry = CachedResponse(
+            body=body,
+            content_type=content_type,
+            charset=charset,
+            etag='"' + hashlib.sha1(body).hexdigest() + '"',
+            created=time.monotonic(),
+            tags=frozenset(tags),
+        )
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def invalidate_tags(self, *tags: str) -> int:
+        """Drop every entry carrying one of the given tags. @zara"""
+        wanted = set(tags)
+        stale = [key for key, entry in self._entries.items() if entry.tags & wanted]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            self.invalidations += len(stale)
+            _LOGGER.debug("Response cache: invalidated %d entries for %s", len(stale), tags)
+        return len(stale)
+
+    def clear(self) -> int:
+        """Drop all entries. @zara"""
+        count = len(self._entries)
+        self._entries.clear()
+        return count
+
+    def attach_sources(self, hass: HomeAssistant | None) -> None:
+        """Subscribe to SFML/GPM coordinator updates not yet tracked. @zara
+
+        Called lazily from the cached views because the source integrations
+        may finish loading after SFML Stats registered its views.
+        """
+        if hass is None:
+            return
+
+        seen: set[int] = set()
+        for domain, tag in ((SFML_DOMAIN, CACHE_TAG_SFML), (GPM_DOMAIN, CACHE_TAG_GPM)):
+            for coordinator in list(hass.data.get(domain, {}).values()):
+                add_listener = getattr(coordinator, "async_add_listener", None)
+                if add_listener is None:
+                    continue
+                seen.add(id(coordinator))
+                if id(coordinator) in self._source_unsubs:
+                    continue
+                self._source_unsubs[id(coordinator)] = add_listener(
+                    functools.partial(self.invalidate_tags, tag)
+                )
+                _LOGGER.debug("Response cache: listening to %s coordinator updates", domain)
+
+        for coordinator_id in set(self._source_unsubs) - seen:
+            self._source_unsubs.pop(coordinator_id)
+
+    def detach_sources(self) -> None:
+        """Remove all coordinator listeners. @zara"""
+        for unsub in self._source_unsubs.values():
+            try:
+                unsub()
+            except Exception:
+                pass
+        self._source_unsubs.clear()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters. @zara"""
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "invalidations": self.invalidations,
+        }
+
+
+_response_cache = ResponseCache()
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the global API response cache instance. @zara"""
+    return _response_cache
@@ -56,6 +56,7 @@ from .sensors.sensor_diagnostic import (
     MLMetricsSensor,
     NextProductionStartSensor,
     PhysicsSamplesSensor,
+    UpdateProfileSensor,
 )
 
 from .sensors.sensor_states import (
@@ -149,6 +150,7 @@ async def async_setup_entry(
             AIRmseSensor(coordinator, entry),
             ActivePredictionModelSensor(coordinator, entry),
             PhysicsSamplesSensor(coordinator, entry),
+            UpdateProfileSensor(coordinator, entry),
         ]
         entities_to_add.extend(diagnostic_entities)
         _LOGGER.info(
@@ -202,6 +204,7 @@ async def _cleanup_orphaned_entities(
         "active_prediction_model",
         "pattern_count",
         "physics_samples",
+        "update_profile",
     ]
 
     entities_removed = 0
@@ -18,7 +18,7 @@ All sensors use DatabaseManager for state persistence.
 """
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Any, Dict, Optional
 
 from homeassistant.components.sensor import (
@@ -43,37 +43,11 @@ from ..const import (
     CONF_TOTAL_CONSUMPTION_TODAY,
     CONF_GRID_IMPORT_TODAY,
     CONF_GRID_EXPORT_TODAY,
-    # Coordinator Data Keys
-    DATA_KEY_FORECAST_TODAY,
-    DATA_KEY_FORECAST_DAY_AFTER,
-    DATA_KEY_PRODUCTION_TIME,
-    DATA_KEY_PEAK_TODAY,
-    DATA_KEY_EXPECTED_DAILY_PRODUCTION,
-    DATA_KEY_STATISTICS,
-    # Sub-Keys
-    PROD_TIME_DURATION_SECONDS,
-    PEAK_TODAY_POWER_W,
-    STATS_ALL_TIME_PEAK,
-    STATS_CURRENT_MONTH,
-    STATS_CURRENT_WEEK,
-    STATS_LAST_7_DAYS,
-    STATS_LAST_30_DAYS,
-    STATS_AVG_ACCURACY,
-    STATS_YIELD_KWH,
-    STATS_AVG_YIELD_KWH,
-    STATS_CONSUMPTION_KWH,
-    # Cache Keys
-    CACHE_HOURLY_PREDICTIONS,
-    CACHE_PREDICTIONS,
-    CACHE_BEST_HOUR_TODAY,
-    # Prediction Keys
-    PRED_TARGET_DATE,
-    PRED_TARGET_HOUR,
-    PRED_PREDICTION_KWH,
-    PRED_PREDICTED_KWH,
 )
 from ..coordinator import SolarForecastMLCoordinator
+from ..core.core_coordinator_snapshot import CoordinatorSnapshot
 from ..data.db_manager import DatabaseManager
+from .sensor_mixins import SnapshotSensorMixin
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -110,7 +84,7 @@ class BaseSolarSensor(CoordinatorEntity, SensorEntity):
         return self.coordinator.last_update_success and self.coordinator.data is not None
 
 
-class SolarForecastSensor(SensorEntity):
+class SolarForecastSensor(SnapshotSensorMixin, SensorEntity):
     """Sensor for today's or tomorrow's solar forecast using DB. @zara"""
 
     _attr_has_entity_name = True
@@ -122,6 +96,7 @@ class SolarForecastSensor(SensorEntity):
         self.entry = entry
         self._key = key
         self._cached_tomorrow_value: float = 0.0
+        self._snapshot: Optional[CoordinatorSnapshot] = None
 
         self._key_mapping = {
             "remaining": {"data_key": "prediction_kwh", "translation_key": "today_forecast"},
@@ -157,78 +132,35 @@ class SolarForecastSensor(SensorEntity):
         """Return if entity is available. @zara"""
         return True
 
-    async def _load_tomorrow_from_db(self) -> None:
-        """Load tomorrow forecast directly from daily_forecasts DB table. @zara"""
-        try:
-            db = self._coordinator.data_manager._db_manager
-            if not db:
-                return
-            from homeassistant.util import dt as dt_util
-            tomorrow_str = (dt_util.now() + timedelta(days=1)).date().isoformat()
-            row = await db.fetchone(
-                """SELECT prediction_kwh FROM daily_forecasts
-                   WHERE forecast_type = 'tomorrow' AND forecast_date = ?""",
-                (tomorrow_str,)
-            )
-            if row and row[0] is not None:
-                self._cached_tomorrow_value = round(float(row[0]), 2)
-            elif self._coordinator.data:
-                self._cached_tomorrow_value = self._coordinator.data.get(self._data_key) or 0.0
-        except Exception as e:
-            _LOGGER.warning("Failed to load tomorrow forecast from DB: %s", e)
-            if self._coordinator.data:
-                self._cached_tomorrow_value = self._coordinator.data.get(self._data_key) or 0.0
+    @callback
+    def apply_snapshot(self, snapshot: CoordinatorSnapshot) -> None:
+        """Keep the snapshot; tomorrow is taken from it directly. @zara"""
+        self._snapshot = snapshot
+        if self._key == "tomorrow":
+            self._cached_tomorrow_value = snapshot.forecast_tomorrow_kwh
 
     @property
     def native_value(self) -> float:
-        """Return the forecast value from DB. @zara"""
+        """Return the forecast value from the coordinator snapshot. @zara"""
         if self._key == "tomorrow":
             return self._cached_tomorrow_value
 
-        # For remaining today, calculate from hourly predictions in coordinator cache
+        # For remaining today, sum the hourly predictions of the snapshot
         production_time_sensor = self.hass.states.get(f"sensor.{DOMAIN}_production_time")
         if production_time_sensor and production_time_sensor.state == "00:00:00":
             return 0.0
 
-        try:
-            from homeassistant.util import dt as dt_util
-
-            hourly_data = getattr(self._coordinator, CACHE_HOURLY_PREDICTIONS, None)
-            if not hourly_data or not isinstance(hourly_data, dict):
-                return 0.0
-
-            predictions = hourly_data.get(CACHE_PREDICTIONS, [])
-            if not predictions:
-                return 0.0
-
-            now = dt_util.now()
-            current_hour = now.hour
-            today_str = now.strftime("%Y-%m-%d")
-
-            remaining_kwh = 0.0
-            for pred in predictions:
-                if (
-                    pred.get(PRED_TARGET_DATE) == today_str
-                    and pred.get(PRED_TARGET_HOUR, -1) >= current_hour
-                ):
-                    kwh = pred.get(PRED_PREDICTION_KWH) or pred.get(PRED_PREDICTED_KWH, 0.0)
-                    remaining_kwh += kwh if kwh is not None else 0.0
+        if self._snapshot is None:
+            return 0.0
 
-            return round(remaining_kwh, 2)
+        from homeassistant.util import dt as dt_util
 
-        except Exception as e:
-            _LOGGER.warning(f"Failed to calculate remaining from hourly predictions: {e}")
-            return 0.0
+        return self._snapshot.remaining_today_kwh(dt_util.now())
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass. @zara"""
         await super().async_added_to_hass()
 
-        if self._key == "tomorrow":
-            await self._load_tomorrow_from_db()
-
-        self.async_on_remove(self._coordinator.async_add_listener(self._handle_coordinator_update))
-
         if self._key == "remaining":
             production_time_entity = f"sensor.{DOMAIN}_production_time"
             self.async_on_remove(
@@ -237,28 +169,13 @@ class SolarForecastSensor(SensorEntity):
                 )
             )
 
-        self.async_write_ha_state()
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle coordinator updates. @zara"""
-        if self._key == "tomorrow":
-            self.hass.async_create_task(self._reload_tomorrow_and_update())
-        else:
-            self.async_write_ha_state()
-
-    async def _reload_tomorrow_and_update(self) -> None:
-        """Reload tomorrow value from DB and update state. @zara"""
-        await self._load_tomorrow_from_db()
-        self.async_write_ha_state()
-
     @callback
     def _handle_production_time_change(self, event) -> None:
         """Handle production time sensor changes. @zara"""
-        self.async_write_ha_state()
+        self._async_write_state_if_changed()
 
 
-class NextHourSensor(SensorEntity):
+class NextHourSensor(SnapshotSensorMixin, SensorEntity):
     """Sensor for the next hour's solar forecast from DB. @zara"""
 
     _attr_has_entity_name = True
@@ -310,72 +227,20 @@ class NextHourSensor(SensorEntity):
 
         return attributes
 
-    async def _load_from_db(self) -> None:
-        """Load next hour forecast from coordinator cache. @zara"""
-        try:
-            from homeassistant.util import dt as dt_util
-
-            hourly_data = getattr(self._coordinator, CACHE_HOURLY_PREDICTIONS, None)
-            if not hourly_data or not isinstance(hourly_data, dict):
-                self._cached_value = None
-                self._upcoming_hours = []
-                return
-
-            predictions = hourly_data.get(CACHE_PREDICTIONS, [])
-            if not predictions:
-                self._cached_value = None
-                self._upcoming_hours = []
-                return
-
-            now_local = dt_util.now()
-            today = now_local.date().isoformat()
-            current_hour = now_local.hour
-
-            upcoming_predictions = [
-                pred
-                for pred in predictions
-                if pred.get(PRED_TARGET_DATE) == today and pred.get(PRED_TARGET_HOUR, -1) > current_hour
-            ]
-
-            upcoming_predictions.sort(key=lambda p: p.get(PRED_TARGET_HOUR, 0))
-
-            self._upcoming_hours = [
-                {
-                    "time": f"{pred.get(PRED_TARGET_HOUR, 0):02d}:00",
-                    "kwh": pred.get(PRED_PREDICTION_KWH, 0.0),
-                }
-                for pred in upcoming_predictions
-            ]
-
-            if upcoming_predictions:
-                self._cached_value = upcoming_predictions[0].get(PRED_PREDICTION_KWH, 0.0)
-            else:
-                self._cached_value = 0.0
-
-        except Exception as e:
-            _LOGGER.warning(f"Failed to load NextHourSensor: {e}")
-            self._cached_value = None
-            self._upcoming_hours = []
-
-    async def async_added_to_hass(self) -> None:
-        """Setup sensor with DB loading. @zara"""
-        await super().async_added_to_hass()
-        await self._load_from_db()
-        self.async_on_remove(self._coordinator.async_add_listener(self._handle_coordinator_update))
-        self.async_write_ha_state()
-
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle coordinator updates. @zara"""
-        self.hass.async_create_task(self._reload_and_update())
+    def apply_snapshot(self, snapshot: CoordinatorSnapshot) -> None:
+        """Take the upcoming hours of today from the snapshot. @zara"""
+        from homeassistant.util import dt as dt_util
 
-    async def _reload_and_update(self) -> None:
-        """Reload value and update state. @zara"""
-        await self._load_from_db()
-        self.async_write_ha_state()
+        now_local = dt_util.now()
+        self._upcoming_hours = [
+            {"time": f"{hour:02d}:00", "kwh": kwh}
+            for hour, kwh in snapshot.hours_from(now_local, now_local.hour + 1)
+        ]
+        self._cached_value = self._upcoming_hours[0]["kwh"] if self._upcoming_hours else None
 
 
-class PeakProductionHourSensor(SensorEntity):
+class PeakProductionHourSensor(SnapshotSensorMixin, SensorEntity):
     """Sensor showing best production hour. @zara"""
 
     _attr_has_entity_name = True
@@ -404,43 +269,10 @@ class PeakProductionHourSensor(SensorEntity):
         """Return peak hour or '--:--' if no data. @zara"""
         return self._cached_value if self._cached_value is not None else "--:--"
 
-    async def _load_from_db(self) -> None:
-        """Load best hour from coordinator cache. @zara"""
-        try:
-            hourly_data = getattr(self._coordinator, CACHE_HOURLY_PREDICTIONS, None)
-            if not hourly_data:
-                self._cached_value = None
-                return
-
-            best_hour_data = hourly_data.get(CACHE_BEST_HOUR_TODAY, {})
-            if best_hour_data:
-                hour = best_hour_data.get("hour")
-                if hour is not None:
-                    self._cached_value = f"{hour:02d}:00"
-                    return
-
-            self._cached_value = None
-
-        except Exception as e:
-            _LOGGER.warning(f"Failed to load PeakProductionHourSensor: {e}")
-            self._cached_value = None
-
-    async def async_added_to_hass(self) -> None:
-        """Setup sensor. @zara"""
-        await super().async_added_to_hass()
-        await self._load_from_db()
-        self.async_on_remove(self._coordinator.async_add_listener(self._handle_coordinator_update))
-        self.async_write_ha_state()
-
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle coordinator updates. @zara"""
-        self.hass.async_create_task(self._reload_and_update())
-
-    async def _reload_and_update(self) -> None:
-        """Reload value and update state. @zara"""
-        await self._load_from_db()
-        self.async_write_ha_state()
+    def apply_snapshot(self, snapshot: CoordinatorSnapshot) -> None:
+        """Take the best hour of today from the snapshot. @zara"""
+        self._cached_value = snapshot.best_hour
 
 
 class AverageYieldSensor(BaseSolarSensor):
@@ -462,7 +294,7 @@ class AverageYieldSensor(BaseSolarSensor):
         return value if value is not None and value > 0 else None
 
 
-class AutarkySensor(SensorEntity):
+class AutarkySensor(SnapshotSensorMixin, SensorEntity):
     """Sensor for the calculated self-sufficiency (Autarky) with live updates. @zara"""
 
     _attr_has_entity_name = True
@@ -557,8 +389,6 @@ class AutarkySensor(SensorEntity):
         """Run when entity about to be added to hass. @zara"""
         await super().async_added_to_hass()
 
-        self.async_on_remove(self._coordinator.async_add_listener(self._handle_coordinator_update))
-
         if self._yield_entity:
             self.async_on_remove(
                 async_track_state_change_event(
@@ -584,20 +414,17 @@ class AutarkySensor(SensorEntity):
                 )
             )
 
-        self.async_write_ha_state()
-
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle coordinator updates. @zara"""
-        self.async_write_ha_state()
+    def apply_snapshot(self, snapshot: CoordinatorSnapshot) -> None:
+        """Nothing to take, autarky is calculated live. @zara"""
 
     @callback
     def _handle_sensor_change(self, event) -> None:
         """Handle yield or consumption sensor state changes. @zara"""
-        self.async_write_ha_state()
+        self._async_write_state_if_changed()
 
 
-class ExpectedDailyProductionSensor(SensorEntity):
+class ExpectedDailyProductionSensor(SnapshotSensorMixin, SensorEntity):
     """Sensor for expected daily production morning snapshot using DB. @zara"""
 
     _attr_has_entity_name = True
@@ -630,42 +457,13 @@ class ExpectedDailyProductionSensor(SensorEntity):
         """Return cached value. @zara"""
         return self._cached_value
 
-    async def _load_from_db(self) -> None:
-        """Load expected daily production from DB via coordinator. @zara"""
-        try:
-            db = getattr(self._coordinator, "db_manager", None)
-            if db:
-                state = await db.get_coordinator_state()
-                if state:
-                    self._cached_value = state.get(DATA_KEY_EXPECTED_DAILY_PRODUCTION)
-                    return
-
-            # Fallback to coordinator data
-            if self._coordinator.data:
-                self._cached_value = self._coordinator.data.get(DATA_KEY_EXPECTED_DAILY_PRODUCTION)
-        except Exception as e:
-            _LOGGER.warning(f"Failed to load ExpectedDailyProductionSensor: {e}")
-            self._cached_value = None
-
-    async def async_added_to_hass(self) -> None:
-        """Setup sensor with DB loading. @zara"""
-        await super().async_added_to_hass()
-        await self._load_from_db()
-        self.async_on_remove(self._coordinator.async_add_listener(self._handle_coordinator_update))
-        self.async_write_ha_state()
-
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle coordinator updates. @zara"""
-        self.hass.async_create_task(self._reload_and_update())
+    def apply_snapshot(self, snapshot: CoordinatorSnapshot) -> None:
+        """Take the expected daily production from the snapshot. @zara"""
+        self._cached_value = snapshot.expected_daily_production_kwh
 
-    async def _reload_and_update(self) -> None:
-        """Reload value and update state. @zara"""
-        await self._load_from_db()
-        self.async_write_ha_state()
 
-
-class ProductionTimeSensor(SensorEntity):
+class ProductionTimeSensor(SnapshotSensorMixin, SensorEntity):
     """Sensor for production time today from DB. @zara"""
 
     _attr_has_entity_name = True
@@ -694,42 +492,13 @@ class ProductionTimeSensor(SensorEntity):
         """Return cached value. @zara"""
         return self._cached_value
 
-    async def _load_from_db(self) -> None:
-        """Load production time from coordinator data. @zara"""
-        try:
-            # Production time is calculated and cached by coordinator
-            if self._coordinator.data:
-                production_time = self._coordinator.data.get(DATA_KEY_PRODUCTION_TIME, {})
-                duration_seconds = production_time.get(PROD_TIME_DURATION_SECONDS, 0)
-
-                hours, remainder = divmod(duration_seconds, 3600)
-                minutes, seconds = divmod(remainder, 60)
-                self._cached_value = f"{int(hours):02}:{int(minutes):02}:{int(seconds):02}"
-            else:
-                self._cached_value = "00:00:00"
-        except Exception as e:
-            _LOGGER.warning(f"Failed to load ProductionTimeSensor: {e}")
-            self._cached_value = None
-
-    async def async_added_to_hass(self) -> None:
-        """Setup sensor. @zara"""
-        await super().async_added_to_hass()
-        await self._load_from_db()
-        self.async_on_remove(self._coordinator.async_add_listener(self._handle_coordinator_update))
-        self.async_write_ha_state()
-
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle coordinator updates. @zara"""
-        self.hass.async_create_task(self._reload_and_update())
-
-    async def _reload_and_update(self) -> None:
-        """Reload value and update state. @zara"""
-        await self._load_from_db()
-        self.async_write_ha_state()
+    def apply_snapshot(self, snapshot: CoordinatorSnapshot) -> None:
+        """Take the production time from the snapshot. @zara"""
+        self._cached_value = snapshot.production_time
 
 
-class MaxPeakTodaySensor(SensorEntity):
+class MaxPeakTodaySensor(SnapshotSensorMixin, SensorEntity):
     """Sensor for today's maximum power peak. @zara"""
 
     _attr_has_entity_name = True
@@ -761,37 +530,13 @@ class MaxPeakTodaySensor(SensorEntity):
         """Return max peak or 0 if no data. @zara"""
         return self._cached_value if self._cached_value is not None else 0.0
 
-    async def _load_from_db(self) -> None:
-        """Load max peak today from coordinator data. @zara"""
-        try:
-            if self._coordinator.data:
-                peak_today = self._coordinator.data.get(DATA_KEY_PEAK_TODAY, {})
-                self._cached_value = peak_today.get(PEAK_TODAY_POWER_W, 0.0)
-            else:
-                self._cached_value = 0.0
-        except Exception as e:
-            _LOGGER.warning(f"Failed to load MaxPeakTodaySensor: {e}")
-            self._cached_value = 0.0
-
-    async def async_added_to_hass(self) -> None:
-        """Setup sensor. @zara"""
-        await super().async_added_to_hass()
-        await self._load_from_db()
-        self.async_on_remove(self._coordinator.async_add_listener(self._handle_coordinator_update))
-        self.async_write_ha_state()
-
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle coordinator updates. @zara"""
-        self.hass.async_create_task(self._reload_and_update())
-
-    async def _reload_and_update(self) -> None:
-        """Reload value and update state. @zara"""
-        await self._load_from_db()
-        self.async_write_ha_state()
+    def apply_snapshot(self, snapshot: CoordinatorSnapshot) -> None:
+        """Take today's peak from the snapshot. @zara"""
+        self._cached_value = snapshot.peak_today_w
 
 
-class MaxPeakAllTimeSensor(SensorEntity):
+class MaxPeakAllTimeSensor(SnapshotSensorMixin, SensorEntity):
     """Sensor for all-time maximum power peak. @zara"""
 
     _attr_has_entity_name = True
@@ -831,39 +576,14 @@ class MaxPeakAllTimeSensor(SensorEntity):
             return {"date": self._cached_date}
         return {}
 
-    async def _load_from_db(self) -> None:
-        """Load all-time peak from coordinator data. @zara"""
-        try:
-            if self._coordinator.data:
-                statistics = self._coordinator.data.get(DATA_KEY_STATISTICS, {})
-                all_time_peak = statistics.get(STATS_ALL_TIME_PEAK, {})
-                self._cached_value = all_time_peak.get(PEAK_TODAY_POWER_W, 0.0)
-                self._cached_date = all_time_peak.get("date")
-            else:
-                self._cached_value = 0.0
-        except Exception as e:
-            _LOGGER.warning(f"Failed to load MaxPeakAllTimeSensor: {e}")
-            self._cached_value = 0.0
-
-    async def async_added_to_hass(self) -> None:
-        """Setup sensor. @zara"""
-        await super().async_added_to_hass()
-        await self._load_from_db()
-        self.async_on_remove(self._coordinator.async_add_listener(self._handle_coordinator_update))
-        self.async_write_ha_state()
-
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle coordinator updates. @zara"""
-        self.hass.async_create_task(self._reload_and_update())
-
-    async def _reload_and_update(self) -> None:
-        """Reload value and update state. @zara"""
-        await self._load_from_db()
-        self.async_write_ha_state()
+    def apply_snapshot(self, snapshot: CoordinatorSnapshot) -> None:
+        """Take the all-time peak from the snapshot. @zara"""
+        self._cached_value = snapshot.all_time_peak_w
+        self._cached_date = snapshot.all_time_peak_date
 
 
-class ForecastDayAfterTomorrowSensor(SensorEntity):
+class ForecastDayAfterTomorrowSensor(SnapshotSensorMixin, SensorEntity):
     """Sensor for day after tomorrow's solar forecast. @zara"""
 
     _attr_has_entity_name = True
@@ -896,50 +616,13 @@ class ForecastDayAfterTomorrowSensor(SensorEntity):
         """Return cached value. @zara"""
         return self._cached_value
 
-    async def _load_from_db(self) -> None:
-        """Load day after tomorrow forecast directly from daily_forecasts DB table. @zara"""
-        try:
-            db = self._coordinator.data_manager._db_manager
-            if not db:
-                return
-            from homeassistant.util import dt as dt_util
-            day_after_str = (dt_util.now() + timedelta(days=2)).date().isoformat()
-            row = await db.fetchone(
-                """SELECT prediction_kwh FROM daily_forecasts
-                   WHERE forecast_type = 'day_after_tomorrow' AND forecast_date = ?""",
-                (day_after_str,)
-            )
-            if row and row[0] is not None:
-                self._cached_value = round(float(row[0]), 2)
-            elif self._coordinator.data:
-                day_after = self._coordinator.data.get(DATA_KEY_FORECAST_DAY_AFTER)
-                if isinstance(day_after, (int, float)):
-                    self._cached_value = float(day_after)
-                elif isinstance(day_after, dict):
-                    self._cached_value = day_after.get(PRED_PREDICTION_KWH)
-        except Exception as e:
-            _LOGGER.warning("Failed to load ForecastDayAfterTomorrowSensor from DB: %s", e)
-            self._cached_value = None
-
-    async def async_added_to_hass(self) -> None:
-        """Setup sensor. @zara"""
-        await super().async_added_to_hass()
-        await self._load_from_db()
-        self.async_on_remove(self._coordinator.async_add_listener(self._handle_coordinator_update))
-        self.async_write_ha_state()
-
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle coordinator updates. @zara"""
-        self.hass.async_create_task(self._reload_and_update())
-
-    async def _reload_and_update(self) -> None:
-        """Reload value and update state. @zara"""
-        await self._load_from_db()
-        self.async_write_ha_state()
+    def apply_snapshot(self, snapshot: CoordinatorSnapshot) -> None:
+        """Take the day after tomorrow forecast from the snapshot. @zara"""
+        self._cached_value = snapshot.forecast_day_after_kwh
 
 
-class MonthlyYieldSensor(SensorEntity):
+class MonthlyYieldSensor(SnapshotSensorMixin, SensorEntity):
     """Sensor for current month's total yield. @zara"""
 
     _attr_has_entity_name = True
@@ -972,35 +655,13 @@ class MonthlyYieldSensor(SensorEntity):
         """Return value or 0.0 if None. @zara"""
         return self._cached_value
 
-    async def _load_from_db(self) -> None:
-        """Load monthly yield from coordinator. @zara"""
-        try:
-            if self._coordinator.data:
-                statistics = self._coordinator.data.get(DATA_KEY_STATISTICS, {})
-                current_month = statistics.get(STATS_CURRENT_MONTH, {})
-                self._cached_value = current_month.get(STATS_YIELD_KWH, 0.0)
-        except Exception as e:
-            _LOGGER.warning(f"Failed to load MonthlyYieldSensor: {e}")
-
-    async def async_added_to_hass(self) -> None:
-        """Setup sensor. @zara"""
-        await super().async_added_to_hass()
-        await self._load_from_db()
-        self.async_on_remove(self._coordinator.async_add_listener(self._handle_coordinator_update))
-        self.async_write_ha_state()
-
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle coordinator updates. @zara"""
-        self.hass.async_create_task(self._reload_and_update())
-
-    async def _reload_and_update(self) -> None:
-        """Reload value and update state. @zara"""
-        await self._load_from_db()
-        self.async_write_ha_state()
+    def apply_snapshot(self, snapshot: CoordinatorSnapshot) -> None:
+        """Take the monthly yield from the snapshot. @zara"""
+        self._cached_value = snapshot.month_yield_kwh
 
 
-class MonthlyConsumptionSensor(SensorEntity):
+class MonthlyConsumptionSensor(SnapshotSensorMixin, SensorEntity):
     """Sensor for current month's total consumption. @zara"""
 
     _attr_has_entity_name = True
@@ -1033,35 +694,13 @@ class MonthlyConsumptionSensor(SensorEntity):
         """Return value or 0.0 if None. @zara"""
         return self._cached_value
 
-    async def _load_from_db(self) -> None:
-        """Load monthly consumption from coordinator. @zara"""
-        try:
-            if self._coordinator.data:
-                statistics = self._coordinator.data.get(DATA_KEY_STATISTICS, {})
-                current_month = statistics.get(STATS_CURRENT_MONTH, {})
-                self._cached_value = current_month.get(STATS_CONSUMPTION_KWH, 0.0)
-        except Exception as e:
-            _LOGGER.warning(f"Failed to load MonthlyConsumptionSensor: {e}")
-
-    async def async_added_to_hass(self) -> None:
-        """Setup sensor. @zara"""
-        await super().async_added_to_hass()
-        await self._load_from_db()
-        self.async_on_remove(self._coordinator.async_add_listener(self._handle_coordinator_update))
-        self.async_write_ha_state()
-
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle coordinator updates. @zara"""
-        self.hass.async_create_task(self._reload_and_update())
+    def apply_snapshot(self, snapshot: CoordinatorSnapshot) -> None:
+        """Take the monthly consumption from the snapshot. @zara"""
+        self._cached_value = snapshot.month_consumption_kwh
 
-    async def _reload_and_update(self) -> None:
-        """Reload value and update state. @zara"""
-        await self._load_from_db()
-        self.async_write_ha_state()
 
-
-class WeeklyYieldSensor(SensorEntity):
+class WeeklyYieldSensor(SnapshotSensorMixin, SensorEntity):
     """Sensor for current week's total yield. @zara"""
 
     _attr_has_entity_name = True
@@ -1094,35 +733,13 @@ class WeeklyYieldSensor(SensorEntity):
         """Return value or 0.0 if None. @zara"""
         return self._cached_value
 
-    async def _load_from_db(self) -> None:
-        """Load weekly yield from coordinator. @zara"""
-        try:
-            if self._coordinator.data:
-                statistics = self._coordinator.data.get(DATA_KEY_STATISTICS, {})
-                current_week = statistics.get(STATS_CURRENT_WEEK, {})
-                self._cached_value = current_week.get(STATS_YIELD_KWH, 0.0)
-        except Exception as e:
-            _LOGGER.warning(f"Failed to load WeeklyYieldSensor: {e}")
-
-    async def async_added_to_hass(self) -> None:
-        """Setup sensor. @zara"""
-        await super().async_added_to_hass()
-        await self._load_from_db()
-        self.async_on_remove(self._coordinator.async_add_listener(self._handle_coordinator_update))
-        self.async_write_ha_state()
-
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle coordinator updates. @zara"""
-        self.hass.async_create_task(self._reload_and_update())
-
-    async def _reload_and_update(self) -> None:
-        """Reload value and update state. @zara"""
-        await self._load_from_db()
-        self.async_write_ha_state()
+    def apply_snapshot(self, snapshot: CoordinatorSnapshot) -> None:
+        """Take the weekly yield from the snapshot. @zara"""
+        self._cached_value = snapshot.week_yield_kwh
 
 
-class WeeklyConsumptionSensor(SensorEntity):
+class WeeklyConsumptionSensor(SnapshotSensorMixin, SensorEntity):
     """Sensor for current week's total consumption. @zara"""
 
     _attr_has_entity_name = True
@@ -1155,35 +772,13 @@ class WeeklyConsumptionSensor(SensorEntity):
         """Return value or 0.0 if None. @zara"""
         return self._cached_value
 
-    async def _load_from_db(self) -> None:
-        """Load weekly consumption from coordinator. @zara"""
-        try:
-            if self._coordinator.data:
-                statistics = self._coordinator.data.get(DATA_KEY_STATISTICS, {})
-                current_week = statistics.get(STATS_CURRENT_WEEK, {})
-                self._cached_value = current_week.get(STATS_CONSUMPTION_KWH, 0.0)
-        except Exception as e:
-            _LOGGER.warning(f"Failed to load WeeklyConsumptionSensor: {e}")
-
-    async def async_added_to_hass(self) -> None:
-        """Setup sensor. @zara"""
-        await super().async_added_to_hass()
-        await self._load_from_db()
-        self.async_on_remove(self._coordinator.async_add_listener(self._handle_coordinator_update))
-        self.async_write_ha_state()
-
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle coordinator updates. @zara"""
-        self.hass.async_create_task(self._reload_and_update())
-
-    async def _reload_and_update(self) -> None:
-        """Reload value and update state. @zara"""
-        await self._load_from_db()
-        self.async_write_ha_state()
+    def apply_snapshot(self, snapshot: CoordinatorSnapshot) -> None:
+        """Take the weekly consumption from the snapshot. @zara"""
+        self._cached_value = snapshot.week_consumption_kwh
 
 
-class AverageYield7DaysSensor(SensorEntity):
+class AverageYield7DaysSensor(SnapshotSensorMixin, SensorEntity):
     """Sensor for average daily yield over last 7 days. @zara"""
 
     _attr_has_entity_name = True
@@ -1216,35 +811,13 @@ class AverageYield7DaysSensor(SensorEntity):
         """Return cached value. @zara"""
         return self._cached_value
 
-    async def _load_from_db(self) -> None:
-        """Load average yield 7 days from coordinator. @zara"""
-        try:
-            if self._coordinator.data:
-                statistics = self._coordinator.data.get(DATA_KEY_STATISTICS, {})
-                last_7d = statistics.get(STATS_LAST_7_DAYS, {})
-                self._cached_value = last_7d.get(STATS_AVG_YIELD_KWH)
-        except Exception as e:
-            _LOGGER.warning(f"Failed to load AverageYield7DaysSensor: {e}")
-
-    async def async_added_to_hass(self) -> None:
-        """Setup sensor. @zara"""
-        await super().async_added_to_hass()
-        await self._load_from_db()
-        self.async_on_remove(self._coordinator.async_add_listener(self._handle_coordinator_update))
-        self.async_write_ha_state()
-
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle coordinator updates. @zara"""
-        self.hass.async_create_task(self._reload_and_update())
+    def apply_snapshot(self, snapshot: CoordinatorSnapshot) -> None:
+        """Take the 7 day average yield from the snapshot. @zara"""
+        self._cached_value = snapshot.avg_yield_7d_kwh
 
-    async def _reload_and_update(self) -> None:
-        """Reload value and update state. @zara"""
-        await self._load_from_db()
-        self.async_write_ha_state()
 
-
-class AverageYield30DaysSensor(SensorEntity):
+class AverageYield30DaysSensor(SnapshotSensorMixin, SensorEntity):
     """Sensor for average daily yield over last 30 days. @zara"""
 
     _attr_has_entity_name = True
@@ -1277,35 +850,13 @@ class AverageYield30DaysSensor(SensorEntity):
         """Return cached value. @zara"""
         return self._cached_value
 
-    async def _load_from_db(self) -> None:
-        """Load average yield 30 days from coordinator. @zara"""
-        try:
-            if self._coordinator.data:
-                statistics = self._coordinator.data.get(DATA_KEY_STATISTICS, {})
-                last_30d = statistics.get(STATS_LAST_30_DAYS, {})
-                self._cached_value = last_30d.get(STATS_AVG_YIELD_KWH)
-        except Exception as e:
-            _LOGGER.warning(f"Failed to load AverageYield30DaysSensor: {e}")
-
-    async def async_added_to_hass(self) -> None:
-        """Setup sensor. @zara"""
-        await super().async_added_to_hass()
-        await self._load_from_db()
-        self.async_on_remove(self._coordinator.async_add_listener(self._handle_coordinator_update))
-        self.async_write_ha_state()
-
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle coordinator updates. @zara"""
-        self.hass.async_create_task(self._reload_and_update())
-
-    async def _reload_and_update(self) -> None:
-        """Reload value and update state. @zara"""
-        await self._load_from_db()
-        self.async_write_ha_state()
+    def apply_snapshot(self, snapshot: CoordinatorSnapshot) -> None:
+        """Take the 30 day average yield from the snapshot. @zara"""
+        self._cached_value = snapshot.avg_yield_30d_kwh
 
 
-class AverageAutarkyMonthSensor(SensorEntity):
+class AverageAutarkyMonthSensor(SnapshotSensorMixin, SensorEntity):
     """Sensor for average autarky for current month. @zara"""
 
     _attr_has_entity_name = True
@@ -1336,35 +887,13 @@ class AverageAutarkyMonthSensor(SensorEntity):
         """Return cached value. @zara"""
         return self._cached_value
 
-    async def _load_from_db(self) -> None:
-        """Load average autarky month from coordinator. @zara"""
-        try:
-            if self._coordinator.data:
-                statistics = self._coordinator.data.get(DATA_KEY_STATISTICS, {})
-                current_month = statistics.get(STATS_CURRENT_MONTH, {})
-                self._cached_value = current_month.get("avg_autarky")
-        except Exception as e:
-            _LOGGER.warning(f"Failed to load AverageAutarkyMonthSensor: {e}")
-
-    async def async_added_to_hass(self) -> None:
-        """Setup sensor. @zara"""
-        await super().async_added_to_hass()
-        await self._load_from_db()
-        self.async_on_remove(self._coordinator.async_add_listener(self._handle_coordinator_update))
-        self.async_write_ha_state()
-
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle coordinator updates. @zara"""
-        self.hass.async_create_task(self._reload_and_update())
-
-    async def _reload_and_update(self) -> None:
-        """Reload value and update state. @zara"""
-        await self._load_from_db()
-        self.async_write_ha_state()
+    def apply_snapshot(self, snapshot: CoordinatorSnapshot) -> None:
+        """Take the monthly average autarky from the snapshot. @zara"""
+        self._cached_value = snapshot.avg_autarky_month
 
 
-class AverageAccuracy30DaysSensor(SensorEntity):
+class AverageAccuracy30DaysSensor(SnapshotSensorMixin, SensorEntity):
     """Sensor for average accuracy over last 30 days. @zara"""
 
     _attr_has_entity_name = True
@@ -1395,29 +924,7 @@ class AverageAccuracy30DaysSensor(SensorEntity):
         """Return cached value. @zara"""
         return self._cached_value
 
-    async def _load_from_db(self) -> None:
-        """Load average accuracy 30 days from coordinator. @zara"""
-        try:
-            if self._coordinator.data:
-                statistics = self._coordinator.data.get(DATA_KEY_STATISTICS, {})
-                last_30d = statistics.get(STATS_LAST_30_DAYS, {})
-                self._cached_value = last_30d.get(STATS_AVG_ACCURACY)
-        except Exception as e:
-            _LOGGER.warning(f"Failed to load AverageAccuracy30DaysSensor: {e}")
-
-    async def async_added_to_hass(self) -> None:
-        """Setup sensor. @zara"""
-        await super().async_added_to_hass()
-        await self._load_from_db()
-        self.async_on_remove(self._coordinator.async_add_listener(self._handle_coordinator_update))
-        self.async_write_ha_state()
-
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle coordinator updates. @zara"""
-        self.hass.async_create_task(self._reload_and_update())
-
-    async def _reload_and_update(self) -> None:
-        """Reload value and update state. @zara"""
-        await self._load_from_db()
-        self.async_write_ha_state()
+    def apply_snapshot(self, snapshot: CoordinatorSnapshot) -> None:
+        """Take the 30 day average accuracy from the snapshot. @zara"""
+        self._cached_value = snapshot.avg_accuracy_30d
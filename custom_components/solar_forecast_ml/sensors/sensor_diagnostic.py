@@ -27,7 +27,7 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE, UnitOfEnergy
+from homeassistant.const import PERCENTAGE, UnitOfEnergy, UnitOfTime
 from homeassistant.helpers.entity import EntityCategory
 
 from ..const import DAILY_UPDATE_HOUR, UPDATE_INTERVAL
@@ -439,6 +439,49 @@ class LastCoordinatorUpdateSensor(BaseSolarSensor):
         }
 
 
+class UpdateProfileSensor(BaseSolarSensor):
+    """Sensor showing the p95 duration of the last coordinator updates. @zara"""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_icon = "mdi:timer-cog-outline"
+
+    def __init__(self, coordinator: SolarForecastMLCoordinator, entry: ConfigEntry):
+        """Initialize. @zara"""
+        super().__init__(coordinator, entry)
+        self._attr_unique_id = f"{entry.entry_id}_ml_update_profile"
+        self._attr_translation_key = "update_profile"
+        self._attr_name = "Update Duration p95"
+
+    @property
+    def native_value(self) -> Optional[float]:
+        """Return the p95 update duration in milliseconds. @zara"""
+        summary = self.coordinator.update_profiler.get_summary()
+        return summary["total_ms"].get("p95") if summary["samples"] else None
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Provide p50/p95 per stage. @zara"""
+        summary = self.coordinator.update_profiler.get_summary()
+        attributes: Dict[str, Any] = {
+            "updates": summary["updates"],
+            "failed_updates": summary["failed_updates"],
+            "samples": summary["samples"],
+            "total_p50_ms": summary["total_ms"].get("p50"),
+            "db_queries_p50": summary["db_queries"].get("p50"),
+            "db_p50_ms": summary["db_ms"].get("p50"),
+            "db_p95_ms": summary["db_ms"].get("p95"),
+        }
+        for name, stage in summary["stages"].items():
+            attributes[f"{name}_p50_ms"] = stage["wall_ms"]["p50"]
+            attributes[f"{name}_p95_ms"] = stage["wall_ms"]["p95"]
+            attributes[f"{name}_db_queries_p50"] = stage["db_queries"]["p50"]
+            attributes[f"{name}_db_p95_ms"] = stage["db_ms"]["p95"]
+        return attributes
+
+
 class LastMLTrainingSensor(BaseSolarSensor):
     """Sensor showing the timestamp of the last ML model training. @zara"""
 
@@ -865,6 +908,7 @@ class CoordinatorHealthSensor(BaseSolarSensor):
                 if self.coordinator.update_interval
                 else None
             ),
+            "weather_requests": self.coordinator.weather_requests.get_stats(),
         }
 
 
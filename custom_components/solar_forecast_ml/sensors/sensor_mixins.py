@@ -24,6 +24,7 @@ from typing import Any, Optional
 from homeassistant.core import callback
 
 from ..const import CACHE_HOURLY_PREDICTIONS, CACHE_PREDICTIONS, PRED_TARGET_DATE
+from ..core.core_coordinator_snapshot import CoordinatorSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -77,6 +78,54 @@ class DBBasedSensorMixin(ABC):
         return self._cached_value
 
 
+class SnapshotSensorMixin(ABC):
+    """Mixin for sensors rendered from the coordinator snapshot. @zara
+
+    The listener callback reads the snapshot synchronously and only writes
+    the HA state when availability, value or attributes changed.
+    """
+
+    _last_written_state: Optional[tuple] = None
+
+    @abstractmethod
+    def apply_snapshot(self, snapshot: CoordinatorSnapshot) -> None:
+        """Take the sensor values from a snapshot - must be implemented. @zara"""
+        pass
+
+    async def async_added_to_hass(self) -> None:
+        """Setup sensor from the current snapshot. @zara"""
+        await super().async_added_to_hass()
+        self._apply_current_snapshot()
+        self.async_on_remove(self._coordinator.async_add_listener(self._handle_coordinator_update))
+        self._async_write_state_if_changed(force=True)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle coordinator updates. @zara"""
+        self._apply_current_snapshot()
+        self._async_write_state_if_changed()
+
+    def _apply_current_snapshot(self) -> None:
+        """Apply the published snapshot, publishing one if none exists yet. @zara"""
+        try:
+            snapshot = self._coordinator.snapshot or self._coordinator.publish_snapshot()
+            self.apply_snapshot(snapshot)
+        except Exception as e:
+            _LOGGER.warning(f"Failed to apply snapshot to {self.__class__.__name__}: {e}")
+
+    @callback
+    def _async_write_state_if_changed(self, force: bool = False) -> None:
+        """Write the HA state only if it differs from the last write. @zara"""
+        state = (self.available, self.native_value, self.extra_state_attributes)
+        counters = self._coordinator.snapshot_counters
+        if not force and state == self._last_written_state:
+            counters.skipped_writes += 1
+            return
+        self._last_written_state = state
+        counters.state_writes += 1
+        self.async_write_ha_state()
+
+
 class CoordinatorPropertySensorMixin(ABC):
     """Mixin for sensors reading from coordinator properties. @zara"""
 
@@ -119,17 +119,22 @@ class AstronomyServiceHandler:
             f"{days_ahead} days ahead, capacity={system_capacity_kwp} kWp"
         )
 
+        def _on_progress(stage: str, info: dict) -> None:
+            _LOGGER.info(f"Astronomy cache build progress [{stage}]: {info}")
+
         try:
             result = await self.astronomy_cache.rebuild_cache(
                 system_capacity_kwp=system_capacity_kwp,
                 start_date=None,
                 days_back=days_back,
                 days_ahead=days_ahead,
+                progress_callback=_on_progress,
             )
 
             _LOGGER.info(
                 f"Astronomy cache built successfully: "
-                f"{result['success_count']} days, {result['error_count']} errors"
+                f"{result['success_count']} days, {result['error_count']} errors "
+                f"in {result.get('total_ms', 0)} ms"
             )
 
             # Reinitialize cache manager from database
@@ -148,7 +153,11 @@ class AstronomyServiceHandler:
                     title="Astronomy Cache Built",
                     message=(
                         f"Successfully built astronomy cache for {result['success_count']} days "
-                        f"({days_back} days back + {days_ahead} days ahead)."
+                        f"({days_back} days back + {days_ahead} days ahead).\n"
+                        f"Rows: {result.get('hourly_rows', 0)} hourly, "
+                        f"{result.get('group_rows', 0)} panel group. "
+                        f"Timing: {result.get('compute_ms', 0)} ms compute, "
+                        f"{result.get('write_ms', 0)} ms write."
                     ),
                     notification_id="astronomy_cache_built",
                 )
@@ -21,16 +21,17 @@ Uses DatabaseManager for all data operations.
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Awaitable, Callable, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
 
 from ..const import (
     DOMAIN,
     SERVICE_ANALYZE_FEATURE_IMPORTANCE,
     SERVICE_BACKFILL_SHADOW_DETECTION,
     SERVICE_BUILD_ASTRONOMY_CACHE,
+    SERVICE_PROFILE_DATABASE_QUERIES,
     SERVICE_RUN_WEATHER_CORRECTION,
     SERVICE_REFRESH_OPEN_METEO_CACHE,
     SERVICE_REFRESH_MULTI_WEATHER,
@@ -43,8 +44,9 @@ from ..const import (
     SERVICE_TEST_MORNING_ROUTINE,
     SERVICE_TEST_RETROSPECTIVE_FORECAST,
 )
-from ..const import CONF_WINTER_MODE, DEFAULT_WINTER_MODE
+from ..const import CONF_WINTER_MODE, DEFAULT_WINTER_MODE, QUERY_PROFILE_TOP_N
 from ..core.core_helpers import SafeDateTimeUtil as dt_util
+from ..data.data_query_profiler import ORDER_BY_FIELDS, get_query_profiler
 from ..data.db_manager import DatabaseManager
 
 _LOGGER = logging.getLogger(__name__)
@@ -55,8 +57,9 @@ class ServiceDefinition:
     """Service definition for registration. @zara"""
 
     name: str
-    handler: Callable[[ServiceCall], Awaitable[None]]
+    handler: Callable[[ServiceCall], Awaitable[Any]]
     description: str = ""
+    supports_response: SupportsResponse = SupportsResponse.NONE
 
 
 class ServiceRegistry:
@@ -96,7 +99,12 @@ class ServiceRegistry:
         services = self._build_service_definitions()
 
         for service in services:
-            self.hass.services.async_register(DOMAIN, service.name, service.handler)
+            self.hass.services.async_register(
+                DOMAIN,
+                service.name,
+                service.handler,
+                supports_response=service.supports_response,
+            )
             self._registered_services.append(service.name)
 
         _LOGGER.debug(f"Registered {len(services)} services")
@@ -189,6 +197,13 @@ class ServiceRegistry:
                 handler=self._handle_backfill_shadow_detection,
                 description="Backfill shadow detection for missing hours",
             ),
+            # Diagnostics Services
+            ServiceDefinition(
+                name=SERVICE_PROFILE_DATABASE_QUERIES,
+                handler=self._handle_profile_database_queries,
+                description="Start, stop, reset or report the database query profiler",
+                supports_response=SupportsResponse.OPTIONAL,
+            ),
         ]
 
     # =========================================================================
@@ -599,6 +614,64 @@ class ServiceRegistry:
     # Shadow Detection Services @zara V16.2
     # =========================================================================
 
+    async def _backfill_hourly_actuals_from_recorder(self, target_date: str) -> int:
+        """Fill missing hourly_predictions.actual_kwh of a day from the yield sensor history. @zara V16.4
+
+        Uses the same single-sweep recorder engine as the panel-group backfill.
+        Only completed hours are filled.
+        """
+        entity_id = getattr(self.coordinator, "solar_yield_today", None)
+        if not entity_id:
+            return 0
+
+        from ..data.data_recorder_backfill import (
+            async_load_energy_readings,
+            hourly_energy_deltas,
+        )
+
+        try:
+            now = dt_util.now()
+            missing = await self.db_manager.fetchall(
+                """SELECT prediction_id, target_date, target_hour
+                   FROM hourly_predictions
+                   WHERE target_date = ?
+                     AND actual_kwh IS NULL
+                     AND (target_date < ? OR target_hour < ?)
+                   ORDER BY target_hour""",
+                (target_date, now.date().isoformat(), now.hour),
+            )
+            if not missing:
+                return 0
+
+            day_start = datetime.fromisoformat(f"{target_date}T00:00:00").replace(
+                tzinfo=dt_util.get_default_time_zone()
+            )
+            readings = await async_load_energy_readings(
+                self.hass, entity_id, day_start, day_start + timedelta(days=1)
+            )
+            if len(readings) < 2:
+                return 0
+
+            deltas = hourly_energy_deltas(
+                readings, ((row[0], row[1], row[2]) for row in missing)
+            )
+            if not deltas:
+                return 0
+
+            await self.db_manager.executemany(
+                """UPDATE hourly_predictions SET actual_kwh = ?
+                   WHERE prediction_id = ? AND actual_kwh IS NULL""",
+                [(delta, prediction_id) for prediction_id, delta in deltas],
+            )
+            await self.db_manager.commit()
+            _LOGGER.info(
+                "Recovered %d hourly actuals for %s from recorder", len(deltas), target_date
+            )
+            return len(deltas)
+        except Exception as e:
+            _LOGGER.warning(f"Recorder backfill of hourly actuals failed for {target_date}: {e}")
+            return 0
+
     async def _handle_backfill_shadow_detection(self, call: ServiceCall) -> None:
         """Handle backfill_shadow_detection service. @zara V16.2
 
@@ -622,6 +695,9 @@ class ServiceRegistry:
 
             morning_handler = self.coordinator.scheduled_tasks.morning_routine_handler
 
+            # Recover hourly actuals the day-end tasks missed, so those hours qualify too
+            await self._backfill_hourly_actuals_from_recorder(target_date)
+
             # Find hours with actual_kwh but no shadow detection
             missing_hours = await self.db_manager.fetchall(
                 """SELECT hp.target_hour, hp.prediction_id, hp.actual_kwh
@@ -750,3 +826,55 @@ class ServiceRegistry:
 
         except Exception as err:
             _LOGGER.error(f"Error in backfill_shadow_detection service: {err}", exc_info=True)
+
+    # =========================================================================
+    # Diagnostics Services
+    # =========================================================================
+
+    async def _handle_profile_database_queries(
+        self, call: ServiceCall
+    ) -> Optional[Dict[str, Any]]:
+        """Handle profile_database_queries service. @zara
+
+        action start/stop/reset controls the profiler; every call returns
+        the current report (top statements, lock waits, query plans).
+        """
+        action = call.data.get("action", "report")
+        _LOGGER.info(f"Service: profile_database_queries ({action})")
+
+        profiler = get_query_profiler(self.db_manager, create=True)
+        if profiler is None:
+            _LOGGER.error("Database manager not available")
+            return {"error": "database not available"}
+
+        if action == "start":
+            profiler.start()
+        elif action == "stop":
+            profiler.stop()
+        elif action == "reset":
+            profiler.reset()
+
+        order_by = call.data.get("order_by", "total_ms")
+        if order_by not in ORDER_BY_FIELDS:
+            order_by = "total_ms"
+
+        try:
+            report = await profiler.async_get_report(
+                limit=call.data.get("limit", QUERY_PROFILE_TOP_N),
+                order_by=order_by,
+                explain=call.data.get("explain", True),
+            )
+        except Exception as err:
+            _LOGGER.error(f"Error in profile_database_queries service: {err}", exc_info=True)
+            return {"error": str(err)}
+
+        for entry in report["statements"]:
+            _LOGGER.info(
+                "Query profile: %d calls, %.1f ms total, %.1f ms max, %.1f ms lock wait: %s",
+                entry["calls"], entry["total_ms"], entry["max_ms"],
+                entry["lock_wait_ms"], entry["sql"][:200],
+            )
+        for scan in report["full_scans"]:
+            _LOGGER.info("Query profile full scan (%s): %s", "; ".join(scan["scans"]), scan["sql"][:200])
+
+        return report if call.return_response else None
@@ -27,6 +27,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ..core.core_update_profiler import get_update_profiler
+from ..data.data_query_profiler import get_query_profiler
 from ..data.db_manager import DatabaseManager
 
 _LOGGER = logging.getLogger(__name__)
@@ -63,9 +65,13 @@ class SystemReportGenerator:
             geometry_data = await self._load_geometry_data()
             statistics = await self._load_statistics()
             history = await self._load_history()
+            update_profile = self._load_update_profile()
+            query_profile = await self._load_query_profile()
 
             # Build report content
-            content = self._build_report(geometry_data, statistics, history)
+            content = self._build_report(
+                geometry_data, statistics, history, update_profile, query_profile
+            )
 
             # Write report
             await self._write_report(content)
@@ -176,6 +182,22 @@ class SystemReportGenerator:
             _LOGGER.error(f"Error loading history: {e}")
             return []
 
+    def _load_update_profile(self) -> Dict[str, Any]:
+        """Get the coordinator update timings recorded for this database. @zara"""
+        profiler = get_update_profiler(self._db)
+        return profiler.get_summary() if profiler else {}
+
+    async def _load_query_profile(self) -> Dict[str, Any]:
+        """Get the query profiler report, if profiling was ever started. @zara"""
+        profiler = get_query_profiler(self._db)
+        if profiler is None or not profiler.has_data:
+            return {}
+        try:
+            return await profiler.async_get_report()
+        except Exception as e:
+            _LOGGER.error(f"Error loading query profile: {e}")
+            return {}
+
     async def _write_report(self, content: str) -> None:
         """Write report to file asynchronously. @zara"""
 
@@ -192,6 +214,8 @@ class SystemReportGenerator:
         geometry_data: Dict[str, Any],
         statistics: Dict[str, Any],
         history: List[Dict[str, Any]],
+        update_profile: Optional[Dict[str, Any]] = None,
+        query_profile: Optional[Dict[str, Any]] = None,
     ) -> str:
         """Build the Markdown report content. @zara"""
         now = datetime.now()
@@ -276,6 +300,9 @@ class SystemReportGenerator:
             else:
                 lines.append(f"| {season} | - | - | - |")
 
+        lines.extend(self._build_update_profile_section(update_profile or {}))
+        lines.extend(self._build_query_profile_section(query_profile or {}))
+
         # Footer with Star Trek quote and greeting
         star_trek_quote = self._get_star_trek_quote()
 
@@ -300,6 +327,66 @@ class SystemReportGenerator:
 
         return "\n".join(lines)
 
+    def _build_update_profile_section(self, update_profile: Dict[str, Any]) -> List[str]:
+        """Build the coordinator update timing table. @zara"""
+        if not update_profile.get("samples"):
+            return []
+
+        total = update_profile["total_ms"]
+        db_ms = update_profile["db_ms"]
+        lines = [
+            "",
+            "### Coordinator Update Timing",
+            "",
+            f"**Updates:** {update_profile['updates']} "
+            f"({update_profile['failed_updates']} failed) | "
+            f"**Samples:** {update_profile['samples']}",
+            "",
+            f"**Total:** p50 {total['p50']:.0f} ms | p95 {total['p95']:.0f} ms | "
+            f"**DB:** p50 {db_ms['p50']:.0f} ms | p95 {db_ms['p95']:.0f} ms",
+            "",
+            "| Stage | p50 | p95 | DB Queries (p50) | DB Time (p95) |",
+            "|-------|-----|-----|------------------|---------------|",
+        ]
+        for name, stage in update_profile["stages"].items():
+            lines.append(
+                f"| {name} | {stage['wall_ms']['p50']:.1f} ms | {stage['wall_ms']['p95']:.1f} ms "
+                f"| {stage['db_queries']['p50']:.0f} | {stage['db_ms']['p95']:.1f} ms |"
+            )
+        return lines
+
+    def _build_query_profile_section(self, query_profile: Dict[str, Any]) -> List[str]:
+        """Build the database query profile table. @zara"""
+        if not query_profile.get("statements"):
+            return []
+
+        lines = [
+            "",
+            "### Database Query Profile",
+            "",
+            f"**Since:** {query_profile.get('started_at') or '-'} | "
+            f"**Profiling:** {'on' if query_profile.get('enabled') else 'off'} | "
+            f"**Statements:** {query_profile['distinct_statements']} | "
+            f"**Calls:** {query_profile['calls']}",
+            "",
+            f"**DB Time:** {query_profile['total_ms']:.0f} ms | "
+            f"**Lock Wait:** {query_profile['lock_wait_ms']:.0f} ms",
+            "",
+            "| Statement | Calls | Total | Max | Rows | Lock Wait | Plan |",
+            "|-----------|-------|-------|-----|------|-----------|------|",
+        ]
+        for entry in query_profile["statements"]:
+            sql = entry["sql"].replace("|", "\\|")
+            if len(sql) > 120:
+                sql = sql[:117] + "..."
+            plan = "; ".join(entry.get("scans") or []) or ("no scan" if entry.get("plan") else "-")
+            lines.append(
+                f"| `{sql}` | {entry['calls']} | {entry['total_ms']:.1f} ms "
+                f"| {entry['max_ms']:.1f} ms | {entry['rows']} "
+                f"| {entry['lock_wait_ms']:.1f} ms | {plan} |"
+            )
+        return lines
+
     def _get_star_trek_quote(self) -> str:
         """Return a random Star Trek quote related to energy/sun/exploration. @zara"""
         quotes = [